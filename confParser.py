@@ -6,6 +6,11 @@ import sqlite3
 import os
 import shutil
 import uuid
+import hashlib
+import functools
+import json
+import csv
+import logging
 import datetime
 import time
 import getpass
@@ -14,13 +19,20 @@ import telnetlib
 import socket
 import getpass
 import multiprocessing
+import multiprocessing.pool
 import xlsxwriter
 
 from ciscoconfparse import CiscoConfParse
 
-debug = True                    # Turn on to see debugging messages
-debugSQL = False                # Turn on to see raw SQL request messages
+logger = logging.getLogger("confParser")
+
+debug = False                   # Turn on to see debugging messages, set with "-v" argument
+debugSQL = False                # Turn on to see raw SQL request messages, set with "-vv" argument
+loggingArgs = (0, "")           # Verbosity and log file of the script, logging of worker processes is set up with them
 DBUpdateDisable = False         # Turn on to disable writing (insert/update/delete) to DB
+batchMode = False               # Turn on to never wait for user input, set with "--batch" argument
+outputChunkSize = 10000         # Number of DB rows fetched at once when output is streamed from the DB
+xlsxMaxRows = 1048576           # Number of rows per sheet in XLSX file (Excel limit), longer tables continue on next sheets
 
 DBFormatVersion = 2             # Specifies current format (columns and their order) of data storing in DB and lists
                                 # Changes whenever the core dictionaried below are changed do disable backward compatibility
@@ -149,6 +161,21 @@ for value in PeeringDict:
     PeeringDict[value][0] = int(i)
     i = i + 1
 
+SourceFilesDict =  {
+    "SourceFile": [0, "TEXT NOT NULL,"],
+    "FileSize": [0, "INTEGER,"],
+    "FileMTime": [0, "REAL,"],
+    "FileHash": [0, "TEXT,"],
+    "ParseOptions": [0, "TEXT,"],
+    "LastUpdatedTime": [0, "TEXT,"],
+    "LastUpdatedBy": [0, "TEXT"]
+}
+
+i = 0
+for value in SourceFilesDict:
+    SourceFilesDict[value][0] = int(i)
+    i = i + 1
+
 CommandsDict =  {
     "IOS": [
         [ "show version", 30 ],
@@ -394,7 +421,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
             try:
                 execTime = time.time() - startTime
                 if ( execTime > execTimeout ):
-                    print("Error: command execution has timed out")
+                    logger.warning("Command execution has timed out")
                     connectionCursor.send("\x03\nq\n")
                     return [ 1, outputText, execTime]
                 connectionCursor.settimeout(readTimeout)
@@ -402,7 +429,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                 # print(outputChunk)
                 outputStream = outputStream + outputChunk
             except:
-                print("   Connection error: ", sys.exc_info()[0])
+                logger.warning("Connection error: %s", sys.exc_info()[0])
     if protocol == "telnet":
         terminalRead = 0
         outputChunk = ""
@@ -410,7 +437,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
             try:
                 execTime = time.time() - startTime
                 if ( execTime > execTimeout ):
-                    print("Error: command execution has timed out")
+                    logger.warning("Command execution has timed out")
                     connectionCursor.write(b"\x03\nq\n")
                     return [ 1, outputText, execTime]
                 terminalLine = ""
@@ -419,7 +446,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                     terminalRead = 1
                 outputStream = outputStream + terminalLine
             except:
-                print("   Connection error: ", sys.exc_info()[0])
+                logger.warning("Connection error: %s", sys.exc_info()[0])
 
     # Checking if terminal is alive
     for attempt in range(0,2):
@@ -437,27 +464,27 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
             while not connectionCursor.recv_ready():
                 execTime = time.time() - startTime
                 if ( execTime > execTimeout ):
-                    print("Error: command execution has timed out")
+                    logger.warning("Command execution has timed out")
                     connectionCursor.send("\x03\nq\n")
                     return [ 2, outputText, execTime]
                 time.sleep(1)
                 waitTime = waitTime + 1
                 if waitTime >= waitTimeout:
-                    print("Error: command execution procedure has timed out while attempting to get CLI prefix")
+                    logger.warning("Command execution procedure has timed out while attempting to get CLI prefix")
                     break
         if protocol == "ssh":
             while connectionCursor.recv_ready():
                 try:
                     execTime = time.time() - startTime
                     if ( execTime > execTimeout ):
-                        print("Error: command execution has timed out")
+                        logger.warning("Command execution has timed out")
                         connectionCursor.send("\x03\nq\n")
                         return [ 3, outputText, execTime]
                     connectionCursor.settimeout(readTimeout)
                     outputChunk = connectionCursor.recv(1000).decode("utf-8")
                     outputStream = outputStream + outputChunk
                 except:
-                    print("   Connection error: ", sys.exc_info()[0])
+                    logger.warning("Connection error: %s", sys.exc_info()[0])
         if protocol == "telnet":
             terminalRead = 0
             outputChunk = ""
@@ -465,7 +492,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                 try:
                     execTime = time.time() - startTime
                     if ( execTime > execTimeout ):
-                        print("Error: command execution has timed out")
+                        logger.warning("Command execution has timed out")
                         connectionCursor.write(b"\x03\nq\n")
                         return [ 3, outputText, execTime]
                     terminalLine = ""
@@ -475,13 +502,13 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                     else:
                         outputStream = outputStream + terminalLine
                 except:
-                    print("   Connection error: ", sys.exc_info()[0])
+                    logger.warning("Connection error: %s", sys.exc_info()[0])
         # print(outputStream)
         if ( re.search(re.compile(shellPromptRegex),outputStream.split("\n")[-1]) ):
             break
 
     if ( not re.search(re.compile(shellPromptRegex),outputStream.split("\n")[-1]) ):
-        print("Error: terminal not responding")
+        logger.warning("Terminal not responding")
         return [ 3, outputText, execTime]
     else:
         # Sending command
@@ -503,19 +530,19 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                 while not connectionCursor.recv_ready():
                     execTime = time.time() - startTime
                     if ( execTime > execTimeout ):
-                        print("Error: command execution has timed out")
+                        logger.warning("Command execution has timed out")
                         connectionCursor.send("\x03\nq\n")
                         return [ 4, outputText, execTime]
                     time.sleep(0.1)
                     waitTime = waitTime + 0.1
                     if waitTime >= waitTimeout:
-                        print("Error: command execution procedure has timed out while attempting to execute target command")
+                        logger.warning("Command execution procedure has timed out while attempting to execute target command")
                         break
                 while connectionCursor.recv_ready():
                     try:
                         execTime = time.time() - startTime
                         if ( execTime > execTimeout ):
-                            print("Error: command execution has timed out")
+                            logger.warning("Command execution has timed out")
                             connectionCursor.send("\x03\nq\n")
                             return [ 4, outputText, execTime]
                         connectionCursor.settimeout(readTimeout)
@@ -524,7 +551,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                         # print(outputChunk)
                         outputPage = outputPage + outputChunk
                     except:
-                        print("   Connection error: ", sys.exc_info()[0])
+                        logger.warning("Connection error: %s", sys.exc_info()[0])
                         # return None
             if protocol == "telnet":
                 terminalRead = 0
@@ -532,7 +559,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                     try:
                         execTime = time.time() - startTime
                         if ( execTime > execTimeout ):
-                            print("Error: command execution has timed out")
+                            logger.warning("Command execution has timed out")
                             connectionCursor.write(b"\x03\nq\n")
                             return [ 4, outputText, execTime]
                         terminalLine = ""
@@ -543,7 +570,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                         else:
                             outputPage = outputPage + terminalLine
                     except:
-                        print("   Connection error: ", sys.exc_info()[0])
+                        logger.warning("Connection error: %s", sys.exc_info()[0])
         
             # print("outputPage: \"" + outputPage + "\"")
             outputStream = outputStream + outputPage
@@ -572,7 +599,7 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
                     connectionCursor.send("\x03\nq\n")
                 if protocol == "telnet":
                     connectionCursor.write(b"\x03\nq\n")
-                print("Error: output paging has timed out")
+                logger.warning("Output paging has timed out")
                 return [ 5, outputText, execTime]
                     
             # print(outputStream)
@@ -620,6 +647,425 @@ def execCLICommand(connectionCursor, protocol, command, execTimeout):
 #####################################################################################################################################################
 
 
+#####################################################################################################################################################
+###########################################################        SQL statements         ###########################################################
+#####################################################################################################################################################
+# SQL statements are generated once per table (and set of columns) from core dictionaries and use "?" placeholders for all values,
+# so the text of every statement stays the same between rows and sqlite3 reuses already compiled statements from its cache
+SQLStatementsDict = {}
+
+def SQLStatementFunc(statement, table, whereColumns=[], setColumns=[], orderBy=""):
+    statementKey = (statement, table, tuple(whereColumns), tuple(setColumns), orderBy)
+    if statementKey in SQLStatementsDict:
+        return SQLStatementsDict[statementKey]
+
+    # Selecting columns dictionary matching the table
+    if re.match(r"^Nodes", table):
+        columnsDict = NodesDict
+    if re.match(r"^Interfaces", table):
+        columnsDict = InterfacesDict
+    if re.match(r"^Peering", table):
+        columnsDict = PeeringDict
+    if re.match(r"^SourceFiles", table):
+        columnsDict = SourceFilesDict
+
+    if statement == "SELECT":
+        DBQuery = "SELECT * FROM " + table
+    if statement == "INSERT":
+        # All columns are inserted unless specific set of columns is requested
+        if len(setColumns) == 0:
+            setColumns = list(columnsDict)
+        DBQuery = "INSERT INTO " + table + " (" + ", ".join(setColumns) + ") VALUES (" + ", ".join(["?"] * len(setColumns)) + ")"
+    if statement == "UPDATE":
+        DBQuery = "UPDATE " + table + " SET " + ", ".join(value + " = ?" for value in setColumns)
+    if statement == "DELETE":
+        DBQuery = "DELETE FROM " + table
+
+    if len(whereColumns) > 0:
+        DBQuery = DBQuery + " WHERE " + " AND ".join(value + " = ?" for value in whereColumns)
+    if orderBy != "":
+        DBQuery = DBQuery + " ORDER BY " + orderBy
+
+    SQLStatementsDict[statementKey] = DBQuery
+    return DBQuery
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
+
+
+#####################################################################################################################################################
+#########################################################       Section classifier        ###########################################################
+#####################################################################################################################################################
+# Commands which output is collected into separate sections of the input file, listed in the order of their priority: [section, description, command]
+sectionCommandsList = [
+    ["config", "config", r"sh(o(w)?)? +run(n(i(n(g(-(c(o(n(f(i(g)?)?)?)?)?)?)?)?)?)?)?"],                       # Cisco IOS/IOS-XE/IOS-XR
+    ["config", "config", r"dis(p(l(a(y)?)?)?)? +cur(r(e(n(t(-(c(o(n(f(i(g)?)?)?)?)?)?)?)?)?)?)?"],               # Huawei VRP
+    ["config", "config", r"adm(i|in)* +disp(l(a(y(-(c(o(n(f(i(g)?)?)?)?)?)?)?)?)?)?"],                             # ALU/Nokia SR-OS
+    ["PHYInterfaces", "PHY interface", r"sh(o(w)?)? +int(e(r(f(a(c(e)?)?)?)?)?)?"],                              # Cisco IOS/IOS-XE/IOS-XR
+    ["PHYInterfaces", "PHY interface", r"sh(o(w)?)? +inv(e(n(t(o(r(y)?)?)?)?)?)?"],                              # Cisco IOS/IOS-XE/IOS-XR
+    ["PHYInterfaces", "PHY interface", r"dis(p(l(a(y)?)?)?)? +int(e(r(f(a(c(e)?)?)?)?)?)?"],                     # Huawei VRP
+    ["PHYInterfaces", "PHY interface", r"sh(o(w)?)? +po(r(t)?)?"],                                               # ALU/Nokia SR-OS
+    ["IPInterfaces", "IP interfaces", r"sh(o(w)?)? +ip(v(4|6))? +int(e(r(f(a(c(e)?)?)?)?)?)?"],                  # Cisco IOS/IOS-XE/IOS-XR
+    ["IPInterfaces", "IP interfaces", r"dis(p(l(a(y)?)?)?)? +ip(v6)? +int(e(r(f(a(c(e)?)?)?)?)?)?"],             # Huawei VRP
+    ["IPInterfaces", "IP interfaces", r"sh(o(w)?)? +ro(u(t(e(r)?)?)?)? +int(e(r(f(a(c(e)?)?)?)?)?)? de(t(a(i(l)?)?)?)?"],   # ALU/Nokia SR-OS
+]
+
+# Expressions which do not depend on the CLI delimiter and translation table of escape symbols are compiled once
+pagingExpression = re.compile(r"(---- )|(--)More(--)|( ----)")
+versionExpressionCisco = re.compile(r'(#|>)[ ]*sh(o(w)?)? +ver(s(i(o(n)?)?)?)?')     # Cisco IOS/IOS-XE/IOS-XR, ALU/Nokia SR-OS
+versionExpressionHuawei = re.compile(r'(#|>)[ ]*dis(p(l(a(y)?)?)?)? +ver(s(i(o(n)?)?)?)?')    # Huawei VRP
+escapesTranslator = str.maketrans('', '', ''.join([chr(char) for char in range(1, 32)]))
+
+# Compiles all section commands prefixed by the CLI delimiter into a single alternation, so a prompt line is classified by one search.
+# The name of the matched group is "s" followed by the index of the command in sectionCommandsList.
+def sectionClassifierFunc(CLIDelimiter):
+    searchExpression = re.escape(CLIDelimiter) + "[ ]*(?:" + "|".join("(?P<s"+str(index)+">"+value[2]+")" for index, value in enumerate(sectionCommandsList)) + ")"
+    return re.compile(searchExpression)
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
+
+
+#####################################################################################################################################################
+#########################################################       Interface classifier        #########################################################
+#####################################################################################################################################################
+# Expressions recognizing interface classes by interface name for every CLI syntax
+interfaceExpressionsDict = {
+    "IOS-XR": {"SubIf": r'\.', "Port": r'([Gg]ig[Ee]|[Ee]thernet)', "Loopback": r"L|loopB|back", "LAG": r'B|bundle-E|ether'},
+    "IOS": {"SubIf": r'\.', "Port": r'([Gg]ig[Ee]|[Ee]thernet)', "Loopback": r"L|loopB|back", "LAG": r'P|port-C|Channel'},
+    "VRP": {"SubIf": r'\.', "Port": r'([Gg]ig[Ee]|[Ee]thernet)', "Virtual": r'[Vv]irtual', "LAG": r'^E|eth-T|trunk', "L2VPN": r'V|virtual-E|ethernet', "Tunnel": r'Tunnel'},
+    "SR-OS": {"Connector": r'.*/c[0-9]+$'},
+}
+interfaceExpressionsDict = {syntax: {name: re.compile(expression) for name, expression in expressions.items()} for syntax, expressions in interfaceExpressionsDict.items()}
+
+# Port types of physical ports are recognized by the first matching expression: [expression, port type]
+portTypesDict = {
+    "IOS-XR": [[r'[Hh]undred[Gg]ig(abit)?E', "100GE"], [r'[Tt]en[Gg]ig(abit)?E', "10GE"], [r'[Gg]igabit', "1GE"], [r'[Ff]ast', "100ME"]],
+    "IOS": [[r'[Hh]undred[Gg]ig(abit)?E', "100GE"], [r'[Tt]en[Gg]ig(abit)?E', "10GE"], [r'[Gg]igabit', "1GE"], [r'[Ff]ast', "100ME"]],
+    "VRP": [[r'[Hh]undred[Gg]igE', "100GE"], [r'[Tt]en[Gg]igE', "10GE"], [r'[Gg]igabit', "1GE"], [r'[Ff]ast', "100ME"]],
+}
+portTypesDict = {syntax: [[re.compile(value[0]), value[1]] for value in portTypes] for syntax, portTypes in portTypesDict.items()}
+
+# LAG ID is the part of the LAG name after this delimiter
+LAGIDDelimitersDict = {"IOS-XR": "ther", "IOS": "hannel", "VRP": "runk"}
+
+def portTypeFunc(CLISyntax, IfNameKey):
+    for value in portTypesDict[CLISyntax]:
+        if value[0].search(IfNameKey):
+            return value[1]
+    return ""
+
+# Class of an interface does not depend on numbers in its name, so all interfaces with the same name prefix (e.g. "GigabitEthernet0/0/0/0" and
+# "GigabitEthernet0/1/0/3") share one memoized result: [IfType, PortType, ServiceType, IfMode, PortName source, subinterface, LAG]
+@functools.lru_cache(maxsize=4096)
+def interfaceClassFunc(CLISyntax, IfNameKey):
+    expressions = interfaceExpressionsDict[CLISyntax]
+    IfType = PortType = ServiceType = IfMode = PortName = ""
+    subinterface = LAG = False
+
+    if CLISyntax == "IOS-XR":
+        if expressions["SubIf"].search(IfNameKey):
+            IfType, PortName, subinterface = "SubIf", "ParentIfName", True
+        elif expressions["Port"].search(IfNameKey):
+            IfType, PortName, PortType = "Port", "IfName", portTypeFunc(CLISyntax, IfNameKey)
+        if expressions["Loopback"].search(IfNameKey):
+            IfType = "Loopback"
+        if expressions["LAG"].search(IfNameKey):
+            IfType, PortName, LAG = "LAG", "IfName", True
+
+    if CLISyntax == "IOS":
+        if expressions["SubIf"].search(IfNameKey):
+            IfType, PortName, subinterface = "SubIf", "ParentIfName", True
+        else:
+            if expressions["Port"].search(IfNameKey):
+                IfType, PortName, PortType = "Port", "IfName", portTypeFunc(CLISyntax, IfNameKey)
+            if expressions["LAG"].search(IfNameKey):
+                IfType, PortName, LAG = "LAG", "IfName", True
+        if expressions["Loopback"].search(IfNameKey):
+            IfType = "Loopback"
+
+    if CLISyntax == "VRP":
+        if expressions["SubIf"].search(IfNameKey):
+            subinterface = True
+        else:
+            if ((expressions["Virtual"].search(IfNameKey) is None) and (expressions["Port"].search(IfNameKey))):
+                IfType, PortName, PortType = "Port", "IfName", portTypeFunc(CLISyntax, IfNameKey)
+        if expressions["LAG"].search(IfNameKey):
+            IfType, LAG = "LAG", True
+        if expressions["L2VPN"].search(IfNameKey):
+            ServiceType = "L2VPN"
+            if IfType == "":
+                IfType, IfMode = "L2VPN SAP", "Access"
+        if expressions["Tunnel"].search(IfNameKey):
+            IfType, IfMode = "RSVP Tunnel", "Network"
+
+    if CLISyntax == "SR-OS":
+        IfType = "Connector" if expressions["Connector"].search(IfNameKey) else "Port"
+
+    return (IfType, PortType, ServiceType, IfMode, PortName, subinterface, LAG)
+
+# Returns {column: value} of all InterfacesDict columns defined by the interface name: IfType, PortType, ParentIfName, PortName, LAGID, ServiceType
+# and IfMode. Columns which are not defined by the name are not returned.
+def interfaceClassifierFunc(CLISyntax, IfName):
+    return interfaceClassColumnsFunc(CLISyntax, IfName, interfaceClassFunc(CLISyntax, re.sub(r"[0-9]+", "0", IfName)))
+
+def interfaceClassColumnsFunc(CLISyntax, IfName, interfaceClassValues):
+    IfType, PortType, ServiceType, IfMode, PortName, subinterface, LAG = interfaceClassValues
+    interfaceClass = {"IfType": IfType, "PortType": PortType, "ServiceType": ServiceType, "IfMode": IfMode}
+
+    if subinterface:
+        interfaceClass["ParentIfName"] = IfName.split(".")[0]
+    if PortName == "IfName":
+        interfaceClass["PortName"] = IfName
+    if PortName == "ParentIfName":
+        interfaceClass["PortName"] = IfName.split(".")[0]
+    if LAG:
+        interfaceClass["LAGID"] = str(IfName.split(LAGIDDelimitersDict[CLISyntax])[1].split(".")[0])
+    return {column: value for column, value in interfaceClass.items() if value != ""}
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
+
+
+
+#####################################################################################################################################################
+#########################################################          Self test function        ########################################################
+#####################################################################################################################################################
+# Reference classes of interface names made by the per-syntax re.search chains used before the classifier, including subinterfaces and LAGs
+interfaceClassifierReferenceList = [
+    ["IOS-XR", "GigabitEthernet0/0/0/1", {"IfType": "Port", "PortType": "1GE", "PortName": "GigabitEthernet0/0/0/1"}],
+    ["IOS-XR", "GigabitEthernet0/0/0/5.300", {"IfType": "SubIf", "ParentIfName": "GigabitEthernet0/0/0/5", "PortName": "GigabitEthernet0/0/0/5"}],
+    ["IOS-XR", "TenGigE0/1/0/0", {"IfType": "Port", "PortType": "10GE", "PortName": "TenGigE0/1/0/0"}],
+    ["IOS-XR", "HundredGigE0/0/1/0", {"IfType": "Port", "PortType": "100GE", "PortName": "HundredGigE0/0/1/0"}],
+    ["IOS-XR", "FastEthernet0/0/0/2", {"IfType": "Port", "PortType": "100ME", "PortName": "FastEthernet0/0/0/2"}],
+    ["IOS-XR", "Loopback0", {"IfType": "Loopback"}],
+    ["IOS-XR", "Bundle-Ether10", {"IfType": "LAG", "PortName": "Bundle-Ether10", "LAGID": "10"}],
+    ["IOS-XR", "Bundle-Ether10.200", {"IfType": "LAG", "ParentIfName": "Bundle-Ether10", "PortName": "Bundle-Ether10.200", "LAGID": "10"}],
+    ["IOS-XR", "MgmtEth0/RSP0/CPU0/0", {}],
+    ["IOS-XR", "tunnel-te10", {}],
+    ["IOS", "GigabitEthernet0/0/1", {"IfType": "Port", "PortType": "1GE", "PortName": "GigabitEthernet0/0/1"}],
+    ["IOS", "GigabitEthernet0/0/0.100", {"IfType": "SubIf", "ParentIfName": "GigabitEthernet0/0/0", "PortName": "GigabitEthernet0/0/0"}],
+    ["IOS", "TenGigabitEthernet1/0/1", {"IfType": "Port", "PortType": "10GE", "PortName": "TenGigabitEthernet1/0/1"}],
+    ["IOS", "FastEthernet0/1", {"IfType": "Port", "PortType": "100ME", "PortName": "FastEthernet0/1"}],
+    ["IOS", "Port-channel5", {"IfType": "LAG", "PortName": "Port-channel5", "LAGID": "5"}],
+    ["IOS", "Port-channel5.10", {"IfType": "SubIf", "ParentIfName": "Port-channel5", "PortName": "Port-channel5"}],
+    ["IOS", "Loopback0", {"IfType": "Loopback"}],
+    ["IOS", "Vlan10", {}],
+    ["IOS", "BDI100", {}],
+    ["IOS", "Tunnel10", {}],
+    ["VRP", "GigabitEthernet0/0/1", {"IfType": "Port", "PortType": "1GE", "PortName": "GigabitEthernet0/0/1"}],
+    ["VRP", "GigabitEthernet0/0/1.100", {"ParentIfName": "GigabitEthernet0/0/1"}],
+    ["VRP", "100GE0/1/0", {}],
+    ["VRP", "XGigabitEthernet0/1/0", {"IfType": "Port", "PortType": "1GE", "PortName": "XGigabitEthernet0/1/0"}],
+    ["VRP", "Eth-Trunk1", {"IfType": "LAG", "LAGID": "1"}],
+    ["VRP", "Eth-Trunk1.100", {"IfType": "LAG", "ParentIfName": "Eth-Trunk1", "LAGID": "1"}],
+    ["VRP", "Virtual-Ethernet0/0/1", {"IfType": "L2VPN SAP", "ServiceType": "L2VPN", "IfMode": "Access"}],
+    ["VRP", "Virtual-Ethernet0/0/1.5", {"IfType": "L2VPN SAP", "ParentIfName": "Virtual-Ethernet0/0/1", "ServiceType": "L2VPN", "IfMode": "Access"}],
+    ["VRP", "Tunnel0/0/1", {"IfType": "RSVP Tunnel", "IfMode": "Network"}],
+    ["VRP", "LoopBack1", {}],
+    ["VRP", "NULL0", {}],
+    ["SR-OS", "1/1/1", {"IfType": "Port"}],
+    ["SR-OS", "1/1/c1", {"IfType": "Connector"}],
+    ["SR-OS", "1/1/c1/1", {"IfType": "Port"}],
+    ["SR-OS", "1/2/c12", {"IfType": "Connector"}],
+    ["SR-OS", "esat-1/1/1", {"IfType": "Port"}]
+]
+
+# Reference configs of every CLI syntax with the constructions where the tree depends on the rules of the engine: comments at different indentations,
+# less indented lines after deeper ones, banners with delimiter on separate lines or on the same line, banner lines indented as children and macros
+configEnginesReferenceDict = {
+    "IOS": """hostname R1
+!
+banner motd ^C
+ Authorized access only
+ ! not a comment
+^C
+banner login ^CSingle line banner^C
+banner exec #
+Exec banner
+#
+aaa authentication fail-message ^
+Login failed
+^
+interface GigabitEthernet0/0/1
+ description uplink
+ ip address 10.0.0.1 255.255.255.252
+ !
+interface GigabitEthernet0/0/1.100
+ encapsulation dot1Q 100
+  ! nested comment
+ service-policy input P1
+!
+macro name ACCESS
+ switchport mode access
+ spanning-tree portfast
+@
+router ospf 1
+ area 0
+   interface GigabitEthernet0/0/1
+ network 10.0.0.0 0.0.0.3 area 0
+  ! comment after a deeper line
+ passive-interface default
+line vty 0 4
+ transport input ssh
+end""",
+    "IOS-XR": """hostname XR1
+banner motd #
+Welcome to XR1
+#
+interface Bundle-Ether10
+ description core
+ ipv4 address 10.1.0.1 255.255.255.252
+!
+interface Bundle-Ether10.200 l2transport
+ encapsulation dot1q 200
+!
+router ospf CORE
+ area 0
+  interface Bundle-Ether10
+   cost 10
+  !
+ !
+!
+l2vpn
+ bridge group BG1
+  bridge-domain BD1
+   interface Bundle-Ether10.200
+   !
+   neighbor 10.0.0.2 pw-id 100
+   !
+end""",
+    "VRP": """#
+sysname VRP1
+#
+header shell information "Welcome to VRP1"
+#
+interface Eth-Trunk1
+ description to-core
+ mode lacp-static
+#
+interface GigabitEthernet0/0/1
+ eth-trunk 1
+#
+interface Eth-Trunk1.100
+ vlan-type dot1q 100
+ ip address 10.2.0.1 255.255.255.0
+#
+ospf 1 router-id 1.1.1.1
+ area 0.0.0.0
+  network 10.2.0.0 0.0.0.255
+#
+return""",
+    "SR-OS": """# TiMOS-C-20.10.R1
+    system
+        name "SR1"
+    exit
+    port 1/1/c1
+        connector
+            breakout c1-100g
+        exit
+        no shutdown
+    exit
+    lag 10
+        port 1/1/1
+    exit
+    router Base
+        interface "system"
+            address 10.3.0.1/32
+        exit
+        interface "to-core"
+            port 1/1/1:100
+        exit
+    exit
+    service
+        vprn 100 customer 1 create
+            interface "cust" create
+                sap lag-10:200 create
+                exit
+            exit
+        exit
+    exit
+exit all""",
+}
+configEnginesExpressionsList = [r"^interface", r"banner", r"^ *!", r"^ *#", r"port", r"^ +exit", r"@", r"."]
+
+# Every reference config is parsed by CiscoConfParse and by the native engine. Results of find_objects for reference expressions and parent, children
+# and re_search_children (direct and recursive) of every line must be the same. Returns number of failed checks.
+def configEnginesCheckFunc():
+    failedChecks = 0
+    for CLISyntax, config in configEnginesReferenceDict.items():
+        configLines = config.split("\n")
+        enginesResults = []
+        for cfg in [CiscoConfParse(configLines), NativeConfParse(configLines)]:
+            engineResults = []
+            for regex in configEnginesExpressionsList:
+                engineResults.append(["find_objects", regex, [[obj.linenum, obj.text] for obj in cfg.find_objects(regex)]])
+            for obj in cfg.find_objects(r"."):
+                engineResults.append(["parent", obj.linenum, obj.parent.linenum])
+                engineResults.append(["children", obj.linenum, [cobj.linenum for cobj in obj.children]])
+                for regex in configEnginesExpressionsList:
+                    engineResults.append(["re_search_children", obj.linenum, regex, [cobj.linenum for cobj in obj.re_search_children(regex)],
+                                          [cobj.linenum for cobj in obj.re_search_children(regex, recurse=True)]])
+            enginesResults.append(engineResults)
+        if enginesResults[0] != enginesResults[1]:
+            failedChecks = failedChecks + 1
+            # First different result is reported, or numbers of results if one list is a part of the other
+            mismatch = next(([result1, result2] for result1, result2 in zip(enginesResults[0], enginesResults[1]) if result1 != result2),
+                            [len(enginesResults[0]), len(enginesResults[1])])
+            logger.error("Config engines check failed for %s reference config: CiscoConfParse %s, native %s", CLISyntax, mismatch[0], mismatch[1])
+        elif debug: logger.debug("%s reference config: %s results of both engines are the same", CLISyntax, len(enginesResults[0]))
+    logger.info("Config engines: %s of %s reference config(s) passed", len(configEnginesReferenceDict) - failedChecks, len(configEnginesReferenceDict))
+    return failedChecks
+
+# Every reference name is classified by the memoized classifier and by the same logic without the cache and without collapsing digits of the name.
+# Both results must be equal to the reference class. Returns number of failed checks.
+def interfaceClassifierCheckFunc():
+    failedChecks = 0
+    for CLISyntax, IfName, referenceClass in interfaceClassifierReferenceList:
+        cachedClass = interfaceClassifierFunc(CLISyntax, IfName)
+        baselineClass = interfaceClassColumnsFunc(CLISyntax, IfName, interfaceClassFunc.__wrapped__(CLISyntax, IfName))
+        if debug: logger.debug("%s %s: cached %s, baseline %s", CLISyntax, IfName, cachedClass, baselineClass)
+        if ((cachedClass != referenceClass) or (baselineClass != referenceClass)):
+            failedChecks = failedChecks + 1
+            logger.error("Interface classifier check failed for %s %s: expected %s, cached %s, baseline %s", CLISyntax, IfName, referenceClass, cachedClass, baselineClass)
+    logger.info("Interface classifier: %s of %s check(s) passed, %s", len(interfaceClassifierReferenceList) - failedChecks, len(interfaceClassifierReferenceList), interfaceClassFunc.cache_info())
+    return failedChecks
+
+# Returns exit code: 0 if all checks are passed, 1 otherwise
+def selfTestFunc():
+    failedChecks = interfaceClassifierCheckFunc() + configEnginesCheckFunc()
+    return 0 if failedChecks == 0 else 1
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
+
+
+
+#####################################################################################################################################################
+#########################################################      Argument values function     #########################################################
+#####################################################################################################################################################
+# Options with values are looked up by their position in sys.argv, so a value equal to another argument (e.g. "--jobs 4 4") is not mixed up.
+
+# Returns value following the option at argumentNumber, exits with an error if the value is missing
+def argumentValueFunc(argumentNumber):
+    if argumentNumber + 1 >= len(sys.argv):
+        logger.error("Missing value of \"%s\" argument, print -h for help.", sys.argv[argumentNumber])
+        sys.exit(1)
+    return sys.argv[argumentNumber + 1]
+
+# Returns positive integer value following the option at argumentNumber, exits with the error message if it is not a positive integer
+def positiveArgumentFunc(argumentNumber, errorMessage):
+    value = argumentValueFunc(argumentNumber)
+    if (not value.isdigit()) or (int(value) < 1):
+        logger.error(errorMessage)
+        sys.exit(1)
+    return int(value)
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
+
+
+
 #####################################################################################################################################################
 ###########################################################      Print help function      ###########################################################
 #####################################################################################################################################################
@@ -634,6 +1080,24 @@ There are several actions available:
 
     -h|--help       Print help
 
+    -t|--test       Check built-in components against reference data
+
+            Interface classifier is checked on reference interface names of every CLI syntax, including subinterfaces and LAGs: memoized results
+            must be the same as the results of uncached classification. Native config engine ("--native") is checked on reference configurations
+            of every CLI syntax, including banners, macros and comments: its trees must be the same as CiscoConfParse ones. Exit code is 0 if all
+            checks are passed and 1 otherwise.
+
+    [--quiet|-v|-vv] [--log-file {filename}] [--batch] [--report {filename}]
+
+            Optional logging arguments accepted by all actions. "--quiet" prints warnings and errors only, "-v" adds debugging messages and pauses
+            after every processed file, "-vv" adds raw SQL requests as well. "--log-file" also writes messages with timestamps into a specified file.
+
+            Use "--batch" for unattended runs (cron, CI): script never waits for user input, files which can not be parsed are skipped without a
+            pause and collection takes passwords from CONFPARSER_PASSWORD and CONFPARSER_ENABLE_PASSWORD environment variables. Skipped or failed
+            files/nodes are saved with reason codes into a JSON report ("--report" or next to the output database/directory by default). Exit
+            code is 0 if everything is processed, 2 on partial failure and 1 if everything failed, the run is interrupted or arguments, input
+            paths or database are not valid.
+
     
     -c|--collect    {login} {IPv4 addresses list/file} {output directory name} [recursive] [number of streams]
 
@@ -657,9 +1121,10 @@ There are several actions available:
             Use "recursive" to dynamically add all detected neighbors (from config file, network interfaces, LSDB etc.) to management address list.
 
             To execute collection over multiple addresses in parallel issue "number of streams" argument in range from 2 to 100. If it is not
-            specified collection will work consecutively.
+            specified collection will work consecutively. A failure on one node does not stop the others, per-node results are printed in a
+            summary at the end of collection.
 
-    -p|--parse      {input directory/directory+filename} {output database directory+name} [default CLI syntax] [clean]
+    -p|--parse      {input directory/directory+filename} {output database directory+name} [default CLI syntax] [clean] [--jobs N] [--commit-every N] [--force] [--native]
 
             Parse manually collected show outputs into a SQLite database. Specify either a path to single config file or a path to directory with
             multiple config/show files. Output database must be specified as well.
@@ -667,6 +1132,19 @@ There are several actions available:
             To save input data recognized and filtered by script into a separate files use optional "clean" argument. These files will be stored in
             ./clean_input directory.
 
+            To parse multiple files in parallel use optional "--jobs N" argument, where N is a number of worker processes (e.g. number of CPU cores).
+            Files are parsed in worker processes while all database updates are still made by a single writer.
+
+            All database changes of a node are made in a single transaction. To commit several nodes at once on large directories use optional
+            "--commit-every N" argument, where N is a number of nodes per commit (1 by default).
+
+            Files which size, modification time or content are not changed since their last successful parse into the same database are skipped.
+            To parse all specified files anyway use optional "--force" argument.
+
+            Configurations are parsed with CiscoConfParse library by default. To use a faster built-in engine use optional "--native" argument.
+            It builds configuration tree by the same rules as CiscoConfParse (including banners and macros), both engines are compared on
+            reference configurations of every CLI syntax by "-t" self test.
+
             Each node must use separate input file containing output of the following commands (* marks required data):
             > Cisco IOS/IOS-XE, IOS-XR:
                 - *show version - used to recognize SW version and CLI syntax
@@ -694,14 +1172,27 @@ There are several actions available:
             default syntax: """+", ".join(str(k) for k,v in SyntaxDict.items() if k != "Hist")+
     """
 
-    -o|--output     {database dir+name} {output dir+filename} [target CLI syntax]
+    -o|--output     {database dir+name} {output dir+filename} [target CLI syntax] [--xlsx-streaming] [--host GLOB] [--syntax SYNTAX] [--if-type TYPE]
+                    [--since TIME] [--until TIME]
 
-            Print data from database to .csv or .xlsx file (file extension must be specified). Data with specified target CLI syntax is considered
-            a destination configuration (e.g. for a node swap/replacement), while data related to all other syntaxes - is a source config. If no
-            target CLI syntax specified all config/data is cosidered source. Source config/data will be displayed on the left side (table) of output
+            Print data from database to .csv, .xlsx or .jsonl file (file extension must be specified). Data with specified target CLI syntax is
+            considered a destination configuration (e.g. for a node swap/replacement), while data related to all other syntaxes - is a source config.
+            If no target CLI syntax specified all config/data is cosidered source. Source config/data will be displayed on the left side (table) of output
             file, and destination config/data - on the right side (table).
 
             Supported target CLI syntax keys are: """+", ".join(str(k) for k,v in SyntaxDict.items() if k != "Hist")+"""
+
+            CSV output is written row by row as data is read from database. XLSX output is built in memory by default, to write large XLSX files
+            row by row as well use optional "--xlsx-streaming" argument. Sheets longer than Excel row limit are continued on additional sheets.
+
+            JSON Lines output (.jsonl or .ndjson) is written row by row with one JSON object per line for every node, interface and peering, keyed
+            by database column names. Multi-value interface fields (VLAN, IPv4/IPv6 addresses and subnets) are written as arrays.
+
+            To print only a part of database use optional filter arguments, all specified filters must match:
+                - "--host GLOB" - hostname matching case-sensitive pattern with "*" and "?" wildcards (e.g. "MSK-*")
+                - "--syntax SYNTAX" - source data of specified CLI syntax only (target CLI syntax data is not filtered by it)
+                - "--if-type TYPE" - interfaces of specified type only (e.g. "Port" matches "Port", "Port|L3" etc.)
+                - "--since TIME", "--until TIME" - data updated at or after / before specified time, given as YYYY-MM-DD or "YYYY-MM-DD HH:MM:SS"
     """)
 #####################################################################################################################################################
 #####################################################################################################################################################
@@ -713,2144 +1204,2799 @@ There are several actions available:
 
 
 #####################################################################################################################################################
-###########################################################        Parse function         ###########################################################
+###########################################################        Pause function         ###########################################################
+#####################################################################################################################################################
+def pauseFunc(message):
+    # Worker processes have no terminal attached and batch mode never waits, so they only print the message instead of waiting for a key press
+    if ((batchMode) or (multiprocessing.current_process().name != "MainProcess")):
+        logger.info(message)
+    else:
+        input(message)
+#####################################################################################################################################################
+#####################################################################################################################################################
 #####################################################################################################################################################
-def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
-    print("Parsing...\r\n")
 
-    outputCursor = outputDB.cursor()
 
-    for showFilePath in inputFiles: # Select new file to parse
-        if debug: print("debug: Reading file "+str(showFilePath))
-        showFileContent = open(showFilePath,"r",newline ='\r')
-        showFileLines = showFileContent.readlines()
-        lineNumber = 0
-        nextFile = 0
-        redirectOutputTo = "default"
-        CLIDelimiter = ""
-
-        versionLines = []                   # Extracted version output lines from input file
-        configLines = []                    # Extracted configuration output lines from input file
-        configLines2 = []                 # Extracted configuration output lines from input file when inpur file is a config file only
-        PHYInterfacesLines = []             # Extracted physical interface output lines from input file
-        IPInterfacesLines = []              # Extracted IPv4/IPv6 interface output lines from input file
-        MPLSInterfacesLines = []            # Extracted MPLS/LDP/RSVP interface output lines from input file
-        CDPNeighborsLines = []              # Extracted CDP neighbors output lines from input file
-        LLDPNeighborsLines = []             # Extracted LLDP neighbors output lines from input file
-        BFDNeighborsLines = []              # Extracted BFD neighbors output lines from input file
-        OSPFv2NeighborsLines = []           # Extracted OSPFv2 neighbors output lines from input file
-        OSPFv2LSDBLines = []                # Extracted OSPFv2 LSDB output lines from input file
-        OSPFv3NeighborsLines = []           # Extracted OSPFv3 neighbors output lines from input file
-        OSPFv3LSDBLines = []                # Extracted OSPFv3 LSDB output lines from input file
-        ISISNeighborsLines = []             # Extracted IS-IS neighbors output lines from input file
-        ISISLSDBLines = []                  # Extracted IS-IS LSDB output lines from input file
-        LDPNeighborsLines = []              # Extracted LDP neighbors output lines from input file
-        RSVPNeighborsLines = []             # Extracted RSVP neighbors output lines from input file
-        BGPNeighborsLines = []              # Extracted BGP neighbors output lines from input file
-        L3VPNServiceLines = []              # Extracted L3VPNs output lines from input file
-        L2VPNServiceLines = []              # Extracted L2VPNs output lines from input file
-        VPLSServiceLines = []               # Extracted VPLS output lines from input file
-
-        for line in showFileLines:
-            lineNumber = lineNumber + 1
-            
-            # if debug: print(line)
-
-            # Remove paging from log (Cisco/Huawei)
-            if re.search(r"(---- )|(--)More(--)|( ----)",line):
-                # Huawei
-                line = line.replace("  ---- More ----[42D                                          [42D","")
-                # Cisco IOS-XR
-                line = line.replace("[K --More--           [K","")
-                # Cisco IOS
-                line = line.replace(" --More--         ","")
-
-            # Remove aux symbols from Putty log
-            # line = line.replace("\x00\r","") # NULCR
-            # line = line.replace("\x00","") # NUL
-            # line = line.replace("","") # BS
-            # line = line.replace("","") # BEL
-            line = line.replace("[1C ","") # [1D
-            line = line.replace("[1Cr","") # [1D
-            line = line.replace("[1C","") # [1D
-            line = line.replace("[1D ","") # [1D
-            line = line.replace("[1Dr","") # [1D
-            line = line.replace("[1D","") # [1D
-            line = line.replace("[2D ","") # [2D
-            line = line.replace("[2Dr","") # [2D
-            line = line.replace("[2D","") # [2D
-
-
-            # Remove paging from log (Nokia)
-            if re.search(r"(---- )|(--)More(--)|( ----)",line):
-                # Nokia
-                line = line.replace("Press any key to continue (Q to quit)                                      \r","")
-
-            # Remove right spacing and escape symbols
-            line = line.rstrip()
-            line = line.replace("\t","    ")                                   # Replace tabulation to four spaces
-            escapes = ''.join([chr(char) for char in range(1, 32)])
-            translator = str.maketrans('', '', escapes)
-            line = line.translate(translator)
-            
-            # if debug: print(line)
-
-            # if debug: 
-            #     if re.search(r'(N|n)o',input("Press any key to do for the next interface, or \"no\" to stop:\r\n")):
-            #         print("Stopping parsing")
-            #         sys.exit()
-
-            # Match version output
-            # Syntax: Cisco IOS/IOS-XE/IOS-XR, ALU/Nokia SR-OS
-            if re.search(r'(#|>)[ ]*sh(o(w)?)? +ver(s(i(o(n)?)?)?)?',line):
-                if redirectOutputTo != "version":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found version output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "version"
-                versionLines.append(line)
-                if re.search(r'>',line):
-                    CLIDelimiter = line.split(">")[0]+">"
-                else:
-                    if re.search(r'#',line):
-                        CLIDelimiter = line.split("#")[0]+"#"
-                if CLIDelimiter != "":
-                    print("Found CLI delimiter beginning at line "+str(lineNumber)+": "+CLIDelimiter)
-                    continue
-                # else:
-                #     print("Could not find CLI delimiter in file "+str(showFilePath))
-                #     break
 
-            # Syntax: Huawei VRP
-            if re.search(r'(#|>)[ ]*dis(p(l(a(y)?)?)?)? +ver(s(i(o(n)?)?)?)?',line):
-                if redirectOutputTo != "version":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found version output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "version"
-                versionLines.append(line)
-                if re.search(r'>',line):
-                    CLIDelimiter = line.split(">")[0]+">"
-                else:
-                    if re.search(r'#',line):
-                        CLIDelimiter = line.split("#")[0]+"#"
-                if CLIDelimiter != "":
-                    print("Found CLI delimiter beginning at line "+str(lineNumber)+": "+CLIDelimiter)
-                    continue
-                else:
-                    print("Could not find CLI delimiter in file "+str(showFilePath))
-                    break
+#####################################################################################################################################################
+###########################################################        Logging function       ###########################################################
+#####################################################################################################################################################
+# Console keeps the plain output of the script: informational messages are printed as is, other levels are prefixed with the level name
+class ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        if record.levelno == logging.INFO:
+            return record.getMessage()
+        return record.levelname.lower()+": "+record.getMessage()
+
+# Messages are formatted lazily by logging module, so they are only built when their level is enabled. Debug messages in per-line and per-interface
+# loops are additionally guarded by "debug" and "debugSQL" flags set here, so disabled debug costs a single flag check only.
+# verbosity is -1 for "--quiet" (warnings and errors only), 0 by default, 1 for "-v" (debug messages) and 2 for "-vv" (debug and SQL messages)
+def loggingSetupFunc(verbosity,logFilePath):
+    global debug, debugSQL, loggingArgs
+    loggingArgs = (verbosity, logFilePath)
+    logger.setLevel(logging.WARNING if verbosity < 0 else logging.INFO if verbosity == 0 else logging.DEBUG)
+    logger.handlers = []
+    consoleHandler = logging.StreamHandler(sys.stdout)
+    consoleHandler.setFormatter(ConsoleFormatter())
+    logger.addHandler(consoleHandler)
+    if logFilePath != "":
+        fileHandler = logging.FileHandler(logFilePath)
+        fileHandler.setFormatter(logging.Formatter("%(asctime)s %(processName)s %(levelname)s: %(message)s"))
+        logger.addHandler(fileHandler)
+    logger.propagate = False
+    debug = logger.isEnabledFor(logging.DEBUG)
+    debugSQL = verbosity >= 2
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-            if defaultCLISyntax != "":
-                configLines2.append(line)
-
-            # Match configuration output
-            # Syntax: Cisco IOS/IOS-XE/Cisco IOS-XR
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*sh(o(w)?)? +run(n(i(n(g(-(c(o(n(f(i(g)?)?)?)?)?)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "config":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found config output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "config"
-                configLines.append(line)
-                continue
-            # Syntax: Huawei VRP
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*dis(p(l(a(y)?)?)?)? +cur(r(e(n(t(-(c(o(n(f(i(g)?)?)?)?)?)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "config":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found config output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "config"
-                configLines.append(line)
-                continue
-            # Syntax: ALU/Nokia SR-OS
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*adm(i|in)* +disp(l(a(y(-(c(o(n(f(i(g)?)?)?)?)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "config":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found config output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "config"
-                configLines.append(line)
-                continue
 
-            # Match PHY interface output
-            # Syntax: Cisco IOS/IOS-XE/Cisco IOS-XR
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*sh(o(w)?)? +int(e(r(f(a(c(e)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "PHYInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found PHY interface output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "PHYInterfaces"
-                PHYInterfacesLines.append(line)
-                continue
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*sh(o(w)?)? +inv(e(n(t(o(r(y)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "PHYInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found PHY interface output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "PHYInterfaces"
-                PHYInterfacesLines.append(line)
-                continue
-            # Syntax: Huawei VRP
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*dis(p(l(a(y)?)?)?)? +int(e(r(f(a(c(e)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "PHYInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found PHY interface output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "PHYInterfaces"
-                PHYInterfacesLines.append(line)
-                continue
-            # searchExpression = r""+re.escape(CLIDelimiter)+
-            # if re.search(r'(#|>)[ ]*dis(p(l(a(y)?)?)?)? +int(e(r(f(a(c(e)?)?)?)?)?)? +ph(y(-(o(p(t(i(o(n)?)?)?)?)?)?)?)?',line):
-            #     if debug: print("debug: Found PHY interface output beginning at line "+str(lineNumber)+": "+line)
-            #     redirectOutputTo = "PHYInterfaces"
-            #     PHYInterfacesLines.append(line)
-            #     continue
-            # Syntax: ALU/Nokia SR-OS
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*sh(o(w)?)? +po(r(t)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "PHYInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found PHY interface output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "PHYInterfaces"
-                PHYInterfacesLines.append(line)
-                continue
-            # searchExpression = r""+re.escape(CLIDelimiter)+
-            # if re.search(r'(#|>)[ ]*sh(o(w)?)? +po(r(t)?)? +(esat-)?[0-9]{1,2}/[0-9]{1,2}/(c)?[0-9]{1,2}(/(u)?[0-9]{1,2})?( +o(p(t(i(c(a(l)?)?)?)?)?)?)?',line):
-            #     if debug: print("debug: Found PHY interface output beginning at line "+str(lineNumber)+": "+line)
-            #     redirectOutputTo = "PHYInterfaces"
-            #     PHYInterfacesLines.append(line)
-            #     continue
-
-
-            # Match IPv4/v6 interface output
-            # Syntax: Cisco IOS/IOS-XE/IOS-XR
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*sh(o(w)?)? +ip(v(4|6))? +int(e(r(f(a(c(e)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "IPInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found IP interfaces output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "IPInterfaces"
-                IPInterfacesLines.append(line)
-                continue
-            # Syntax: Huawei VRP
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*dis(p(l(a(y)?)?)?)? +ip(v6)? +int(e(r(f(a(c(e)?)?)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "IPInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found IP interfaces output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "IPInterfaces"
-                IPInterfacesLines.append(line)
-                continue
-            # Syntax: ALU/Nokia SR-OS
-            searchExpression = r""+re.escape(CLIDelimiter)+"[ ]*sh(o(w)?)? +ro(u(t(e(r)?)?)?)? +int(e(r(f(a(c(e)?)?)?)?)?)? de(t(a(i(l)?)?)?)?"
-            if re.search(searchExpression,line):
-                if redirectOutputTo != "IPInterfaces":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                if debug: print("debug: Found IP interfaces output beginning at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "IPInterfaces"
-                IPInterfacesLines.append(line)
-                continue
 
-            # Match unknown command output
-            # Syntax: all
-            searchExpression = r"^"+re.escape(CLIDelimiter)
-            if re.search(searchExpression,line):
-                # if debug: print("debug: Found unknown output beginning at line "+str(lineNumber)+": "+line)
-                if redirectOutputTo != "default":
-                    if debug: print("debug: "+ redirectOutputTo +" output ends at line "+str(lineNumber)+": "+line)
-                redirectOutputTo = "default"
-                continue
+#####################################################################################################################################################
+###########################################################      Batch report function      #########################################################
+#####################################################################################################################################################
+# Saves summary of a batch run into a JSON report and returns exit code of the script: 0 if all files/nodes are processed, 2 on partial failure and
+# 1 if all of them failed or the run was interrupted
+def batchReportFunc(reportPath,report):
+    report["finished"] = str(datetime.datetime.today())
+    try:
+        with open(reportPath,"w") as reportFile:
+            json.dump(report, reportFile, indent=4)
+        logger.info("Batch report saved to %s", reportPath)
+    except OSError as e:
+        logger.error("Could not save batch report to %s: %s", reportPath, e)
+
+    if len(report["failed"]) > 0:
+        logger.warning("%s of %s item(s) failed, see batch report for details.", len(report["failed"]), report["total"])
+    if ((report["interrupted"]) or ((len(report["failed"]) > 0) and (report["succeeded"] == 0) and (report["unchanged"] == 0))):
+        return 1
+    if len(report["failed"]) > 0:
+        return 2
+    return 0
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
 
-            # Redirect already classified output to appropriate list
-            if redirectOutputTo == "version":
-                versionLines.append(line)
-                # if debug: print("version: "+str(lineNumber)+": "+line)
-                continue
-            if redirectOutputTo == "config":
-                configLines.append(line)
-                continue
-            if redirectOutputTo == "PHYInterfaces":
-                PHYInterfacesLines.append(line)
-                continue
-            if redirectOutputTo == "IPInterfaces":
-                IPInterfacesLines.append(line)
-                continue
-            if redirectOutputTo == "MPLSInterfaces":
-                MPLSInterfacesLines.append(line)
-                continue
-            if redirectOutputTo == "CDPNeighbors":
-                CDPNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "LLDPNeighbors":
-                LLDPNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "BFDNeighbors":
-                BFDNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "OSPFv2Neighbors":
-                OSPFv2NeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "OSPFv2LSDB":
-                OSPFv2LSDBLines.append(line)
-                continue
-            if redirectOutputTo == "OSPFv3Neighbors":
-                OSPFv3NeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "OSPFv3LSDB":
-                OSPFv3LSDBLines.append(line)
-                continue
-            if redirectOutputTo == "ISISNeighbors":
-                ISISNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "ISISLSDB":
-                ISISLSDBLines.append(line)
-                continue
-            if redirectOutputTo == "LDPNeighbors":
-                LDPNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "RSVPNeighbors":
-                RSVPNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "BGPNeighbors":
-                BGPNeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "L3VPNService":
-                L3VPNServiceLines.append(line)
-                continue
-            if redirectOutputTo == "L2VPNService":
-                L2VPNServiceLines.append(line)
-                continue
-            if redirectOutputTo == "VPLSService":
-                VPLSServiceLines.append(line)
-                continue
-            if redirectOutputTo == "OSPFv2Neighbors":
-                OSPFv2NeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "OSPFv3Neighbors":
-                OSPFv3NeighborsLines.append(line)
-                continue
-            if redirectOutputTo == "BGPNeighbors":
-                BGPNeighborsLines.append(line)
-                continue
 
-        if debug: input("Input file processed. Press any key proceed.\r\n")
+#####################################################################################################################################################
+#######################################################        DB structure function        #########################################################
+#####################################################################################################################################################
+# Creates all tables and indexes if they are missing, so databases created by previous script runs get new indexes as soon as they are opened
+def createDBStructureFunc(DB):
+    DBCursor = DB.cursor()
+
+    # Creating Nodes table
+    DBQuery="""CREATE TABLE IF NOT EXISTS Nodes (\n"""
+    for value1 in NodesDict:
+        DBQuery = DBQuery + "\t\t" + str(value1) + " " + str(NodesDict[value1][1]) + "\n"
+    DBQuery = DBQuery + "\t\t, PRIMARY KEY(NodeID)\n"
+    DBQuery = DBQuery + "\t\t)\n"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DB.commit()
+
+    # Creating historical Interfaces table
+    DBQuery="""CREATE TABLE IF NOT EXISTS Interfaces"""+str(SyntaxDict["Hist"])+""" (\n"""
+    for value2 in InterfacesDict:
+        DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(InterfacesDict[value2][1]) + "\n"
+    DBQuery = DBQuery + "\t\t)\n"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DB.commit()
+
+    # Creating historical Peering table
+    DBQuery="""CREATE TABLE IF NOT EXISTS Peering"""+str(SyntaxDict["Hist"])+""" (\n"""
+    for value2 in PeeringDict:
+        DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(PeeringDict[value2][1]) + "\n"
+    DBQuery = DBQuery + "\t\t)\n"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DB.commit()
+
+    # Creating set of tables for each CLI syntax recognized by script
+    for value1 in SyntaxDict:
 
-        # # if debug: print("debug: Printing versionLines\r\n"+str(versionLines))
-        # if debug: print("debug: Printing configLinesToParser\r\n"+str(configLinesToParser))
-        # if debug: print("debug: Printing PHYInterfacesLines\r\n"+str(PHYInterfacesLines))
-        # if debug: print("debug: Printing IPInterfacesLines\r\n"+str(IPInterfacesLines))
-        # if debug: print("debug: Printing MPLSInterfacesLines\r\n"+str(MPLSInterfacesLines))
-        # if debug: print("debug: Printing CDPNeighborsLines\r\n"+str(CDPNeighborsLines))
-        # if debug: print("debug: Printing LLDPNeighborsLines\r\n"+str(LLDPNeighborsLines))
-        # if debug: print("debug: Printing BFDNeighborsLines\r\n"+str(BFDNeighborsLines))
-        # if debug: print("debug: Printing OSPFv2NeighborsLines\r\n"+str(OSPFv2NeighborsLines))
-        # if debug: print("debug: Printing OSPFv2LSDBLines\r\n"+str(OSPFv2LSDBLines))
-        # if debug: print("debug: Printing OSPFv3NeighborsLines\r\n"+str(OSPFv3NeighborsLines))
-        # if debug: print("debug: Printing OSPFv3LSDBLines\r\n"+str(OSPFv3LSDBLines))
-        # if debug: print("debug: Printing ISISNeighborsLines\r\n"+str(ISISNeighborsLines))
-        # if debug: print("debug: Printing ISISLSDBLines\r\n"+str(ISISLSDBLines))
-        # if debug: print("debug: Printing LDPNeighborsLines\r\n"+str(LDPNeighborsLines))
-        # if debug: print("debug: Printing RSVPNeighborsLines\r\n"+str(RSVPNeighborsLines))
-        # if debug: print("debug: Printing BGPNeighborsLines\r\n"+str(BGPNeighborsLines))
-        # if debug: print("debug: Printing L3VPNServiceLines\r\n"+str(L3VPNServiceLines))
-        # if debug: print("debug: Printing L2VPNServiceLines\r\n"+str(L2VPNServiceLines))
-        # if debug: print("debug: Printing VPLSServiceLines\r\n"+str(VPLSServiceLines))
-        # if debug: print("debug: Printing OSPFv2NeighborsLines\r\n"+str(OSPFv2NeighborsLines))
-        # if debug: print("debug: Printing OSPFv3NeighborsLines\r\n"+str(OSPFv3NeighborsLines))
-        # if debug: print("debug: Printing BGPNeighborsLines\r\n"+str(BGPNeighborsLines))
-
-        CLISyntax = ""                  # Stores CLI syntax for correct parsing and matching
-        SWDescr = ""                    # Stores SW description line from show|display version
-        SysAddr = ""                    # Stores system/loopback0 address
-
-        # print("1111: len(versionLines) = "+str(len(versionLines)))
-        print(versionLines)
-        if len(versionLines) == 0:
-            if defaultCLISyntax != "":
-                print("Could not determine parsing syntax in file "+showFilePath+", using default one specified")
-                CLISyntax = defaultCLISyntax
-                # if len(configLines) == 0:
-                configLines = configLines2
+        if value1 == "Hist": continue
+
+        # Creating multiple Interfaces tables
+        DBQuery="""CREATE TABLE IF NOT EXISTS Interfaces"""+str(SyntaxDict[value1])+""" (\n"""
+        for value2 in InterfacesDict:
+            DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(InterfacesDict[value2][1]) + "\n"
+        DBQuery = DBQuery + "\t\t, PRIMARY KEY(IfID)\n"
+        DBQuery = DBQuery + "\t\t)\n"
+        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+        DBCursor.execute(DBQuery)
+        DB.commit()
+
+        # Creating multiple Peering tables
+        DBQuery="""CREATE TABLE IF NOT EXISTS Peering"""+str(SyntaxDict[value1])+""" (\n"""
+        for value2 in PeeringDict:
+            DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(PeeringDict[value2][1]) + "\n"
+        DBQuery = DBQuery + "\t\t, PRIMARY KEY(PeeringID)\n"
+        DBQuery = DBQuery + "\t\t)\n"
+        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+        DBCursor.execute(DBQuery)
+        DB.commit()
+
+        # Creating multiple Routing tables - TBD
+
+    # Creating SourceFiles table with the state of input files at their last successful parse
+    # (table with other columns is created by earlier script versions, it is only a cache, so it is recreated and all files are parsed again once)
+    DBCursor.execute("PRAGMA table_info(SourceFiles)")
+    SourceFilesColumns = [value[1] for value in DBCursor.fetchall()]
+    if ((len(SourceFilesColumns) > 0) and (SourceFilesColumns != list(SourceFilesDict))):
+        DBQuery = "DROP TABLE SourceFiles"
+        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+        DBCursor.execute(DBQuery)
+    DBQuery="""CREATE TABLE IF NOT EXISTS SourceFiles (\n"""
+    for value1 in SourceFilesDict:
+        DBQuery = DBQuery + "\t\t" + str(value1) + " " + str(SourceFilesDict[value1][1]) + "\n"
+    DBQuery = DBQuery + "\t\t, PRIMARY KEY(SourceFile)\n"
+    DBQuery = DBQuery + "\t\t)\n"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DB.commit()
+
+    # Creating indexes for all columns used to filter and sort interfaces and peerings
+    for value1 in SyntaxDict:
+        for value2 in [ ["Interfaces", "IfNumber"], ["Peering", "PeeringType"] ]:
+            DBTable = value2[0] + str(SyntaxDict[value1])
+            for DBIndex in [ ["Hostname"], ["NodeID"], ["Hostname", "CLISyntax", value2[1]], ["LastUpdatedTime"] ]:
+                DBQuery = "CREATE INDEX IF NOT EXISTS " + DBTable + "_" + "_".join(DBIndex) + " ON " + DBTable + " (" + ", ".join(DBIndex) + ")"
+                if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                DBCursor.execute(DBQuery)
+
+            # Creating index for CLI syntax of historical data only, all other tables hold data of a single syntax and are skipped by output
+            # functions instead of being filtered (index is removed from databases created by earlier script versions)
+            if value1 == "Hist":
+                DBQuery = "CREATE INDEX IF NOT EXISTS " + DBTable + "_CLISyntax ON " + DBTable + " (CLISyntax)"
             else:
-                input("Could not determine parsing syntax in file "+showFilePath+" and no default syntax specified, press any key to skip to the next file\r\n")
-                continue
+                DBQuery = "DROP INDEX IF EXISTS " + DBTable + "_CLISyntax"
+            if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+            DBCursor.execute(DBQuery)
+
+        # Creating index for LAG membership, so member ports of a LAG are found by LAGID of the port records
+        DBTable = "Interfaces" + str(SyntaxDict[value1])
+        DBQuery = "CREATE INDEX IF NOT EXISTS " + DBTable + "_NodeID_LAGID ON " + DBTable + " (NodeID, LAGID)"
+        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+        DBCursor.execute(DBQuery)
+
+        # Creating index for IfID of historical interfaces, in all other Interfaces tables IfID is the primary key and is indexed already
+        # (IfID index duplicating the primary key index is removed from databases created by earlier script versions)
+        if value1 == "Hist":
+            DBQuery = "CREATE INDEX IF NOT EXISTS " + DBTable + "_IfID ON " + DBTable + " (IfID)"
         else:
-            for obj2 in versionLines:       # Determine configuration syntax
-                searchExpression = r'.*Cisco IOS XR'
-                if re.match(searchExpression,obj2):
-                    SWDescr = obj2
-                    CLISyntax = "IOS-XR"
-                    break
-                searchExpression = r'.*Cisco IOS(-| XE)? '
-                if re.match(searchExpression,obj2):
-                    SWDescr = obj2
-                    CLISyntax = "IOS"
-                    break
-                searchExpression = r'.*VRP \(R\) software'
-                if re.match(searchExpression,obj2):
-                    SWDescr = obj2
-                    CLISyntax = "VRP"
-                    break          
-                searchExpression = r'.*TiMOS-'
-                if re.match(searchExpression,obj2):
-                    SWDescr = obj2
-                    CLISyntax = "SR-OS"
-                    break
-            
-            SWDescr = SWDescr.replace("#","")
-            SWDescr = SWDescr.replace("!","")
-            SWDescr = SWDescr.rstrip()
-            SWDescr = SWDescr.lstrip()
-            print("Found following software description: "+SWDescr)
-
-            if CLISyntax == "":
-                input("Could not determine parsing syntax in file "+showFilePath+" and no default syntax specified, press any key to skip to the next file\r\n")
-                continue
-
-        print("Using following parsing syntax for this node: "+CLISyntax)
+            DBQuery = "DROP INDEX IF EXISTS " + DBTable + "_IfID"
+        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+        DBCursor.execute(DBQuery)
+
+        # Creating index for interface type, so output can be filtered by it
+        DBQuery = "CREATE INDEX IF NOT EXISTS " + DBTable + "_IfType ON " + DBTable + " (IfType)"
+        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+        DBCursor.execute(DBQuery)
+
+    DBQuery = "CREATE INDEX IF NOT EXISTS Nodes_Hostname_CLISyntax ON Nodes (Hostname, CLISyntax)"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DBQuery = "CREATE INDEX IF NOT EXISTS Nodes_CLISyntax ON Nodes (CLISyntax)"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DBQuery = "CREATE INDEX IF NOT EXISTS Nodes_LastUpdatedTime ON Nodes (LastUpdatedTime)"
+    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+    DBCursor.execute(DBQuery)
+    DB.commit()
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-        if len(configLines) == 0:
-            input("Could not find router's configuration in file "+showFilePath+", press any key to skip to the next file\r\n")
-            continue
-        else:
-            configLinesToParser = []
-            for line in configLines:                            # Cleaning configLines before parsing
-                if not re.match(r'^ *[#!]',line):                # Remove all comments        
-                    if not re.match(r'echo "',line):            # Remove SR-OS echo lines
-                        if not re.match(r'^$',line):            # Remove empty lines
-                            if CLISyntax == "SR-OS":
-                                line = line.replace("    "," ")     # Replace SR-OS indentation to single spaces
-                            configLinesToParser.append(line)
 
 
-            # if debug: print("debug: Printing configLinesToParser\r\n"+str(configLinesToParser))
+#####################################################################################################################################################
+###########################################################        Parse function         ###########################################################
+#####################################################################################################################################################
+def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean,jobs,commitEvery,force,nativeEngine):
+    logger.info("Parsing...")
 
-            cfg = CiscoConfParse(configLinesToParser)    # Parse configLines using CiscoConfParse library
-            #if debug: print("debug: cfg: "+str(cfg))
+    outputCursor = outputDB.cursor()
 
-            if ((CLIDelimiter == "") or (re.match(r"^[#>]$",CLIDelimiter))):
-                Hostname = os.path.split(showFilePath)[1]
-            else:
-                Hostname = CLIDelimiter
+    createDBStructureFunc(outputDB)
 
-            if debug: print("debug: Setting Hostname to: "+Hostname)
+    # Skipping files which are not changed since their last successful parse
+    SourceFilesParseAll = {}
+    for showFilePath in inputFiles:
+        SourceFilesParse = sourceFileCheckFunc(outputDB,outputCursor,showFilePath,force,sourceFileOptionsFunc(defaultCLISyntax,genClean,nativeEngine))
+        if SourceFilesParse is not None:
+            SourceFilesParseAll[showFilePath] = SourceFilesParse
+    if len(SourceFilesParseAll) < len(inputFiles):
+        logger.info("Skipping %s unchanged file(s), use \"--force\" argument to parse them anyway.", len(inputFiles) - len(SourceFilesParseAll))
 
+    # Summary of the run used for the batch report, skipped and failed files are listed with their reason codes
+    parseReport = {"action": "parse", "total": len(inputFiles), "unchanged": len(inputFiles) - len(SourceFilesParseAll), "succeeded": 0, "failed": [], "interrupted": False}
 
-            # Find Hostname
-            # Syntax: Cisco IOS/IOS-XE/IOS-XR
-            if ((CLISyntax == "IOS") or (CLISyntax == "IOS-XR")):
-                for obj1 in cfg.find_objects("^hostname"):       # Find node's Hostname from config
-                    if debug: print("debug: obj1: "+str(obj1))
-                    Hostname = obj1.text.split(" ")[1]
-                    if debug: print("debug: Found Hostname in configuration file and updated to: "+Hostname)
-                    break
-            # Syntax: Huawei VRP
-            if (CLISyntax == "VRP"):
-                for obj1 in cfg.find_objects("^sysname"):       # Find node's Hostname from config
-                    if debug: print("debug: obj1: "+str(obj1))
-                    Hostname = obj1.text.split(" ")[1]
-                    if debug: print("debug: Found Hostname in configuration file and updated to: "+Hostname)
-                    break
-            # Syntax: ALU/Nokia SR-OS
-            if (CLISyntax == "SR-OS"):
-                for obj1 in cfg.find_objects(" *name"):       # Find node's Hostname from config
-                    print(obj1)
-                    if debug: print("debug: obj1: "+str(obj1))
-                    Hostname = obj1.text.split(" \"")[1].split("\"")[0]
-                    if debug: print("debug: Found Hostname in configuration file and updated to: "+Hostname)
-                    break
+    inputFiles = [showFilePath for showFilePath in inputFiles if showFilePath in SourceFilesParseAll]
+    jobs = min(jobs,len(inputFiles))
 
-            # Find system/loopback0 address
-            # Syntax: Cisco IOS-XR
-            if (CLISyntax == "IOS-XR"):
-                for obj1 in cfg.find_objects("^interface Loopback0"):       # Find node's system/loopback0 address from config
-                    if debug: print("debug: obj1: "+str(obj1))
-                    for obj2 in obj1.re_search_children("ipv4 address "):    #Find all IPv4 addresses associated with current interface (IOS-XR syntax)
-                        if debug: print("debug: obj2: "+str(obj2))
-                        if re.search(r"/",obj2.text):
-                            SysAddr = obj2.text.split("ipv4 address ")[1].split("/")[0]
-                        else:
-                            SysAddr = obj2.text.split("ipv4 address ")[1].split(" ")[0]
-                        if debug: print("debug: SysAddr: "+str(SysAddr))
-                        break
-                    break
-            # Syntax: Cisco IOS/IOS-XE
-            if (CLISyntax == "IOS"):
-                for obj1 in cfg.find_objects("^interface Loopback0"):       # Find node's system/loopback0 address from config
-                    if debug: print("debug: obj1: "+str(obj1))
-                    for obj2 in obj1.re_search_children("ip address "):    #Find all IPv4 addresses associated with current interface (IOS/IOS-XE syntax)
-                        if debug: print("debug: obj2: "+str(obj2))
-                        if re.search("/",obj2.text):
-                            SysAddr = obj2.text.split("ip address ")[1].split("/")[0]
-                        else:
-                            SysAddr = obj2.text.split("ip address ")[1].split(" ")[0]
-                        if debug: print("debug: SysAddr: "+str(SysAddr))
-                        break
-                    break
-            # Syntax: Huawei VRP
-            if (CLISyntax == "VRP"):
-                for obj1 in cfg.find_objects("^interface LoopBack0"):       # Find node's system/loopback0 address from config
-                    if debug: print("debug: obj1: "+str(obj1))
-                    for obj2 in obj1.re_search_children("ip address "):    #Find all IPv4 addresses associated with current interface (VRP syntax)
-                        if debug: print("debug: obj2: "+str(obj2))
-                        SysAddr = obj2.text.split("address ")[1].split(" ")[0]
-                        if debug: print("debug: SysAddr: "+str(SysAddr))
-                        break
-                    break
-            # Syntax: ALU/Nokia SR-OS
-            if (CLISyntax == "SR-OS"):
-                for obj1 in cfg.find_objects("^ *interface \"system\""):       # Find node's system/loopback0 address from config
-                    if debug: print("debug: obj1: "+str(obj1))
-                    for obj2 in obj1.re_search_children("address "):    #Find all IPv4 addresses associated with current interface (SR-OS syntax)
-                        if debug: print("debug: obj2: "+str(obj2))
-                        SysAddr = obj2.text.split("address ")[1].split("/")[0]
-                        if debug: print("debug: SysAddr: "+str(SysAddr))
-                        break
-                    break
+#####################################################################################################################################################
+################################################                 Parsing files and writing DB                ########################################
+#####################################################################################################################################################
+    if jobs > 1:
+        # Files are parsed in worker processes, while this process stays the only writer of the DB
+        logger.info("Parsing %s file(s) in %s parallel jobs.", len(inputFiles), jobs)
+        # Workers set up the same logging at start, as processes made by "spawn" start method do not inherit handlers and debug flags
+        parsePool = multiprocessing.Pool(processes=jobs, initializer=loggingSetupFunc, initargs=loggingArgs)
+        parseResults = parsePool.imap(parseWorkerFunc, [[showFilePath,defaultCLISyntax,genClean,nativeEngine] for showFilePath in inputFiles])
+    elif batchMode:
+        # Errors of every single file are isolated in batch mode the same way as in parallel jobs, so one broken file does not stop the run
+        parseResults = (parseWorkerFunc([showFilePath,defaultCLISyntax,genClean,nativeEngine]) for showFilePath in inputFiles)
+    else:
+        parseResults = (parseFileFunc(showFilePath,defaultCLISyntax,genClean,nativeEngine) for showFilePath in inputFiles)
+
+    # All changes of a single node are made within one transaction, which is committed once every commitEvery nodes
+    nodesUncommitted = 0
+    try:
+        for parseResult in parseResults:
+            writeNodeFunc(outputDB,outputCursor,parseResult)
+            # Saving state of the file only when it is completely parsed, so skipped or failed files are parsed again next time
+            if len(parseResult[5]) == 0:
+                sourceFileSaveFunc(outputCursor,SourceFilesParseAll[parseResult[0]])
+                parseReport["succeeded"] = parseReport["succeeded"] + 1
+            else:
+                parseReport["failed"].append({"file": str(parseResult[0]), "reason": parseResult[5][0], "message": parseResult[5][1]})
+            nodesUncommitted = nodesUncommitted + 1
+            if nodesUncommitted >= commitEvery:
+                if debug: logger.debug("Committing changes of %s node(s) to the DB", nodesUncommitted)
+                outputDB.commit()
+                nodesUncommitted = 0
+        if jobs > 1: parsePool.close()
+    except KeyboardInterrupt:
+        logger.warning("Parsing interrupted, discarding changes of %s uncommitted node(s).", nodesUncommitted)
+        outputDB.rollback()
+        parseReport["interrupted"] = True
+        if jobs > 1: parsePool.terminate()
+    if jobs > 1: parsePool.join()
+
+    outputDB.commit()
+    outputDB.close()
 
-            if genClean == 1:
-                # Generating clean input file for node
-                if os.path.isfile("./clean_input") == True:
-                    print("Could not create directory ./clean_input")
-                else:
-                    if os.path.isdir("./clean_input") == False:
-                        os.mkdir("./clean_input")
-                        
-                    cleanInputFileName = str(Hostname +"_"+ SysAddr +"_"+ time.strftime("%Y%m%d_%H%M%S")+".txt")
-
-                    with open("./clean_input/"+cleanInputFileName, 'w') as cleanInputFile:
-                        cleanInputFile.write("\n".join(str(item) for item in versionLines))
-                        cleanInputFile.write("\n".join(str(item) for item in configLines))
-                        cleanInputFile.write("\n".join(str(item) for item in PHYInterfacesLines))
-                        cleanInputFile.write("\n".join(str(item) for item in IPInterfacesLines))
-                        cleanInputFile.write("\n".join(str(item) for item in MPLSInterfacesLines))
-                        cleanInputFile.write("\n".join(str(item) for item in CDPNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in LLDPNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in BFDNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in OSPFv2NeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in OSPFv2LSDBLines ))
-                        cleanInputFile.write("\n".join(str(item) for item in OSPFv3NeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in OSPFv3LSDBLines ))
-                        cleanInputFile.write("\n".join(str(item) for item in ISISNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in ISISLSDBLines ))
-                        cleanInputFile.write("\n".join(str(item) for item in LDPNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in RSVPNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in BGPNeighborsLines))
-                        cleanInputFile.write("\n".join(str(item) for item in L3VPNServiceLines))
-                        cleanInputFile.write("\n".join(str(item) for item in L2VPNServiceLines))
-                        cleanInputFile.write("\n".join(str(item) for item in VPLSServiceLines))
-                    cleanInputFile.close()
-
-                    if debug:
-                        cleanInputDebugFileName = str(Hostname +"_"+ SysAddr +"_debug_config_"+ time.strftime("%Y%m%d_%H%M%S")+".txt")
-                        with open("./clean_input/"+cleanInputDebugFileName, 'w') as cleanInputDebugFileName:
-                            cleanInputDebugFileName.write("\n".join(str(item) for item in configLinesToParser))
-                        cleanInputDebugFileName.close()
-
-
-                    if debug: input("Generated a clean input file "+cleanInputFileName+" for the node. Press any key proceed.\r\n")
-
-#####################################################################################################################################################
-################################################                  Creating DB structure                  ############################################
-#####################################################################################################################################################
-            # Creating Nodes table
-            DBQuery="""CREATE TABLE IF NOT EXISTS Nodes (\n"""
-            for value1 in NodesDict:
-                DBQuery = DBQuery + "\t\t" + str(value1) + " " + str(NodesDict[value1][1]) + "\n"
-            DBQuery = DBQuery + "\t\t, PRIMARY KEY(NodeID)\n"
-            DBQuery = DBQuery + "\t\t)\n"
-            if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-            outputCursor.execute(DBQuery)
-            outputDB.commit()
+    return parseReport
 
-            # Creating historical Interfaces table
-            DBQuery="""CREATE TABLE IF NOT EXISTS Interfaces"""+str(SyntaxDict["Hist"])+""" (\n"""
-            for value2 in InterfacesDict:
-                DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(InterfacesDict[value2][1]) + "\n"
-            DBQuery = DBQuery + "\t\t)\n"
-            if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-            outputCursor.execute(DBQuery)
-            outputDB.commit()
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-            # Creating historical Peering table
-            DBQuery="""CREATE TABLE IF NOT EXISTS Peering"""+str(SyntaxDict["Hist"])+""" (\n"""
-            for value2 in PeeringDict:
-                DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(PeeringDict[value2][1]) + "\n"
-            DBQuery = DBQuery + "\t\t)\n"
-            if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-            outputCursor.execute(DBQuery)
-            outputDB.commit()
 
-            # Creating set of tables for each CLI syntax recognized by script
-            for value1 in SyntaxDict:
 
-                if value1 == "Hist": continue
+#####################################################################################################################################################
+#########################################################        Source file cache         ##########################################################
+#####################################################################################################################################################
+# Input files are identified by their absolute path, so files with the same name in different directories are cached separately. Size and
+# modification time of a file are compared first, its content hash is calculated only when they differ from the ones saved at the last successful
+# parse. A file is parsed again when it was parsed with other options (default CLI syntax, clean mode or config engine), as they change the result.
+def sourceFileOptionsFunc(defaultCLISyntax,genClean,nativeEngine):
+    return "CLISyntax=" + str(defaultCLISyntax) + ";Clean=" + str(genClean) + ";Native=" + str(int(nativeEngine))
+
+def sourceFileHashFunc(showFilePath):
+    fileHash = hashlib.sha256()
+    with open(showFilePath,"rb") as showFileContent:
+        for chunk in iter(lambda: showFileContent.read(1048576), b""):
+            fileHash.update(chunk)
+    return fileHash.hexdigest()
+
+# Returns the new state of the file to be saved after the parse, or None if the file is not changed and can be skipped
+def sourceFileCheckFunc(outputDB,outputCursor,showFilePath,force,parseOptions):
+    SourceFilesParse = ["" for value in SourceFilesDict]
+    SourceFilesParse[SourceFilesDict["SourceFile"][0]] = str(os.path.abspath(showFilePath))
+    SourceFilesParse[SourceFilesDict["FileSize"][0]] = os.path.getsize(showFilePath)
+    SourceFilesParse[SourceFilesDict["FileMTime"][0]] = os.path.getmtime(showFilePath)
+    SourceFilesParse[SourceFilesDict["ParseOptions"][0]] = parseOptions
+
+    DBQuery = SQLStatementFunc("SELECT", "SourceFiles", ["SourceFile"])
+    DBParams = [SourceFilesParse[SourceFilesDict["SourceFile"][0]]]
+    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+    outputCursor.execute(DBQuery,DBParams)
+    DBResponse=outputCursor.fetchone()
+    if debugSQL: logger.debug("DBResponse: %s", DBResponse)
+
+    if ((not force) and (DBResponse is not None) and (DBResponse[SourceFilesDict["ParseOptions"][0]] != parseOptions)):
+        if debug: logger.debug("File %s was parsed with other options (%s), parsing it again", showFilePath, DBResponse[SourceFilesDict["ParseOptions"][0]])
+        DBResponse = None
+
+    if ((not force) and (DBResponse is not None)):
+        if ((DBResponse[SourceFilesDict["FileSize"][0]] == SourceFilesParse[SourceFilesDict["FileSize"][0]]) and (DBResponse[SourceFilesDict["FileMTime"][0]] == SourceFilesParse[SourceFilesDict["FileMTime"][0]])):
+            if debug: logger.debug("File %s has the same size and modification time as at the last parse, skipping it", showFilePath)
+            return None
+
+    SourceFilesParse[SourceFilesDict["FileHash"][0]] = sourceFileHashFunc(showFilePath)
+    SourceFilesParse[SourceFilesDict["LastUpdatedTime"][0]] = str(datetime.datetime.today())
+    SourceFilesParse[SourceFilesDict["LastUpdatedBy"][0]] = str(getpass.getuser())
+
+    if ((not force) and (DBResponse is not None)):
+        if DBResponse[SourceFilesDict["FileHash"][0]] == SourceFilesParse[SourceFilesDict["FileHash"][0]]:
+            if debug: logger.debug("File %s has the same content as at the last parse, skipping it", showFilePath)
+            # File is only touched, so its new size and modification time are saved to skip hashing next time
+            sourceFileSaveFunc(outputCursor,SourceFilesParse)
+            outputDB.commit()
+            return None
 
-                # Creating multiple Interfaces tables
-                DBQuery="""CREATE TABLE IF NOT EXISTS Interfaces"""+str(SyntaxDict[value1])+""" (\n"""
-                for value2 in InterfacesDict:
-                    DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(InterfacesDict[value2][1]) + "\n"
-                DBQuery = DBQuery + "\t\t, PRIMARY KEY(IfID)\n"
-                DBQuery = DBQuery + "\t\t)\n"
-                if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
-                outputDB.commit()
+    return SourceFilesParse
 
-                # Creating multiple Peering tables
-                DBQuery="""CREATE TABLE IF NOT EXISTS Peering"""+str(SyntaxDict[value1])+""" (\n"""
-                for value2 in PeeringDict:
-                    DBQuery = DBQuery + "\t\t" + str(value2) + " " + str(PeeringDict[value2][1]) + "\n"
-                DBQuery = DBQuery + "\t\t, PRIMARY KEY(PeeringID)\n"
-                DBQuery = DBQuery + "\t\t)\n"
-                if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
-                outputDB.commit()
+def sourceFileSaveFunc(outputCursor,SourceFilesParse):
+    DBQuery = SQLStatementFunc("DELETE", "SourceFiles", ["SourceFile"])
+    DBParams = [SourceFilesParse[SourceFilesDict["SourceFile"][0]]]
+    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+    if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
 
-                # Creating multiple Routing tables - TBD
+    DBQuery = SQLStatementFunc("INSERT", "SourceFiles")
+    DBParams = SourceFilesParse
+    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+    if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
 
-            # Checking if the node already exists
-            DBQuery="""SELECT * 
-                        FROM Nodes
-                        WHERE Hostname = '"""+str(Hostname)+"""' AND CLISyntax = '"""+str(CLISyntax)+"""'
-                        ORDER BY LastUpdatedTime DESC
-                        """
-            if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-            outputCursor.execute(DBQuery)
-            DBResponse=outputCursor.fetchone()
-            if debugSQL: print("debug: DBResponse: "+str(DBResponse))
 
-            if DBResponse is None:
-                NodeID = str(uuid.uuid4())
-            else:
-                NodeID = DBResponse[NodesDict["NodeID"][0]]
-
-            if DBResponse is None:
-                DBQuery="""INSERT INTO Nodes (
-                            NodeID,
-                            Hostname,
-                            CLISyntax,
-                            SysAddr,
-                            SWDescr,
-                            SourceFile,
-                            LastUpdatedTime,
-                            LastUpdatedBy
-                            ) 
-                            VALUES 
-                            (
-                            '"""+str(NodeID)+"""',
-                            '"""+str(Hostname)+"""',
-                            '"""+str(CLISyntax)+"""',
-                            '"""+str(SysAddr)+"""',
-                            '"""+str(SWDescr)+"""',
-                            '"""+str(os.path.split(showFilePath)[1])+"""',
-                            '"""+str(datetime.datetime.today())+"""',
-                            '"""+str(getpass.getuser())+"""'
-                            )"""
-                if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                outputDB.commit()
+#####################################################################################################################################################
+#########################################################       Native config engine        #########################################################
+#####################################################################################################################################################
+# Lightweight alternative to CiscoConfParse selected with "--native" argument. Only the subset of queries used by parsers is offered: find_objects,
+# re_search, re_search_children, text, linenum, indent, parent and children. The tree is built by the same rules as CiscoConfParse 1.5.30 does for
+# IOS syntax, including its quirks: blank lines are skipped, comments ("!") never become parents, parents found for an indentation are reused until
+# a less indented config line, banners take all lines up to their delimiter as children and macros take all lines up to "@". Trees of both engines
+# are compared on reference configs of every CLI syntax by "-t" self test.
+nativeBannerExpression = re.compile("|".join([r"^(set\s+)*banner\s+"+value for value in ["login", "motd", "incoming", "exec", "telnet", "lcd"]]
+                                             + ["aaa authentication fail-message"]))
+nativeBannerDelimiterExpression = re.compile(r"^(?:(?P<btype>(?:set\s+)*banner\s\w+\s+)(?P<bchar>\S))")
+
+class NativeCfgLine(object):
+    __slots__ = ("text", "linenum", "indent", "parent", "children", "isComment")
+
+    def __init__(self, text, linenum, indent):
+        self.text = text
+        self.linenum = linenum
+        self.indent = indent
+        self.parent = self
+        self.children = []
+        self.isComment = text.lstrip().startswith("!")
+
+    # Same truth value as in CiscoConfParse: the text of the line if regex matches, default otherwise
+    def re_search(self, regex, default=""):
+        if re.search(regex, self.text) is not None:
+            return self.text
+        return default
+
+    def re_search_children(self, regex, recurse=False):
+        if recurse:
+            return [cobj for cobj in self.all_children if cobj.re_search(regex)]
+        return [cobj for cobj in self.children if cobj.re_search(regex)]
+
+    # All descendants without duplicates in the order of the config, the same as in CiscoConfParse
+    @property
+    def all_children(self):
+        allChildren = {}
+        for cobj in self.children:
+            allChildren[cobj.linenum] = cobj
+            for cobj2 in cobj.all_children:
+                allChildren[cobj2.linenum] = cobj2
+        return [allChildren[linenum] for linenum in sorted(allChildren)]
+
+    # Same format as IOSCfgLine, so duplicate and debug messages do not depend on the engine
+    def __repr__(self):
+        if self.parent is self:
+            return "<IOSCfgLine # %s '%s'>" % (self.linenum, self.text)
+        return "<IOSCfgLine # %s '%s' (parent is # %s)>" % (self.linenum, self.text, self.parent.linenum)
+
+class NativeConfParse(object):
+    def __init__(self, configLines):
+        self.ConfigObjs = []
+        maxIndent = 0
+        parentsDict = {}        # Parents found for each indentation, reused until a less indented config line
+        macroParents = []
+
+        for line in configLines:
+            if line.strip() == "":
+                continue
+            indent = len(line) - len(line.lstrip())
+            obj = NativeCfgLine(line, len(self.ConfigObjs), indent)
+            isConfigLine = not obj.isComment
+            if line[0:11] == "macro name ":
+                macroParents.append(obj.linenum)
+
+            if ((indent < maxIndent) and (isConfigLine)):
+                parent = None
+                for value in [value for value in parentsDict if value >= indent]:
+                    del parentsDict[value]
             else:
-                if DBResponse[NodesDict["SysAddr"][0]] != SysAddr:
-                    print("Node system address changed to "+SysAddr+" - updating.")
-                    DBQuery="""UPDATE Nodes 
-                                SET 
-                                    SysAddr = '"""+str(SysAddr)+"""', 
-                                    LastUpdatedTime = '"""+str(datetime.datetime.today())+"""', 
-                                    LastUpdatedBy = '"""+str(getpass.getuser())+"""' 
-                                WHERE 
-                                    NodeID = '"""+NodeID+"""'
-                                    """
-                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                    if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                if DBResponse[NodesDict["SourceFile"][0]] != str(os.path.split(showFilePath)[1]):
-                    print("Node source file changed to "+str(os.path.split(showFilePath)[1])+" - updating.")
-                    DBQuery="""UPDATE Nodes 
-                                SET
-                                    SourceFile = '"""+str(os.path.split(showFilePath)[1])+"""', 
-                                    LastUpdatedTime = '"""+str(datetime.datetime.today())+"""', 
-                                    LastUpdatedBy = '"""+str(getpass.getuser())+"""' 
-                                WHERE 
-                                    NodeID = '"""+NodeID+"""'
-                                    """
-                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                    if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                if DBResponse[NodesDict["SWDescr"][0]] != SWDescr:
-                    print("Node SW description changed to "+SWDescr+" - updating.")
-                    DBQuery="""UPDATE Nodes 
-                                SET 
-                                    SWDescr = '"""+str(SWDescr)+"""', 
-                                    LastUpdatedTime = '"""+str(datetime.datetime.today())+"""', 
-                                    LastUpdatedBy = '"""+str(getpass.getuser())+"""'
-                                WHERE 
-                                    NodeID = '"""+NodeID+"""'
-                                    """
-                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                    if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                outputDB.commit()
-            if debug: input("Node updated in the database. Press any key proceed.\r\n")
+                parent = parentsDict.get(indent, None)
+
+            if ((indent > 0) and (parent is None)):
+                # Parent is the closest previous config line with a smaller indentation
+                for candidate in reversed(self.ConfigObjs):
+                    if ((candidate.indent < indent) and (not candidate.isComment)):
+                        parent = candidate
+                        parentsDict[indent] = parent
+                        break
+            if ((indent > 0) and (parent is not None)):
+                # Comment is not a child when the line above it is indented more
+                if not ((obj.isComment) and (self.ConfigObjs[-1].indent > indent)):
+                    parent.children.append(obj)
+                    obj.parent = parent
+
+            if ((indent == 0) and (isConfigLine)):
+                maxIndent = 0
+            elif indent > maxIndent:
+                maxIndent = indent
+            self.ConfigObjs.append(obj)
+
+        # Banner lines up to the one with the delimiter are children of the banner, even if they are already children of another line
+        for parent in [obj for obj in self.ConfigObjs if nativeBannerExpression.search(obj.text)]:
+            bannerMatch = nativeBannerDelimiterExpression.search(parent.text)
+            if ((bannerMatch is None) or (len(parent.text.split(bannerMatch.group("bchar"))) > 2)):
+                continue
+            for obj in self.ConfigObjs[parent.linenum+1:]:
+                parent.children.append(obj)
+                obj.parent = parent
+                if bannerMatch.group("bchar") in obj.text.strip():
+                    break
+
+        # Macro lines up to "@" are children of the macro, an unterminated macro fails the same way as in CiscoConfParse
+        for linenum in macroParents:
+            parent = self.ConfigObjs[linenum]
+            while True:
+                linenum = linenum + 1
+                obj = self.ConfigObjs[linenum]
+                obj.parent = parent
+                parent.children.append(obj)
+                if obj.text.rstrip() == "@":
+                    break
 
+    def find_objects(self, linespec):
+        linespecRe = re.compile(linespec)
+        return [obj for obj in self.ConfigObjs if linespecRe.search(obj.text)]
 
+# Returns parsed configuration tree made by the selected engine
+def configParseFunc(configLinesToParser,nativeEngine):
+    if nativeEngine:
+        return NativeConfParse(configLinesToParser)
+    return CiscoConfParse(configLinesToParser)
 #####################################################################################################################################################
-###################################################           Find all interfaces in config file           ##########################################
 #####################################################################################################################################################
+#####################################################################################################################################################
+
 
-            IfNumber = 0
-            IfNew = 0
-            IfUpdated = 0
-            IfKept = 0
-            IfDeleted = 0
-            IDMatched = []
-            InterfacesParseAll = []
 
 #####################################################################################################################################################
-###################################################                  Cisco IOS-XR parsing                  ##########################################
+#########################################################      Config objects index         #########################################################
+#####################################################################################################################################################
+# Groups config objects by a key (e.g. interface name) in a single pass, so duplicate checks and lookups by name do not search the whole config
+# again for every object. Objects with the same key are kept in the order of the config.
+def objectsIndexFunc(objects, keyFunc):
+    objectsIndex = {}
+    for obj in objects:
+        objectsIndex.setdefault(keyFunc(obj), []).append(obj)
+    return objectsIndex
+
+# Maps every interface name to the config objects of its subinterfaces, e.g. both "Gi0/0/0/1" and "Gi0/0/0/1.100" for "Gi0/0/0/1.100.200"
+def subinterfacesIndexFunc(interfacesIndex):
+    subinterfacesIndex = {}
+    for IfName in interfacesIndex:
+        IfNameParts = IfName.split(".")
+        for i in range(1, len(IfNameParts)):
+            subinterfacesIndex.setdefault(".".join(IfNameParts[:i]), []).extend(interfacesIndex[IfName])
+    return subinterfacesIndex
+
+# Maps every SR-OS port/LAG name to the list of [VLAN, object] bindings in a single pass over the config, where object is a router interface for
+# "port <name>[:<vlan>]" lines of router interfaces and a parent interface or service (VPRN, IES, VPLS, Epipe) for "sap <name>[:<vlan>] create" lines.
+# Bindings are kept in the order of the config, untagged ones have "null" VLAN.
+def portBindingsIndexFunc(cfg):
+    routerPortsIndex = {}
+    SAPPortsIndex = {}
+
+    for obj19 in cfg.find_objects(r" *router"):
+        for obj20 in obj19.re_search_children(r" *interface"):
+            for obj21 in obj20.re_search_children(r"port "):
+                if re.search(":",obj21.text):
+                    tempVLAN = obj21.text.split(":")[1].split(" ")[0]
+                else:
+                    tempVLAN = "null"
+                # Port name ends either with VLAN delimiter or with the line
+                for portName in set(value.split(":")[0] for value in obj21.text.split("port ")[1:]):
+                    routerPortsIndex.setdefault(portName, []).append([tempVLAN, obj20])
+
+    for obj22 in cfg.find_objects(r"sap [^: ]*(:.*| )create"):
+        if re.search(":",obj22.text):
+            tempVLAN = obj22.text.split(":")[1].split(" ")[0]
+        else:
+            tempVLAN = "null"
+        portName = re.search(r"sap ([^: ]*)(:.*| )create",obj22.text).group(1)
+        SAPPortsIndex.setdefault(portName, []).append([tempVLAN, obj22.parent])
+
+    return [routerPortsIndex, SAPPortsIndex]
+
+# Routing protocol sections (OSPF processes, VRFs and areas, IS-IS, LDP) are searched for every interface of a node, so results of these searches are
+# kept in a per-node protocolIndex dictionary. Each section is searched for the same expression and indexed by names of its interfaces only once.
+def protocolChildrenFunc(protocolIndex, obj, searchExpression):
+    indexKey = (id(obj), searchExpression)
+    if indexKey not in protocolIndex:
+        if isinstance(obj, (CiscoConfParse, NativeConfParse)):
+            protocolIndex[indexKey] = obj.find_objects(searchExpression)
+        else:
+            protocolIndex[indexKey] = obj.re_search_children(searchExpression)
+    return protocolIndex[indexKey]
+
+# Interfaces are named either by the last word of a line (Cisco) or by the first quoted string (SR-OS)
+def protocolInterfacesFunc(protocolIndex, obj, IfName):
+    indexKey = (id(obj), None)
+    if indexKey not in protocolIndex:
+        protocolIndex[indexKey] = objectsIndexFunc(obj.children, lambda child: child.text.split("\"")[1] if "\"" in child.text else child.text.split()[-1])
+    return protocolIndex[indexKey].get(IfName, [])
+
+# Maps every IOS-XR attachment circuit name to the list of its [service name, pseudowire] bindings in a single walk over the l2vpn tree, covering both
+# bridge-domains of bridge groups and p2p of xconnect groups. Pseudowire is the last "neighbor" of the service as "address:pw-id", or None if the
+# service has no neighbors. Bindings are kept in the order of the config.
+def L2VPNIndexFunc(cfg):
+    L2VPNIndex = {}
+    for obj200 in cfg.find_objects(r"^l2vpn"):
+        for obj201 in obj200.re_search_children("bridge |xconnect group "):
+            for obj202 in obj201.re_search_children("bridge-domain |p2p "):
+                servicePW = None
+                for obj204 in obj202.re_search_children("neighbor "):
+                    servicePW = obj204.text.split("neighbor ")[1].lstrip().rstrip().replace("ipv4 ","").replace(" pw-id ",":")
+                for obj203 in obj202.re_search_children("interface "):
+                    L2VPNIndex.setdefault(obj203.text.split()[-1], []).append([obj202.text.split()[1], servicePW])
+    return L2VPNIndex
+
+# Maps every SR-OS port name to the LAG object it is a member of within the "configure" section. If a port is listed in several LAGs, the last
+# one is used.
+def portLAGIndexFunc(obj1):
+    portLAGIndex = {}
+    for obj10 in obj1.re_search_children(r" +lag +"):
+        for obj11 in obj10.re_search_children(r" +port +"):
+            portLAGIndex[obj11.text.split("port ")[1]] = obj10
+    return portLAGIndex
+#####################################################################################################################################################
+#####################################################################################################################################################
 #####################################################################################################################################################
-            # Syntax: Cisco IOS-XR
-            if (CLISyntax == "IOS-XR"):
-                if debug: print("debug: Using IOS-XR syntax to parse file")
-                # Find node's interfaces from config
-                for obj1 in cfg.find_objects(r"^interface"):
-                    if re.search(" preconfigure ",obj1.text): continue
-                    duplicate = []
-                    for obj2 in cfg.find_objects(r"^interface"):
-                        if obj1.text.split("interface ")[1].split(" ")[0] == obj2.text.split("interface ")[1].split(" ")[0]:
-                            duplicate.append(str(obj2))
 
-                    if len(duplicate) > 1:
-                        print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
-                        nextFile = 1
-                        break
-                    
-                    IfNumber = IfNumber + 1
-                    InterfacesParse = [""] * len(InterfacesDict)
-                    if debug: print("debug: obj1: "+str(obj1))
-                    
-                    InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                    InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                    InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                    InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                    InterfacesParse[InterfacesDict["IfName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
 
-                    # Check if interface is a subinterface of another one
-                    if re.search(r'\.',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(".")[0]
-                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(".")[0]
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "SubIf"
-                    else:
-                        # Check if interface is physical port
-                        if re.search(r'([Gg]ig[Ee]|[Ee]thernet)',InterfacesParse[InterfacesDict["IfName"][0]]):
-                            InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "Port"
-                            if re.search(r'[Hh]undred[Gg]ig(abit)?E',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                InterfacesParse[InterfacesDict["PortType"][0]] = "100GE"
-                            else:
-                                if re.search(r'[Tt]en[Gg]ig(abit)?E',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "10GE"
-                                else:
-                                    if re.search(r'[Gg]igabit',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                        InterfacesParse[InterfacesDict["PortType"][0]] = "1GE"
-                                    else:
-                                        if re.search(r'[Ff]ast',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                            InterfacesParse[InterfacesDict["PortType"][0]] = "100ME"
-                                        else:
-                                            InterfacesParse[InterfacesDict["PortType"][0]] = ""
 
-                    # Check if interface is a loopback
-                    if re.search(r"L|loopB|back",InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
+#####################################################################################################################################################
+#########################################################        Parse file function        #########################################################
+#####################################################################################################################################################
+# Parses a single input file into plain lists and returns [showFilePath, nextFile, NodesParse, InterfacesParseAll, IfNumber, skipReason] without touching
+# the DB, so it can be executed both in the main process and in worker processes. skipReason is [reason code, message] if the file is skipped.
+def parseFileFunc(showFilePath,defaultCLISyntax,genClean,nativeEngine):
+    if debug: logger.debug("Reading file %s", showFilePath)
+    showFileContent = open(showFilePath,"r",newline ='\r')
+    lineNumber = 0
+    nextFile = 0
+    skipReason = []
+    redirectOutputTo = "default"
+    CLIDelimiter = ""
+
+    versionLines = []                   # Extracted version output lines from input file
+    configLines = []                    # Extracted configuration output lines from input file
+    configLines2 = []                 # Extracted configuration output lines from input file when inpur file is a config file only
+    PHYInterfacesLines = []             # Extracted physical interface output lines from input file
+    IPInterfacesLines = []              # Extracted IPv4/IPv6 interface output lines from input file
+    MPLSInterfacesLines = []            # Extracted MPLS/LDP/RSVP interface output lines from input file
+    CDPNeighborsLines = []              # Extracted CDP neighbors output lines from input file
+    LLDPNeighborsLines = []             # Extracted LLDP neighbors output lines from input file
+    BFDNeighborsLines = []              # Extracted BFD neighbors output lines from input file
+    OSPFv2NeighborsLines = []           # Extracted OSPFv2 neighbors output lines from input file
+    OSPFv2LSDBLines = []                # Extracted OSPFv2 LSDB output lines from input file
+    OSPFv3NeighborsLines = []           # Extracted OSPFv3 neighbors output lines from input file
+    OSPFv3LSDBLines = []                # Extracted OSPFv3 LSDB output lines from input file
+    ISISNeighborsLines = []             # Extracted IS-IS neighbors output lines from input file
+    ISISLSDBLines = []                  # Extracted IS-IS LSDB output lines from input file
+    LDPNeighborsLines = []              # Extracted LDP neighbors output lines from input file
+    RSVPNeighborsLines = []             # Extracted RSVP neighbors output lines from input file
+    BGPNeighborsLines = []              # Extracted BGP neighbors output lines from input file
+    L3VPNServiceLines = []              # Extracted L3VPNs output lines from input file
+    L2VPNServiceLines = []              # Extracted L2VPNs output lines from input file
+    VPLSServiceLines = []               # Extracted VPLS output lines from input file
+
+    # Lists of the sections matched by the section classifier
+    sectionLinesDict = {"config": configLines, "PHYInterfaces": PHYInterfacesLines, "IPInterfaces": IPInterfacesLines}
+    sectionDelimiter = None
+    sectionClassifier = None
+
+    # Lines are read lazily from the file, only lines of the recognized sections are kept in memory
+    for line in showFileContent:
+        lineNumber = lineNumber + 1
+        
+        # if debug: print(line)
+
+        # Remove paging from log (Cisco/Huawei)
+        if pagingExpression.search(line):
+            # Huawei
+            line = line.replace("  ---- More ----[42D                                          [42D","")
+            # Cisco IOS-XR
+            line = line.replace("[K --More--           [K","")
+            # Cisco IOS
+            line = line.replace(" --More--         ","")
+
+        # Remove aux symbols from Putty log
+        # line = line.replace("\x00\r","") # NULCR
+        # line = line.replace("\x00","") # NUL
+        # line = line.replace("","") # BS
+        # line = line.replace("","") # BEL
+        line = line.replace("[1C ","") # [1D
+        line = line.replace("[1Cr","") # [1D
+        line = line.replace("[1C","") # [1D
+        line = line.replace("[1D ","") # [1D
+        line = line.replace("[1Dr","") # [1D
+        line = line.replace("[1D","") # [1D
+        line = line.replace("[2D ","") # [2D
+        line = line.replace("[2Dr","") # [2D
+        line = line.replace("[2D","") # [2D
+
+
+        # Remove paging from log (Nokia)
+        if pagingExpression.search(line):
+            # Nokia
+            line = line.replace("Press any key to continue (Q to quit)                                      \r","")
+
+        # Remove right spacing and escape symbols
+        line = line.rstrip()
+        line = line.replace("\t","    ")                                   # Replace tabulation to four spaces
+        line = line.translate(escapesTranslator)
+        
+        # if debug: print(line)
+
+        # if debug: 
+        #     if re.search(r'(N|n)o',input("Press any key to do for the next interface, or \"no\" to stop:\r\n")):
+        #         print("Stopping parsing")
+        #         sys.exit()
+
+        # Match version output
+        # Syntax: Cisco IOS/IOS-XE/IOS-XR, ALU/Nokia SR-OS
+        if versionExpressionCisco.search(line):
+            if redirectOutputTo != "version":
+                if debug: logger.debug("%s output ends at line %s: %s", redirectOutputTo, lineNumber, line)
+            if debug: logger.debug("Found version output beginning at line %s: %s", lineNumber, line)
+            redirectOutputTo = "version"
+            versionLines.append(line)
+            if re.search(r'>',line):
+                CLIDelimiter = line.split(">")[0]+">"
+            else:
+                if re.search(r'#',line):
+                    CLIDelimiter = line.split("#")[0]+"#"
+            if CLIDelimiter != "":
+                logger.info("Found CLI delimiter beginning at line %s: %s", lineNumber, CLIDelimiter)
+                continue
+            # else:
+            #     print("Could not find CLI delimiter in file "+str(showFilePath))
+            #     break
 
-                    # Check if interface is a bundle
-                    if re.search(r'B|bundle-E|ether',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
-                        InterfacesParse[InterfacesDict["LAGID"][0]] = str(InterfacesParse[InterfacesDict["IfName"][0]].split("ther")[1].split(".")[0])
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "LAG"
+        # Syntax: Huawei VRP
+        if versionExpressionHuawei.search(line):
+            if redirectOutputTo != "version":
+                if debug: logger.debug("%s output ends at line %s: %s", redirectOutputTo, lineNumber, line)
+            if debug: logger.debug("Found version output beginning at line %s: %s", lineNumber, line)
+            redirectOutputTo = "version"
+            versionLines.append(line)
+            if re.search(r'>',line):
+                CLIDelimiter = line.split(">")[0]+">"
+            else:
+                if re.search(r'#',line):
+                    CLIDelimiter = line.split("#")[0]+"#"
+            if CLIDelimiter != "":
+                logger.info("Found CLI delimiter beginning at line %s: %s", lineNumber, CLIDelimiter)
+                continue
+            else:
+                logger.warning("Could not find CLI delimiter in file %s", showFilePath)
+                break
 
-                    # Check if interface is l2tpansport interface
-                    if re.search(r'l2transport',obj1.text.split("interface ")[1]):
-                        InterfacesParse[InterfacesDict["IfName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(" ")[0]
-                        InterfacesParse[InterfacesDict["ServiceType"][0]] = "L2VPN"
-                        if InterfacesParse[InterfacesDict["IfType"][0]] != "":
-                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
-                        
-                        InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "L2VPN"
-                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+        # Whole input file is kept as configuration only while there is no version output, otherwise it is never used
+        if ((defaultCLISyntax != "") and (len(versionLines) == 0)):
+            configLines2.append(line)
+
+        # Match command output using the section classifier compiled for the current CLI delimiter
+        # Syntax: all
+        if CLIDelimiter in line:
+            if CLIDelimiter != sectionDelimiter:
+                sectionClassifier = sectionClassifierFunc(CLIDelimiter)
+                sectionDelimiter = CLIDelimiter
+            sectionMatch = sectionClassifier.search(line)
+            if sectionMatch:
+                section = sectionCommandsList[int(sectionMatch.lastgroup[1:])]
+                if redirectOutputTo != section[0]:
+                    if debug: logger.debug("%s output ends at line %s: %s", redirectOutputTo, lineNumber, line)
+                if debug: logger.debug("Found %s output beginning at line %s: %s", section[1], lineNumber, line)
+                redirectOutputTo = section[0]
+                sectionLinesDict[redirectOutputTo].append(line)
+                continue
 
-                        for obj200 in cfg.find_objects(r"^l2vpn"):
-                            for obj201 in obj200.re_search_children("bridge "):
-                                for obj202 in obj201.re_search_children("bridge-domain "):
-                                    searchExpression = InterfacesParse[InterfacesDict["IfName"][0]] + r"$"
-                                    for obj203 in obj202.re_search_children(searchExpression):
-                                        InterfacesParse[InterfacesDict["ServiceName"][0]] = obj202.text.split("bridge-domain ")[1].split()[0]
-                                        for obj204 in obj202.re_search_children("neighbor "):
-                                            InterfacesParse[InterfacesDict["ServiceSDP"][0]] = obj204.text.split("neighbor ")[1].lstrip().rstrip().replace(" pw-id ",":")
+            # Match unknown command output
+            if line.startswith(CLIDelimiter):
+                # if debug: print("debug: Found unknown output beginning at line "+str(lineNumber)+": "+line)
+                if redirectOutputTo != "default":
+                    if debug: logger.debug("%s output ends at line %s: %s", redirectOutputTo, lineNumber, line)
+                redirectOutputTo = "default"
+                continue
 
 
-                    # Find description associated with current interface
-                    for obj2 in obj1.re_search_children("description "):
-                        InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj2.text.split("description ")[1].replace("\"",""))
-                        break
+        # Redirect already classified output to appropriate list
+        if redirectOutputTo == "version":
+            versionLines.append(line)
+            # if debug: print("version: "+str(lineNumber)+": "+line)
+            continue
+        if redirectOutputTo == "config":
+            configLines.append(line)
+            continue
+        if redirectOutputTo == "PHYInterfaces":
+            PHYInterfacesLines.append(line)
+            continue
+        if redirectOutputTo == "IPInterfaces":
+            IPInterfacesLines.append(line)
+            continue
+        if redirectOutputTo == "MPLSInterfaces":
+            MPLSInterfacesLines.append(line)
+            continue
+        if redirectOutputTo == "CDPNeighbors":
+            CDPNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "LLDPNeighbors":
+            LLDPNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "BFDNeighbors":
+            BFDNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "OSPFv2Neighbors":
+            OSPFv2NeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "OSPFv2LSDB":
+            OSPFv2LSDBLines.append(line)
+            continue
+        if redirectOutputTo == "OSPFv3Neighbors":
+            OSPFv3NeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "OSPFv3LSDB":
+            OSPFv3LSDBLines.append(line)
+            continue
+        if redirectOutputTo == "ISISNeighbors":
+            ISISNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "ISISLSDB":
+            ISISLSDBLines.append(line)
+            continue
+        if redirectOutputTo == "LDPNeighbors":
+            LDPNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "RSVPNeighbors":
+            RSVPNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "BGPNeighbors":
+            BGPNeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "L3VPNService":
+            L3VPNServiceLines.append(line)
+            continue
+        if redirectOutputTo == "L2VPNService":
+            L2VPNServiceLines.append(line)
+            continue
+        if redirectOutputTo == "VPLSService":
+            VPLSServiceLines.append(line)
+            continue
+        if redirectOutputTo == "OSPFv2Neighbors":
+            OSPFv2NeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "OSPFv3Neighbors":
+            OSPFv3NeighborsLines.append(line)
+            continue
+        if redirectOutputTo == "BGPNeighbors":
+            BGPNeighborsLines.append(line)
+            continue
+
+    showFileContent.close()
+    if debug: pauseFunc("Input file processed. Press any key proceed.\r\n")
+
+    # # if debug: print("debug: Printing versionLines\r\n"+str(versionLines))
+    # if debug: print("debug: Printing configLinesToParser\r\n"+str(configLinesToParser))
+    # if debug: print("debug: Printing PHYInterfacesLines\r\n"+str(PHYInterfacesLines))
+    # if debug: print("debug: Printing IPInterfacesLines\r\n"+str(IPInterfacesLines))
+    # if debug: print("debug: Printing MPLSInterfacesLines\r\n"+str(MPLSInterfacesLines))
+    # if debug: print("debug: Printing CDPNeighborsLines\r\n"+str(CDPNeighborsLines))
+    # if debug: print("debug: Printing LLDPNeighborsLines\r\n"+str(LLDPNeighborsLines))
+    # if debug: print("debug: Printing BFDNeighborsLines\r\n"+str(BFDNeighborsLines))
+    # if debug: print("debug: Printing OSPFv2NeighborsLines\r\n"+str(OSPFv2NeighborsLines))
+    # if debug: print("debug: Printing OSPFv2LSDBLines\r\n"+str(OSPFv2LSDBLines))
+    # if debug: print("debug: Printing OSPFv3NeighborsLines\r\n"+str(OSPFv3NeighborsLines))
+    # if debug: print("debug: Printing OSPFv3LSDBLines\r\n"+str(OSPFv3LSDBLines))
+    # if debug: print("debug: Printing ISISNeighborsLines\r\n"+str(ISISNeighborsLines))
+    # if debug: print("debug: Printing ISISLSDBLines\r\n"+str(ISISLSDBLines))
+    # if debug: print("debug: Printing LDPNeighborsLines\r\n"+str(LDPNeighborsLines))
+    # if debug: print("debug: Printing RSVPNeighborsLines\r\n"+str(RSVPNeighborsLines))
+    # if debug: print("debug: Printing BGPNeighborsLines\r\n"+str(BGPNeighborsLines))
+    # if debug: print("debug: Printing L3VPNServiceLines\r\n"+str(L3VPNServiceLines))
+    # if debug: print("debug: Printing L2VPNServiceLines\r\n"+str(L2VPNServiceLines))
+    # if debug: print("debug: Printing VPLSServiceLines\r\n"+str(VPLSServiceLines))
+    # if debug: print("debug: Printing OSPFv2NeighborsLines\r\n"+str(OSPFv2NeighborsLines))
+    # if debug: print("debug: Printing OSPFv3NeighborsLines\r\n"+str(OSPFv3NeighborsLines))
+    # if debug: print("debug: Printing BGPNeighborsLines\r\n"+str(BGPNeighborsLines))
+
+    CLISyntax = ""                  # Stores CLI syntax for correct parsing and matching
+    SWDescr = ""                    # Stores SW description line from show|display version
+    SysAddr = ""                    # Stores system/loopback0 address
+
+    # print("1111: len(versionLines) = "+str(len(versionLines)))
+    if debug: logger.debug("versionLines: %s", versionLines)
+    if len(versionLines) == 0:
+        if defaultCLISyntax != "":
+            logger.warning("Could not determine parsing syntax in file %s, using default one specified", showFilePath)
+            CLISyntax = defaultCLISyntax
+            # if len(configLines) == 0:
+            configLines = configLines2
+        else:
+            pauseFunc("Could not determine parsing syntax in file "+showFilePath+" and no default syntax specified, press any key to skip to the next file\r\n")
+            return [showFilePath, 1, [], [], 0, ["noSyntax", "Could not determine parsing syntax and no default syntax specified"]]
+    else:
+        for obj2 in versionLines:       # Determine configuration syntax
+            searchExpression = r'.*Cisco IOS XR'
+            if re.match(searchExpression,obj2):
+                SWDescr = obj2
+                CLISyntax = "IOS-XR"
+                break
+            searchExpression = r'.*Cisco IOS(-| XE)? '
+            if re.match(searchExpression,obj2):
+                SWDescr = obj2
+                CLISyntax = "IOS"
+                break
+            searchExpression = r'.*VRP \(R\) software'
+            if re.match(searchExpression,obj2):
+                SWDescr = obj2
+                CLISyntax = "VRP"
+                break          
+            searchExpression = r'.*TiMOS-'
+            if re.match(searchExpression,obj2):
+                SWDescr = obj2
+                CLISyntax = "SR-OS"
+                break
+        
+        SWDescr = SWDescr.replace("#","")
+        SWDescr = SWDescr.replace("!","")
+        SWDescr = SWDescr.rstrip()
+        SWDescr = SWDescr.lstrip()
+        logger.info("Found following software description: %s", SWDescr)
+
+        if CLISyntax == "":
+            pauseFunc("Could not determine parsing syntax in file "+showFilePath+" and no default syntax specified, press any key to skip to the next file\r\n")
+            return [showFilePath, 1, [], [], 0, ["noSyntax", "Could not determine parsing syntax and no default syntax specified"]]
+
+    logger.info("Using following parsing syntax for this node: %s", CLISyntax)
+
+    if len(configLines) == 0:
+        pauseFunc("Could not find router's configuration in file "+showFilePath+", press any key to skip to the next file\r\n")
+        return [showFilePath, 1, [], [], 0, ["noConfig", "Could not find router's configuration"]]
+    else:
+        configLinesToParser = []
+        for line in configLines:                            # Cleaning configLines before parsing
+            if not re.match(r'^ *[#!]',line):                # Remove all comments        
+                if not re.match(r'echo "',line):            # Remove SR-OS echo lines
+                    if not re.match(r'^$',line):            # Remove empty lines
+                        if CLISyntax == "SR-OS":
+                            line = line.replace("    "," ")     # Replace SR-OS indentation to single spaces
+                        configLinesToParser.append(line)
+
+
+        # if debug: print("debug: Printing configLinesToParser\r\n"+str(configLinesToParser))
+
+        cfg = configParseFunc(configLinesToParser,nativeEngine)    # Parse configLines using CiscoConfParse library or native engine
+        #if debug: print("debug: cfg: "+str(cfg))
+
+        # Index of top level interfaces by name used for duplicate checks and lookups of LAGs, subinterfaces and BDIs
+        interfacesIndex = objectsIndexFunc(cfg.find_objects(r"^interface"), lambda obj: obj.text.split("interface ")[1].split(" ")[0])
+        subinterfacesIndex = subinterfacesIndexFunc(interfacesIndex)
+        protocolIndex = {}
+
+        if ((CLIDelimiter == "") or (re.match(r"^[#>]$",CLIDelimiter))):
+            Hostname = os.path.split(showFilePath)[1]
+        else:
+            Hostname = CLIDelimiter
+
+        if debug: logger.debug("Setting Hostname to: %s", Hostname)
+
+
+        # Find Hostname
+        # Syntax: Cisco IOS/IOS-XE/IOS-XR
+        if ((CLISyntax == "IOS") or (CLISyntax == "IOS-XR")):
+            for obj1 in cfg.find_objects("^hostname"):       # Find node's Hostname from config
+                if debug: logger.debug("obj1: %s", obj1)
+                Hostname = obj1.text.split(" ")[1]
+                if debug: logger.debug("Found Hostname in configuration file and updated to: %s", Hostname)
+                break
+        # Syntax: Huawei VRP
+        if (CLISyntax == "VRP"):
+            for obj1 in cfg.find_objects("^sysname"):       # Find node's Hostname from config
+                if debug: logger.debug("obj1: %s", obj1)
+                Hostname = obj1.text.split(" ")[1]
+                if debug: logger.debug("Found Hostname in configuration file and updated to: %s", Hostname)
+                break
+        # Syntax: ALU/Nokia SR-OS
+        if (CLISyntax == "SR-OS"):
+            for obj1 in cfg.find_objects(" *name"):       # Find node's Hostname from config
+                if debug: logger.debug("obj1: %s", obj1)
+                Hostname = obj1.text.split(" \"")[1].split("\"")[0]
+                if debug: logger.debug("Found Hostname in configuration file and updated to: %s", Hostname)
+                break
+
+        # Find system/loopback0 address
+        # Syntax: Cisco IOS-XR
+        if (CLISyntax == "IOS-XR"):
+            for obj1 in cfg.find_objects("^interface Loopback0"):       # Find node's system/loopback0 address from config
+                if debug: logger.debug("obj1: %s", obj1)
+                for obj2 in obj1.re_search_children("ipv4 address "):    #Find all IPv4 addresses associated with current interface (IOS-XR syntax)
+                    if debug: logger.debug("obj2: %s", obj2)
+                    if re.search(r"/",obj2.text):
+                        SysAddr = obj2.text.split("ipv4 address ")[1].split("/")[0]
+                    else:
+                        SysAddr = obj2.text.split("ipv4 address ")[1].split(" ")[0]
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
+                    break
+                break
+        # Syntax: Cisco IOS/IOS-XE
+        if (CLISyntax == "IOS"):
+            for obj1 in cfg.find_objects("^interface Loopback0"):       # Find node's system/loopback0 address from config
+                if debug: logger.debug("obj1: %s", obj1)
+                for obj2 in obj1.re_search_children("ip address "):    #Find all IPv4 addresses associated with current interface (IOS/IOS-XE syntax)
+                    if debug: logger.debug("obj2: %s", obj2)
+                    if re.search("/",obj2.text):
+                        SysAddr = obj2.text.split("ip address ")[1].split("/")[0]
+                    else:
+                        SysAddr = obj2.text.split("ip address ")[1].split(" ")[0]
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
+                    break
+                break
+        # Syntax: Huawei VRP
+        if (CLISyntax == "VRP"):
+            for obj1 in cfg.find_objects("^interface LoopBack0"):       # Find node's system/loopback0 address from config
+                if debug: logger.debug("obj1: %s", obj1)
+                for obj2 in obj1.re_search_children("ip address "):    #Find all IPv4 addresses associated with current interface (VRP syntax)
+                    if debug: logger.debug("obj2: %s", obj2)
+                    SysAddr = obj2.text.split("address ")[1].split(" ")[0]
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
+                    break
+                break
+        # Syntax: ALU/Nokia SR-OS
+        if (CLISyntax == "SR-OS"):
+            for obj1 in cfg.find_objects("^ *interface \"system\""):       # Find node's system/loopback0 address from config
+                if debug: logger.debug("obj1: %s", obj1)
+                for obj2 in obj1.re_search_children("address "):    #Find all IPv4 addresses associated with current interface (SR-OS syntax)
+                    if debug: logger.debug("obj2: %s", obj2)
+                    SysAddr = obj2.text.split("address ")[1].split("/")[0]
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
+                    break
+                break
+
+        if genClean == 1:
+            # Generating clean input file for node
+            if os.path.isfile("./clean_input") == True:
+                logger.warning("Could not create directory ./clean_input")
+            else:
+                if os.path.isdir("./clean_input") == False:
+                    os.mkdir("./clean_input")
                     
-                    # Find encapsulation associated with current interface
-                    for obj2 in obj1.re_search_children(r"^ *encapsulation "):
-                        if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                        if re.search("second-dot1q ",obj2.text):
-                            if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
-                                InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj2.text.split(" dot1q ")[1].split(" second-dot1q ")[0].lstrip().rstrip().replace(" , ","|"))) + "." + str(obj2.text.split(" second-dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
-                        else:
-                            if re.search("dot1q ",obj2.text):
-                                if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                    InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj2.text.split(" dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
-                            else:
-                                if re.search("untagged",obj2.text):
-                                    if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
+                cleanInputFileName = str(Hostname +"_"+ SysAddr +"_"+ time.strftime("%Y%m%d_%H%M%S")+".txt")
+
+                with open("./clean_input/"+cleanInputFileName, 'w') as cleanInputFile:
+                    cleanInputFile.write("\n".join(str(item) for item in versionLines))
+                    cleanInputFile.write("\n".join(str(item) for item in configLines))
+                    cleanInputFile.write("\n".join(str(item) for item in PHYInterfacesLines))
+                    cleanInputFile.write("\n".join(str(item) for item in IPInterfacesLines))
+                    cleanInputFile.write("\n".join(str(item) for item in MPLSInterfacesLines))
+                    cleanInputFile.write("\n".join(str(item) for item in CDPNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in LLDPNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in BFDNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in OSPFv2NeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in OSPFv2LSDBLines ))
+                    cleanInputFile.write("\n".join(str(item) for item in OSPFv3NeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in OSPFv3LSDBLines ))
+                    cleanInputFile.write("\n".join(str(item) for item in ISISNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in ISISLSDBLines ))
+                    cleanInputFile.write("\n".join(str(item) for item in LDPNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in RSVPNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in BGPNeighborsLines))
+                    cleanInputFile.write("\n".join(str(item) for item in L3VPNServiceLines))
+                    cleanInputFile.write("\n".join(str(item) for item in L2VPNServiceLines))
+                    cleanInputFile.write("\n".join(str(item) for item in VPLSServiceLines))
+                cleanInputFile.close()
+
+                if debug:
+                    cleanInputDebugFileName = str(Hostname +"_"+ SysAddr +"_debug_config_"+ time.strftime("%Y%m%d_%H%M%S")+".txt")
+                    with open("./clean_input/"+cleanInputDebugFileName, 'w') as cleanInputDebugFileName:
+                        cleanInputDebugFileName.write("\n".join(str(item) for item in configLinesToParser))
+                    cleanInputDebugFileName.close()
+
+
+                if debug: pauseFunc("Generated a clean input file "+cleanInputFileName+" for the node. Press any key proceed.\r\n")
 
-                    # If encapsulation was not specified set it to default
-                    if (((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG")) and len(obj1.re_search_children("service instance ")) == 0):
-                        if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                            InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = "0"
+#####################################################################################################################################################
+###################################################           Find all interfaces in config file           ##########################################
+#####################################################################################################################################################
 
-                    # Find LAG associated with current interface
-                    for obj2 in obj1.re_search_children("bundle id "):
-                        InterfacesParse[InterfacesDict["LAGID"][0]] = str(obj2.text.split("bundle id ")[1].split(" ")[0])
-                        if re.search("active",obj2.text):
-                            InterfacesParse[InterfacesDict["LAGMode"][0]] = "Active"
+        NodeID = ""                     # NodeID is assigned by the DB writer once the node is found or created in the DB
+        IfNumber = 0
+        InterfacesParseAll = []
+
+#####################################################################################################################################################
+###################################################                  Cisco IOS-XR parsing                  ##########################################
+#####################################################################################################################################################
+        # Syntax: Cisco IOS-XR
+        if (CLISyntax == "IOS-XR"):
+            if debug: logger.debug("Using IOS-XR syntax to parse file")
+
+            # Index of bridge-domains and xconnects associated with every attachment circuit
+            L2VPNIndex = L2VPNIndexFunc(cfg)
+
+            # Find node's interfaces from config
+            for obj1 in cfg.find_objects(r"^interface"):
+                if re.search(" preconfigure ",obj1.text): continue
+                duplicate = [str(obj2) for obj2 in interfacesIndex[obj1.text.split("interface ")[1].split(" ")[0]]]
+
+                if len(duplicate) > 1:
+                    logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                    nextFile = 1
+                    skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
+                    break
+                
+                IfNumber = IfNumber + 1
+                InterfacesParse = [""] * len(InterfacesDict)
+                if debug: logger.debug("obj1: %s", obj1)
+                
+                InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                InterfacesParse[InterfacesDict["IfName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
+
+                # Classify interface by its name
+                for column, value in interfaceClassifierFunc(CLISyntax, InterfacesParse[InterfacesDict["IfName"][0]]).items():
+                    InterfacesParse[InterfacesDict[column][0]] = value
+
+                # Check if interface is l2tpansport interface
+                if re.search(r'l2transport',obj1.text.split("interface ")[1]):
+                    InterfacesParse[InterfacesDict["IfName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(" ")[0]
+                    InterfacesParse[InterfacesDict["ServiceType"][0]] = "L2VPN"
+                    if InterfacesParse[InterfacesDict["IfType"][0]] != "":
+                        InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
+                    
+                    InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "L2VPN"
+                    InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+
+                    # Find bridge-domain or xconnect associated with current interface
+                    for binding in L2VPNIndex.get(InterfacesParse[InterfacesDict["IfName"][0]], []):
+                        InterfacesParse[InterfacesDict["ServiceName"][0]] = binding[0]
+                        if binding[1] is not None:
+                            InterfacesParse[InterfacesDict["ServiceSDP"][0]] = binding[1]
+
+
+                # Find description associated with current interface
+                for obj2 in obj1.re_search_children("description "):
+                    InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj2.text.split("description ")[1].replace("\"",""))
+                    break
+                
+                # Find encapsulation associated with current interface
+                for obj2 in obj1.re_search_children(r"^ *encapsulation "):
+                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                    if re.search("second-dot1q ",obj2.text):
+                        if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
+                            InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj2.text.split(" dot1q ")[1].split(" second-dot1q ")[0].lstrip().rstrip().replace(" , ","|"))) + "." + str(obj2.text.split(" second-dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                    else:
+                        if re.search("dot1q ",obj2.text):
+                            if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                                InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj2.text.split(" dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
                         else:
-                            if re.search("passive",obj2.text):
-                                InterfacesParse[InterfacesDict["LAGMode"][0]] = "Passive"
+                            if re.search("untagged",obj2.text):
+                                if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
+
+                # If encapsulation was not specified set it to default
+                if (((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG")) and len(obj1.re_search_children("service instance ")) == 0):
+                    if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                        InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                    if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = "0"
+
+                # Find LAG associated with current interface
+                for obj2 in obj1.re_search_children("bundle id "):
+                    InterfacesParse[InterfacesDict["LAGID"][0]] = str(obj2.text.split("bundle id ")[1].split(" ")[0])
+                    if re.search("active",obj2.text):
+                        InterfacesParse[InterfacesDict["LAGMode"][0]] = "Active"
+                    else:
+                        if re.search("passive",obj2.text):
+                            InterfacesParse[InterfacesDict["LAGMode"][0]] = "Passive"
 
-                        for obj3 in cfg.find_objects(r"^interface Bundle-Ether"+str(InterfacesParse[InterfacesDict["LAGID"][0]])):
-                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj3.text.split("interface ")[1]
-                            break
+                    for obj3 in interfacesIndex.get("Bundle-Ether"+str(InterfacesParse[InterfacesDict["LAGID"][0]]), []):
+                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj3.text.split("interface ")[1]
                         break
+                    break
 
-                    # Find subinterfaces and respective VLANs associated with current interface
-                    for obj40 in cfg.find_objects(r"^interface"):
-                        searchExpression = r"^ *interface " + InterfacesParse[InterfacesDict["IfName"][0]] + r"[\. $]"
-                        if re.match(searchExpression,obj40.text):
-                            # print("FOUND")
-                            for obj3 in obj40.re_search_children(r"^ *encapsulation "):
-                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                if re.search("second-dot1q ",obj3.text):
-                                    if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj3.text.split(" dot1q ")[1].split(" second-dot1q ")[0].lstrip().rstrip().replace(" , ","|"))) + "." + str(obj3.text.split(" second-dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                # Find subinterfaces and respective VLANs associated with current interface
+                for obj40 in sorted(interfacesIndex[InterfacesParse[InterfacesDict["IfName"][0]]] + subinterfacesIndex.get(InterfacesParse[InterfacesDict["IfName"][0]], []), key=lambda obj: obj.linenum):
+                    searchExpression = r"^ *interface " + InterfacesParse[InterfacesDict["IfName"][0]] + r"[\. $]"
+                    if re.match(searchExpression,obj40.text):
+                        # print("FOUND")
+                        for obj3 in obj40.re_search_children(r"^ *encapsulation "):
+                            if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                            if re.search("second-dot1q ",obj3.text):
+                                if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj3.text.split(" dot1q ")[1].split(" second-dot1q ")[0].lstrip().rstrip().replace(" , ","|"))) + "." + str(obj3.text.split(" second-dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                            else:
+                                if re.search("dot1q ",obj3.text):
+                                    if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                                        InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj3.text.split(" dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
                                 else:
-                                    if re.search("dot1q ",obj3.text):
+                                    if re.search("untagged",obj3.text):
                                         if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                            InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj3.text.split(" dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
-                                    else:
-                                        if re.search("untagged",obj3.text):
-                                            if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                                InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
-
-                    # Find admin state associated with current interface
-                    for obj2 in obj1.re_search_children(r" +shutdown"):
-                        if str(obj2.text.split(" ")[1]):
-                            InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
-                        else:
-                            InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                    if InterfacesParse[InterfacesDict["StateAdm"][0]] == "":
+                                            InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
+
+                # Find admin state associated with current interface
+                for obj2 in obj1.re_search_children(r" +shutdown"):
+                    if str(obj2.text.split(" ")[1]):
+                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
+                    else:
                         InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                if InterfacesParse[InterfacesDict["StateAdm"][0]] == "":
+                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
 
-                    # Find L3VPN service associated with current interface
-                    for obj2 in obj1.re_search_children("vrf "):
-                        InterfacesParse[InterfacesDict["ServiceName"][0]] = str(obj2.text.split("vrf ")[1])
-                        InterfacesParse[InterfacesDict["ServiceType"][0]] = "L3VPN"
+                # Find L3VPN service associated with current interface
+                for obj2 in obj1.re_search_children("vrf "):
+                    InterfacesParse[InterfacesDict["ServiceName"][0]] = str(obj2.text.split("vrf ")[1])
+                    InterfacesParse[InterfacesDict["ServiceType"][0]] = "L3VPN"
 
-                    # Find L2 MTU associated with current interface 
-                    for obj2 in obj1.re_search_children(r"^ +mtu"):
-                        InterfacesParse[InterfacesDict["L2MTU"][0]]  = str(obj2.text.split("mtu ")[1])
-                        break
+                # Find L2 MTU associated with current interface 
+                for obj2 in obj1.re_search_children(r"^ +mtu"):
+                    InterfacesParse[InterfacesDict["L2MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    break
 
-                    # Find L3 MTU associated with current interface 
-                    for obj2 in obj1.re_search_children(r"^ +ipv4 mtu"):
-                        InterfacesParse[InterfacesDict["L3MTU"][0]]  = str(obj2.text.split("mtu ")[1])
-                        break
+                # Find L3 MTU associated with current interface 
+                for obj2 in obj1.re_search_children(r"^ +ipv4 mtu"):
+                    InterfacesParse[InterfacesDict["L3MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    break
 
-                    # Find all IPv4 addresses associated with current interface
-                    for obj2 in obj1.re_search_children("ipv4 address "):
-                        rawInput = obj2.text.split("ipv4 address ")[1].lstrip().rstrip()
-                        rawInput = rawInput.replace(" ","/")
-                        ipadd = ipaddress.ip_interface(str(rawInput))
-                        if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = str(ipadd)
-                        else:
-                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["IPV4Addr"][0]] + "|" + str(ipadd)
-                        if InterfacesParse[InterfacesDict["IPV4Subnet"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
-                        else:
-                            InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
+                # Find all IPv4 addresses associated with current interface
+                for obj2 in obj1.re_search_children("ipv4 address "):
+                    rawInput = obj2.text.split("ipv4 address ")[1].lstrip().rstrip()
+                    rawInput = rawInput.replace(" ","/")
+                    ipadd = ipaddress.ip_interface(str(rawInput))
+                    if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = str(ipadd)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["IPV4Addr"][0]] + "|" + str(ipadd)
+                    if InterfacesParse[InterfacesDict["IPV4Subnet"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
+
+                # Find all IPv6 addresses associated with current interface
+                for obj2 in obj1.re_search_children("ipv6 address "):
+                    rawInput = obj2.text.split("ipv6 address ")[1].lstrip().rstrip()
+                    ipadd = ipaddress.ip_interface(str(line))
+                    if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
+                    if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
 
-                    # Find all IPv6 addresses associated with current interface
-                    for obj2 in obj1.re_search_children("ipv6 address "):
-                        rawInput = obj2.text.split("ipv6 address ")[1].lstrip().rstrip()
-                        ipadd = ipaddress.ip_interface(str(line))
-                        if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
+                # Check if interface is a L3 interface
+                if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
+                    if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
+                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
                         else:
-                            InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
-                        if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
+                    # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned and no VRF assigned and create port binding for it
+                    if (InterfacesParse[InterfacesDict["ServiceName"][0]] == ""):
+                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
                         else:
-                            InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
-
-                    # Check if interface is a L3 interface
-                    if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
-                        if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
-                            if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-                            else:
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
-                        # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned and no VRF assigned and create port binding for it
-                        if (InterfacesParse[InterfacesDict["ServiceName"][0]] == ""):
-                            if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
-                            else:
-                                InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-                        # Mark interface as Access if it has any IPv4/v6 addresses and VRF assigned and create port binding for it
+                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+                    # Mark interface as Access if it has any IPv4/v6 addresses and VRF assigned and create port binding for it
+                    else:
+                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN"
                         else:
-                            if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN"
-                            else:
-                                InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3VPN"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3VPN"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
 
-                    # Check if interface has any port binding assigned
-                    if ((InterfacesParse[InterfacesDict["ServiceName"][0]] != "") or (InterfacesParse[InterfacesDict["ServiceID"][0]] != "")):
-                        if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
-                            if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-                            else:
-                                for vlan in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
-                                    if InterfacesParse[InterfacesDict["PortBinding"][0]] != "":
-                                        InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|"
-                                    InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + InterfacesParse[InterfacesDict["PortName"][0]] + ":" + vlan
+                # Check if interface has any port binding assigned
+                if ((InterfacesParse[InterfacesDict["ServiceName"][0]] != "") or (InterfacesParse[InterfacesDict["ServiceID"][0]] != "")):
+                    if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
+                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
+                        else:
+                            for vlan in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
+                                if InterfacesParse[InterfacesDict["PortBinding"][0]] != "":
+                                    InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|"
+                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + InterfacesParse[InterfacesDict["PortName"][0]] + ":" + vlan
+                
+                
+                # Find all OSPF processes and areas where this interface is participating
+                ospfList = []
+                # ospfLine = []
+
+                bfdList = []
+                # bfdLine = []
+
+                # Find all OSPF processes associated with interface
+                for obj10 in protocolChildrenFunc(protocolIndex, cfg, r"router ospf"):
+                    ospfPID = ""
+                    ospfRID = ""
+                    ospfVRFList = []
+                    ospfLine = []
                     
+                    ospfBFDMinTmr = ""
+                    ospfBFDMultTmr = ""
+                    bfdLine = []
+
+                    ospfVRFList.append(obj10)
+                    ospfPID = str(obj10.text.split("ospf ")[1].split(" ")[0])
+                    ospfLine.append(ospfPID)
+
+                    bfdLine.append("ospf")
+                    bfdLine.append(ospfPID)
                     
-                    # Find all OSPF processes and areas where this interface is participating
-                    ospfList = []
-                    # ospfLine = []
-
-                    bfdList = []
-                    # bfdLine = []
-
-                    # Find all OSPF processes associated with interface
-                    for obj10 in cfg.find_objects(r"router ospf"):
-                        ospfPID = ""
-                        ospfRID = ""
-                        ospfVRFList = []
-                        ospfLine = []
-                        
-                        ospfBFDMinTmr = ""
-                        ospfBFDMultTmr = ""
-                        bfdLine = []
+                    # Create a list of base entities (GRT + all VRFs) where areas can be located
+                    for obj70 in protocolChildrenFunc(protocolIndex, obj10, r"vrf"):
+                        ospfVRFList.append(obj70)
 
-                        ospfVRFList.append(obj10)
-                        ospfPID = str(obj10.text.split("ospf ")[1].split(" ")[0])
-                        ospfLine.append(ospfPID)
+                    # Look through all OSPF areas in and outside VRFs
+                    for ospfVRF in ospfVRFList:
 
-                        bfdLine.append("ospf")
-                        bfdLine.append(ospfPID)
-                        
-                        # Create a list of base entities (GRT + all VRFs) where areas can be located
-                        for obj70 in obj10.re_search_children(r"vrf"):
-                            ospfVRFList.append(obj70)
+                        # Find all OSPF global parameters
+
+                        for obj101 in protocolChildrenFunc(protocolIndex, ospfVRF, "router-id"):
+                            ospfRID = obj101.text.split("router-id ")[1].split()[0].lstrip().rstrip()
+
+                        for obj101 in protocolChildrenFunc(protocolIndex, ospfVRF, "bfd fast-detect"):
+                            if re.match(r"^ *bfd fast-detect *$",obj101.text):
+                                ospfBFDState = "En"
+                            if re.match(r"^ *no bfd fast-detect *$",obj101.text):
+                                ospfBFDState = "Dis"
 
-                        # Look through all OSPF areas in and outside VRFs
-                        for ospfVRF in ospfVRFList:
+                        for obj101 in protocolChildrenFunc(protocolIndex, ospfVRF, "bfd minimum-interval"):
+                            ospfBFDMinTmr = obj101.text.lstrip().rstrip().split("bfd minimum-interval ")[1]
+                        
+                        for obj101 in protocolChildrenFunc(protocolIndex, ospfVRF, "bfd multiplier"):
+                            ospfBFDMultTmr = obj101.text.lstrip().rstrip().split("bfd multiplier ")[1]
+                        
 
-                            # Find all OSPF global parameters
+                        # First we will look for the area where interface is primary
+                        ospfIfType1 = ""
+                        ospfIfType2 = "Bcast"
+                        ospfIfMode = "Act"
+                        ospfBFDState = "Dis"
+                        ospfPriority = ""
+                        ospfMetric = ""
+                        ospfHello = ""
+                        ospfDead = ""
+                        ospfRetransmit = ""
+                        ospfAuth = ""
+                        ospfIfState = "En"
 
-                            for obj101 in ospfVRF.re_search_children("router-id"):
-                                ospfRID = obj101.text.split("router-id ")[1].split()[0].lstrip().rstrip()
+                        area = ""
+                        for obj11 in protocolChildrenFunc(protocolIndex, ospfVRF, r"area "):
+                            
+                            area = int(obj11.text.split("area ")[1])
+                            area = ipaddress.ip_address(area)
 
-                            for obj101 in ospfVRF.re_search_children("bfd fast-detect"):
+                            for obj101 in protocolChildrenFunc(protocolIndex, obj11, "bfd fast-detect"):
                                 if re.match(r"^ *bfd fast-detect *$",obj101.text):
                                     ospfBFDState = "En"
                                 if re.match(r"^ *no bfd fast-detect *$",obj101.text):
                                     ospfBFDState = "Dis"
 
-                            for obj101 in ospfVRF.re_search_children("bfd minimum-interval"):
+                            for obj101 in protocolChildrenFunc(protocolIndex, obj11, "bfd minimum-interval"):
                                 ospfBFDMinTmr = obj101.text.lstrip().rstrip().split("bfd minimum-interval ")[1]
                             
-                            for obj101 in ospfVRF.re_search_children("bfd multiplier"):
+                            for obj101 in protocolChildrenFunc(protocolIndex, obj11, "bfd multiplier"):
                                 ospfBFDMultTmr = obj101.text.lstrip().rstrip().split("bfd multiplier ")[1]
-                            
 
-                            # First we will look for the area where interface is primary
-                            ospfIfType1 = ""
-                            ospfIfType2 = "Bcast"
-                            ospfIfMode = "Act"
-                            ospfBFDState = "Dis"
-                            ospfPriority = ""
-                            ospfMetric = ""
-                            ospfHello = ""
-                            ospfDead = ""
-                            ospfRetransmit = ""
-                            ospfAuth = ""
-                            ospfIfState = "En"
+                            # print("Looking in PID:" + ospfPID + " VRF:" + str(VRF) + " Area:" + str(int(area)))
 
-                            area = ""
-                            for obj11 in ospfVRF.re_search_children(r"area "):
-                                
-                                area = int(obj11.text.split("area ")[1])
-                                area = ipaddress.ip_address(area)
+                            # Find current interface configured as primary within an area
+                            # print(len(obj11.re_search_children(searchExpression)))
+                            # print("Number of interfaces in area " + str(int(area)) + ":" + str(len(obj11.re_search_children(r"interface "))))
 
-                                for obj101 in obj11.re_search_children("bfd fast-detect"):
-                                    if re.match(r"^ *bfd fast-detect *$",obj101.text):
-                                        ospfBFDState = "En"
-                                    if re.match(r"^ *no bfd fast-detect *$",obj101.text):
-                                        ospfBFDState = "Dis"
+                            # if len(obj11.re_search_children(r"interface ")) == 0:
+                                # print(obj11.re_search_children(r".*"))
+                            for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
+                                # print("Match found in PID:" + ospfPID + " VRF:" + VRF + " Area:" + str(int(area)))
 
-                                for obj101 in obj11.re_search_children("bfd minimum-interval"):
-                                    ospfBFDMinTmr = obj101.text.lstrip().rstrip().split("bfd minimum-interval ")[1]
-                                
-                                for obj101 in obj11.re_search_children("bfd multiplier"):
-                                    ospfBFDMultTmr = obj101.text.lstrip().rstrip().split("bfd multiplier ")[1]
+                                if re.search(r"multi-area-interface",obj12.text):
+                                    continue
+                                else:
+                                    # Find all OSPF parameters for this primary interface
 
-                                # print("Looking in PID:" + ospfPID + " VRF:" + str(VRF) + " Area:" + str(int(area)))
+                                    ospfLine.append(ospfRID)
 
-                                # Find current interface configured as primary within an area
-                                searchExpression = InterfacesParse[InterfacesDict["IfName"][0]] + r"$"
-                                # print(len(obj11.re_search_children(searchExpression)))
-                                # print("Number of interfaces in area " + str(int(area)) + ":" + str(len(obj11.re_search_children(r"interface "))))
+                                    for obj13 in obj12.re_search_children("network "):
+                                        ospfIfType1 = str(obj13.text.split("network ")[1].split(" ")[0].lstrip().rstrip())
+                                        ospfIfType2 = ""
+                                        if ospfIfType1 == "point-to-point":
+                                            ospfIfType2 = "PtP"
+                                        else:
+                                            if ospfIfType1 == "point-to-multipoint":
+                                                ospfIfType2 = "PtMP"
+                                            else:
+                                                ospfIfType2 = ospfIfType1
+                                        break
+                                    ospfLine.append(ospfIfType2)
+                                    for obj13 in obj12.re_search_children("passive"):
+                                        if re.match(r"^ *passive enable *$",obj13.text):
+                                            ospfIfMode = "Pass"
+                                        if re.match(r"^ *no passive enable *$",obj13.text):
+                                            ospfIfMode = "Act"
+                                        break
+                                    ospfLine.append(ospfIfMode)
+                                    for obj13 in obj12.re_search_children("bfd fast-detect"):
+                                        if re.match(r"^ *bfd fast-detect *$",obj13.text):
+                                            ospfBFDState = "En"
+                                        if re.match(r"^ *no bfd fast-detect *$",obj13.text):
+                                            ospfBFDState = "Dis"
+                                        break
+                                    if ospfBFDState == "": ospfBFDState = "Dis"
+
+                                    for obj101 in obj12.re_search_children("bfd fast-detect"):
+                                        if re.match(r"^ *bfd fast-detect *$",obj101.text):
+                                            ospfBFDState = "En"
+                                        if re.match(r"^ *no bfd fast-detect *$",obj101.text):
+                                            ospfBFDState = "Dis"
+                                    ospfLine.append(ospfBFDState)
+                                    for obj101 in obj12.re_search_children("bfd minimum-interval"):
+                                        ospfBFDMinTmr = obj101.text.lstrip().rstrip().split("bfd minimum-interval ")[1]
+                                    
+                                    for obj101 in obj12.re_search_children("bfd multiplier"):
+                                        ospfBFDMultTmr = obj101.text.lstrip().rstrip().split("bfd multiplier ")[1]
 
-                                # if len(obj11.re_search_children(r"interface ")) == 0:
-                                    # print(obj11.re_search_children(r".*"))
-                                for obj12 in obj11.re_search_children(searchExpression):
-                                    # print("Match found in PID:" + ospfPID + " VRF:" + VRF + " Area:" + str(int(area)))
+                                    bfdLine.append(ospfBFDMinTmr)
+                                    bfdLine.append(ospfBFDMultTmr)
 
-                                    if re.search(r"multi-area-interface",obj12.text):
-                                        continue
-                                    else:
-                                        # Find all OSPF parameters for this primary interface
-
-                                        ospfLine.append(ospfRID)
+                                    for obj13 in obj12.re_search_children("priority "):
+                                        ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfPriority)
+                                    for obj13 in obj12.re_search_children("cost "):
+                                        ospfMetric = str(obj13.text.split("cost ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfMetric)
+                                    for obj13 in obj12.re_search_children("hello-interval "):
+                                        ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfHello)
+                                    for obj13 in obj12.re_search_children("dead-interval "):
+                                        ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfDead)
+                                    for obj13 in obj12.re_search_children("retransmit-interval "):
+                                        ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfRetransmit)
+                                    for obj13 in obj12.re_search_children("authentication "):
+                                        ospfAuth = str(obj13.text.split("authentication ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfAuth)
+                                    for obj13 in obj12.re_search_children("shutdown"):
+                                        ospfIfState = "Dis"
+                                        break
 
-                                        for obj13 in obj12.re_search_children("network "):
-                                            ospfIfType1 = str(obj13.text.split("network ")[1].split(" ")[0].lstrip().rstrip())
-                                            ospfIfType2 = ""
-                                            if ospfIfType1 == "point-to-point":
-                                                ospfIfType2 = "PtP"
-                                            else:
-                                                if ospfIfType1 == "point-to-multipoint":
-                                                    ospfIfType2 = "PtMP"
-                                                else:
-                                                    ospfIfType2 = ospfIfType1
-                                            break
-                                        ospfLine.append(ospfIfType2)
-                                        for obj13 in obj12.re_search_children("passive"):
-                                            if re.match(r"^ *passive enable *$",obj13.text):
-                                                ospfIfMode = "Pass"
-                                            if re.match(r"^ *no passive enable *$",obj13.text):
-                                                ospfIfMode = "Act"
-                                            break
-                                        ospfLine.append(ospfIfMode)
-                                        for obj13 in obj12.re_search_children("bfd fast-detect"):
-                                            if re.match(r"^ *bfd fast-detect *$",obj13.text):
-                                                ospfBFDState = "En"
-                                            if re.match(r"^ *no bfd fast-detect *$",obj13.text):
-                                                ospfBFDState = "Dis"
-                                            break
-                                        if ospfBFDState == "": ospfBFDState = "Dis"
+                                    ospfAreaList = []
+                                    ospfAreaList.append([int(area),"*",""])
+                                    if ospfIfState == "Dis":
+                                        ospfAreaList[0][2] = "(Dis)"
+                                    else:
+                                        ospfAreaList[0][2] = ""
 
-                                        for obj101 in obj12.re_search_children("bfd fast-detect"):
-                                            if re.match(r"^ *bfd fast-detect *$",obj101.text):
-                                                ospfBFDState = "En"
-                                            if re.match(r"^ *no bfd fast-detect *$",obj101.text):
-                                                ospfBFDState = "Dis"
-                                        ospfLine.append(ospfBFDState)
-                                        for obj101 in obj12.re_search_children("bfd minimum-interval"):
-                                            ospfBFDMinTmr = obj101.text.lstrip().rstrip().split("bfd minimum-interval ")[1]
-                                        
-                                        for obj101 in obj12.re_search_children("bfd multiplier"):
-                                            ospfBFDMultTmr = obj101.text.lstrip().rstrip().split("bfd multiplier ")[1]
+                                    ospfLine.append(ospfAreaList)
 
-                                        bfdLine.append(ospfBFDMinTmr)
-                                        bfdLine.append(ospfBFDMultTmr)
+                                    ospfList.append(ospfLine)  
+                                    bfdList.append(bfdLine)
 
-                                        for obj13 in obj12.re_search_children("priority "):
-                                            ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfPriority)
-                                        for obj13 in obj12.re_search_children("cost "):
-                                            ospfMetric = str(obj13.text.split("cost ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfMetric)
-                                        for obj13 in obj12.re_search_children("hello-interval "):
-                                            ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfHello)
-                                        for obj13 in obj12.re_search_children("dead-interval "):
-                                            ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfDead)
-                                        for obj13 in obj12.re_search_children("retransmit-interval "):
-                                            ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfRetransmit)
-                                        for obj13 in obj12.re_search_children("authentication "):
-                                            ospfAuth = str(obj13.text.split("authentication ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfAuth)
-                                        for obj13 in obj12.re_search_children("shutdown"):
-                                            ospfIfState = "Dis"
-                                            break
+                                    break
 
-                                        ospfAreaList = []
-                                        ospfAreaList.append([int(area),"*",""])
-                                        if ospfIfState == "Dis":
-                                            ospfAreaList[0][2] = "(Dis)"
-                                        else:
-                                            ospfAreaList[0][2] = ""
+                        # Now we will look for all other areas where interface is secondary
 
-                                        ospfLine.append(ospfAreaList)
+                        area = ""
+                        # Look through all OSPF areas
+                        for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"area "):
+                            area = int(obj11.text.split("area ")[1])
+                            area = ipaddress.ip_address(area)
 
-                                        ospfList.append(ospfLine)  
-                                        bfdList.append(bfdLine)
+                            ospfLine = []
+                            ospfPriority = ""
+                            ospfMetric = ""
+                            ospfHello = ""
+                            ospfDead = ""
+                            ospfRetransmit = ""
+                            ospfAuth = ""
+                            ospfIfState = "En"
 
+                            # Find current interface configured as secondary within an area
+                            for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
+                                if re.search(r"multi-area-interface",obj12.text):
+                                    # Find all OSPF parameters for this secondary interface
+                                    ospfLine.append(ospfPID)        # Set to same value as on primary configuration
+                                    ospfLine.append(ospfRID)        # Set to same value as on primary configuration
+                                    ospfLine.append(ospfIfType2)    # Set to same value as on primary configuration
+                                    ospfLine.append(ospfIfMode)     # Set to same value as on primary configuration
+                                    ospfLine.append(ospfBFDState)   # Set to same value as on primary configuration
+                                    for obj13 in obj12.re_search_children("priority "):
+                                        ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfPriority)
+                                    for obj13 in obj12.re_search_children("cost "):
+                                        ospfMetric = str(obj13.text.split("cost ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfMetric)
+                                    for obj13 in obj12.re_search_children("hello-interval "):
+                                        ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfHello)
+                                    for obj13 in obj12.re_search_children("dead-interval "):
+                                        ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfDead)
+                                    for obj13 in obj12.re_search_children("retransmit-interval "):
+                                        ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfRetransmit)
+                                    for obj13 in obj12.re_search_children("authentication "):
+                                        ospfAuth = str(obj13.text.split("authentication ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    ospfLine.append(ospfAuth)
+                                    for obj13 in obj12.re_search_children("shutdown"):
+                                        ospfIfState = "Dis"
                                         break
 
-                            # Now we will look for all other areas where interface is secondary
-
-                            area = ""
-                            # Look through all OSPF areas
-                            for obj11 in obj10.re_search_children(r"area "):
-                                area = int(obj11.text.split("area ")[1])
-                                area = ipaddress.ip_address(area)
-
-                                ospfLine = []
-                                ospfPriority = ""
-                                ospfMetric = ""
-                                ospfHello = ""
-                                ospfDead = ""
-                                ospfRetransmit = ""
-                                ospfAuth = ""
-                                ospfIfState = "En"
+                                    ospfAreaList = []
+                                    ospfAreaList.append([int(area),"",""])
+                                    if ospfIfState == "Dis":
+                                        ospfAreaList[0][2] = "(Dis)"
+                                    else:
+                                        ospfAreaList[0][2] = ""
+                                    ospfLine.append(ospfAreaList)
 
-                                # Find current interface configured as secondary within an area
-                                searchExpression = InterfacesParse[InterfacesDict["IfName"][0]] + r"$"
-                                for obj12 in obj11.re_search_children(searchExpression):
-                                    if re.search(r"multi-area-interface",obj12.text):
-                                        # Find all OSPF parameters for this secondary interface
-                                        ospfLine.append(ospfPID)        # Set to same value as on primary configuration
-                                        ospfLine.append(ospfRID)        # Set to same value as on primary configuration
-                                        ospfLine.append(ospfIfType2)    # Set to same value as on primary configuration
-                                        ospfLine.append(ospfIfMode)     # Set to same value as on primary configuration
-                                        ospfLine.append(ospfBFDState)   # Set to same value as on primary configuration
-                                        for obj13 in obj12.re_search_children("priority "):
-                                            ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfPriority)
-                                        for obj13 in obj12.re_search_children("cost "):
-                                            ospfMetric = str(obj13.text.split("cost ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfMetric)
-                                        for obj13 in obj12.re_search_children("hello-interval "):
-                                            ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfHello)
-                                        for obj13 in obj12.re_search_children("dead-interval "):
-                                            ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfDead)
-                                        for obj13 in obj12.re_search_children("retransmit-interval "):
-                                            ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfRetransmit)
-                                        for obj13 in obj12.re_search_children("authentication "):
-                                            ospfAuth = str(obj13.text.split("authentication ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        ospfLine.append(ospfAuth)
-                                        for obj13 in obj12.re_search_children("shutdown"):
-                                            ospfIfState = "Dis"
+                                    lineNumber = 0
+                                    match = 0
+                                    for ospfLineCheck in ospfList:
+                                        if ((ospfLineCheck[4] == ospfBFDState) and (ospfLineCheck[5] == ospfPriority) and (ospfLineCheck[6] == ospfMetric) and (ospfLineCheck[7] == ospfHello) 
+                                            and (ospfLineCheck[8] == ospfDead) and (ospfLineCheck[9] == ospfRetransmit) and (ospfLineCheck[10] == ospfAuth)):
+                                            
+                                            ospfList[lineNumber][11].extend(ospfAreaList)
+                                            match = 1
                                             break
 
-                                        ospfAreaList = []
-                                        ospfAreaList.append([int(area),"",""])
-                                        if ospfIfState == "Dis":
-                                            ospfAreaList[0][2] = "(Dis)"
-                                        else:
-                                            ospfAreaList[0][2] = ""
-                                        ospfLine.append(ospfAreaList)
-
-                                        lineNumber = 0
-                                        match = 0
-                                        for ospfLineCheck in ospfList:
-                                            if ((ospfLineCheck[4] == ospfBFDState) and (ospfLineCheck[5] == ospfPriority) and (ospfLineCheck[6] == ospfMetric) and (ospfLineCheck[7] == ospfHello) 
-                                                and (ospfLineCheck[8] == ospfDead) and (ospfLineCheck[9] == ospfRetransmit) and (ospfLineCheck[10] == ospfAuth)):
-                                                
-                                                ospfList[lineNumber][11].extend(ospfAreaList)
-                                                match = 1
-                                                break
-
-                                            lineNumber = lineNumber + 1
+                                        lineNumber = lineNumber + 1
 
-                                        if match == 0:
-                                            ospfList.append(ospfLine)
+                                    if match == 0:
+                                        ospfList.append(ospfLine)
 
 
-                        # Sort all areas inside the ospfList
-                        # print(ospfList)
-                        lineNumber = 0
-                        for ospfLineCheck in ospfList:
-                            # print(ospfList[lineNumber][10])
-                            ospfList[lineNumber][11].sort(key=lambda x: x[0])
-                            lineNumber = lineNumber + 1
-                        
-                        # ospfList.sort(key=lambda x: x[10])
+                    # Sort all areas inside the ospfList
+                    # print(ospfList)
+                    lineNumber = 0
+                    for ospfLineCheck in ospfList:
+                        # print(ospfList[lineNumber][10])
+                        ospfList[lineNumber][11].sort(key=lambda x: x[0])
+                        lineNumber = lineNumber + 1
+                    
+                    # ospfList.sort(key=lambda x: x[10])
 
 
-                        # Print OSPF data for each OSPF process where this interface is enabled
-                        if len(ospfList) > 0:
-                            ospfOutputLine = ""
-                            for ospfLine in ospfList:
-                                # print(ospfLine)
-                                if ospfOutputLine != "":
-                                    ospfOutputLine = ospfOutputLine + ";"
+                    # Print OSPF data for each OSPF process where this interface is enabled
+                    if len(ospfList) > 0:
+                        ospfOutputLine = ""
+                        for ospfLine in ospfList:
+                            # print(ospfLine)
+                            if ospfOutputLine != "":
+                                ospfOutputLine = ospfOutputLine + ";"
 
-                                # ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3]) + "|prio:"+str(ospfLine[4]) + "|metr:"+str(ospfLine[5]) + "|hello:"+str(ospfLine[6]) + "|dead:"+str(ospfLine[7]) + "|retr:"+str(ospfLine[8]) + "|auth:"+str(ospfLine[9])
-                                
-                                ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0])
-                                if ospfLine[1] != "": ospfOutputLine = ospfOutputLine + "|rid:"+str(ospfLine[1])
-                                ospfOutputLine = ospfOutputLine + "|type:"+str(ospfLine[2]) + "|mode:"+str(ospfLine[3]) + "|bfd:"+str(ospfLine[4])
-                                if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[5])
-                                if ospfLine[6] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[6])
-                                if ((ospfLine[7] != "") or (ospfLine[8] != "") or (ospfLine[9] != "")):
-                                    if ospfLine[7] == "": ospfLine[7] = "def"
-                                    if ospfLine[8] == "": ospfLine[8] = "def"
-                                    if ospfLine[9] == "": ospfLine[9] = "def"
-                                    ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[7]) + " " + str(ospfLine[8]) + " " + str(ospfLine[9])
-                                if ospfLine[10] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[10])
+                            # ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3]) + "|prio:"+str(ospfLine[4]) + "|metr:"+str(ospfLine[5]) + "|hello:"+str(ospfLine[6]) + "|dead:"+str(ospfLine[7]) + "|retr:"+str(ospfLine[8]) + "|auth:"+str(ospfLine[9])
+                            
+                            ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0])
+                            if ospfLine[1] != "": ospfOutputLine = ospfOutputLine + "|rid:"+str(ospfLine[1])
+                            ospfOutputLine = ospfOutputLine + "|type:"+str(ospfLine[2]) + "|mode:"+str(ospfLine[3]) + "|bfd:"+str(ospfLine[4])
+                            if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[5])
+                            if ospfLine[6] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[6])
+                            if ((ospfLine[7] != "") or (ospfLine[8] != "") or (ospfLine[9] != "")):
+                                if ospfLine[7] == "": ospfLine[7] = "def"
+                                if ospfLine[8] == "": ospfLine[8] = "def"
+                                if ospfLine[9] == "": ospfLine[9] = "def"
+                                ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[7]) + " " + str(ospfLine[8]) + " " + str(ospfLine[9])
+                            if ospfLine[10] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[10])
 
-                                if len(ospfLine) > 11:
-                                    ospfOutputLine = ospfOutputLine + "|areas:"
+                            if len(ospfLine) > 11:
+                                ospfOutputLine = ospfOutputLine + "|areas:"
 
-                                    ospfOutputLine2 = ""
-                                    for area in ospfLine[11]:
-                                        if ospfOutputLine2 == "":
-                                            ospfOutputLine2 = str(area[0]) + str(area[1]) + str(area[2]) 
-                                        else:
-                                            ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1]) + str(area[2])
-                                    
-                                    ospfOutputLine = ospfOutputLine + ospfOutputLine2
+                                ospfOutputLine2 = ""
+                                for area in ospfLine[11]:
+                                    if ospfOutputLine2 == "":
+                                        ospfOutputLine2 = str(area[0]) + str(area[1]) + str(area[2]) 
+                                    else:
+                                        ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1]) + str(area[2])
                                 
-                            if InterfacesParse[InterfacesDict["OSPFv2"][0]] != "": InterfacesParse[InterfacesDict["OSPFv2"][0]] = InterfacesParse[InterfacesDict["OSPFv2"][0]] + ";"
-                            InterfacesParse[InterfacesDict["OSPFv2"][0]] = InterfacesParse[InterfacesDict["OSPFv2"][0]] + ospfOutputLine
-
+                                ospfOutputLine = ospfOutputLine + ospfOutputLine2
                             
-                            # Print BFD timers for each OSPF process where this interface is enabled
-                            if len(bfdList) > 0:
-                                bfdOutputLine = ""
-                                for bfdLine in bfdList:
-                                    if bfdOutputLine != "":
-                                        bfdOutputLine = bfdOutputLine + ";"
-                                    if (( bfdLine[2] != "" ) or ( bfdLine[3] != "" )):
-                                        if bfdLine[2] == "": ospfLine[2] = "def"
-                                        if bfdLine[3] == "": ospfLine[3] = "def"
-                                        bfdOutputLine = bfdOutputLine + "type:"+str(bfdLine[0]) + "|pid:"+str(bfdLine[1]) + "|tmr:"+str(bfdLine[2])+" "+str(bfdLine[2])+" "+str(bfdLine[3])
-
-                                InterfacesParse[InterfacesDict["BFD"][0]] = bfdOutputLine
-
-
-                    # Find if LDP is enabled on this interface
-                    for obj10 in cfg.find_objects(r"^mpls ldp"):
-                        # print(obj10)
-                        LDPIfAdmState = ""
-                        LDPIPv4AdmState = ""
-                        LDPIPv6AdmState = ""
-
-                        searchExpression = InterfacesParse[InterfacesDict["IfName"][0]] + r"$"
-                        for obj12 in obj10.re_search_children(searchExpression):
-                            # print(obj12)
-                            for obj13 in obj12.re_search_children(r"shutdown"):
-                                LDPIfAdmState = "if:Dis"
-                                break
-                            if LDPIfAdmState == "":
-                                LDPIfAdmState = "if:En"
-
-                        if LDPIfAdmState != "":
-                            for obj12 in obj10.re_search_children(r"address-family ipv4"):
-                                LDPIPv4AdmState = "ipv4:En"
-                            # if LDPIPv4AdmState == "": LDPIPv4AdmState = "ipv4:Dis"
-                            for obj12 in obj10.re_search_children(r"address-family ipv6"):
-                                LDPIPv6AdmState = "ipv6:En"
-                            # if LDPIPv6AdmState == "": LDPIPv6AdmState = "ipv6:Dis"
-
-
-                        if LDPIfAdmState != "":
-                            InterfacesParse[InterfacesDict["LDP"][0]] = LDPIfAdmState
-                        if LDPIPv4AdmState != "":
-                            InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv4AdmState
-                        if LDPIPv6AdmState != "":
-                            InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv6AdmState
-                        
-                        # print(InterfacesParse[InterfacesDict["LDP"][0]])
+                        if InterfacesParse[InterfacesDict["OSPFv2"][0]] != "": InterfacesParse[InterfacesDict["OSPFv2"][0]] = InterfacesParse[InterfacesDict["OSPFv2"][0]] + ";"
+                        InterfacesParse[InterfacesDict["OSPFv2"][0]] = InterfacesParse[InterfacesDict["OSPFv2"][0]] + ospfOutputLine
 
+                        
+                        # Print BFD timers for each OSPF process where this interface is enabled
+                        if len(bfdList) > 0:
+                            bfdOutputLine = ""
+                            for bfdLine in bfdList:
+                                if bfdOutputLine != "":
+                                    bfdOutputLine = bfdOutputLine + ";"
+                                if (( bfdLine[2] != "" ) or ( bfdLine[3] != "" )):
+                                    if bfdLine[2] == "": ospfLine[2] = "def"
+                                    if bfdLine[3] == "": ospfLine[3] = "def"
+                                    bfdOutputLine = bfdOutputLine + "type:"+str(bfdLine[0]) + "|pid:"+str(bfdLine[1]) + "|tmr:"+str(bfdLine[2])+" "+str(bfdLine[2])+" "+str(bfdLine[3])
+
+                            InterfacesParse[InterfacesDict["BFD"][0]] = bfdOutputLine
+
+
+                # Find if LDP is enabled on this interface
+                for obj10 in protocolChildrenFunc(protocolIndex, cfg, r"^mpls ldp"):
+                    # print(obj10)
+                    LDPIfAdmState = ""
+                    LDPIPv4AdmState = ""
+                    LDPIPv6AdmState = ""
 
-                    # Find QoS input policy associated with current interface
-                    for obj2 in obj1.re_search_children("service-policy input"):
-                        InterfacesParse[InterfacesDict["QoSIn"][0]] = str(obj2.text.split("service-policy input ")[1])
-                        break
+                    for obj12 in protocolInterfacesFunc(protocolIndex, obj10, InterfacesParse[InterfacesDict["IfName"][0]]):
+                        # print(obj12)
+                        for obj13 in obj12.re_search_children(r"shutdown"):
+                            LDPIfAdmState = "if:Dis"
+                            break
+                        if LDPIfAdmState == "":
+                            LDPIfAdmState = "if:En"
+
+                    if LDPIfAdmState != "":
+                        for obj12 in protocolChildrenFunc(protocolIndex, obj10, r"address-family ipv4"):
+                            LDPIPv4AdmState = "ipv4:En"
+                        # if LDPIPv4AdmState == "": LDPIPv4AdmState = "ipv4:Dis"
+                        for obj12 in protocolChildrenFunc(protocolIndex, obj10, r"address-family ipv6"):
+                            LDPIPv6AdmState = "ipv6:En"
+                        # if LDPIPv6AdmState == "": LDPIPv6AdmState = "ipv6:Dis"
+
+
+                    if LDPIfAdmState != "":
+                        InterfacesParse[InterfacesDict["LDP"][0]] = LDPIfAdmState
+                    if LDPIPv4AdmState != "":
+                        InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv4AdmState
+                    if LDPIPv6AdmState != "":
+                        InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv6AdmState
+                    
+                    # print(InterfacesParse[InterfacesDict["LDP"][0]])
 
-                    # Find QoS output policy associated with current interface
-                    for obj2 in obj1.re_search_children("service-policy output"):
-                        InterfacesParse[InterfacesDict["QoSOut"][0]] = str(obj2.text.split("service-policy output ")[1])
-                        break
 
-                    # Find if SyncE enabled on current interface
-                    for obj2 in obj1.re_search_children("synchronization"):
-                        InterfacesParse[InterfacesDict["SyncE"][0]] = "En"
-                        # Find SyncE configuration on current interface
-                        for obj3 in obj2.re_search_children(r".*"):
-                            InterfacesParse[InterfacesDict["SyncE"][0]] = InterfacesParse[InterfacesDict["SyncE"][0]] + "|" + str(obj3.text.lstrip().rstrip())
-                            # break
-                        break
+                # Find QoS input policy associated with current interface
+                for obj2 in obj1.re_search_children("service-policy input"):
+                    InterfacesParse[InterfacesDict["QoSIn"][0]] = str(obj2.text.split("service-policy input ")[1])
+                    break
 
-                    # Find if CDP is enabled on current interface
-                    for obj2 in obj1.re_search_children("cdp"):
-                        InterfacesParse[InterfacesDict["CDP"][0]] = "En"
-                        break
+                # Find QoS output policy associated with current interface
+                for obj2 in obj1.re_search_children("service-policy output"):
+                    InterfacesParse[InterfacesDict["QoSOut"][0]] = str(obj2.text.split("service-policy output ")[1])
+                    break
 
-                    # Find if LLDP is enabled on current interface
-                    for obj2 in obj1.re_search_children("lldp"):
-                        InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
-                        break
+                # Find if SyncE enabled on current interface
+                for obj2 in obj1.re_search_children("synchronization"):
+                    InterfacesParse[InterfacesDict["SyncE"][0]] = "En"
+                    # Find SyncE configuration on current interface
+                    for obj3 in obj2.re_search_children(r".*"):
+                        InterfacesParse[InterfacesDict["SyncE"][0]] = InterfacesParse[InterfacesDict["SyncE"][0]] + "|" + str(obj3.text.lstrip().rstrip())
+                        # break
+                    break
 
-                    #########################################################################################################################################
-                    #                                                    Post-processing for interfaces                                                     #
-                    #########################################################################################################################################
-                    
-                    # Sort VLANs for Ports
-                    if re.search(r"(Port|LAG)",InterfacesParse[InterfacesDict["IfType"][0]]):
-                        if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]])
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
-                            # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
-                            VLANList = []
-                            for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
-                                VLANList.append(value)
-                            VLANList = sorted(VLANList, key=float)
+                # Find if CDP is enabled on current interface
+                for obj2 in obj1.re_search_children("cdp"):
+                    InterfacesParse[InterfacesDict["CDP"][0]] = "En"
+                    break
 
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = ""
-                            # VLANList = VLANList.sort()
-                            # print(VLANList)
-                            for value in VLANList:
-                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
+                # Find if LLDP is enabled on current interface
+                for obj2 in obj1.re_search_children("lldp"):
+                    InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
+                    break
 
-                    # Sort BridgeIDs for Ports
-                    if re.search(r"Port",InterfacesParse[InterfacesDict["IfType"][0]]):
-                        if re.search(r"\|",InterfacesParse[InterfacesDict["BridgeID"][0]]):
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]])
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
-                            # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
-                            BridgeList = []
-                            for value in InterfacesParse[InterfacesDict["BridgeID"][0]].split("|"):
-                                BridgeList.append(value)
-                            BridgeList = sorted(BridgeList, key=float)
-
-                            InterfacesParse[InterfacesDict["BridgeID"][0]] = ""
-                            # VLANList = VLANList.sort()
-                            # print(BridgeList)
-                            for value in BridgeList:
-                                if InterfacesParse[InterfacesDict["BridgeID"][0]] != "": InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|"
-                                InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + str(value)
+                #########################################################################################################################################
+                #                                                    Post-processing for interfaces                                                     #
+                #########################################################################################################################################
+                
+                # Sort VLANs for Ports
+                if re.search(r"(Port|LAG)",InterfacesParse[InterfacesDict["IfType"][0]]):
+                    if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]])
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
+                        # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
+                        VLANList = []
+                        for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
+                            VLANList.append(value)
+                        VLANList = sorted(VLANList, key=float)
+
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = ""
+                        # VLANList = VLANList.sort()
+                        # print(VLANList)
+                        for value in VLANList:
+                            if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
+
+                # Sort BridgeIDs for Ports
+                if re.search(r"Port",InterfacesParse[InterfacesDict["IfType"][0]]):
+                    if re.search(r"\|",InterfacesParse[InterfacesDict["BridgeID"][0]]):
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]])
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
+                        # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
+                        BridgeList = []
+                        for value in InterfacesParse[InterfacesDict["BridgeID"][0]].split("|"):
+                            BridgeList.append(value)
+                        BridgeList = sorted(BridgeList, key=float)
+
+                        InterfacesParse[InterfacesDict["BridgeID"][0]] = ""
+                        # VLANList = VLANList.sort()
+                        # print(BridgeList)
+                        for value in BridgeList:
+                            if InterfacesParse[InterfacesDict["BridgeID"][0]] != "": InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|"
+                            InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + str(value)
 
 
 
 
-                    InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                    InterfacesParseAll.append(InterfacesParse)
+                InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                InterfacesParseAll.append(InterfacesParse)
 
 
 #####################################################################################################################################################
 ###################################################               Cisco IOS/IOS-XE parsing               ############################################
 #####################################################################################################################################################
 
-            # Syntax: Cisco IOS/IOS-XE
-            if (CLISyntax == "IOS"):
-                if debug: print("debug: Using IOS syntax to parse file")
-                # Find node's interfaces from config
-                for obj1 in cfg.find_objects(r"^interface"):
-                    duplicate = []
-                    for obj2 in cfg.find_objects(r"^interface"):
-                        if obj1.text.split("interface ")[1].split(" ")[0] == obj2.text.split("interface ")[1].split(" ")[0]:
-                            duplicate.append(str(obj2))
+        # Syntax: Cisco IOS/IOS-XE
+        if (CLISyntax == "IOS"):
+            if debug: logger.debug("Using IOS syntax to parse file")
+            # Find node's interfaces from config
+            for obj1 in cfg.find_objects(r"^interface"):
+                duplicate = [str(obj2) for obj2 in interfacesIndex[obj1.text.split("interface ")[1].split(" ")[0]]]
+
+                if len(duplicate) > 1:
+                    logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                    nextFile = 1
+                    skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
+                    break
+                
+                IfNumber = IfNumber + 1
+                InterfacesParse = [""] * len(InterfacesDict)
+                if debug: logger.debug("obj1: %s", obj1)
+                
+                InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                InterfacesParse[InterfacesDict["IfName"][0]] = obj1.text.split("interface ")[1].split()[0]
+
+                # Classify interface by its name
+                for column, value in interfaceClassifierFunc(CLISyntax, InterfacesParse[InterfacesDict["IfName"][0]]).items():
+                    InterfacesParse[InterfacesDict[column][0]] = value
+
+                # Check if interface is a BDI
+                if re.search(r'BDI',InterfacesParse[InterfacesDict["IfName"][0]]):
+                    # print(InterfacesParse[InterfacesDict["IfName"][0]])
+                    InterfacesParse[InterfacesDict["BridgeID"][0]] = str(InterfacesParse[InterfacesDict["IfName"][0]].split("BDI")[1].split(".")[0])
+                    InterfacesParse[InterfacesDict["IfType"][0]] = "Bridge"
+                    # Find port with wich ports this BDI is associated
+                    for obj10 in cfg.find_objects(r"^interface"):
+                        
+                        tempPortBinding = ""
+                        tempVLAN = ""
+                        tempEncap = ""
+                        # Find bridge-domain IDs and respective VLANs associated with current interface
+                        for obj11 in obj10.re_search_children("service instance "):
+                            for obj12 in obj11.re_search_children("bridge-domain "):
+                                if InterfacesParse[InterfacesDict["BridgeID"][0]] == obj12.text.split("bridge-domain ")[1].split()[0]:
+                                    
+                                    tempPortBinding = obj10.text.split("interface ")[1]
 
-                    if len(duplicate) > 1:
-                        print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
-                        nextFile = 1
-                        break
-                    
-                    IfNumber = IfNumber + 1
-                    InterfacesParse = [""] * len(InterfacesDict)
-                    if debug: print("debug: obj1: "+str(obj1))
-                    
-                    InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                    InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                    InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                    InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                    InterfacesParse[InterfacesDict["IfName"][0]] = obj1.text.split("interface ")[1].split()[0]
-
-                    # Check if interface is a subinterface of another one
-                    if re.search(r'\.',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(".")[0]
-                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(".")[0]
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "SubIf"
-                    else:
-                        # Check if interface is physical port
-                        if re.search(r'([Gg]ig[Ee]|[Ee]thernet)',InterfacesParse[InterfacesDict["IfName"][0]]):
-                            InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "Port"
-                            if re.search(r'[Hh]undred[Gg]ig(abit)?E',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                InterfacesParse[InterfacesDict["PortType"][0]] = "100GE"
-                            else:
-                                if re.search(r'[Tt]en[Gg]ig(abit)?E',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "10GE"
-                                else:
-                                    if re.search(r'[Gg]igabit',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                        InterfacesParse[InterfacesDict["PortType"][0]] = "1GE"
+                                    if InterfacesParse[InterfacesDict["PortName"][0]] == "":
+                                        InterfacesParse[InterfacesDict["PortName"][0]] = tempPortBinding
                                     else:
-                                        if re.search(r'[Ff]ast',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                            InterfacesParse[InterfacesDict["PortType"][0]] = "100ME"
-                                        else:
-                                            InterfacesParse[InterfacesDict["PortType"][0]] = ""
-
-
-                        # Check if interface is a bundle
-                        if re.search(r'P|port-C|Channel',InterfacesParse[InterfacesDict["IfName"][0]]):
-                            InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
-                            InterfacesParse[InterfacesDict["LAGID"][0]] = str(InterfacesParse[InterfacesDict["IfName"][0]].split("hannel")[1].split(".")[0])
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "LAG"
+                                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + "|" + tempPortBinding
 
-
-                    # Check if interface is a loopback
-                    if re.search(r"L|loopB|back",InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
-
-                    # Check if interface is a BDI
-                    if re.search(r'BDI',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        # print(InterfacesParse[InterfacesDict["IfName"][0]])
-                        InterfacesParse[InterfacesDict["BridgeID"][0]] = str(InterfacesParse[InterfacesDict["IfName"][0]].split("BDI")[1].split(".")[0])
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "Bridge"
-                        # Find port with wich ports this BDI is associated
-                        for obj10 in cfg.find_objects(r"^interface"):
-                            
-                            tempPortBinding = ""
-                            tempVLAN = ""
-                            tempEncap = ""
-                            # Find bridge-domain IDs and respective VLANs associated with current interface
-                            for obj11 in obj10.re_search_children("service instance "):
-                                for obj12 in obj11.re_search_children("bridge-domain "):
-                                    if InterfacesParse[InterfacesDict["BridgeID"][0]] == obj12.text.split("bridge-domain ")[1].split()[0]:
-                                        
-                                        tempPortBinding = obj10.text.split("interface ")[1]
-
-                                        if InterfacesParse[InterfacesDict["PortName"][0]] == "":
-                                            InterfacesParse[InterfacesDict["PortName"][0]] = tempPortBinding
+                                    for obj13 in obj11.re_search_children(r"^ *encapsulation "):
+                                        if re.search("second-dot1q ",obj13.text):
+                                            tempVLAN = (str(obj13.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj13.text.split("second-dot1q ")[1].split(" ")[0]))
+                                            tempEncap = "qinq"
+                                            
                                         else:
-                                            InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + "|" + tempPortBinding
+                                            if re.search("dot1q ",obj13.text):
+                                                tempVLAN = str(obj13.text.split("dot1q ")[1].split(" ")[0])
+                                                tempEncap = "dot1q"
+                                                # tempPortBinding = tempPortBinding + ":" + obj13.text.split("dot1q ")[1].split(" ")[0]
+                                            else:    
+                                                tempVLAN = "0"
+                                                tempEncap = "null"
+                                                # tempPortBinding = tempPortBinding + ":" + obj13.text.split("dot1q ")[1].split(" ")[0]
+                                        tempPortBinding = tempPortBinding + ":" + tempVLAN
+
+
+                                    if tempPortBinding != "":
+                                        if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
+                                            InterfacesParse[InterfacesDict["PortBinding"][0]] = tempPortBinding
+                                        else:
+                                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|" + tempPortBinding
 
-                                        for obj13 in obj11.re_search_children(r"^ *encapsulation "):
-                                            if re.search("second-dot1q ",obj13.text):
-                                                tempVLAN = (str(obj13.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj13.text.split("second-dot1q ")[1].split(" ")[0]))
-                                                tempEncap = "qinq"
-                                                
-                                            else:
-                                                if re.search("dot1q ",obj13.text):
-                                                    tempVLAN = str(obj13.text.split("dot1q ")[1].split(" ")[0])
-                                                    tempEncap = "dot1q"
-                                                    # tempPortBinding = tempPortBinding + ":" + obj13.text.split("dot1q ")[1].split(" ")[0]
-                                                else:    
-                                                    tempVLAN = "0"
-                                                    tempEncap = "null"
-                                                    # tempPortBinding = tempPortBinding + ":" + obj13.text.split("dot1q ")[1].split(" ")[0]
-                                            tempPortBinding = tempPortBinding + ":" + tempVLAN
-
-
-                                        if tempPortBinding != "":
-                                            if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
-                                                InterfacesParse[InterfacesDict["PortBinding"][0]] = tempPortBinding
-                                            else:
-                                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|" + tempPortBinding
+                                    if tempEncap != "":
+                                        if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                                            InterfacesParse[InterfacesDict["Encap"][0]] = tempEncap
+                                        else:
+                                            InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "|" + tempEncap
 
-                                        if tempEncap != "":
-                                            if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                                InterfacesParse[InterfacesDict["Encap"][0]] = tempEncap
-                                            else:
-                                                InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "|" + tempEncap
+                                    if tempVLAN != "":
+                                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                                            InterfacesParse[InterfacesDict["VLAN"][0]] = tempVLAN
+                                        else:
+                                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|" + tempVLAN
 
-                                        if tempVLAN != "":
-                                            if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                                InterfacesParse[InterfacesDict["VLAN"][0]] = tempVLAN
-                                            else:
-                                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|" + tempVLAN
+                                    break
 
-                                        break
 
+                # Find description associated with current interface
+                for obj2 in obj1.re_search_children("description "):
+                    InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj2.text.split("description ")[1].replace("\"",""))
+                    break
 
-                    # Find description associated with current interface
-                    for obj2 in obj1.re_search_children("description "):
-                        InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj2.text.split("description ")[1].replace("\"",""))
+                # Find encapsulation associated with current interface
+                for obj2 in obj1.re_search_children(r"^ *encapsulation "):
+                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                    if re.search("second-dot1q ",obj2.text):
+                        if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
+                            InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj2.text.split(" dot1q ")[1].split(" second-dot1q ")[0].lstrip().rstrip().replace(" , ","|"))) + "." + str(obj2.text.split(" second-dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                    else:
+                        if re.search("dot1q ",obj2.text):
+                            if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                                InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj2.text.split(" dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                        else:
+                            if re.search("untagged",obj2.text):
+                                if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
+                # for obj2 in obj1.re_search_children("encapsulation"):
+                #     if re.search(" second-dot1q ",obj2.text):
+                #         InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                #         InterfacesParse[InterfacesDict["VLAN"][0]] = (str(obj2.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj2.text.split("second-dot1q ")[1].split(" ")[0]))
+                #     else:
+                #         if re.search(" dot1q ",obj2.text):
+                #             InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                #             InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj2.text.split("dot1q ")[1].split(" ")[0])
+                #         else:
+                #             if re.search(" untagged",obj2.text):
+                #                 InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                #                 InterfacesParse[InterfacesDict["VLAN"][0]] = "0"
+                #     break
+                
+                # If encapsulation was not specified set it to default
+                if (((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG")) and len(obj1.re_search_children("service instance ")) == 0):
+                    if InterfacesParse[InterfacesDict["Encap"][0]] == "":
+                        InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                    if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = "0"
+                
+                # Find LAG associated with current interface
+                for obj2 in obj1.re_search_children("channel-group "):
+                    InterfacesParse[InterfacesDict["LAGID"][0]] = str(obj2.text.split("channel-group ")[1].split(" ")[0])
+                    if re.search("active",obj2.text):
+                        InterfacesParse[InterfacesDict["LAGMode"][0]] = "Active"
+                    else:
+                        if re.search("passive",obj2.text):
+                            InterfacesParse[InterfacesDict["LAGMode"][0]] = "Passive"
+                            
+                    for obj3 in interfacesIndex.get("Port-channel"+str(InterfacesParse[InterfacesDict["LAGID"][0]]), []):
+                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj3.text.split("interface ")[1]
                         break
+                    break
 
-                    # Find encapsulation associated with current interface
-                    for obj2 in obj1.re_search_children(r"^ *encapsulation "):
+                # Find bridge-domain IDs and respective VLANs associated with current interface
+                for obj2 in obj1.re_search_children("service instance "):
+                    for obj3 in obj2.re_search_children("bridge-domain "):
+                        if InterfacesParse[InterfacesDict["BridgeID"][0]] != "": InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|"
+                        InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + str(obj3.text.split("bridge-domain ")[1].split()[0])
+                        # if InterfacesParse[InterfacesDict["BridgeID"][0]] == "":
+                        #     InterfacesParse[InterfacesDict["BridgeID"][0]] = str(obj3.text.split("bridge-domain ")[1].split(" ")[0])
+                        # else:
+                        #     InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|" + str(obj3.text.split("bridge-domain ")[1])
+
+                    for obj3 in obj2.re_search_children(r"^ *encapsulation "):
                         if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                        if re.search("second-dot1q ",obj2.text):
+                        if re.search("second-dot1q ",obj3.text):
                             if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
                                 InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj2.text.split(" dot1q ")[1].split(" second-dot1q ")[0].lstrip().rstrip().replace(" , ","|"))) + "." + str(obj2.text.split(" second-dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                            # if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                            #     InterfacesParse[InterfacesDict["VLAN"][0]] = (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + ":" + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
+                            # else:
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
                         else:
-                            if re.search("dot1q ",obj2.text):
+                            if re.search("dot1q ",obj3.text):
                                 if InterfacesParse[InterfacesDict["Encap"][0]] == "":
                                     InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj2.text.split(" dot1q ")[1].lstrip().rstrip().replace(" , ","|"))
+                                # if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                                #     InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj3.text.split("dot1q ")[1].split(" ")[0])
+                                # else:
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj3.text.split("dot1q ")[1].split(" ")[0])
                             else:
-                                if re.search("untagged",obj2.text):
+                                if re.search("untagged",obj3.text):
                                     if InterfacesParse[InterfacesDict["Encap"][0]] == "":
                                         InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                                    # if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                                    #     InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj3.text.split("dot1q ")[1].split(" ")[0])
+                                    # else:
                                     InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
-                    # for obj2 in obj1.re_search_children("encapsulation"):
-                    #     if re.search(" second-dot1q ",obj2.text):
-                    #         InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                    #         InterfacesParse[InterfacesDict["VLAN"][0]] = (str(obj2.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj2.text.split("second-dot1q ")[1].split(" ")[0]))
-                    #     else:
-                    #         if re.search(" dot1q ",obj2.text):
-                    #             InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                    #             InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj2.text.split("dot1q ")[1].split(" ")[0])
-                    #         else:
-                    #             if re.search(" untagged",obj2.text):
-                    #                 InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                    #                 InterfacesParse[InterfacesDict["VLAN"][0]] = "0"
-                    #     break
-                    
-                    # If encapsulation was not specified set it to default
-                    if (((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG")) and len(obj1.re_search_children("service instance ")) == 0):
-                        if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                            InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = "0"
-                    
-                    # Find LAG associated with current interface
-                    for obj2 in obj1.re_search_children("channel-group "):
-                        InterfacesParse[InterfacesDict["LAGID"][0]] = str(obj2.text.split("channel-group ")[1].split(" ")[0])
-                        if re.search("active",obj2.text):
-                            InterfacesParse[InterfacesDict["LAGMode"][0]] = "Active"
-                        else:
-                            if re.search("passive",obj2.text):
-                                InterfacesParse[InterfacesDict["LAGMode"][0]] = "Passive"
-                                
-                        for obj3 in cfg.find_objects(r"^interface P|port-C|channel"+str(InterfacesParse[InterfacesDict["LAGID"][0]])):
-                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj3.text.split("interface ")[1]
-                            break
-                        break
 
-                    # Find bridge-domain IDs and respective VLANs associated with current interface
-                    for obj2 in obj1.re_search_children("service instance "):
-                        for obj3 in obj2.re_search_children("bridge-domain "):
-                            if InterfacesParse[InterfacesDict["BridgeID"][0]] != "": InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|"
-                            InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + str(obj3.text.split("bridge-domain ")[1].split()[0])
-                            # if InterfacesParse[InterfacesDict["BridgeID"][0]] == "":
-                            #     InterfacesParse[InterfacesDict["BridgeID"][0]] = str(obj3.text.split("bridge-domain ")[1].split(" ")[0])
-                            # else:
-                            #     InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|" + str(obj3.text.split("bridge-domain ")[1])
 
-                        for obj3 in obj2.re_search_children(r"^ *encapsulation "):
+                # Find subinterfaces and respective VLANs associated with current interface
+                for obj40 in subinterfacesIndex.get(InterfacesParse[InterfacesDict["IfName"][0]], []):
+                    searchExpression = r"^ *interface " + InterfacesParse[InterfacesDict["IfName"][0]] + r"\.[0-9]+$"
+                    if re.match(searchExpression,obj40.text):
+                        # print("FOUND")
+                        for obj3 in obj40.re_search_children(r"^ *encapsulation "):
                             if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
                             if re.search("second-dot1q ",obj3.text):
                                 if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
                                     InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                                # if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                #     InterfacesParse[InterfacesDict["VLAN"][0]] = (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + ":" + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
-                                # else:
                                 InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
                             else:
                                 if re.search("dot1q ",obj3.text):
                                     if InterfacesParse[InterfacesDict["Encap"][0]] == "":
                                         InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                    # if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                    #     InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj3.text.split("dot1q ")[1].split(" ")[0])
-                                    # else:
                                     InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj3.text.split("dot1q ")[1].split(" ")[0])
                                 else:
                                     if re.search("untagged",obj3.text):
                                         if InterfacesParse[InterfacesDict["Encap"][0]] == "":
                                             InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                                        # if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                        #     InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj3.text.split("dot1q ")[1].split(" ")[0])
-                                        # else:
                                         InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
 
 
-                    # Find subinterfaces and respective VLANs associated with current interface
-                    for obj40 in cfg.find_objects(r"^interface"):
-                        searchExpression = r"^ *interface " + InterfacesParse[InterfacesDict["IfName"][0]] + r"\.[0-9]+$"
-                        if re.match(searchExpression,obj40.text):
-                            # print("FOUND")
-                            for obj3 in obj40.re_search_children(r"^ *encapsulation "):
-                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                if re.search("second-dot1q ",obj3.text):
-                                    if ((InterfacesParse[InterfacesDict["Encap"][0]] == "dot1q") or (InterfacesParse[InterfacesDict["Encap"][0]] == "")):
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
-                                else:
-                                    if re.search("dot1q ",obj3.text):
-                                        if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                            InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(obj3.text.split("dot1q ")[1].split(" ")[0])
-                                    else:
-                                        if re.search("untagged",obj3.text):
-                                            if InterfacesParse[InterfacesDict["Encap"][0]] == "":
-                                                InterfacesParse[InterfacesDict["Encap"][0]] = "null"
-                                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "0"
-
-
-                    # Find admin state associated with current interface
-                    for obj2 in obj1.re_search_children(r"^ +shutdown"):
-                        if str(obj2.text.split(" ")[1]):
-                            InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
-                        else:
-                            InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                    if InterfacesParse[InterfacesDict["StateAdm"][0]] == "":
+                # Find admin state associated with current interface
+                for obj2 in obj1.re_search_children(r"^ +shutdown"):
+                    if str(obj2.text.split(" ")[1]):
+                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
+                    else:
                         InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                if InterfacesParse[InterfacesDict["StateAdm"][0]] == "":
+                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
 
-                    # Find L3VPN service associated with current interface
-                    for obj2 in obj1.re_search_children("vrf forwarding"):
-                        InterfacesParse[InterfacesDict["ServiceName"][0]] = str(obj2.text.split("vrf forwarding ")[1])
-                        InterfacesParse[InterfacesDict["ServiceType"][0]] = "L3VPN"
+                # Find L3VPN service associated with current interface
+                for obj2 in obj1.re_search_children("vrf forwarding"):
+                    InterfacesParse[InterfacesDict["ServiceName"][0]] = str(obj2.text.split("vrf forwarding ")[1])
+                    InterfacesParse[InterfacesDict["ServiceType"][0]] = "L3VPN"
 
-                    # Find L2 MTU associated with current interface 
-                    for obj2 in obj1.re_search_children(r"^ +mtu"):
-                        InterfacesParse[InterfacesDict["L2MTU"][0]]  = str(obj2.text.split("mtu ")[1])
-                        break
+                # Find L2 MTU associated with current interface 
+                for obj2 in obj1.re_search_children(r"^ +mtu"):
+                    InterfacesParse[InterfacesDict["L2MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    break
 
-                    # Find L3 MTU associated with current interface 
-                    for obj2 in obj1.re_search_children(r"^ +ip mtu"):
-                        InterfacesParse[InterfacesDict["L3MTU"][0]]  = str(obj2.text.split("mtu ")[1])
-                        break
+                # Find L3 MTU associated with current interface 
+                for obj2 in obj1.re_search_children(r"^ +ip mtu"):
+                    InterfacesParse[InterfacesDict["L3MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    break
 
-                    # Find all IPv4 addresses associated with current interface
-                    for obj2 in obj1.re_search_children("ip address "):
-                        rawInput = obj2.text.split("ip address ")[1].lstrip().rstrip()
-                        rawInput = rawInput.replace(" ","/")
-                        ipadd = ipaddress.ip_interface(str(rawInput))
-                        if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = str(ipadd)
-                        else:
-                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["IPV4Addr"][0]] + "|" + str(ipadd)
-                        if InterfacesParse[InterfacesDict["IPV4Subnet"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
+                # Find all IPv4 addresses associated with current interface
+                for obj2 in obj1.re_search_children("ip address "):
+                    rawInput = obj2.text.split("ip address ")[1].lstrip().rstrip()
+                    rawInput = rawInput.replace(" ","/")
+                    ipadd = ipaddress.ip_interface(str(rawInput))
+                    if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = str(ipadd)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["IPV4Addr"][0]] + "|" + str(ipadd)
+                    if InterfacesParse[InterfacesDict["IPV4Subnet"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
+
+                # Find all IPv6 addresses associated with current interface
+                for obj2 in obj1.re_search_children("ipv6 address "):
+                    rawInput = obj2.text.split("ipv6 address ")[1].lstrip().rstrip()
+                    ipadd = ipaddress.ip_interface(str(line))
+                    if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
+                    if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
+                
+                # Check if interface is a L3 interface
+                if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
+                    if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
+                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
                         else:
-                            InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
-
-                    # Find all IPv6 addresses associated with current interface
-                    for obj2 in obj1.re_search_children("ipv6 address "):
-                        rawInput = obj2.text.split("ipv6 address ")[1].lstrip().rstrip()
-                        ipadd = ipaddress.ip_interface(str(line))
-                        if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
+                    # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned and no VRF assigned and create port binding for it
+                    if (InterfacesParse[InterfacesDict["ServiceName"][0]] == ""):
+                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
                         else:
-                            InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
-                        if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
+                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+                    # Mark interface as Access if it has any IPv4/v6 addresses and VRF assigned and create port binding for it
+                    else:
+                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN"
                         else:
-                            InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
-                    
-                    # Check if interface is a L3 interface
-                    if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
-                        if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
-                            if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-                            else:
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
-                        # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned and no VRF assigned and create port binding for it
-                        if (InterfacesParse[InterfacesDict["ServiceName"][0]] == ""):
-                            if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
-                            else:
-                                InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-                        # Mark interface as Access if it has any IPv4/v6 addresses and VRF assigned and create port binding for it
+                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3VPN"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+
+                # Check if interface has any port binding assigned
+                if ((InterfacesParse[InterfacesDict["ServiceName"][0]] != "") or (InterfacesParse[InterfacesDict["ServiceID"][0]] != "")):
+                    if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
+                        if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
                         else:
-                            if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN"
-                            else:
-                                InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3VPN"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
 
-                    # Check if interface has any port binding assigned
-                    if ((InterfacesParse[InterfacesDict["ServiceName"][0]] != "") or (InterfacesParse[InterfacesDict["ServiceID"][0]] != "")):
-                        if InterfacesParse[InterfacesDict["PortBinding"][0]] == "":
-                            if InterfacesParse[InterfacesDict["VLAN"][0]] == "":
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-                            else:
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
+                # Find QoS input policy associated with current interface
+                for obj2 in obj1.re_search_children("service-policy input"):
+                    InterfacesParse[InterfacesDict["QoSIn"][0]] = str(obj2.text.split("service-policy input ")[1])
+                    break
 
-                    # Find QoS input policy associated with current interface
-                    for obj2 in obj1.re_search_children("service-policy input"):
-                        InterfacesParse[InterfacesDict["QoSIn"][0]] = str(obj2.text.split("service-policy input ")[1])
-                        break
+                # Find QoS output policy associated with current interface
+                for obj2 in obj1.re_search_children("service-policy output"):
+                    InterfacesParse[InterfacesDict["QoSOut"][0]] = str(obj2.text.split("service-policy output ")[1])
+                    break
 
-                    # Find QoS output policy associated with current interface
-                    for obj2 in obj1.re_search_children("service-policy output"):
-                        InterfacesParse[InterfacesDict["QoSOut"][0]] = str(obj2.text.split("service-policy output ")[1])
-                        break
+                # Find if SyncE enabled on current interface
+                for obj2 in obj1.re_search_children("synchronization"):
+                    InterfacesParse[InterfacesDict["SyncE"][0]] = "En"
+                    # Find SyncE configuration on current interface
+                    for obj3 in obj2.re_search_children(r".*"):
+                        InterfacesParse[InterfacesDict["SyncE"][0]] = InterfacesParse[InterfacesDict["SyncE"][0]] + "|" + str(obj3.text)
+                        # break
+                    break
 
-                    # Find if SyncE enabled on current interface
-                    for obj2 in obj1.re_search_children("synchronization"):
-                        InterfacesParse[InterfacesDict["SyncE"][0]] = "En"
-                        # Find SyncE configuration on current interface
-                        for obj3 in obj2.re_search_children(r".*"):
-                            InterfacesParse[InterfacesDict["SyncE"][0]] = InterfacesParse[InterfacesDict["SyncE"][0]] + "|" + str(obj3.text)
-                            # break
-                        break
+                # Find if CDP is enabled on current interface
+                for obj2 in obj1.re_search_children("cdp"):
+                    InterfacesParse[InterfacesDict["CDP"][0]] = "En"
+                    break
 
-                    # Find if CDP is enabled on current interface
-                    for obj2 in obj1.re_search_children("cdp"):
-                        InterfacesParse[InterfacesDict["CDP"][0]] = "En"
-                        break
+                # Find if LLDP is enabled on current interface
+                for obj2 in obj1.re_search_children("lldp"):
+                    InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
+                    break
 
-                    # Find if LLDP is enabled on current interface
-                    for obj2 in obj1.re_search_children("lldp"):
-                        InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
+                # Find all OSPF processes and areas where this interface is participating
+                ospfList = []
+
+                # Find all OSPF processes associated with interface
+                for obj10 in obj1.re_search_children(r"ip ospf [0-9]+"):
+                    ospfLine = []
+                    ospfPID = ""
+                    ospfRID = ""
+                    ospfPID = str(obj10.text.split("ip ospf ")[1].split(" ")[0])
+                    ospfLine.append(ospfPID)
+
+                    ospfIfType1 = ""
+                    ospfIfType2 = "Bcast"
+                    ospfIfMode = "Act"
+                    ospfBFDState = "Dis"
+                    ospfPriority = ""
+                    ospfMetric = ""
+                    ospfHello = ""
+                    ospfDead = ""
+                    ospfRetransmit = ""
+                    ospfAuth = ""
+
+                    # Find all OSPF interface parameters
+                    for obj11 in obj1.re_search_children("ip ospf network "):
+                        ospfIfType1 = str(obj11.text.split("ip ospf network ")[1].split(" ")[0].lstrip().rstrip())
+                        ospfIfType2 = ""
+                        if ospfIfType1 == "point-to-point":
+                            ospfIfType2 = "PtP"
+                        else:
+                            if ospfIfType1 == "point-to-multipoint":
+                                ospfIfType2 = "PtMP"
+                            else:
+                                ospfIfType2 = ospfIfType1
                         break
 
-                    # Find all OSPF processes and areas where this interface is participating
-                    ospfList = []
-
-                    # Find all OSPF processes associated with interface
-                    for obj10 in obj1.re_search_children(r"ip ospf [0-9]+"):
-                        ospfLine = []
-                        ospfPID = ""
-                        ospfRID = ""
-                        ospfPID = str(obj10.text.split("ip ospf ")[1].split(" ")[0])
-                        ospfLine.append(ospfPID)
-
-                        ospfIfType1 = ""
-                        ospfIfType2 = "Bcast"
-                        ospfIfMode = "Act"
-                        ospfBFDState = "Dis"
-                        ospfPriority = ""
-                        ospfMetric = ""
-                        ospfHello = ""
-                        ospfDead = ""
-                        ospfRetransmit = ""
-                        ospfAuth = ""
-
-                        # Find all OSPF interface parameters
-                        for obj11 in obj1.re_search_children("ip ospf network "):
-                            ospfIfType1 = str(obj11.text.split("ip ospf network ")[1].split(" ")[0].lstrip().rstrip())
-                            ospfIfType2 = ""
-                            if ospfIfType1 == "point-to-point":
-                                ospfIfType2 = "PtP"
-                            else:
-                                if ospfIfType1 == "point-to-multipoint":
-                                    ospfIfType2 = "PtMP"
-                                else:
-                                    ospfIfType2 = ospfIfType1
+                    for obj100 in protocolChildrenFunc(protocolIndex, cfg, r"^router ospf "+ospfPID):
+                        for obj101 in protocolChildrenFunc(protocolIndex, obj100, "router-id"):
+                            ospfRID = obj101.text.split("router-id ")[1].split()[0].lstrip().rstrip()
                             break
+                        for obj101 in protocolChildrenFunc(protocolIndex, obj100, "passive-interface default"):
+                            if re.match(r"^ *no passive-interface default *$",obj101.text):
+                                ospfIfMode = "Act"
+                            if re.match(r"^ *passive-interface default *$",obj101.text):
+                                ospfIfMode = "Pass"
 
-                        for obj100 in cfg.find_objects(r"^router ospf "+ospfPID):
-                            for obj101 in obj100.re_search_children("router-id"):
-                                ospfRID = obj101.text.split("router-id ")[1].split()[0].lstrip().rstrip()
-                                break
-                            for obj101 in obj100.re_search_children("passive-interface default"):
-                                if re.match(r"^ *no passive-interface default *$",obj101.text):
-                                    ospfIfMode = "Act"
-                                if re.match(r"^ *passive-interface default *$",obj101.text):
-                                    ospfIfMode = "Pass"
-
-                            searchExpression = InterfacesParse[InterfacesDict["IfName"][0]] + r"$"
-                            for obj101 in obj100.re_search_children(searchExpression):
-                                if re.search(r"^ *no passive-interface *.*$",obj101.text):
-                                    ospfIfMode = "Act"
-                                if re.search(r"^ *passive-interface *.*$",obj101.text):
-                                    ospfIfMode = "Pass"
-
-                            for obj101 in obj100.re_search_children("bfd all-interfaces"):
-                                if re.match(r"^ *bfd all-interfaces *$",obj101.text):
-                                    ospfBFDState = "En"
-                                if re.match(r"^ *no bfd all-interfaces *$",obj101.text):
-                                    ospfBFDState = "Dis"
-                        ospfLine.append(ospfRID)
-                        ospfLine.append(ospfIfType2)
-                        ospfLine.append(ospfIfMode)
+                        for obj101 in protocolInterfacesFunc(protocolIndex, obj100, InterfacesParse[InterfacesDict["IfName"][0]]):
+                            if re.search(r"^ *no passive-interface *.*$",obj101.text):
+                                ospfIfMode = "Act"
+                            if re.search(r"^ *passive-interface *.*$",obj101.text):
+                                ospfIfMode = "Pass"
 
-                        for obj11 in obj1.re_search_children("ip ospf bfd"):
-                            if re.match(r"^ *ip ospf bfd *$",obj11.text):
+                        for obj101 in protocolChildrenFunc(protocolIndex, obj100, "bfd all-interfaces"):
+                            if re.match(r"^ *bfd all-interfaces *$",obj101.text):
                                 ospfBFDState = "En"
-                            if re.match(r"^ *ip ospf bfd disable *$",obj11.text):
+                            if re.match(r"^ *no bfd all-interfaces *$",obj101.text):
                                 ospfBFDState = "Dis"
-                            break
-                        ospfLine.append(ospfBFDState)
-                        for obj11 in obj1.re_search_children("ip ospf priority "):
-                            ospfPriority = str(obj11.text.split("ip ospf priority ")[1].split(" ")[0].lstrip().rstrip())
-                            break
-                        ospfLine.append(ospfPriority)
-                        for obj11 in obj1.re_search_children("ip ospf cost "):
-                            ospfMetric = str(obj11.text.split("ip ospf cost ")[1].split(" ")[0].lstrip().rstrip())
-                            break
-                        ospfLine.append(ospfMetric)
-                        for obj11 in obj1.re_search_children("ip ospf hello-interval "):
-                            ospfHello = str(obj11.text.split("ip ospf hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                            break
-                        ospfLine.append(ospfHello)
-                        for obj11 in obj1.re_search_children("ip ospf dead-interval "):
-                            ospfDead = str(obj11.text.split("ip ospf dead-interval ")[1].split(" ")[0].lstrip().rstrip())
-                            break
-                        ospfLine.append(ospfDead)
-                        for obj11 in obj1.re_search_children("ip ospf retransmit-interval "):
-                            ospfRetransmit = str(obj11.text.split("ip ospf retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
-                            break
-                        ospfLine.append(ospfRetransmit)
-                        for obj11 in obj1.re_search_children("ip ospf authentication "):
-                            ospfAuth = str(obj11.text.split("ip ospf authentication ")[1].split(" ")[0].lstrip().rstrip())
-                            break
-                        ospfLine.append(ospfAuth)
-
-                        ospfAreaList = []
-                        area = ""
-                        # Find all OSPF primary areas
-                        for obj11 in obj1.re_search_children("ip ospf "+ospfPID+" area"):
-                            area = obj11.text.split("area ")[1]
-                            area = ipaddress.ip_address(int(area))
-
-                            ospfAreaList.append([int(area),"*"])
+                    ospfLine.append(ospfRID)
+                    ospfLine.append(ospfIfType2)
+                    ospfLine.append(ospfIfMode)
+
+                    for obj11 in obj1.re_search_children("ip ospf bfd"):
+                        if re.match(r"^ *ip ospf bfd *$",obj11.text):
+                            ospfBFDState = "En"
+                        if re.match(r"^ *ip ospf bfd disable *$",obj11.text):
+                            ospfBFDState = "Dis"
+                        break
+                    ospfLine.append(ospfBFDState)
+                    for obj11 in obj1.re_search_children("ip ospf priority "):
+                        ospfPriority = str(obj11.text.split("ip ospf priority ")[1].split(" ")[0].lstrip().rstrip())
+                        break
+                    ospfLine.append(ospfPriority)
+                    for obj11 in obj1.re_search_children("ip ospf cost "):
+                        ospfMetric = str(obj11.text.split("ip ospf cost ")[1].split(" ")[0].lstrip().rstrip())
+                        break
+                    ospfLine.append(ospfMetric)
+                    for obj11 in obj1.re_search_children("ip ospf hello-interval "):
+                        ospfHello = str(obj11.text.split("ip ospf hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                        break
+                    ospfLine.append(ospfHello)
+                    for obj11 in obj1.re_search_children("ip ospf dead-interval "):
+                        ospfDead = str(obj11.text.split("ip ospf dead-interval ")[1].split(" ")[0].lstrip().rstrip())
+                        break
+                    ospfLine.append(ospfDead)
+                    for obj11 in obj1.re_search_children("ip ospf retransmit-interval "):
+                        ospfRetransmit = str(obj11.text.split("ip ospf retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
+                        break
+                    ospfLine.append(ospfRetransmit)
+                    for obj11 in obj1.re_search_children("ip ospf authentication "):
+                        ospfAuth = str(obj11.text.split("ip ospf authentication ")[1].split(" ")[0].lstrip().rstrip())
+                        break
+                    ospfLine.append(ospfAuth)
+
+                    ospfAreaList = []
+                    area = ""
+                    # Find all OSPF primary areas
+                    for obj11 in obj1.re_search_children("ip ospf "+ospfPID+" area"):
+                        area = obj11.text.split("area ")[1]
+                        area = ipaddress.ip_address(int(area))
+
+                        ospfAreaList.append([int(area),"*"])
+
+                    # Find all OSPF multi-areas
+                    for obj11 in obj1.re_search_children(r"ip ospf multi-area"):
+                        area = obj11.text.split("area ")[1]
+                        area = ipaddress.ip_address(int(area))
+
+                        ospfAreaList.append([int(area),""])
+
+                    ospfAreaList.sort(key=lambda x: x[0])
+                    ospfLine.append(ospfAreaList)
+
+                    ospfList.append(ospfLine)
+
+                if len(ospfList) > 0:
+                    ospfOutputLine = ""
+                    for ospfLine in ospfList:
+                        # print(ospfLine)
+                        if ospfOutputLine != "":
+                            ospfOutputLine = ospfOutputLine + ";"
+
+                        ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0])
+                        if ospfLine[1] != "": ospfOutputLine = ospfOutputLine + "|rid:" + str(ospfLine[1])
+                        ospfOutputLine = ospfOutputLine + "|type:"+str(ospfLine[2]) + "|mode:"+str(ospfLine[3]) + "|bfd:"+str(ospfLine[4])
+                        if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[5])
+                        if ospfLine[6] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[6])
+                        if ((ospfLine[7] != "") or (ospfLine[8] != "") or (ospfLine[9] != "")):
+                            if ospfLine[7] == "": ospfLine[7] = "def"
+                            if ospfLine[8] == "": ospfLine[8] = "def"
+                            if ospfLine[9] == "": ospfLine[9] = "def"
+                            ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[7]) + " " + str(ospfLine[8]) + " " + str(ospfLine[9])
+                        if ospfLine[10] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[10])
+
+                        if len(ospfLine) > 11:
+                            ospfOutputLine = ospfOutputLine + "|areas:"
+
+                            ospfOutputLine2 = ""
+                            for area in ospfLine[11]:
+                                if ospfOutputLine2 == "":
+                                    ospfOutputLine2 = str(area[0]) + str(area[1]) 
+                                else:
+                                    ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1])
+                            
+                            ospfOutputLine = ospfOutputLine + ospfOutputLine2
+                        
+                    InterfacesParse[InterfacesDict["OSPFv2"][0]] = ospfOutputLine
 
-                        # Find all OSPF multi-areas
-                        for obj11 in obj1.re_search_children(r"ip ospf multi-area"):
-                            area = obj11.text.split("area ")[1]
-                            area = ipaddress.ip_address(int(area))
 
-                            ospfAreaList.append([int(area),""])
+                # Find BFD timers associated with current interface
+                for obj2 in obj1.re_search_children(r"bfd interval"):
+                    if InterfacesParse[InterfacesDict["BFD"][0]] != "":
+                        InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "|"
+                    InterfacesParse[InterfacesDict["BFD"][0]] = "if_tmr:" + obj2.text.lstrip().rstrip().replace("bfd interval ","").replace(" min_rx "," ").replace(" multiplier "," ")
+                    break
+                # Find BFD template associated with current interface
+                for obj2 in obj1.re_search_children(r"bfd template"):
+                    if InterfacesParse[InterfacesDict["BFD"][0]] != "":
+                        InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "|"
+                    InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "if_tmpl:" + obj2.text.lstrip().rstrip().split("bfd template ")[1].split(" ")[0]
+                    break
 
-                        ospfAreaList.sort(key=lambda x: x[0])
-                        ospfLine.append(ospfAreaList)
 
-                        ospfList.append(ospfLine)
+                LDPIfAdmState = ""
+                LDPIPv4AdmState = ""
+                LDPIPv6AdmState = ""
+                # Find if LDP is enabled on this interface
+                for obj10 in obj1.re_search_children(r"mpls ip"):
+                    LDPIfAdmState = "if:En"
+                    LDPIPv4AdmState = "ipv4:En"
+                    
+                    if LDPIfAdmState != "":
+                        InterfacesParse[InterfacesDict["LDP"][0]] = LDPIfAdmState
+                    if LDPIPv4AdmState != "":
+                        InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv4AdmState
+                    if LDPIPv6AdmState != "":
+                        InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv6AdmState
 
-                    if len(ospfList) > 0:
-                        ospfOutputLine = ""
-                        for ospfLine in ospfList:
-                            # print(ospfLine)
-                            if ospfOutputLine != "":
-                                ospfOutputLine = ospfOutputLine + ";"
+                    break                
 
-                            ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0])
-                            if ospfLine[1] != "": ospfOutputLine = ospfOutputLine + "|rid:" + str(ospfLine[1])
-                            ospfOutputLine = ospfOutputLine + "|type:"+str(ospfLine[2]) + "|mode:"+str(ospfLine[3]) + "|bfd:"+str(ospfLine[4])
-                            if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[5])
-                            if ospfLine[6] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[6])
-                            if ((ospfLine[7] != "") or (ospfLine[8] != "") or (ospfLine[9] != "")):
-                                if ospfLine[7] == "": ospfLine[7] = "def"
-                                if ospfLine[8] == "": ospfLine[8] = "def"
-                                if ospfLine[9] == "": ospfLine[9] = "def"
-                                ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[7]) + " " + str(ospfLine[8]) + " " + str(ospfLine[9])
-                            if ospfLine[10] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[10])
 
-                            if len(ospfLine) > 11:
-                                ospfOutputLine = ospfOutputLine + "|areas:"
 
-                                ospfOutputLine2 = ""
-                                for area in ospfLine[11]:
-                                    if ospfOutputLine2 == "":
-                                        ospfOutputLine2 = str(area[0]) + str(area[1]) 
-                                    else:
-                                        ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1])
-                                
-                                ospfOutputLine = ospfOutputLine + ospfOutputLine2
-                            
-                        InterfacesParse[InterfacesDict["OSPFv2"][0]] = ospfOutputLine
+                #########################################################################################################################################
+                #                                                    Post-processing for interfaces                                                     #
+                #########################################################################################################################################
+                
+                # Sort VLANs for Ports
+                if re.search(r"(Port|LAG)",InterfacesParse[InterfacesDict["IfType"][0]]):
+                    if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]])
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
+                        # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
+                        VLANList = []
+                        for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
+                            VLANList.append(value)
+                        VLANList = sorted(VLANList, key=float)
+
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = ""
+                        # VLANList = VLANList.sort()
+                        # print(VLANList)
+                        for value in VLANList:
+                            if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
+
+                # Sort BridgeIDs for Ports
+                if re.search(r"Port",InterfacesParse[InterfacesDict["IfType"][0]]):
+                    if re.search(r"\|",InterfacesParse[InterfacesDict["BridgeID"][0]]):
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]])
+                        # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
+                        # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
+                        BridgeList = []
+                        for value in InterfacesParse[InterfacesDict["BridgeID"][0]].split("|"):
+                            BridgeList.append(value)
+                        BridgeList = sorted(BridgeList, key=float)
+
+                        InterfacesParse[InterfacesDict["BridgeID"][0]] = ""
+                        # VLANList = VLANList.sort()
+                        # print(BridgeList)
+                        for value in BridgeList:
+                            if InterfacesParse[InterfacesDict["BridgeID"][0]] != "": InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|"
+                            InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + str(value)
 
 
-                    # Find BFD timers associated with current interface
-                    for obj2 in obj1.re_search_children(r"bfd interval"):
-                        if InterfacesParse[InterfacesDict["BFD"][0]] != "":
-                            InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "|"
-                        InterfacesParse[InterfacesDict["BFD"][0]] = "if_tmr:" + obj2.text.lstrip().rstrip().replace("bfd interval ","").replace(" min_rx "," ").replace(" multiplier "," ")
-                        break
-                    # Find BFD template associated with current interface
-                    for obj2 in obj1.re_search_children(r"bfd template"):
-                        if InterfacesParse[InterfacesDict["BFD"][0]] != "":
-                            InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "|"
-                        InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "if_tmpl:" + obj2.text.lstrip().rstrip().split("bfd template ")[1].split(" ")[0]
-                        break
+                InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
 
 
-                    LDPIfAdmState = ""
-                    LDPIPv4AdmState = ""
-                    LDPIPv6AdmState = ""
-                    # Find if LDP is enabled on this interface
-                    for obj10 in obj1.re_search_children(r"mpls ip"):
-                        LDPIfAdmState = "if:En"
-                        LDPIPv4AdmState = "ipv4:En"
-                        
-                        if LDPIfAdmState != "":
-                            InterfacesParse[InterfacesDict["LDP"][0]] = LDPIfAdmState
-                        if LDPIPv4AdmState != "":
-                            InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv4AdmState
-                        if LDPIPv6AdmState != "":
-                            InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv6AdmState
+                InterfacesParseAll.append(InterfacesParse)
 
-                        break                
+                # Find EVCs associated with current interface and save them as separate interface
+                for obj2 in obj1.re_search_children("service instance "):
 
+                    IfNumber = IfNumber + 1
+                    InterfacesParse = [""] * len(InterfacesDict)
+                    if debug: logger.debug("obj2: %s", obj2)
+                    
+                    InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                    InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                    InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                    InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                    # InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
+                    InterfacesParse[InterfacesDict["IfName"][0]] = str(obj1.text.split("interface ")[1].split(" ")[0]) + " EVC " + str(obj2.text.split("service instance ")[1].split(" ")[0])
+                    InterfacesParse[InterfacesDict["PortName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
+                    InterfacesParse[InterfacesDict["IfType"][0]] = "EVC"
+                    InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
+
+                    # Find description associated with current EVC
+                    for obj3 in obj2.re_search_children("description "):
+                        InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj3.text.split("description ")[1].replace("\"",""))
+                        break
+                    
+                    # Find encapsulation associated with current EVC
+                    for obj3 in obj2.re_search_children(r"^ *encapsulation"):
+                        if re.search(" second-dot1q ",obj3.text):
+                            InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
+                        else:
+                            if re.search(" dot1q ",obj3.text):
+                                InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj3.text.split("dot1q ")[1].split(" ")[0])
+                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
+                        break
 
+                    # Find bridge-domain associated with current EVC
+                    for obj3 in obj2.re_search_children("bridge-domain "):
+                        if InterfacesParse[InterfacesDict["IfType"][0]] != "": InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
+                        InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "L3"
 
-                    #########################################################################################################################################
-                    #                                                    Post-processing for interfaces                                                     #
-                    #########################################################################################################################################
+                        if InterfacesParse[InterfacesDict["BridgeID"][0]] == "":
+                            InterfacesParse[InterfacesDict["BridgeID"][0]] = str(obj3.text.split("bridge-domain ")[1].split()[0])
+                        else:
+                            InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|" + str(obj3.text.split("bridge-domain ")[1].split()[0])
                     
-                    # Sort VLANs for Ports
-                    if re.search(r"(Port|LAG)",InterfacesParse[InterfacesDict["IfType"][0]]):
-                        if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]])
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
-                            # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
-                            VLANList = []
-                            for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
-                                VLANList.append(value)
-                            VLANList = sorted(VLANList, key=float)
 
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = ""
-                            # VLANList = VLANList.sort()
-                            # print(VLANList)
-                            for value in VLANList:
-                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
+                    # Find a parent BDI interface if exists
+                    for obj30 in interfacesIndex.get("BDI" + InterfacesParse[InterfacesDict["BridgeID"][0]], []):
+                        searchExpression = r"^interface BDI" + InterfacesParse[InterfacesDict["BridgeID"][0]] + r"$"
+                        if re.match(searchExpression,obj30.text):
+                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj30.text.split("interface ")[1].split(" ")[0]
 
-                    # Sort BridgeIDs for Ports
-                    if re.search(r"Port",InterfacesParse[InterfacesDict["IfType"][0]]):
-                        if re.search(r"\|",InterfacesParse[InterfacesDict["BridgeID"][0]]):
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]])
-                            # print(InterfacesParse[InterfacesDict["VLAN"][0]].split("|"))
-                            # print(sorted(InterfacesParse[InterfacesDict["VLAN"][0]].split("|")))
-                            BridgeList = []
-                            for value in InterfacesParse[InterfacesDict["BridgeID"][0]].split("|"):
-                                BridgeList.append(value)
-                            BridgeList = sorted(BridgeList, key=float)
-
-                            InterfacesParse[InterfacesDict["BridgeID"][0]] = ""
-                            # VLANList = VLANList.sort()
-                            # print(BridgeList)
-                            for value in BridgeList:
-                                if InterfacesParse[InterfacesDict["BridgeID"][0]] != "": InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|"
-                                InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + str(value)
+                    # Find associated xconnect if exists
+                    for obj3 in obj2.re_search_children(r"^ *xconnect "):
+                        if InterfacesParse[InterfacesDict["IfType"][0]] != "": InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
+                        InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "L2"
+                        InterfacesParse[InterfacesDict["ServiceType"][0]] = "L2VPN"
 
+                        if InterfacesParse[InterfacesDict["ServiceSDP"][0]] != "": InterfacesParse[InterfacesDict["ServiceSDP"][0]] = InterfacesParse[InterfacesDict["ServiceSDP"][0]] + "|"
+                        InterfacesParse[InterfacesDict["ServiceSDP"][0]] = InterfacesParse[InterfacesDict["ServiceSDP"][0]] + obj3.text.split("xconnect ")[1].split()[0] + ":" + obj3.text.split("xconnect ")[1].split(" ")[1]
 
+                        for obj4 in obj3.re_search_children(r"^ *mtu "):
+                            if InterfacesParse[InterfacesDict["L2MTU"][0]] != "": InterfacesParse[InterfacesDict["L2MTU"][0]] = InterfacesParse[InterfacesDict["L2MTU"][0]] + "|"
+                            InterfacesParse[InterfacesDict["L2MTU"][0]] = InterfacesParse[InterfacesDict["L2MTU"][0]] + obj4.text.split("mtu ")[1].split()[0]
+                    
                     InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                    InterfacesParseAll.append(InterfacesParse)
 
+#####################################################################################################################################################
+###################################################                  Huawei VRP parsing               ###############################################
+#####################################################################################################################################################
+        # Syntax: Huawei VRP parsing
+        if (CLISyntax == "VRP"):
+            if debug: logger.debug("Using Huawei VRP syntax to parse file")
+            # Find node's interfaces from config
+            for obj1 in cfg.find_objects(r"^interface"):       
+                duplicate = [str(obj2) for obj2 in interfacesIndex[obj1.text.split("interface ")[1].split(" ")[0]]]
+
+                if len(duplicate) > 1:
+                    logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                    nextFile = 1
+                    skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
+                    break
+                
+                IfNumber = IfNumber + 1
+                InterfacesParse = [""] * len(InterfacesDict)
+                if debug: logger.debug("obj1: %s", obj1)
+                
+                InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                InterfacesParse[InterfacesDict["IfName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
+
+                # Classify interface by its name
+                for column, value in interfaceClassifierFunc(CLISyntax, InterfacesParse[InterfacesDict["IfName"][0]]).items():
+                    InterfacesParse[InterfacesDict[column][0]] = value
+
+                # Find description associated with current interface
+                for obj2 in obj1.re_search_children("description "):
+                    InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj2.text.split("description ")[1].replace("\"",""))
+                    break
 
-                    InterfacesParseAll.append(InterfacesParse)
+                # Find encapsulation associated with current interface
+                for obj2 in obj1.re_search_children("vlan-type "):
+                    InterfacesParse[InterfacesDict["Encap"][0]] = str(obj2.text.split("vlan-type ")[1].split(" ")[0])
+                    InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj2.text.split("vlan-type ")[1].split(" ")[1])
+                    break
+                
+                # Find LAG associated with current interface
+                for obj2 in obj1.re_search_children("eth-trunk "):
+                    InterfacesParse[InterfacesDict["LAGID"][0]] = str(obj2.text.split("eth-trunk")[1])
+                    for obj3 in cfg.find_objects(r"^interface Eth-Trunk"+str(InterfacesParse[InterfacesDict["LAGID"][0]]+"$")):
+                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj3.text.split("Eth-Trunk")[1]
+                        break
+                    break
 
-                    # Find EVCs associated with current interface and save them as separate interface
-                    for obj2 in obj1.re_search_children("service instance "):
+                # Find admin state associated with current interface
+                for obj2 in obj1.re_search_children(r"shutdown"):
+                    if obj2.re_search(r"undo"):
+                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                    else:
+                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
-                        IfNumber = IfNumber + 1
-                        InterfacesParse = [""] * len(InterfacesDict)
-                        if debug: print("debug: obj2: "+str(obj2))
+                # Find L3VPN service associated with current interface
+                for obj2 in obj1.re_search_children("ip binding vpn-instance"):
+                    InterfacesParse[InterfacesDict["ServiceName"][0]] = str(obj2.text.split("vpn-instance ")[1])
+                    InterfacesParse[InterfacesDict["ServiceType"][0]] = "L3VPN"
+                    if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                        if re.search(r"L|loopB|back",InterfacesParse[InterfacesDict["IfName"][0]]):
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN Loopback"
+                        else:
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN SAP"
+                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                        break
+                
+                # Check if interface is a non-VRF loopback
+                if InterfacesParse[InterfacesDict["ServiceName"][0]] == "":
+                    if re.search(r"L|loopB|back",InterfacesParse[InterfacesDict["IfName"][0]]):
+                        InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+
+                # Find L2 MTU associated with current interface 
+                for obj2 in obj1.re_search_children(r"^ +mtu"):
+                    InterfacesParse[InterfacesDict["L2MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    break
+
+                # Find L3 MTU associated with current interface 
+                for obj2 in obj1.re_search_children(r"^ +ipv4 mtu"):
+                    InterfacesParse[InterfacesDict["L3MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    break
+
+                # Find all IPv4 addresses associated with current interface
+                for obj2 in obj1.re_search_children("ip address "):
+                    if re.search("ip address unnumbered interface", obj2.text):
+                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj2.text.split("unnumbered interface ")[1]
+                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["ParentIfName"][0]]
+                    else:
+                        rawInput = obj2.text.split("ip address ")[1].lstrip().rstrip()
+                        rawInput = rawInput.replace(" ","/")
+                        ipadd = ipaddress.ip_interface(str(rawInput))
+                        if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
+                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = str(ipadd)
+                        else:
+                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["IPV4Addr"][0]] + "|" + str(ipadd)
+                        if InterfacesParse[InterfacesDict["IPV4Subnet"][0]] == "":
+                            InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
+                        else:
+                            InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
                         
-                        InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                        InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                        InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                        InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                        # InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
-                        InterfacesParse[InterfacesDict["IfName"][0]] = str(obj1.text.split("interface ")[1].split(" ")[0]) + " EVC " + str(obj2.text.split("service instance ")[1].split(" ")[0])
-                        InterfacesParse[InterfacesDict["PortName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "EVC"
-                        InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-
-                        # Find description associated with current EVC
-                        for obj3 in obj2.re_search_children("description "):
-                            InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj3.text.split("description ")[1].replace("\"",""))
-                            break
+                        # print(rawInput, ipadd, InterfacesParse[InterfacesDict["IPV4Addr"][0]],InterfacesParse[InterfacesDict["IPV4Subnet"][0]])
+                        # input("Stop")
+
                         
-                        # Find encapsulation associated with current EVC
-                        for obj3 in obj2.re_search_children(r"^ *encapsulation"):
-                            if re.search(" second-dot1q ",obj3.text):
-                                InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = (str(obj3.text.split("dot1q ")[1].split(" ")[0]) + "." + str(obj3.text.split("second-dot1q ")[1].split(" ")[0]))
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
-                            else:
-                                if re.search(" dot1q ",obj3.text):
-                                    InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj3.text.split("dot1q ")[1].split(" ")[0])
-                                    InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + ":" + InterfacesParse[InterfacesDict["VLAN"][0]]
-                            break
+                    # Mark interface as Network/Hybrid if it has any addresses assigned
+                    if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                        InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+            
 
-                        # Find bridge-domain associated with current EVC
-                        for obj3 in obj2.re_search_children("bridge-domain "):
-                            if InterfacesParse[InterfacesDict["IfType"][0]] != "": InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
-                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "L3"
+                # Find all IPv6 addresses associated with current interface
+                for obj2 in obj1.re_search_children("ipv6 address "):
+                    rawInput = obj2.text.split("ipv6 address ")[1].lstrip().rstrip()
+                    ipadd = ipaddress.ip_interface(str(line))
+                    if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
+                    if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
+                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
+                    else:
+                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
 
-                            if InterfacesParse[InterfacesDict["BridgeID"][0]] == "":
-                                InterfacesParse[InterfacesDict["BridgeID"][0]] = str(obj3.text.split("bridge-domain ")[1].split()[0])
-                            else:
-                                InterfacesParse[InterfacesDict["BridgeID"][0]] = InterfacesParse[InterfacesDict["BridgeID"][0]] + "|" + str(obj3.text.split("bridge-domain ")[1].split()[0])
-                        
+                    # Mark interface as Network/Hybrid if it has any addresses assigned
+                    if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                        InterfacesParse[InterfacesDict["IfType"][0]] == "L3"
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+
+                # Find QoS input policy associated with current interface
+                for obj2 in obj1.re_search_children(r"^ *traffic-policy .* in"):
+                    InterfacesParse[InterfacesDict["QoSIn"][0]] = str(obj2.text.split("traffic-policy ")[1].split(" ")[0])
+                    break
 
-                        # Find a parent BDI interface if exists
-                        for obj30 in cfg.find_objects(r"^interface "):
-                            searchExpression = r"^interface BDI" + InterfacesParse[InterfacesDict["BridgeID"][0]] + r"$"
-                            if re.match(searchExpression,obj30.text):
-                                InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj30.text.split("interface ")[1].split(" ")[0]
+                # Find QoS output policy associated with current interface
+                for obj2 in obj1.re_search_children(r"^ *traffic-policy .* out"):
+                    InterfacesParse[InterfacesDict["QoSOut"][0]] = str(obj2.text.split("traffic-policy ")[1].split(" ")[0])
+                    break
 
-                        # Find associated xconnect if exists
-                        for obj3 in obj2.re_search_children(r"^ *xconnect "):
-                            if InterfacesParse[InterfacesDict["IfType"][0]] != "": InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
-                            InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "L2"
-                            InterfacesParse[InterfacesDict["ServiceType"][0]] = "L2VPN"
+                # Find if SyncE enabled on current interface
+                # for obj2 in obj1.re_search_children("synchronization"):
+                #     InterfacesParse[InterfacesDict["SyncE"][0]] = "Enabled"
+                #     # Find SyncE configuration on current interface
+                #     for obj3 in obj2.re_search_children():
+                #         InterfacesParse[InterfacesDict["SyncE"][0]] = InterfacesParse[InterfacesDict["SyncE"][0]] + "|" + str(obj3.text)
+                #         break
+                #     break
 
-                            if InterfacesParse[InterfacesDict["ServiceSDP"][0]] != "": InterfacesParse[InterfacesDict["ServiceSDP"][0]] = InterfacesParse[InterfacesDict["ServiceSDP"][0]] + "|"
-                            InterfacesParse[InterfacesDict["ServiceSDP"][0]] = InterfacesParse[InterfacesDict["ServiceSDP"][0]] + obj3.text.split("xconnect ")[1].split()[0] + ":" + obj3.text.split("xconnect ")[1].split(" ")[1]
+                # Find if LLDP is enabled on current interface
+                for obj2 in obj1.re_search_children("lldp"):
+                    InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
+                    break
+
+                # Find if BFD timers on current interface for OSPF
+                # BFD = ""
+                # for obj10 in cfg.find_objects(r"^router ospf"):
+                #     # print(obj10.text)
+                #     for obj11 in obj10.re_search_children("area"):
+                #         # print(obj11.text)
+                #         for obj12 in obj11.re_search_children(InterfacesParse[InterfacesDict["IfName"][0]]):
+                #             # print(obj12.text)
+                #             if ((obj10.re_search_children("^bfd fast-detect")) or (obj12.re_search_children("bfd fast-detect"))):
+                #                 obj13 = obj12.re_search_children("^bfd minimum-interval")[0]
+                #                 # print(obj13.text)
+                #                 if obj13:
+                #                     BFD = "OSPF " + obj10.text.split("ospf ")[1] + ":" + obj13.text.split("minimum-interval ")[1] + "|" + obj13.text.split("minimum-interval ")[1]
+                #                 else:
+                #                     BFD = "OSPF:100|100"
+                #                 obj13 = obj12.re_search_children("bfd multiplier")[0]
+                #                 if obj13:
+                #                     BFD = BFD + "|" + obj13.text.split("multiplier ")[1]
+                #                 else:
+                #                     BFD = BFD + "|3"
+
+                #     for obj11 in obj10.re_search_children("vrf"):
+                #         # print(obj11.text)
+                #         for obj12 in obj11.re_search_children("area"):
+                #             # print(obj12.text)
+                #             for obj13 in obj12.re_search_children(InterfacesParse[InterfacesDict["IfName"][0]]):
+                #                 # print(obj13.text)
+                #                 if ((obj10.re_search_children("bfd fast-detect")) or (obj13.re_search_children("bfd fast-detect"))):
+                #                     obj14 = obj13.re_search_children("bfd minimum-interval")[0]
+                #                     # print(obj14.text)
+                #                     if obj14:
+                #                         BFD = "OSPF " + obj10.text.split("ospf ")[1] + ":" + obj14.text.split("minimum-interval ")[1] + "|" + obj14.text.split("minimum-interval ")[1]
+                #                     else:
+                #                         BFD = "OSPF:100|100"
+                #                     obj14 = obj13.re_search_children("bfd multiplier")[0]
+                #                     if obj14:
+                #                         BFD = BFD + "|" + obj14.text.split("multiplier ")[1]
+                #                     else:
+                #                         BFD = BFD + "|3"
+
+
+                # if InterfacesParse[InterfacesDict["BFD"][0]] == "":
+                #     InterfacesParse[InterfacesDict["BFD"][0]] = BFD
+                # else:
+                #     InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "," + BFD
+
+                InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                InterfacesParseAll.append(InterfacesParse)
 
-                            for obj4 in obj3.re_search_children(r"^ *mtu "):
-                                if InterfacesParse[InterfacesDict["L2MTU"][0]] != "": InterfacesParse[InterfacesDict["L2MTU"][0]] = InterfacesParse[InterfacesDict["L2MTU"][0]] + "|"
-                                InterfacesParse[InterfacesDict["L2MTU"][0]] = InterfacesParse[InterfacesDict["L2MTU"][0]] + obj4.text.split("mtu ")[1].split()[0]
-                        
-                        InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                        InterfacesParseAll.append(InterfacesParse)
 
 #####################################################################################################################################################
-###################################################                  Huawei VRP parsing               ###############################################
+###################################################                Nokia/ALU SR-OS parsing                 ##########################################
 #####################################################################################################################################################
-            # Syntax: Huawei VRP parsing
-            if (CLISyntax == "VRP"):
-                if debug: print("debug: Using Huawei VRP syntax to parse file")
-                # Find node's interfaces from config
-                for obj1 in cfg.find_objects(r"^interface"):       
-                    duplicate = []
-                    for obj2 in cfg.find_objects(r"^interface"):
-                        if obj1.text.split("interface ")[1].split(" ")[0] == obj2.text.split("interface ")[1].split(" ")[0]:
-                            duplicate.append(str(obj2))
+        # Syntax: Nokia/ALU SR-OS
+        if (CLISyntax == "SR-OS"):
+            if debug: logger.debug("Using SR-OS syntax to parse file")
+
+            # Index of VLANs bound to every port and LAG by router interfaces and SAPs
+            routerPortsIndex, SAPPortsIndex = portBindingsIndexFunc(cfg)
+
+            # Enter "config" domain section
+            for obj1 in cfg.find_objects(r"^configure"):
+
+                # Find node's ports from config
+                portLAGIndex = portLAGIndexFunc(obj1)
+                portsIndex = objectsIndexFunc(obj1.re_search_children(r" +port +"), lambda obj: obj.text.split("port ")[1])
+                for obj2 in obj1.re_search_children(r" +port +"):
+                    duplicate = [str(obj3) for obj3 in portsIndex[obj2.text.split("port ")[1]]]
 
                     if len(duplicate) > 1:
-                        print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
+                        logger.warning("File %s contains duplicate port lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
                         nextFile = 1
+                        skipReason = ["duplicatePorts", "Duplicate port lines: "+str(duplicate)]
                         break
-                    
+
                     IfNumber = IfNumber + 1
+                    if debug: logger.debug("obj2: %s", obj2)
+
                     InterfacesParse = [""] * len(InterfacesDict)
-                    if debug: print("debug: obj1: "+str(obj1))
-                    
                     InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
                     InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
                     InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
                     InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                    InterfacesParse[InterfacesDict["IfName"][0]] = obj1.text.split("interface ")[1].split(" ")[0]
+                    InterfacesParse[InterfacesDict["IfName"][0]] = obj2.text.split("port ")[1]
+                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
 
-                    # Check if interface is a subinterface of another one
-                    if re.search(r'\.',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split(".")[0]
-                    else:
-                        # Check if interface is physical port
-                        if re.search(r'[Vv]irtual',InterfacesParse[InterfacesDict["IfName"][0]]) is None:
-                            if re.search(r'([Gg]ig[Ee]|[Ee]thernet)',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "Port"
-                                if re.search(r'[Hh]undred[Gg]igE',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "100GE"
-                                else:
-                                    if re.search(r'[Tt]en[Gg]igE',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                        InterfacesParse[InterfacesDict["PortType"][0]] = "10GE"
-                                    else:
-                                        if re.search(r'[Gg]igabit',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                            InterfacesParse[InterfacesDict["PortType"][0]] = "1GE"
-                                        else:
-                                            if re.search(r'[Ff]ast',InterfacesParse[InterfacesDict["IfName"][0]]):
-                                                InterfacesParse[InterfacesDict["PortType"][0]] = "100ME"
-                                            else:
-                                                InterfacesParse[InterfacesDict["PortType"][0]] = ""
+                    # Classify interface by its name
+                    for column, value in interfaceClassifierFunc(CLISyntax, InterfacesParse[InterfacesDict["IfName"][0]]).items():
+                        InterfacesParse[InterfacesDict[column][0]] = value
 
-                    # Check if interface is a bundle
-                    if re.search(r'^E|eth-T|trunk',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["LAGID"][0]] = str(InterfacesParse[InterfacesDict["IfName"][0]].split("runk")[1].split(".")[0])
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "LAG"
+                    
+                    # Find description associated with current port
+                    for obj3 in obj2.re_search_children("description "):
+                        InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj3.text.split("description ")[1].replace("\"",""))
+                        break
 
-                    # Check if interface is L2 VC interface
-                    if re.search(r'V|virtual-E|ethernet',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["ServiceType"][0]] = "L2VPN"
-                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "L2VPN SAP"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                    # Find admin state associated with current port
+                    for obj3 in obj2.re_search_children(r"shutdown"):
+                        if obj3.re_search(r"no "):
+                            InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                        else:
+                            InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
-                    # Check if interface is RSVP Tunnel interface
-                    if re.search(r'Tunnel',InterfacesParse[InterfacesDict["IfName"][0]]):
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "RSVP Tunnel"
-                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+                    for obj3 in obj2.re_search_children("ethernet"):
+                        # Get port mode
+                        for obj4 in obj3.re_search_children("mode"):
+                            # print(obj4)
+                            if obj4.text.split("mode ")[1] == "hybrid":
+                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Hybrid"
+                            if obj4.text.split("mode ")[1] == "network":
+                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+                            if obj4.text.split("mode ")[1] == "access":
+                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                            break
 
-                    # Find description associated with current interface
-                    for obj2 in obj1.re_search_children("description "):
-                        InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj2.text.split("description ")[1].replace("\"",""))
-                        break
+                        # Get port speed
+                        for obj4 in obj3.re_search_children("speed"):
+                            # print(obj4)
+                            tempSpeed = obj4.text.split("speed")[1].rstrip().lstrip()
+                            if tempSpeed == "100":
+                                InterfacesParse[InterfacesDict["PortType"][0]] = "100ME"
+                            if tempSpeed == "1000":
+                                InterfacesParse[InterfacesDict["PortType"][0]] = "1GE"
+                            if tempSpeed == "10000":
+                                InterfacesParse[InterfacesDict["PortType"][0]] = "10GE"
+                            if tempSpeed == "100000":
+                                InterfacesParse[InterfacesDict["PortType"][0]] = "100GE"
+                            break
+
+                        # Get port encapsulation
+                        for obj4 in obj3.re_search_children("encap-type"):
+                            # print(obj4)
+                            InterfacesParse[InterfacesDict["Encap"][0]] = obj4.text.split("encap-type ")[1]
+                            break
 
-                    # Find encapsulation associated with current interface
-                    for obj2 in obj1.re_search_children("vlan-type "):
-                        InterfacesParse[InterfacesDict["Encap"][0]] = str(obj2.text.split("vlan-type ")[1].split(" ")[0])
-                        InterfacesParse[InterfacesDict["VLAN"][0]] = str(obj2.text.split("vlan-type ")[1].split(" ")[1])
+                        # Get all VLANs associated with this port
+                        # searchExpression = r"(sap " + InterfacesParse[InterfacesDict["IfName"][0]] + r"(:.*| )create|port " + InterfacesParse[InterfacesDict["IfName"][0]] + "(:|$))"
+                        # (sap 1/1/14(:.*| )create|port 1/1/1(:|$))
+                        for binding in routerPortsIndex.get(InterfacesParse[InterfacesDict["IfName"][0]], []) + SAPPortsIndex.get(InterfacesParse[InterfacesDict["IfName"][0]], []):
+                            if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + binding[0]
+
+
+                        # Find LAG associated with this port
+                        if InterfacesParse[InterfacesDict["IfName"][0]] in portLAGIndex:
+                            obj10 = portLAGIndex[InterfacesParse[InterfacesDict["IfName"][0]]]
+                            InterfacesParse[InterfacesDict["LAGID"][0]] = obj10.text.split("lag ")[1]
+                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj10.text
+
+                        # Find L2 MTU parameters associated with current port
+                        for obj4 in obj3.re_search_children(r"mtu"):
+                            InterfacesParse[InterfacesDict["L2MTU"][0]] = obj4.text.split("mtu ")[1]
+                            break
+
+                        # Get port LLDP state
+                        for obj4 in obj3.re_search_children("lldp"):
+                            # print(obj4)
+                            InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
+                            break
+
+                        # Get port egress QoS policy
+                        for obj4 in obj3.re_search_children("egress-port-qos-policy"):
+                            # print(obj4)
+                            InterfacesParse[InterfacesDict["QoSOut"][0]] = obj4.text.split("egress-port-qos-policy ")[1].replace("\"","")
+                            break
+
+                        # Get port ingress QoS policy
+                        for obj4 in obj3.re_search_children("ingress-port-qos-policy"):
+                            # print(obj4)
+                            InterfacesParse[InterfacesDict["QoSIn"][0]] = obj4.text.split("ingress-port-qos-policy ")[1].replace("\"","")
+                            break
+                    # print(InterfacesParse)
+
+
+
+
+                    #########################################################################################################################################
+                    #                                                    Post-processing for ports                                                     #
+                    #########################################################################################################################################
+                
+                    # Sort VLANs for Ports
+                    if re.search(r"Port",InterfacesParse[InterfacesDict["IfType"][0]]):
+                        if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
+                            VLANList = []
+                            for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
+                                if re.search(r"\*",value):
+                                    value = value.replace("*","9999")
+                                VLANList.append(value)
+                            VLANList = sorted(VLANList, key=float)
+
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = ""
+                            # VLANList = VLANList.sort()
+                            # print(VLANList)
+                            for value in VLANList:
+                                if re.search("9999",value):
+                                    value = value.replace("9999","*")
+                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
+
+
+
+                    InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                    InterfacesParseAll.append(InterfacesParse)
+
+
+
+                # Find node's LAGs from config
+                LAGsIndex = objectsIndexFunc(obj1.re_search_children(r" +lag +"), lambda obj: obj.text.lstrip().rstrip())
+                for obj2 in obj1.re_search_children(r" +lag +"):
+                    duplicate = [str(obj3) for obj3 in LAGsIndex[obj2.text.lstrip().rstrip()]]
+
+                    if len(duplicate) > 1:
+                        logger.warning("File %s contains duplicate port lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                        nextFile = 1
+                        skipReason = ["duplicatePorts", "Duplicate port lines: "+str(duplicate)]
                         break
+                
+                    IfNumber = IfNumber + 1
+                    if debug: logger.debug("obj2: %s", obj2)
                     
-                    # Find LAG associated with current interface
-                    for obj2 in obj1.re_search_children("eth-trunk "):
-                        InterfacesParse[InterfacesDict["LAGID"][0]] = str(obj2.text.split("eth-trunk")[1])
-                        for obj3 in cfg.find_objects(r"^interface Eth-Trunk"+str(InterfacesParse[InterfacesDict["LAGID"][0]]+"$")):
-                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj3.text.split("Eth-Trunk")[1]
-                            break
+                    InterfacesParse = [""] * len(InterfacesDict)
+                    InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                    InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                    InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                    InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                    InterfacesParse[InterfacesDict["IfName"][0]] = obj2.text.lstrip().rstrip()
+                    InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split("lag ")[1]
+                    InterfacesParse[InterfacesDict["PortName"][0]] = str("lag-"+InterfacesParse[InterfacesDict["LAGID"][0]])
+                    InterfacesParse[InterfacesDict["IfType"][0]] = "LAG"
+
+                    # Find description associated with current LAG
+                    for obj3 in obj2.re_search_children("description "):
+                        InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj3.text.split("description ")[1].replace("\"",""))
                         break
 
-                    # Find admin state associated with current interface
-                    for obj2 in obj1.re_search_children(r"shutdown"):
-                        if obj2.re_search(r"undo"):
+                    # Find admin state associated with current LAG
+                    for obj3 in obj2.re_search_children(r"shutdown"):
+                        if obj3.re_search(r"no "):
                             InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
                         else:
                             InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
-                    # Find L3VPN service associated with current interface
-                    for obj2 in obj1.re_search_children("ip binding vpn-instance"):
-                        InterfacesParse[InterfacesDict["ServiceName"][0]] = str(obj2.text.split("vpn-instance ")[1])
-                        InterfacesParse[InterfacesDict["ServiceType"][0]] = "L3VPN"
-                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                            if re.search(r"L|loopB|back",InterfacesParse[InterfacesDict["IfName"][0]]):
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN Loopback"
-                            else:
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN SAP"
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
-                            break
-                    
-                    # Check if interface is a non-VRF loopback
-                    if InterfacesParse[InterfacesDict["ServiceName"][0]] == "":
-                        if re.search(r"L|loopB|back",InterfacesParse[InterfacesDict["IfName"][0]]):
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
+                    # Find mode associated with current LAG
+                    for obj3 in obj2.re_search_children("mode"):
+                        # print(obj3)
+                        if obj3.text.split("mode ")[1] == "hybrid":
+                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Hybrid"
+                        if obj3.text.split("mode ")[1] == "network":
                             InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-
-                    # Find L2 MTU associated with current interface 
-                    for obj2 in obj1.re_search_children(r"^ +mtu"):
-                        InterfacesParse[InterfacesDict["L2MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                        if obj3.text.split("mode ")[1] == "access":
+                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
                         break
 
-                    # Find L3 MTU associated with current interface 
-                    for obj2 in obj1.re_search_children(r"^ +ipv4 mtu"):
-                        InterfacesParse[InterfacesDict["L3MTU"][0]]  = str(obj2.text.split("mtu ")[1])
+                    # Get LAG encapsulation
+                    for obj3 in obj2.re_search_children("encap-type"):
+                        # print(obj3)
+                        InterfacesParse[InterfacesDict["Encap"][0]] = obj3.text.split("encap-type ")[1]
+                        break
+                    
+                    # Get LACP mode
+                    for obj3 in obj2.re_search_children("lacp"):
+                        # print(obj3)
+                        if obj3.re_search(r"active"):
+                            InterfacesParse[InterfacesDict["LAGMode"][0]] = "Active"
+                        else:
+                            if obj3.re_search(r"passive"):
+                                InterfacesParse[InterfacesDict["LAGMode"][0]] = "Passive"
                         break
 
-                    # Find all IPv4 addresses associated with current interface
-                    for obj2 in obj1.re_search_children("ip address "):
-                        if re.search("ip address unnumbered interface", obj2.text):
-                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj2.text.split("unnumbered interface ")[1]
-                            InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["ParentIfName"][0]]
+                    # Get all VLANs associated with this LAG
+                    # searchExpression = r"(sap " + InterfacesParse[InterfacesDict["IfName"][0]] + r"(:.*| )create|port " + InterfacesParse[InterfacesDict["IfName"][0]] + "(:|$))"
+                    # (sap 1/1/14(:.*| )create|port 1/1/1(:|$))
+                    for binding in routerPortsIndex.get(InterfacesParse[InterfacesDict["IfName"][0]].replace(" ","-"), []) + SAPPortsIndex.get(InterfacesParse[InterfacesDict["IfName"][0]].replace(" ","-"), []):
+                        if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + binding[0]
+
+                    #########################################################################################################################################
+                    #                                                    Post-processing for LAGs                                                     #
+                    #########################################################################################################################################
+                
+                    # Sort VLANs for LAGs
+                    if re.search(r"LAG",InterfacesParse[InterfacesDict["IfType"][0]]):
+                        if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
+                            VLANList = []
+                            for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
+                                if re.search(r"\*",value):
+                                    value = value.replace("*","9999")
+                                VLANList.append(value)
+                            VLANList = sorted(VLANList, key=float)
+
+                            InterfacesParse[InterfacesDict["VLAN"][0]] = ""
+                            for value in VLANList:
+                                if re.search("9999",value):
+                                    value = value.replace("9999","*")
+                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
+
+
+                    # print(InterfacesParse)
+                    InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                    InterfacesParseAll.append(InterfacesParse)
+
+                # Find node's network interfaces from config
+                for obj2 in obj1.re_search_children(r"router Base"):
+                    networkInterfacesIndex = objectsIndexFunc(obj2.re_search_children(r"interface"), lambda obj: obj.text.split("interface ")[1])
+                    for obj3 in obj2.re_search_children(r"interface"):
+                        duplicate = [str(obj3) for obj4 in networkInterfacesIndex[obj3.text.split("interface ")[1]]]
+
+                        if len(duplicate) > 1:
+                            logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                            nextFile = 1
+                            skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
+                            break
+                    
+                        IfNumber = IfNumber + 1
+                        if debug: logger.debug("obj3: %s", obj3)
+                        
+                        InterfacesParse = [""] * len(InterfacesDict)
+                        InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                        InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                        InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                        InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                        InterfacesParse[InterfacesDict["IfName"][0]] = obj3.text.split("interface ")[1].replace("\"","")
+                        InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+
+                        # Check if interface is a system or loopback interface
+                        if re.match(r'system',InterfacesParse[InterfacesDict["IfName"][0]]):
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
                         else:
-                            rawInput = obj2.text.split("ip address ")[1].lstrip().rstrip()
+                            for obj4 in obj3.re_search_children("loopback"):
+                                InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
+                                break
+
+                        # Find description associated with current interface
+                        for obj4 in obj3.re_search_children("description "):
+                            InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj4.text.split("description ")[1].replace("\"",""))
+                            break
+
+                        # Find admin state associated with current interface
+                        for obj4 in obj3.re_search_children(r"shutdown"):
+                            if obj4.re_search(r"no "):
+                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                            else:
+                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
+
+                        # Find BFD parameters associated with current interface
+                        for obj4 in obj3.re_search_children(r"bfd"):
+                            InterfacesParse[InterfacesDict["BFD"][0]] = "if_tmr:" + obj4.text.lstrip().rstrip().replace("bfd ","").replace(" receive "," ").replace(" multiplier "," ").replace(" type "," ")
+                            break
+
+                        # Find all IPv4 addresses associated with current interface
+                        for obj4 in obj3.re_search_children(r"^ *address "):
+                            rawInput = obj4.text.split("address ")[1].lstrip().rstrip()
                             rawInput = rawInput.replace(" ","/")
                             ipadd = ipaddress.ip_interface(str(rawInput))
                             if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
@@ -2861,458 +4007,639 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                                 InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
                             else:
                                 InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
-                            
-                            # print(rawInput, ipadd, InterfacesParse[InterfacesDict["IPV4Addr"][0]],InterfacesParse[InterfacesDict["IPV4Subnet"][0]])
-                            # input("Stop")
 
+                        # Find all IPv6 addresses associated with current interface
+                        for obj4 in obj3.re_search_children(r"^ *ipv6 address "):
+                            rawInput = obj4.text.split("ipv6 address ")[1].lstrip().rstrip()
+                            ipadd = ipaddress.ip_interface(str(line))
+                            if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
+                                InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
+                            else:
+                                InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
+                            if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
+                                InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
+                            else:
+                                InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
+
+
+                        # Check if interface is a L3 interface
+                        if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
+                            # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned
+                            if InterfacesParse[InterfacesDict["IfType"][0]] == "":
+                                InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
+                            # if ((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG") or (InterfacesParse[InterfacesDict["IfType"][0]] == "Bridge")):
+                            else:
+                                InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3"
+
+                        # Find L3 MTU parameters associated with current interface
+                        for obj4 in obj3.re_search_children(r"ip-mtu"):
+                            InterfacesParse[InterfacesDict["L3MTU"][0]] = obj4.text.split("ip-mtu ")[1]
+                            break
+
+                        # Find QoS input policy associated with current interface
+                        for obj4 in obj3.re_search_children(r"^ *ingress"):
+                            for obj5 in obj4.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
+                                    InterfacesParse[InterfacesDict["QoSIn"][0]] = obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                else:
+                                    InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+
+                        # Find QoS output policy associated with current interface
+                        for obj4 in obj3.re_search_children(r"^ *egress"):
+                            for obj5 in obj4.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
+                                    InterfacesParse[InterfacesDict["QoSOut"][0]] = obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                else:
+                                    InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+
+                        # Find port/LAG associated with current interface
+                        for obj4 in obj3.re_search_children(r"^ *port"):
+                            # print(obj4.text)
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = obj4.text.split("port ")[1]
+                            if obj4.re_search(r":"):
+                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[0]
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[1]
+                                if obj4.re_search(r"\."):
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                                else:
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                            else:
+                                InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
                             
-                        # Mark interface as Network/Hybrid if it has any addresses assigned
-                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-                
+                            if obj4.re_search(r"lag-"):
+                                # InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
+                                # InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["LAGID"][0]]
+                                InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
+                            else:
+                                InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
 
-                    # Find all IPv6 addresses associated with current interface
-                    for obj2 in obj1.re_search_children("ipv6 address "):
-                        rawInput = obj2.text.split("ipv6 address ")[1].lstrip().rstrip()
-                        ipadd = ipaddress.ip_interface(str(line))
-                        if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
-                        else:
-                            InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
-                        if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
-                            InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
-                        else:
-                            InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
 
-                        # Mark interface as Network/Hybrid if it has any addresses assigned
-                        if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                            InterfacesParse[InterfacesDict["IfType"][0]] == "L3"
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
+                        # Find all OSPF processes and areas where this interface is participating
+                        ospfList = []
+                        # Find all OSPF processes associated with interface
+                        for obj10 in protocolChildrenFunc(protocolIndex, obj2, r"ospf "):
+                            ospfLine = []
+                            ospfPID = ""
+                            ospfRID = ""
+                            ospfPID = str(obj10.text.split("ospf ")[1].split()[0])
+                            ospfLine.append(ospfPID)
 
-                    # Find QoS input policy associated with current interface
-                    for obj2 in obj1.re_search_children(r"^ *traffic-policy .* in"):
-                        InterfacesParse[InterfacesDict["QoSIn"][0]] = str(obj2.text.split("traffic-policy ")[1].split(" ")[0])
-                        break
+                            if len(obj10.text.split("ospf ")[1].split()) > 1:
+                                ospfRID = str(obj10.text.split("ospf ")[1].split()[1])
+                            ospfLine.append(ospfRID)
+                            
+                            # First we will look for the area where interface is primary
+                            ospfIfType1 = ""
+                            ospfIfType2 = "Bcast"
+                            ospfIfMode = "Act"
+                            ospfBFDState = "Dis"
+                            ospfPriority = ""
+                            ospfMetric = ""
+                            ospfHello = ""
+                            ospfDead = ""
+                            ospfRetransmit = ""
+                            ospfAuth = ""
+                            ospfIfState = "Dis"
 
-                    # Find QoS output policy associated with current interface
-                    for obj2 in obj1.re_search_children(r"^ *traffic-policy .* out"):
-                        InterfacesParse[InterfacesDict["QoSOut"][0]] = str(obj2.text.split("traffic-policy ")[1].split(" ")[0])
-                        break
+                            area = ""
+                            # Look through all OSPF areas
+                            for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"area "):
+                                area = obj11.text.split("area ")[1]
+                                area = ipaddress.ip_address(area)
 
-                    # Find if SyncE enabled on current interface
-                    # for obj2 in obj1.re_search_children("synchronization"):
-                    #     InterfacesParse[InterfacesDict["SyncE"][0]] = "Enabled"
-                    #     # Find SyncE configuration on current interface
-                    #     for obj3 in obj2.re_search_children():
-                    #         InterfacesParse[InterfacesDict["SyncE"][0]] = InterfacesParse[InterfacesDict["SyncE"][0]] + "|" + str(obj3.text)
-                    #         break
-                    #     break
-
-                    # Find if LLDP is enabled on current interface
-                    for obj2 in obj1.re_search_children("lldp"):
-                        InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
-                        break
+                                # Find current interface configured as primary within an area
+                                for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
+                                    if re.search(r"secondary",obj12.text):
+                                        continue
+                                    else:
+                                        # Find all OSPF parameters for this primary interface
+                                        for obj13 in obj12.re_search_children("interface-type "):
+                                            ospfIfType1 = str(obj13.text.split("interface-type ")[1].split(" ")[0].lstrip().rstrip())
+                                            ospfIfType2 = ""
+                                            if ospfIfType1 == "point-to-point":
+                                                ospfIfType2 = "PtP"
+                                            else:
+                                                if ospfIfType1 == "point-to-multipoint":
+                                                    ospfIfType2 = "PtMP"
+                                                else:
+                                                    ospfIfType2 = ospfIfType1
+                                            break
+                                        ospfLine.append(ospfIfType2)
+                                        for obj13 in obj12.re_search_children("passive"):
+                                            if re.match(r"^ *passive *$",obj13.text):
+                                                ospfIfMode = "Pass"
+                                            if re.match(r"^ *no passive *$",obj13.text):
+                                                ospfIfMode = "Act"
+                                            break
+                                        ospfLine.append(ospfIfMode)
+                                        for obj13 in obj12.re_search_children("bfd-enable"):
+                                            if re.match(r"^ *bfd-enable *$",obj13.text):
+                                                ospfBFDState = "En"
+                                            if re.match(r"^ *no bfd-enable *$",obj13.text):
+                                                ospfBFDState = "Dis"
+                                            break
+                                        ospfLine.append(ospfBFDState)
+                                        for obj13 in obj12.re_search_children("priority "):
+                                            ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfPriority)
+                                        for obj13 in obj12.re_search_children("metric "):
+                                            ospfMetric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfMetric)
+                                        for obj13 in obj12.re_search_children("hello-interval "):
+                                            ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfHello)
+                                        for obj13 in obj12.re_search_children("dead-interval "):
+                                            ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfDead)
+                                        for obj13 in obj12.re_search_children("retransmit-interval "):
+                                            ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfRetransmit)
+                                        for obj13 in obj12.re_search_children("authentication-type "):
+                                            ospfAuth = str(obj13.text.split("authentication-type ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfAuth)
+                                        for obj13 in obj12.re_search_children("no shutdown"):
+                                            ospfIfState = "En"
+                                            break
 
-                    # Find if BFD timers on current interface for OSPF
-                    # BFD = ""
-                    # for obj10 in cfg.find_objects(r"^router ospf"):
-                    #     # print(obj10.text)
-                    #     for obj11 in obj10.re_search_children("area"):
-                    #         # print(obj11.text)
-                    #         for obj12 in obj11.re_search_children(InterfacesParse[InterfacesDict["IfName"][0]]):
-                    #             # print(obj12.text)
-                    #             if ((obj10.re_search_children("^bfd fast-detect")) or (obj12.re_search_children("bfd fast-detect"))):
-                    #                 obj13 = obj12.re_search_children("^bfd minimum-interval")[0]
-                    #                 # print(obj13.text)
-                    #                 if obj13:
-                    #                     BFD = "OSPF " + obj10.text.split("ospf ")[1] + ":" + obj13.text.split("minimum-interval ")[1] + "|" + obj13.text.split("minimum-interval ")[1]
-                    #                 else:
-                    #                     BFD = "OSPF:100|100"
-                    #                 obj13 = obj12.re_search_children("bfd multiplier")[0]
-                    #                 if obj13:
-                    #                     BFD = BFD + "|" + obj13.text.split("multiplier ")[1]
-                    #                 else:
-                    #                     BFD = BFD + "|3"
-
-                    #     for obj11 in obj10.re_search_children("vrf"):
-                    #         # print(obj11.text)
-                    #         for obj12 in obj11.re_search_children("area"):
-                    #             # print(obj12.text)
-                    #             for obj13 in obj12.re_search_children(InterfacesParse[InterfacesDict["IfName"][0]]):
-                    #                 # print(obj13.text)
-                    #                 if ((obj10.re_search_children("bfd fast-detect")) or (obj13.re_search_children("bfd fast-detect"))):
-                    #                     obj14 = obj13.re_search_children("bfd minimum-interval")[0]
-                    #                     # print(obj14.text)
-                    #                     if obj14:
-                    #                         BFD = "OSPF " + obj10.text.split("ospf ")[1] + ":" + obj14.text.split("minimum-interval ")[1] + "|" + obj14.text.split("minimum-interval ")[1]
-                    #                     else:
-                    #                         BFD = "OSPF:100|100"
-                    #                     obj14 = obj13.re_search_children("bfd multiplier")[0]
-                    #                     if obj14:
-                    #                         BFD = BFD + "|" + obj14.text.split("multiplier ")[1]
-                    #                     else:
-                    #                         BFD = BFD + "|3"
-
-
-                    # if InterfacesParse[InterfacesDict["BFD"][0]] == "":
-                    #     InterfacesParse[InterfacesDict["BFD"][0]] = BFD
-                    # else:
-                    #     InterfacesParse[InterfacesDict["BFD"][0]] = InterfacesParse[InterfacesDict["BFD"][0]] + "," + BFD
+                                        ospfAreaList = []
+                                        ospfAreaList.append([int(area),"*",""])
+                                        if ospfIfState == "Dis":
+                                            ospfAreaList[0][2] = "(Dis)"
+                                        else:
+                                            ospfAreaList[0][2] = ""
 
-                    InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                    InterfacesParseAll.append(InterfacesParse)
+                                        ospfLine.append(ospfAreaList)
 
+                                        ospfList.append(ospfLine)
 
-#####################################################################################################################################################
-###################################################                Nokia/ALU SR-OS parsing                 ##########################################
-#####################################################################################################################################################
-            # Syntax: Nokia/ALU SR-OS
-            if (CLISyntax == "SR-OS"):
-                if debug: print("debug: Using SR-OS syntax to parse file")
+                                        break
 
-                # Enter "config" domain section
-                for obj1 in cfg.find_objects(r"^configure"):
+                            # Now we will look for all other areas where interface is secondary
 
-                    # Find node's ports from config
-                    for obj2 in obj1.re_search_children(r" +port +"):
-                        duplicate = []
-                        for obj3 in obj1.re_search_children(r" +port +"):
-                            if obj3.text.split("port ")[1] == obj2.text.split("port ")[1]:
-                                duplicate.append(str(obj3))
+                            area = ""
+                            # Look through all OSPF areas
+                            for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"area "):
+                                area = obj11.text.split("area ")[1]
+                                area = ipaddress.ip_address(area)
 
-                        if len(duplicate) > 1:
-                            print("File "+str(os.path.split(inputPath)[1])+" contains duplicate port lines: "+str(duplicate)+", skipping this file")
-                            nextFile = 1
-                            break
+                                ospfLine = []
+                                ospfBFDState = "Dis"
+                                ospfPriority = ""
+                                ospfMetric = ""
+                                ospfHello = ""
+                                ospfDead = ""
+                                ospfRetransmit = ""
+                                ospfAuth = ""
+                                ospfIfState = "Dis"
 
-                        IfNumber = IfNumber + 1
-                        if debug: print("debug: obj2: "+str(obj2))
+                                # Find current interface configured as secondary within an area
+                                for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
+                                    if re.search(r"secondary",obj12.text):
+                                        # Find all OSPF parameters for this secondary interface
+                                        ospfLine.append(ospfPID)        # Set to same value as on primary configuration
+                                        ospfLine.append(ospfRID)        # Set to same value as on primary configuration
+                                        ospfLine.append(ospfIfType2)    # Set to same value as on primary configuration
+                                        ospfLine.append(ospfIfMode)     # Set to same value as on primary configuration
+                                        for obj13 in obj12.re_search_children("bfd-enable"):
+                                            if re.match(r"^ *bfd-enable *$",obj13.text):
+                                                ospfBFDState = "En"
+                                            if re.match(r"^ *no bfd-enable *$",obj13.text):
+                                                ospfBFDState = "Dis"
+                                            break
+                                        ospfLine.append(ospfBFDState)
+                                        for obj13 in obj12.re_search_children("priority "):
+                                            ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfPriority)
+                                        for obj13 in obj12.re_search_children("metric "):
+                                            ospfMetric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfMetric)
+                                        for obj13 in obj12.re_search_children("hello-interval "):
+                                            ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfHello)
+                                        for obj13 in obj12.re_search_children("dead-interval "):
+                                            ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfDead)
+                                        for obj13 in obj12.re_search_children("retransmit-interval "):
+                                            ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfRetransmit)
+                                        for obj13 in obj12.re_search_children("authentication-type "):
+                                            ospfAuth = str(obj13.text.split("authentication-type ")[1].split(" ")[0].lstrip().rstrip())
+                                            break
+                                        ospfLine.append(ospfAuth)
+                                        for obj13 in obj12.re_search_children("no shutdown"):
+                                            ospfIfState = "En"
+                                            break
 
-                        InterfacesParse = [""] * len(InterfacesDict)
-                        InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                        InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                        InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                        InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                        InterfacesParse[InterfacesDict["IfName"][0]] = obj2.text.split("port ")[1]
-                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["IfName"][0]]
+                                        ospfAreaList = []
+                                        ospfAreaList.append([int(area),"",""])
+                                        if ospfIfState == "Dis":
+                                            ospfAreaList[0][2] = "(Dis)"
+                                        else:
+                                            ospfAreaList[0][2] = ""
+                                        ospfLine.append(ospfAreaList)
 
-                        # Check if interface is connector
-                        if re.search(r'.*/c[0-9]+$',InterfacesParse[InterfacesDict["IfName"][0]]):
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "Connector"
-                        else:
-                            InterfacesParse[InterfacesDict["IfType"][0]] = "Port"
+                                        lineNumber = 0
+                                        match = 0
+                                        for ospfLineCheck in ospfList:
+                                            if ((ospfLineCheck[4] == ospfBFDState) and (ospfLineCheck[5] == ospfPriority) and (ospfLineCheck[6] == ospfMetric) and (ospfLineCheck[7] == ospfHello) 
+                                                and (ospfLineCheck[8] == ospfDead) and (ospfLineCheck[9] == ospfRetransmit) and (ospfLineCheck[10] == ospfAuth)):
+                                                
+                                                ospfList[lineNumber][11].extend(ospfAreaList)
+                                                match = 1
+                                                break
 
+                                            lineNumber = lineNumber + 1
+
+                                        if match == 0:
+                                            ospfList.append(ospfLine)
                         
-                        # Find description associated with current port
-                        for obj3 in obj2.re_search_children("description "):
-                            InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj3.text.split("description ")[1].replace("\"",""))
-                            break
+                        # Sort all areas inside the ospfList
+                        # print(ospfList)
+                        lineNumber = 0
+                        for ospfLineCheck in ospfList:
+                            ospfList[lineNumber][11].sort(key=lambda x: x[0])
+                            lineNumber = lineNumber + 1
+                        
+                        # ospfList.sort(key=lambda x: x[10])
 
-                        # Find admin state associated with current port
-                        for obj3 in obj2.re_search_children(r"shutdown"):
-                            if obj3.re_search(r"no "):
-                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                            else:
-                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
-                        for obj3 in obj2.re_search_children("ethernet"):
-                            # Get port mode
-                            for obj4 in obj3.re_search_children("mode"):
-                                # print(obj4)
-                                if obj4.text.split("mode ")[1] == "hybrid":
-                                    InterfacesParse[InterfacesDict["IfMode"][0]] = "Hybrid"
-                                if obj4.text.split("mode ")[1] == "network":
-                                    InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-                                if obj4.text.split("mode ")[1] == "access":
-                                    InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
-                                break
+                        if len(ospfList) > 0:
+                            ospfOutputLine = ""
+                            for ospfLine in ospfList:
+                                # print(ospfLine)
+                                if ospfOutputLine != "":
+                                    ospfOutputLine = ospfOutputLine + ";"
 
-                            # Get port speed
-                            for obj4 in obj3.re_search_children("speed"):
-                                # print(obj4)
-                                tempSpeed = obj4.text.split("speed")[1].rstrip().lstrip()
-                                if tempSpeed == "100":
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "100ME"
-                                if tempSpeed == "1000":
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "1GE"
-                                if tempSpeed == "10000":
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "10GE"
-                                if tempSpeed == "100000":
-                                    InterfacesParse[InterfacesDict["PortType"][0]] = "100GE"
-                                break
+                                # ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3]) + "|prio:"+str(ospfLine[4]) + "|metr:"+str(ospfLine[5]) + "|hello:"+str(ospfLine[6]) + "|dead:"+str(ospfLine[7]) + "|retr:"+str(ospfLine[8]) + "|auth:"+str(ospfLine[9])
+                                
+                                ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0])
+                                if ospfLine[1] != "": ospfOutputLine = ospfOutputLine + "|rid:"+str(ospfLine[1])
+                                ospfOutputLine = ospfOutputLine + "|type:"+str(ospfLine[2]) + "|mode:"+str(ospfLine[3]) + "|bfd:"+str(ospfLine[4])
+                                if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[5])
+                                if ospfLine[6] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[6])
+                                if ((ospfLine[7] != "") or (ospfLine[8] != "") or (ospfLine[9] != "")):
+                                    if ospfLine[7] == "": ospfLine[7] = "def"
+                                    if ospfLine[8] == "": ospfLine[8] = "def"
+                                    if ospfLine[9] == "": ospfLine[9] = "def"
+                                    ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[7]) + " " + str(ospfLine[8]) + " " + str(ospfLine[9])
+                                if ospfLine[10] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[10])
 
-                            # Get port encapsulation
-                            for obj4 in obj3.re_search_children("encap-type"):
-                                # print(obj4)
-                                InterfacesParse[InterfacesDict["Encap"][0]] = obj4.text.split("encap-type ")[1]
-                                break
+                                if len(ospfLine) > 11:
+                                    ospfOutputLine = ospfOutputLine + "|areas:"
 
-                            # Get all VLANs associated with this port
-                            # searchExpression = r"(sap " + InterfacesParse[InterfacesDict["IfName"][0]] + r"(:.*| )create|port " + InterfacesParse[InterfacesDict["IfName"][0]] + "(:|$))"
-                            # (sap 1/1/14(:.*| )create|port 1/1/1(:|$))
-                            searchExpression1 = r"port " + InterfacesParse[InterfacesDict["IfName"][0]] + r"(:|$)" 
-                            for obj19 in cfg.find_objects(r" *router"):
-                                for obj20 in obj19.re_search_children(r" *interface"):
-                                    for obj21 in obj20.re_search_children(searchExpression1):
-                                        tempVLAN = ""                                
-                                        if re.search(":",obj21.text):
-                                            tempVLAN = obj21.text.split(":")[1].split(" ")[0]
+                                    ospfOutputLine2 = ""
+                                    for area in ospfLine[11]:
+                                        if ospfOutputLine2 == "":
+                                            ospfOutputLine2 = str(area[0]) + str(area[1]) + str(area[2])
                                         else:
-                                            tempVLAN = "null"
-                                        
-                                        if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempVLAN
-
-                            searchExpression2 = r"sap " + InterfacesParse[InterfacesDict["IfName"][0]] + r"(:.*| )create"
-                            for obj22 in cfg.find_objects(searchExpression2):
-                                # print(obj20)
-                                tempVLAN = ""                                
-                                if re.search(":",obj22.text):
-                                    tempVLAN = obj22.text.split(":")[1].split(" ")[0]
-                                else:
-                                    tempVLAN = "null"
+                                            ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1]) + str(area[2])
+                                    
+                                    ospfOutputLine = ospfOutputLine + ospfOutputLine2
                                 
-                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempVLAN
+                            InterfacesParse[InterfacesDict["OSPFv2"][0]] = ospfOutputLine
 
 
-                            # Find LAG associated with this port
-                            for obj10 in obj1.re_search_children(r" +lag +"):
-                                for obj11 in obj10.re_search_children(r" +port +"):
-                                    # print(obj11)
-                                    if obj11.text.split("port ")[1] == InterfacesParse[InterfacesDict["IfName"][0]]:
-                                        InterfacesParse[InterfacesDict["LAGID"][0]] = obj10.text.split("lag ")[1]
-                                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = obj10.text
-                                        break
 
-                            # Find L2 MTU parameters associated with current port
-                            for obj4 in obj3.re_search_children(r"mtu"):
-                                InterfacesParse[InterfacesDict["L2MTU"][0]] = obj4.text.split("mtu ")[1]
-                                break
+                        # Find all IS-IS processes where this interface is participating
+                        isisList = []
+                        # Find all OSPF processes associated with interface
+                        for obj10 in protocolChildrenFunc(protocolIndex, obj2, r"isis "):
+                            isisLine = []
+
+                            isisPID = ""
+                            isisPID = str(obj10.text.split("isis ")[1].split()[0])
+                            isisLine.append(isisPID)
+
+                            isisSID = ""
+                            for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"system-id "):
+                                isisSID = obj11.text.split("system-id ")[1].lstrip().rstrip()
+                            isisLine.append(isisSID)
 
-                            # Get port LLDP state
-                            for obj4 in obj3.re_search_children("lldp"):
-                                # print(obj4)
-                                InterfacesParse[InterfacesDict["LLDP"][0]] = "En"
+                            isisArea = ""
+                            for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"area-id "):
+                                isisArea = obj11.text.split("area-id ")[1].lstrip().rstrip()
+                            isisLine.append(isisArea)
+
+                            isisLevelCapability = "L1/2"
+                            for obj11 in protocolChildrenFunc(protocolIndex, obj10, "level-capability"):
+                                if re.match(r"^ *level-capability *level-1$",obj11.text):
+                                    isisLevelCapability = "L1"
+                                else:
+                                    if re.match(r"^ *level-capability *level-2$",obj11.text):
+                                        isisLevelCapability = "L2"
+                                    else:
+                                        if re.match(r"^ *level-capability *level-1/2$",obj11.text):
+                                            isisLevelCapability = "L1/2"
+                                        else:
+                                            isisLevelCapability = obj13.text.split("level-capability ")[1]
                                 break
 
-                            # Get port egress QoS policy
-                            for obj4 in obj3.re_search_children("egress-port-qos-policy"):
-                                # print(obj4)
-                                InterfacesParse[InterfacesDict["QoSOut"][0]] = obj4.text.split("egress-port-qos-policy ")[1].replace("\"","")
-                                break
+                            isisIfType1 = ""
+                            isisIfType2 = "Bcast"
+                            isisIfMode = "Act"
+                            isisBFDState = "Dis"
+
+                            isisL1Priority = ""
+                            isisL2Priority = ""
+                            isisL1Metric = ""
+                            isisL2Metric = ""
+                            isisL1Hello = ""
+                            isisL2Hello = ""
+                            isisL1HelloMult = ""
+                            isisL2HelloMult = ""
+                            isisRetransmit = ""
+                            isisIfAuth = ""
+                            isisL1Auth = ""
+                            isisL2Auth = ""
+                            isisIfState = "Dis"
+                            
+                            # Find current interface
+                            for obj11 in protocolInterfacesFunc(protocolIndex, obj10, InterfacesParse[InterfacesDict["IfName"][0]]):
+
+                                # Find all ISIS parameters for this interface
+                                for obj13 in obj11.re_search_children("interface-type "):
+                                    isisIfType1 = str(obj13.text.split("interface-type ")[1].split(" ")[0].lstrip().rstrip())
+                                    isisIfType2 = ""
+                                    if isisIfType1 == "point-to-point":
+                                        isisIfType2 = "PtP"
+                                    else:
+                                        if isisIfType1 == "point-to-multipoint":
+                                            isisIfType2 = "PtMP"
+                                        else:
+                                            isisIfType2 = isisIfType1
+                                    break
+                                isisLine.append(isisIfType2)
+                                for obj13 in obj11.re_search_children("passive"):
+                                    if re.match(r"^ *passive *$",obj13.text):
+                                        isisIfMode = "Pass"
+                                    else:
+                                        if re.match(r"^ *no passive *$",obj13.text):
+                                            isisIfMode = "Act"
+                                    break
+                                isisLine.append(isisIfMode)
+                                for obj13 in obj11.re_search_children("bfd-enable"):
+                                    if re.match(r"^ *bfd-enable.*$",obj13.text):
+                                        if re.search(r"ip",obj13.text):
+                                            isisBFDState = "En " + obj13.text.split("bfd-enable ")[1]
+                                        else:
+                                            isisBFDState = "En"
+                                    if re.match(r"^ *no bfd-enable.*$",obj13.text):
+                                        isisBFDState = "Dis"
+                                    break
+                                isisLine.append(isisBFDState)
+                                for obj13 in obj11.re_search_children("level-capability"):
+                                    if re.match(r"^ *level-capability *level-1$",obj13.text):
+                                        isisLevelCapability = "L1"
+                                    else:
+                                        if re.match(r"^ *level-capability *level-2$",obj13.text):
+                                            isisLevelCapability = "L2"
+                                        else:
+                                            if re.match(r"^ *level-capability *level-1/2$",obj13.text):
+                                                isisLevelCapability = "L1/2"
+                                            else:
+                                                isisLevelCapability = obj13.text.split("level-capability ")[1]
+                                    break
+                                isisLine.append(isisLevelCapability)
+                                for obj13 in obj11.re_search_children("no shutdown"):
+                                    isisIfState = "En"
+                                    break
+                                isisLine.append(isisIfState)
+                                for obj13 in obj11.re_search_children("retransmit-interval "):
+                                    isisRetransmit = str(obj13.text.split("retransmit-interval ")[1].lstrip().rstrip())
+                                    break
+                                isisLine.append(isisRetransmit)
+                                for obj13 in obj11.re_search_children("hello-authentication-type "):
+                                    isisIfAuth = str(obj13.text.split("hello-authentication-type ")[1].lstrip().rstrip())
+                                    break
+                                isisLine.append(isisIfAuth)
+
+                                # Get L1 parameters
+                                for obj12 in obj11.re_search_children("level 1"):
+                                    for obj13 in obj12.re_search_children("priority "):
+                                        isisL1Priority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("metric "):
+                                        isisL1Metric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("hello-interval "):
+                                        isisL1Hello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("hello-multiplier "):
+                                        isisL1HelloMult = str(obj13.text.split("hello-multiplier ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("hello-authentication-type "):
+                                        isisL1Auth = str(obj13.text.split("hello-authentication-type ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                
+                                isisLine.append(isisL1Priority)
+                                isisLine.append(isisL1Metric)
+                                isisLine.append(isisL1Hello)
+                                isisLine.append(isisL1HelloMult)
+                                isisLine.append(isisL1Auth)
+
+                                # Get L2 parameters
+                                for obj12 in obj11.re_search_children("level 2"):
+                                    for obj13 in obj12.re_search_children("priority "):
+                                        isisL2Priority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("metric "):
+                                        isisL2Metric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("hello-interval "):
+                                        isisL2Hello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("hello-multiplier "):
+                                        isisL2HelloMult = str(obj13.text.split("hello-multiplier ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                    
+                                    for obj13 in obj12.re_search_children("hello-authentication-type "):
+                                        isisL2Auth = str(obj13.text.split("hello-authentication-type ")[1].split(" ")[0].lstrip().rstrip())
+                                        break
+                                
+
+                                isisLine.append(isisL2Priority)
+                                isisLine.append(isisL2Metric)
+                                isisLine.append(isisL2Hello)
+                                isisLine.append(isisL2HelloMult)
+                                isisLine.append(isisL2Auth)
 
-                            # Get port ingress QoS policy
-                            for obj4 in obj3.re_search_children("ingress-port-qos-policy"):
-                                # print(obj4)
-                                InterfacesParse[InterfacesDict["QoSIn"][0]] = obj4.text.split("ingress-port-qos-policy ")[1].replace("\"","")
+                                isisList.append(isisLine)
                                 break
-                        # print(InterfacesParse)
-
-
-
-
-                        #########################################################################################################################################
-                        #                                                    Post-processing for ports                                                     #
-                        #########################################################################################################################################
-                    
-                        # Sort VLANs for Ports
-                        if re.search(r"Port",InterfacesParse[InterfacesDict["IfType"][0]]):
-                            if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
-                                VLANList = []
-                                for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
-                                    if re.search(r"\*",value):
-                                        value = value.replace("*","9999")
-                                    VLANList.append(value)
-                                VLANList = sorted(VLANList, key=float)
-
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = ""
-                                # VLANList = VLANList.sort()
-                                # print(VLANList)
-                                for value in VLANList:
-                                    if re.search("9999",value):
-                                        value = value.replace("9999","*")
-                                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
 
+                        if len(isisList) > 0:
+                            isisOutputLine = ""
+                            for isisLine in isisList:
+                                if debug: logger.debug("isisLine: %s", isisLine)
+                                if isisOutputLine != "":
+                                    isisOutputLine = isisOutputLine + ";"
+
+                                isisOutputLine = isisOutputLine + "pid:"+str(isisLine[0])
+                                if isisLine[1] != "": isisOutputLine = isisOutputLine + "|sid:"+str(isisLine[1])
+                                isisOutputLine = isisOutputLine + "|area:"+str(isisLine[2]) + "|type:"+str(isisLine[3]) + "|mode:"+str(isisLine[4]) + "|bfd:"+str(isisLine[5]) + "|cap:"+str(isisLine[6]) + "|if_state:"+str(isisLine[7])
+                                if isisLine[8] != "": isisOutputLine = isisOutputLine + "|retr:" + str(isisLine[8])
+                                if isisLine[9] != "": isisOutputLine = isisOutputLine + "|if_auth:" + str(isisLine[9])
+                                if isisLine[10] != "": isisOutputLine = isisOutputLine + "|l1_pri:" + str(isisLine[10])
+                                if isisLine[15] != "": isisOutputLine = isisOutputLine + "|l2_pri:" + str(isisLine[15])
+                                if isisLine[11] != "": isisOutputLine = isisOutputLine + "|l1_metr:" + str(isisLine[11])
+                                if isisLine[16] != "": isisOutputLine = isisOutputLine + "|l2_metr:" + str(isisLine[16])
+                                if ((isisLine[12] != "") or (isisLine[13] != "")):
+                                    if isisLine[12] == "": isisLine[11] = "def"
+                                    if isisLine[13] == "": isisLine[12] = "def"
+                                    isisOutputLine = isisOutputLine + "|isis_l1_tmr:" + str(isisLine[12]) + " " + str(isisLine[13])
+                                if ((isisLine[17] != "") or (isisLine[18] != "")):
+                                    if isisLine[17] == "": isisLine[17] = "def"
+                                    if isisLine[18] == "": isisLine[18] = "def"
+                                    isisOutputLine = isisOutputLine + "|isis_l2_tmr:" + str(isisLine[17]) + " " + str(isisLine[18])
+                                if isisLine[14] != "": isisOutputLine = isisOutputLine + "|l1_auth:" + str(isisLine[14])
+                                if isisLine[19] != "": isisOutputLine = isisOutputLine + "|l2_auth:" + str(isisLine[19])
+                                
+                            InterfacesParse[InterfacesDict["ISIS"][0]] = isisOutputLine
+
+
+                        # Find if LDP is enabled on this interface
+                        for obj10 in protocolChildrenFunc(protocolIndex, obj2, r"ldp"):
+                            for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"interface-parameters"):
+                                LDPIfAdmState = ""
+                                LDPIPv4AdmState = ""
+                                LDPIPv6AdmState = ""
+                                for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
+                                    # if obj12.text.split("interface ")[1].split("\"")[1] == obj3.text.split("interface ")[1].split("\"")[1]:
+                                    for obj13 in obj12.re_search_children(r"shutdown"):
+                                        if obj13.re_search(r"no "):
+                                            LDPIfAdmState = "if:En"
+                                        else:
+                                            LDPIfAdmState = "if:Dis"
+                                    for obj13 in obj12.re_search_children(r"ipv4"):
+                                        for obj14 in obj13.re_search_children(r"shutdown"):
+                                            if obj14.re_search(r"no "):
+                                                LDPIPv4AdmState = "ipv4:En"
+                                            else:
+                                                LDPIPv4AdmState = "ipv4:Dis"
+                                    for obj13 in obj12.re_search_children(r"ipv6"):
+                                        for obj14 in obj13.re_search_children(r"shutdown"):
+                                            if obj14.re_search(r"no "):
+                                                LDPIPv6AdmState = "ipv6:En"
+                                            else:
+                                                LDPIPv6AdmState = "ipv6:Dis"
+
+                            if LDPIfAdmState != "":
+                                InterfacesParse[InterfacesDict["LDP"][0]] = LDPIfAdmState
+                            if LDPIPv4AdmState != "":
+                                InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv4AdmState
+                            if LDPIPv6AdmState != "":
+                                InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv6AdmState
+
+
+                        # Find all MPLS/RSVP parameters for this interface
+                        # rsvpList = []
+                        # # Go to MPLS process first
+                        # for obj10 in obj2.re_search_children(r"mpls "):
+                        #     rsvpLine = []
+
+                        #     mplsIfState = ""
+                        #     mplsIfAdmGroup = ""
+                        #     rsvpIfState = ""
+                        #     rsvpIfSubscription = ""
+                        #     rsvpIfRefreshReduction = ""
+                        #     rsvpIfReliableDelivery = ""
+
+                        #     # Find current interface
+                        #     searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
+                        #     for obj11 in obj10.re_search_children(searchExpression):
+                        
 
 
+                        # print(InterfacesParse)
                         InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
                         InterfacesParseAll.append(InterfacesParse)
 
 
 
-                    # Find node's LAGs from config
-                    for obj2 in obj1.re_search_children(r" +lag +"):
-                        duplicate = []
-                        for obj3 in obj1.re_search_children(r" +lag +"):
-                            if obj3.text.lstrip().rstrip() == obj2.text.lstrip().rstrip():
-                                duplicate.append(str(obj3))
-
-                        if len(duplicate) > 1:
-                            print("File "+str(os.path.split(inputPath)[1])+" contains duplicate port lines: "+str(duplicate)+", skipping this file")
-                            nextFile = 1
-                            break
-                    
-                        IfNumber = IfNumber + 1
-                        if debug: print("debug: obj2: "+str(obj2))
-                        
-                        InterfacesParse = [""] * len(InterfacesDict)
-                        InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                        InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                        InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                        InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                        InterfacesParse[InterfacesDict["IfName"][0]] = obj2.text.lstrip().rstrip()
-                        InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["IfName"][0]].split("lag ")[1]
-                        InterfacesParse[InterfacesDict["PortName"][0]] = str("lag-"+InterfacesParse[InterfacesDict["LAGID"][0]])
-                        InterfacesParse[InterfacesDict["IfType"][0]] = "LAG"
-
-                        # Find description associated with current LAG
-                        for obj3 in obj2.re_search_children("description "):
-                            InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj3.text.split("description ")[1].replace("\"",""))
-                            break
-
-                        # Find admin state associated with current LAG
-                        for obj3 in obj2.re_search_children(r"shutdown"):
-                            if obj3.re_search(r"no "):
-                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                            else:
-                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
-
-                        # Find mode associated with current LAG
-                        for obj3 in obj2.re_search_children("mode"):
-                            # print(obj3)
-                            if obj3.text.split("mode ")[1] == "hybrid":
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Hybrid"
-                            if obj3.text.split("mode ")[1] == "network":
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-                            if obj3.text.split("mode ")[1] == "access":
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
-                            break
-
-                        # Get LAG encapsulation
-                        for obj3 in obj2.re_search_children("encap-type"):
-                            # print(obj3)
-                            InterfacesParse[InterfacesDict["Encap"][0]] = obj3.text.split("encap-type ")[1]
-                            break
-                        
-                        # Get LACP mode
-                        for obj3 in obj2.re_search_children("lacp"):
-                            # print(obj3)
-                            if obj3.re_search(r"active"):
-                                InterfacesParse[InterfacesDict["LAGMode"][0]] = "Active"
-                            else:
-                                if obj3.re_search(r"passive"):
-                                    InterfacesParse[InterfacesDict["LAGMode"][0]] = "Passive"
-                            break
-
-                        # Get all VLANs associated with this LAG
-                        # searchExpression = r"(sap " + InterfacesParse[InterfacesDict["IfName"][0]] + r"(:.*| )create|port " + InterfacesParse[InterfacesDict["IfName"][0]] + "(:|$))"
-                        # (sap 1/1/14(:.*| )create|port 1/1/1(:|$))
-                        searchExpression1 = r"port " + InterfacesParse[InterfacesDict["IfName"][0]].replace(" ","-") + r"(:|$)" 
-                        for obj19 in cfg.find_objects(r" *router"):
-                            for obj20 in obj19.re_search_children(r" *interface"):
-                                for obj21 in obj20.re_search_children(searchExpression1):
-                                    tempVLAN = ""                                
-                                    if re.search(":",obj21.text):
-                                        tempVLAN = obj21.text.split(":")[1].split(" ")[0]
-                                    else:
-                                        tempVLAN = "null"
-                                    
-                                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempVLAN
-
-                        searchExpression2 = r"sap " + InterfacesParse[InterfacesDict["IfName"][0]].replace(" ","-") + r"(:.*| )create"
-                        for obj22 in cfg.find_objects(searchExpression2):
-                            # print(obj20)
-                            tempVLAN = ""                                
-                            if re.search(":",obj22.text):
-                                tempVLAN = obj22.text.split(":")[1].split(" ")[0]
-                            else:
-                                tempVLAN = "null"
-                            
-                            if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                            InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempVLAN
-
-                        #########################################################################################################################################
-                        #                                                    Post-processing for LAGs                                                     #
-                        #########################################################################################################################################
-                    
-                        # Sort VLANs for LAGs
-                        if re.search(r"LAG",InterfacesParse[InterfacesDict["IfType"][0]]):
-                            if re.search(r"\|",InterfacesParse[InterfacesDict["VLAN"][0]]):
-                                VLANList = []
-                                for value in InterfacesParse[InterfacesDict["VLAN"][0]].split("|"):
-                                    if re.search(r"\*",value):
-                                        value = value.replace("*","9999")
-                                    VLANList.append(value)
-                                VLANList = sorted(VLANList, key=float)
-
-                                InterfacesParse[InterfacesDict["VLAN"][0]] = ""
-                                for value in VLANList:
-                                    if re.search("9999",value):
-                                        value = value.replace("9999","*")
-                                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + str(value)
-
-
-                        # print(InterfacesParse)
-                        InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                        InterfacesParseAll.append(InterfacesParse)
 
-                    # Find node's network interfaces from config
-                    for obj2 in obj1.re_search_children(r"router Base"):
-                        for obj3 in obj2.re_search_children(r"interface"):
+                # Find node's SAP interfaces from config
+                for obj2 in obj1.re_search_children(r"service"):
+                    # Find VPRN SAPs
+                    for obj3 in obj2.re_search_children(r"vprn"):
+                        for obj4 in obj3.re_search_children(r"interface"):
+                            # for obj5 in obj4.re_search_children(r".*"):
+                            #     print(obj5)
+                            if len(obj4.re_search_children(r".*")) == 0: continue
                             duplicate = []
-                            for obj4 in obj2.re_search_children(r"interface"):
-                                if obj4.text.split("interface ")[1] == obj3.text.split("interface ")[1]:
-                                    duplicate.append(str(obj3))
+                            for obj5 in obj4.re_search_children(r"interface"):
+                                if obj4.text.split("interface ")[1].split(" create")[0] == obj5.text.split("interface ")[1].split(" create")[0]:
+                                    duplicate.append(str(obj4))
 
                             if len(duplicate) > 1:
-                                print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
+                                logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
                                 nextFile = 1
+                                skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
                                 break
                         
                             IfNumber = IfNumber + 1
-                            if debug: print("debug: obj3: "+str(obj3))
+                            if debug: logger.debug("obj4: %s", obj4)
                             
                             InterfacesParse = [""] * len(InterfacesDict)
                             InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
                             InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
                             InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
                             InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                            InterfacesParse[InterfacesDict["IfName"][0]] = obj3.text.split("interface ")[1].replace("\"","")
-                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Network"
-
-                            # Check if interface is a system or loopback interface
-                            if re.match(r'system',InterfacesParse[InterfacesDict["IfName"][0]]):
+                            InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("interface ")[1].split(" create")[0].replace("\"","")
+                            # InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN SAP"
+                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                            InterfacesParse[InterfacesDict["ServiceID"][0]] = obj3.text.split("vprn ")[1].split(" name")[0] + ":" + obj3.text.split("customer ")[1].split(" create")[0]
+                            InterfacesParse[InterfacesDict["ServiceType"][0]] = "VPRN"
+                            InterfacesParse[InterfacesDict["ServiceName"][0]] = obj3.text.split("name ")[1].split(" customer")[0].replace("\"","")
+                            
+                            # Check if interface is a loopback interface
+                            for obj5 in obj4.re_search_children("loopback"):
                                 InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
-                            else:
-                                for obj4 in obj3.re_search_children("loopback"):
-                                    InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
-                                    break
-
+                                break
+                            
+                            for obj10 in obj3.re_search_children(r"description"):
+                                InterfacesParse[InterfacesDict["ServiceDescr"][0]] = obj10.text.split("description ")[1].replace("\"","")
+                        
                             # Find description associated with current interface
-                            for obj4 in obj3.re_search_children("description "):
-                                InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj4.text.split("description ")[1].replace("\"",""))
+                            for obj5 in obj4.re_search_children("description "):
+                                InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj5.text.split("description ")[1].replace("\"",""))
                                 break
 
                             # Find admin state associated with current interface
-                            for obj4 in obj3.re_search_children(r"shutdown"):
-                                if obj4.re_search(r"no "):
+                            for obj5 in obj4.re_search_children(r"shutdown"):
+                                if obj5.re_search(r"no "):
                                     InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
                                 else:
                                     InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
+                            if InterfacesParse[InterfacesDict["StateAdm"][0]] == "":
+                                InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+
                             # Find BFD parameters associated with current interface
-                            for obj4 in obj3.re_search_children(r"bfd"):
-                                InterfacesParse[InterfacesDict["BFD"][0]] = "if_tmr:" + obj4.text.lstrip().rstrip().replace("bfd ","").replace(" receive "," ").replace(" multiplier "," ").replace(" type "," ")
+                            for obj5 in obj4.re_search_children(r"bfd"):
+                                InterfacesParse[InterfacesDict["BFD"][0]] = "if_tmr:" + obj5.text.lstrip().rstrip().replace("bfd ","").replace(" receive "," ").replace(" multiplier "," ").replace(" type "," ")
                                 break
 
                             # Find all IPv4 addresses associated with current interface
-                            for obj4 in obj3.re_search_children(r"^ *address "):
-                                rawInput = obj4.text.split("address ")[1].lstrip().rstrip()
+                            for obj5 in obj4.re_search_children(r"^ *address "):
+                                rawInput = obj5.text.split("address ")[1].lstrip().rstrip()
                                 rawInput = rawInput.replace(" ","/")
                                 ipadd = ipaddress.ip_interface(str(rawInput))
                                 if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
@@ -3325,8 +4652,8 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                                     InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
 
                             # Find all IPv6 addresses associated with current interface
-                            for obj4 in obj3.re_search_children(r"^ *ipv6 address "):
-                                rawInput = obj4.text.split("ipv6 address ")[1].lstrip().rstrip()
+                            for obj5 in obj4.re_search_children(r"^ *ipv6 address "):
+                                rawInput = obj5.text.split("ipv6 address ")[1].lstrip().rstrip()
                                 ipadd = ipaddress.ip_interface(str(line))
                                 if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
                                     InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
@@ -3337,72 +4664,141 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                                 else:
                                     InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
 
-
                             # Check if interface is a L3 interface
                             if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
                                 # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned
                                 if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                                    InterfacesParse[InterfacesDict["IfType"][0]] = "L3"
+                                    InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN SAP"
                                 # if ((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG") or (InterfacesParse[InterfacesDict["IfType"][0]] == "Bridge")):
                                 else:
-                                    InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3"
+                                    InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3VPN SAP"
 
                             # Find L3 MTU parameters associated with current interface
-                            for obj4 in obj3.re_search_children(r"ip-mtu"):
-                                InterfacesParse[InterfacesDict["L3MTU"][0]] = obj4.text.split("ip-mtu ")[1]
+                            for obj5 in obj4.re_search_children(r"ip-mtu"):
+                                InterfacesParse[InterfacesDict["L3MTU"][0]] = obj5.text.split("ip-mtu ")[1]
                                 break
 
-                            # Find QoS input policy associated with current interface
-                            for obj4 in obj3.re_search_children(r"^ *ingress"):
-                                for obj5 in obj4.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                    if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
-                                        InterfacesParse[InterfacesDict["QoSIn"][0]] = obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                    else:
-                                        InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-
-                            # Find QoS output policy associated with current interface
-                            for obj4 in obj3.re_search_children(r"^ *egress"):
-                                for obj5 in obj4.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                    if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
-                                        InterfacesParse[InterfacesDict["QoSOut"][0]] = obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                    else:
-                                        InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj5.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-
                             # Find port/LAG associated with current interface
-                            for obj4 in obj3.re_search_children(r"^ *port"):
-                                # print(obj4.text)
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = obj4.text.split("port ")[1]
-                                if obj4.re_search(r":"):
-                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[0]
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[1]
-                                    if obj4.re_search(r"\."):
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                            for obj5 in obj4.re_search_children(r"^ *sap"):
+                                if InterfacesParse[InterfacesDict["PortBinding"][0]] != "": InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|"
+                                tempPortBinding = obj5.text.split("sap ")[1].split(" create")[0]
+                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + tempPortBinding
+                                if obj5.re_search(r":"):
+                                    if InterfacesParse[InterfacesDict["PortName"][0]] != "": InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + "|"
+                                    if InterfacesParse[InterfacesDict["Encap"][0]] != "": InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "|"
+                                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + tempPortBinding.split(":")[0]
+                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempPortBinding.split(":")[1]
+                                    if obj5.re_search(r"\."):
+                                        InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "qinq"
                                     else:
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                                        InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "dot1q"
                                 else:
-                                    InterfacesParse[InterfacesDict["Encap"][0]] = "null"
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
                                     InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
                                 
-                                if obj4.re_search(r"lag-"):
-                                    # InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
-                                    # InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["LAGID"][0]]
-                                    InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
+                                if obj5.re_search(r"lag"):
+                                    InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
+                                    InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["LAGID"][0]]
                                 else:
                                     InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
 
+                                # Find QoS input policy associated with current interface
+                                for obj6 in obj5.re_search_children(r"^ *ingress"):
+                                    for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                        if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
+                                            InterfacesParse[InterfacesDict["QoSIn"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                        else:
+                                            InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+
+                                # Find QoS output policy associated with current interface
+                                for obj6 in obj5.re_search_children(r"^ *egress"):
+                                    for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                        if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
+                                            InterfacesParse[InterfacesDict["QoSOut"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                        else:
+                                            InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+
+
+                            # Find VPLS service associated with current interface
+                            for obj5 in obj4.re_search_children(r"^ *vpls"):
+                                vplsServiceName = obj5.text.split("\"")[1]
+                                if InterfacesParse[InterfacesDict["IfType"][0]] != "": InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
+                                InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "VPLS SAP"
+                                # Go to service section
+                                for obj50 in obj1.re_search_children(r"service"):
+                                    # Find relevant VPLS service
+                                    for obj51 in obj50.re_search_children(r"vpls.*\""+vplsServiceName+r"\""):
+                                        vplsServiceID = obj51.text.split("vpls ")[1].split(" name")[0] + ":" + obj51.text.split("customer ")[1].split(" create")[0]
+                                        
+                                        vplsServiceDescr = ""
+                                        for obj5 in obj51.re_search_children(r"^ *description"):
+                                            vplsServiceDescr = obj51.text.split("\"")[1].split()[0]
+                                            if InterfacesParse[InterfacesDict["ServiceDescr"][0]] != "": InterfacesParse[InterfacesDict["ServiceDescr"][0]] = InterfacesParse[InterfacesDict["ServiceDescr"][0]] + "|"
+                                            InterfacesParse[InterfacesDict["ServiceDescr"][0]] = InterfacesParse[InterfacesDict["ServiceDescr"][0]] + vplsServiceDescr
+
+                                        if InterfacesParse[InterfacesDict["ParentIfName"][0]] != "": InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["ParentIfName"][0]] + "|"
+                                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["ParentIfName"][0]] + "vpls:" + vplsServiceID + ":" + vplsServiceName
+
+                                        if InterfacesParse[InterfacesDict["ServiceID"][0]] != "": InterfacesParse[InterfacesDict["ServiceID"][0]] = InterfacesParse[InterfacesDict["ServiceID"][0]] + "|"
+                                        InterfacesParse[InterfacesDict["ServiceID"][0]] = InterfacesParse[InterfacesDict["ServiceID"][0]] + vplsServiceID
+                                        
+                                        if InterfacesParse[InterfacesDict["ServiceName"][0]] != "": InterfacesParse[InterfacesDict["ServiceName"][0]] = InterfacesParse[InterfacesDict["ServiceName"][0]] + "|"
+                                        InterfacesParse[InterfacesDict["ServiceName"][0]] = InterfacesParse[InterfacesDict["ServiceName"][0]] + vplsServiceName
+
+                                        if InterfacesParse[InterfacesDict["ServiceType"][0]] != "": InterfacesParse[InterfacesDict["ServiceType"][0]] = InterfacesParse[InterfacesDict["ServiceType"][0]] + "|"
+                                        InterfacesParse[InterfacesDict["ServiceType"][0]] = InterfacesParse[InterfacesDict["ServiceType"][0]] + "VPLS"
+
+                                        # Find VPLS SAPs from config
+                                        for obj5 in obj51.re_search_children(r"^ *sap"):
+                                            if InterfacesParse[InterfacesDict["PortBinding"][0]] != "": InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|"
+                                            tempPortBinding = obj5.text.split("sap ")[1].split(" create")[0]
+                                            InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + tempPortBinding
+                                            if obj5.re_search(r":"):
+                                                if InterfacesParse[InterfacesDict["PortName"][0]] != "": InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + "|"
+                                                if InterfacesParse[InterfacesDict["Encap"][0]] != "": InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "|"
+                                                if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
+                                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + tempPortBinding.split(":")[0]
+                                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempPortBinding.split(":")[1]
+                                                if obj5.re_search(r"\."):
+                                                    InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "qinq"
+                                                else:
+                                                    InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "dot1q"
+                                            else:
+                                                InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
+                                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
+                                            
+                                            # if obj5.re_search(r"lag"):
+                                            #     InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
+                                            #     InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["LAGID"][0]]
+                                            # else:
+                                            #     InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
+
+                                            # Find QoS input policy associated with current interface
+                                            for obj6 in obj5.re_search_children(r"^ *ingress"):
+                                                for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                                    if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
+                                                        InterfacesParse[InterfacesDict["QoSIn"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                                    else:
+                                                        InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+
+                                            # Find QoS output policy associated with current interface
+                                            for obj6 in obj5.re_search_children(r"^ *egress"):
+                                                for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                                    if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
+                                                        InterfacesParse[InterfacesDict["QoSOut"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                                    else:
+                                                        InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+
 
                             # Find all OSPF processes and areas where this interface is participating
                             ospfList = []
+                            ospfLine = []
+                            ospfRID = ""
                             # Find all OSPF processes associated with interface
-                            for obj10 in obj2.re_search_children(r"ospf "):
-                                ospfLine = []
-                                ospfPID = ""
-                                ospfRID = ""
-                                ospfPID = str(obj10.text.split("ospf ")[1].split()[0])
-                                ospfLine.append(ospfPID)
-
-                                if len(obj10.text.split("ospf ")[1].split()) > 1:
-                                    ospfRID = str(obj10.text.split("ospf ")[1].split()[1])
+                            for obj10 in protocolChildrenFunc(protocolIndex, obj3, r"ospf "):
+                                if len(obj10.text.split("ospf ")) > 1:
+                                    ospfRID = str(obj10.text.split("ospf ")[1].split(" ")[0])
                                 ospfLine.append(ospfRID)
                                 
                                 # First we will look for the area where interface is primary
@@ -3420,13 +4816,12 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
 
                                 area = ""
                                 # Look through all OSPF areas
-                                for obj11 in obj10.re_search_children(r"area "):
+                                for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"area "):
                                     area = obj11.text.split("area ")[1]
                                     area = ipaddress.ip_address(area)
 
                                     # Find current interface configured as primary within an area
-                                    searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                                    for obj12 in obj11.re_search_children(searchExpression):
+                                    for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
                                         if re.search(r"secondary",obj12.text):
                                             continue
                                         else:
@@ -3502,7 +4897,7 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
 
                                 area = ""
                                 # Look through all OSPF areas
-                                for obj11 in obj10.re_search_children(r"area "):
+                                for obj11 in protocolChildrenFunc(protocolIndex, obj10, r"area "):
                                     area = obj11.text.split("area ")[1]
                                     area = ipaddress.ip_address(area)
 
@@ -3517,11 +4912,9 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                                     ospfIfState = "Dis"
 
                                     # Find current interface configured as secondary within an area
-                                    searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                                    for obj12 in obj11.re_search_children(searchExpression):
+                                    for obj12 in protocolInterfacesFunc(protocolIndex, obj11, InterfacesParse[InterfacesDict["IfName"][0]]):
                                         if re.search(r"secondary",obj12.text):
                                             # Find all OSPF parameters for this secondary interface
-                                            ospfLine.append(ospfPID)        # Set to same value as on primary configuration
                                             ospfLine.append(ospfRID)        # Set to same value as on primary configuration
                                             ospfLine.append(ospfIfType2)    # Set to same value as on primary configuration
                                             ospfLine.append(ospfIfMode)     # Set to same value as on primary configuration
@@ -3571,10 +4964,10 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                                             lineNumber = 0
                                             match = 0
                                             for ospfLineCheck in ospfList:
-                                                if ((ospfLineCheck[4] == ospfBFDState) and (ospfLineCheck[5] == ospfPriority) and (ospfLineCheck[6] == ospfMetric) and (ospfLineCheck[7] == ospfHello) 
-                                                    and (ospfLineCheck[8] == ospfDead) and (ospfLineCheck[9] == ospfRetransmit) and (ospfLineCheck[10] == ospfAuth)):
+                                                if ((ospfLineCheck[3] == ospfBFDState) and (ospfLineCheck[4] == ospfPriority) and (ospfLineCheck[5] == ospfMetric) and (ospfLineCheck[6] == ospfHello) 
+                                                    and (ospfLineCheck[7] == ospfDead) and (ospfLineCheck[8] == ospfRetransmit) and (ospfLineCheck[9] == ospfAuth)):
                                                     
-                                                    ospfList[lineNumber][11].extend(ospfAreaList)
+                                                    ospfList[lineNumber][10].extend(ospfAreaList)
                                                     match = 1
                                                     break
 
@@ -3587,7 +4980,7 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                             # print(ospfList)
                             lineNumber = 0
                             for ospfLineCheck in ospfList:
-                                ospfList[lineNumber][11].sort(key=lambda x: x[0])
+                                ospfList[lineNumber][10].sort(key=lambda x: x[0])
                                 lineNumber = lineNumber + 1
                             
                             # ospfList.sort(key=lambda x: x[10])
@@ -3602,25 +4995,23 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
 
                                     # ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3]) + "|prio:"+str(ospfLine[4]) + "|metr:"+str(ospfLine[5]) + "|hello:"+str(ospfLine[6]) + "|dead:"+str(ospfLine[7]) + "|retr:"+str(ospfLine[8]) + "|auth:"+str(ospfLine[9])
                                     
-                                    ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0])
-                                    if ospfLine[1] != "": ospfOutputLine = ospfOutputLine + "|rid:"+str(ospfLine[1])
-                                    ospfOutputLine = ospfOutputLine + "|type:"+str(ospfLine[2]) + "|mode:"+str(ospfLine[3]) + "|bfd:"+str(ospfLine[4])
-                                    if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[5])
-                                    if ospfLine[6] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[6])
-                                    if ((ospfLine[7] != "") or (ospfLine[8] != "") or (ospfLine[9] != "")):
+                                    ospfOutputLine = ospfOutputLine + "rid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3])
+                                    if ospfLine[4] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[4])
+                                    if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[5])
+                                    if ((ospfLine[6] != "") or (ospfLine[7] != "") or (ospfLine[8] != "")):
+                                        if ospfLine[6] == "": ospfLine[6] = "def"
                                         if ospfLine[7] == "": ospfLine[7] = "def"
                                         if ospfLine[8] == "": ospfLine[8] = "def"
-                                        if ospfLine[9] == "": ospfLine[9] = "def"
-                                        ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[7]) + " " + str(ospfLine[8]) + " " + str(ospfLine[9])
-                                    if ospfLine[10] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[10])
+                                        ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[6]) + " " + str(ospfLine[7]) + " " + str(ospfLine[8])
+                                    if ospfLine[9] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[9])
 
-                                    if len(ospfLine) > 11:
+                                    if len(ospfLine) > 10:
                                         ospfOutputLine = ospfOutputLine + "|areas:"
 
                                         ospfOutputLine2 = ""
-                                        for area in ospfLine[11]:
+                                        for area in ospfLine[10]:
                                             if ospfOutputLine2 == "":
-                                                ospfOutputLine2 = str(area[0]) + str(area[1]) + str(area[2])
+                                                ospfOutputLine2 = str(area[0]) + str(area[1]) + str(area[2]) 
                                             else:
                                                 ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1]) + str(area[2])
                                         
@@ -3629,1920 +5020,1117 @@ def parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean):
                                 InterfacesParse[InterfacesDict["OSPFv2"][0]] = ospfOutputLine
 
 
-
-                            # Find all IS-IS processes where this interface is participating
-                            isisList = []
-                            # Find all OSPF processes associated with interface
-                            for obj10 in obj2.re_search_children(r"isis "):
-                                isisLine = []
-
-                                isisPID = ""
-                                isisPID = str(obj10.text.split("isis ")[1].split()[0])
-                                isisLine.append(isisPID)
-
-                                isisSID = ""
-                                for obj11 in obj10.re_search_children(r"system-id "):
-                                    isisSID = obj11.text.split("system-id ")[1].lstrip().rstrip()
-                                isisLine.append(isisSID)
-
-                                isisArea = ""
-                                for obj11 in obj10.re_search_children(r"area-id "):
-                                    isisArea = obj11.text.split("area-id ")[1].lstrip().rstrip()
-                                isisLine.append(isisArea)
-
-                                isisLevelCapability = "L1/2"
-                                for obj11 in obj10.re_search_children("level-capability"):
-                                    if re.match(r"^ *level-capability *level-1$",obj11.text):
-                                        isisLevelCapability = "L1"
-                                    else:
-                                        if re.match(r"^ *level-capability *level-2$",obj11.text):
-                                            isisLevelCapability = "L2"
-                                        else:
-                                            if re.match(r"^ *level-capability *level-1/2$",obj11.text):
-                                                isisLevelCapability = "L1/2"
-                                            else:
-                                                isisLevelCapability = obj13.text.split("level-capability ")[1]
-                                    break
-
-                                isisIfType1 = ""
-                                isisIfType2 = "Bcast"
-                                isisIfMode = "Act"
-                                isisBFDState = "Dis"
-
-                                isisL1Priority = ""
-                                isisL2Priority = ""
-                                isisL1Metric = ""
-                                isisL2Metric = ""
-                                isisL1Hello = ""
-                                isisL2Hello = ""
-                                isisL1HelloMult = ""
-                                isisL2HelloMult = ""
-                                isisRetransmit = ""
-                                isisIfAuth = ""
-                                isisL1Auth = ""
-                                isisL2Auth = ""
-                                isisIfState = "Dis"
-                                
-                                # Find current interface
-                                searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                                for obj11 in obj10.re_search_children(searchExpression):
-
-                                    # Find all ISIS parameters for this interface
-                                    for obj13 in obj11.re_search_children("interface-type "):
-                                        isisIfType1 = str(obj13.text.split("interface-type ")[1].split(" ")[0].lstrip().rstrip())
-                                        isisIfType2 = ""
-                                        if isisIfType1 == "point-to-point":
-                                            isisIfType2 = "PtP"
-                                        else:
-                                            if isisIfType1 == "point-to-multipoint":
-                                                isisIfType2 = "PtMP"
-                                            else:
-                                                isisIfType2 = isisIfType1
-                                        break
-                                    isisLine.append(isisIfType2)
-                                    for obj13 in obj11.re_search_children("passive"):
-                                        if re.match(r"^ *passive *$",obj13.text):
-                                            isisIfMode = "Pass"
-                                        else:
-                                            if re.match(r"^ *no passive *$",obj13.text):
-                                                isisIfMode = "Act"
-                                        break
-                                    isisLine.append(isisIfMode)
-                                    for obj13 in obj11.re_search_children("bfd-enable"):
-                                        if re.match(r"^ *bfd-enable.*$",obj13.text):
-                                            if re.search(r"ip",obj13.text):
-                                                isisBFDState = "En " + obj13.text.split("bfd-enable ")[1]
-                                            else:
-                                                isisBFDState = "En"
-                                        if re.match(r"^ *no bfd-enable.*$",obj13.text):
-                                            isisBFDState = "Dis"
-                                        break
-                                    isisLine.append(isisBFDState)
-                                    for obj13 in obj11.re_search_children("level-capability"):
-                                        if re.match(r"^ *level-capability *level-1$",obj13.text):
-                                            isisLevelCapability = "L1"
-                                        else:
-                                            if re.match(r"^ *level-capability *level-2$",obj13.text):
-                                                isisLevelCapability = "L2"
-                                            else:
-                                                if re.match(r"^ *level-capability *level-1/2$",obj13.text):
-                                                    isisLevelCapability = "L1/2"
-                                                else:
-                                                    isisLevelCapability = obj13.text.split("level-capability ")[1]
-                                        break
-                                    isisLine.append(isisLevelCapability)
-                                    for obj13 in obj11.re_search_children("no shutdown"):
-                                        isisIfState = "En"
-                                        break
-                                    isisLine.append(isisIfState)
-                                    for obj13 in obj11.re_search_children("retransmit-interval "):
-                                        isisRetransmit = str(obj13.text.split("retransmit-interval ")[1].lstrip().rstrip())
-                                        break
-                                    isisLine.append(isisRetransmit)
-                                    for obj13 in obj11.re_search_children("hello-authentication-type "):
-                                        isisIfAuth = str(obj13.text.split("hello-authentication-type ")[1].lstrip().rstrip())
-                                        break
-                                    isisLine.append(isisIfAuth)
-
-                                    # Get L1 parameters
-                                    for obj12 in obj11.re_search_children("level 1"):
-                                        for obj13 in obj12.re_search_children("priority "):
-                                            isisL1Priority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("metric "):
-                                            isisL1Metric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("hello-interval "):
-                                            isisL1Hello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("hello-multiplier "):
-                                            isisL1HelloMult = str(obj13.text.split("hello-multiplier ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("hello-authentication-type "):
-                                            isisL1Auth = str(obj13.text.split("hello-authentication-type ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                    
-                                    isisLine.append(isisL1Priority)
-                                    isisLine.append(isisL1Metric)
-                                    isisLine.append(isisL1Hello)
-                                    isisLine.append(isisL1HelloMult)
-                                    isisLine.append(isisL1Auth)
-
-                                    # Get L2 parameters
-                                    for obj12 in obj11.re_search_children("level 2"):
-                                        for obj13 in obj12.re_search_children("priority "):
-                                            isisL2Priority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("metric "):
-                                            isisL2Metric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("hello-interval "):
-                                            isisL2Hello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("hello-multiplier "):
-                                            isisL2HelloMult = str(obj13.text.split("hello-multiplier ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                        
-                                        for obj13 in obj12.re_search_children("hello-authentication-type "):
-                                            isisL2Auth = str(obj13.text.split("hello-authentication-type ")[1].split(" ")[0].lstrip().rstrip())
-                                            break
-                                    
-
-                                    isisLine.append(isisL2Priority)
-                                    isisLine.append(isisL2Metric)
-                                    isisLine.append(isisL2Hello)
-                                    isisLine.append(isisL2HelloMult)
-                                    isisLine.append(isisL2Auth)
-
-                                    isisList.append(isisLine)
-                                    break
-
-                            if len(isisList) > 0:
-                                isisOutputLine = ""
-                                for isisLine in isisList:
-                                    print(isisLine)
-                                    if isisOutputLine != "":
-                                        isisOutputLine = isisOutputLine + ";"
-
-                                    isisOutputLine = isisOutputLine + "pid:"+str(isisLine[0])
-                                    if isisLine[1] != "": isisOutputLine = isisOutputLine + "|sid:"+str(isisLine[1])
-                                    isisOutputLine = isisOutputLine + "|area:"+str(isisLine[2]) + "|type:"+str(isisLine[3]) + "|mode:"+str(isisLine[4]) + "|bfd:"+str(isisLine[5]) + "|cap:"+str(isisLine[6]) + "|if_state:"+str(isisLine[7])
-                                    if isisLine[8] != "": isisOutputLine = isisOutputLine + "|retr:" + str(isisLine[8])
-                                    if isisLine[9] != "": isisOutputLine = isisOutputLine + "|if_auth:" + str(isisLine[9])
-                                    if isisLine[10] != "": isisOutputLine = isisOutputLine + "|l1_pri:" + str(isisLine[10])
-                                    if isisLine[15] != "": isisOutputLine = isisOutputLine + "|l2_pri:" + str(isisLine[15])
-                                    if isisLine[11] != "": isisOutputLine = isisOutputLine + "|l1_metr:" + str(isisLine[11])
-                                    if isisLine[16] != "": isisOutputLine = isisOutputLine + "|l2_metr:" + str(isisLine[16])
-                                    if ((isisLine[12] != "") or (isisLine[13] != "")):
-                                        if isisLine[12] == "": isisLine[11] = "def"
-                                        if isisLine[13] == "": isisLine[12] = "def"
-                                        isisOutputLine = isisOutputLine + "|isis_l1_tmr:" + str(isisLine[12]) + " " + str(isisLine[13])
-                                    if ((isisLine[17] != "") or (isisLine[18] != "")):
-                                        if isisLine[17] == "": isisLine[17] = "def"
-                                        if isisLine[18] == "": isisLine[18] = "def"
-                                        isisOutputLine = isisOutputLine + "|isis_l2_tmr:" + str(isisLine[17]) + " " + str(isisLine[18])
-                                    if isisLine[14] != "": isisOutputLine = isisOutputLine + "|l1_auth:" + str(isisLine[14])
-                                    if isisLine[19] != "": isisOutputLine = isisOutputLine + "|l2_auth:" + str(isisLine[19])
-                                    
-                                InterfacesParse[InterfacesDict["ISIS"][0]] = isisOutputLine
-
-
-                            # Find if LDP is enabled on this interface
-                            for obj10 in obj2.re_search_children(r"ldp"):
-                                for obj11 in obj10.re_search_children(r"interface-parameters"):
-                                    LDPIfAdmState = ""
-                                    LDPIPv4AdmState = ""
-                                    LDPIPv6AdmState = ""
-                                    searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                                    for obj12 in obj11.re_search_children(searchExpression):
-                                        # if obj12.text.split("interface ")[1].split("\"")[1] == obj3.text.split("interface ")[1].split("\"")[1]:
-                                        for obj13 in obj12.re_search_children(r"shutdown"):
-                                            if obj13.re_search(r"no "):
-                                                LDPIfAdmState = "if:En"
-                                            else:
-                                                LDPIfAdmState = "if:Dis"
-                                        for obj13 in obj12.re_search_children(r"ipv4"):
-                                            for obj14 in obj13.re_search_children(r"shutdown"):
-                                                if obj14.re_search(r"no "):
-                                                    LDPIPv4AdmState = "ipv4:En"
-                                                else:
-                                                    LDPIPv4AdmState = "ipv4:Dis"
-                                        for obj13 in obj12.re_search_children(r"ipv6"):
-                                            for obj14 in obj13.re_search_children(r"shutdown"):
-                                                if obj14.re_search(r"no "):
-                                                    LDPIPv6AdmState = "ipv6:En"
-                                                else:
-                                                    LDPIPv6AdmState = "ipv6:Dis"
-
-                                if LDPIfAdmState != "":
-                                    InterfacesParse[InterfacesDict["LDP"][0]] = LDPIfAdmState
-                                if LDPIPv4AdmState != "":
-                                    InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv4AdmState
-                                if LDPIPv6AdmState != "":
-                                    InterfacesParse[InterfacesDict["LDP"][0]] = InterfacesParse[InterfacesDict["LDP"][0]] + "|" + LDPIPv6AdmState
-
-
-                            # Find all MPLS/RSVP parameters for this interface
-                            # rsvpList = []
-                            # # Go to MPLS process first
-                            # for obj10 in obj2.re_search_children(r"mpls "):
-                            #     rsvpLine = []
-
-                            #     mplsIfState = ""
-                            #     mplsIfAdmGroup = ""
-                            #     rsvpIfState = ""
-                            #     rsvpIfSubscription = ""
-                            #     rsvpIfRefreshReduction = ""
-                            #     rsvpIfReliableDelivery = ""
-
-                            #     # Find current interface
-                            #     searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                            #     for obj11 in obj10.re_search_children(searchExpression):
-                            
-
-
                             # print(InterfacesParse)
                             InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
                             InterfacesParseAll.append(InterfacesParse)
 
 
+                    # Find ePipe SAPs
+                    for obj3 in obj2.re_search_children(r"epipe"):
 
+                        sdpList = []
+                        # Find all SDP associated with the service
+                        for obj4 in obj3.re_search_children(r"sdp"):
 
-                    # Find node's SAP interfaces from config
-                    for obj2 in obj1.re_search_children(r"service"):
-                        # Find VPRN SAPs
-                        for obj3 in obj2.re_search_children(r"vprn"):
-                            for obj4 in obj3.re_search_children(r"interface"):
-                                # for obj5 in obj4.re_search_children(r".*"):
-                                #     print(obj5)
-                                if len(obj4.re_search_children(r".*")) == 0: continue
-                                duplicate = []
-                                for obj5 in obj4.re_search_children(r"interface"):
-                                    if obj4.text.split("interface ")[1].split(" create")[0] == obj5.text.split("interface ")[1].split(" create")[0]:
-                                        duplicate.append(str(obj4))
-
-                                if len(duplicate) > 1:
-                                    print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
-                                    nextFile = 1
-                                    break
-                            
-                                IfNumber = IfNumber + 1
-                                if debug: print("debug: obj4: "+str(obj4))
-                                
-                                InterfacesParse = [""] * len(InterfacesDict)
-                                InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                                InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                                InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                                InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                                InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("interface ")[1].split(" create")[0].replace("\"","")
-                                # InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN SAP"
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
-                                InterfacesParse[InterfacesDict["ServiceID"][0]] = obj3.text.split("vprn ")[1].split(" name")[0] + ":" + obj3.text.split("customer ")[1].split(" create")[0]
-                                InterfacesParse[InterfacesDict["ServiceType"][0]] = "VPRN"
-                                InterfacesParse[InterfacesDict["ServiceName"][0]] = obj3.text.split("name ")[1].split(" customer")[0].replace("\"","")
-                                
-                                # Check if interface is a loopback interface
-                                for obj5 in obj4.re_search_children("loopback"):
-                                    InterfacesParse[InterfacesDict["IfType"][0]] = "Loopback"
-                                    break
-                                
-                                for obj10 in obj3.re_search_children(r"description"):
-                                    InterfacesParse[InterfacesDict["ServiceDescr"][0]] = obj10.text.split("description ")[1].replace("\"","")
-                            
-                                # Find description associated with current interface
-                                for obj5 in obj4.re_search_children("description "):
-                                    InterfacesParse[InterfacesDict["IfDescr"][0]] = str(obj5.text.split("description ")[1].replace("\"",""))
-                                    break
-
-                                # Find admin state associated with current interface
-                                for obj5 in obj4.re_search_children(r"shutdown"):
-                                    if obj5.re_search(r"no "):
-                                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                                    else:
-                                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
-
-                                if InterfacesParse[InterfacesDict["StateAdm"][0]] == "":
-                                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-
-                                # Find BFD parameters associated with current interface
-                                for obj5 in obj4.re_search_children(r"bfd"):
-                                    InterfacesParse[InterfacesDict["BFD"][0]] = "if_tmr:" + obj5.text.lstrip().rstrip().replace("bfd ","").replace(" receive "," ").replace(" multiplier "," ").replace(" type "," ")
-                                    break
+                            sdpLine = []
 
-                                # Find all IPv4 addresses associated with current interface
-                                for obj5 in obj4.re_search_children(r"^ *address "):
-                                    rawInput = obj5.text.split("address ")[1].lstrip().rstrip()
-                                    rawInput = rawInput.replace(" ","/")
-                                    ipadd = ipaddress.ip_interface(str(rawInput))
-                                    if InterfacesParse[InterfacesDict["IPV4Addr"][0]] == "":
-                                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = str(ipadd)
-                                    else:
-                                        InterfacesParse[InterfacesDict["IPV4Addr"][0]] = InterfacesParse[InterfacesDict["IPV4Addr"][0]] + "|" + str(ipadd)
-                                    if InterfacesParse[InterfacesDict["IPV4Subnet"][0]] == "":
-                                        InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = str(ipadd.network)
-                                    else:
-                                        InterfacesParse[InterfacesDict["IPV4Subnet"][0]] = InterfacesParse[InterfacesDict["IPV4Subnet"][0]] + "|"+ str(ipadd.network)
-
-                                # Find all IPv6 addresses associated with current interface
-                                for obj5 in obj4.re_search_children(r"^ *ipv6 address "):
-                                    rawInput = obj5.text.split("ipv6 address ")[1].lstrip().rstrip()
-                                    ipadd = ipaddress.ip_interface(str(line))
-                                    if InterfacesParse[InterfacesDict["IPV6Addr"][0]] == "":
-                                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = str(ipadd)
-                                    else:
-                                        InterfacesParse[InterfacesDict["IPV6Addr"][0]] = InterfacesParse[InterfacesDict["IPV6Addr"][0]] + "|" + str(ipadd)
-                                    if InterfacesParse[InterfacesDict["IPV6Subnet"][0]] == "":
-                                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = str(ipadd.network)
-                                    else:
-                                        InterfacesParse[InterfacesDict["IPV6Subnet"][0]] = InterfacesParse[InterfacesDict["IPV6Subnet"][0]] + "|" + str(ipadd.network)
-
-                                # Check if interface is a L3 interface
-                                if ((InterfacesParse[InterfacesDict["IPV4Addr"][0]] != "") or (InterfacesParse[InterfacesDict["IPV6Addr"][0]] != "")):
-                                    # Mark interface as Network/Hybrid if it has any IPv4/v6 addresses assigned
-                                    if InterfacesParse[InterfacesDict["IfType"][0]] == "":
-                                        InterfacesParse[InterfacesDict["IfType"][0]] = "L3VPN SAP"
-                                    # if ((InterfacesParse[InterfacesDict["IfType"][0]] == "Port") or (InterfacesParse[InterfacesDict["IfType"][0]] == "LAG") or (InterfacesParse[InterfacesDict["IfType"][0]] == "Bridge")):
-                                    else:
-                                        InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|L3VPN SAP"
+                            sdpType = ""
+                            sdpID = obj4.text.split("sdp ")[1].split(":")[0]
+                            sdpLine.append(sdpID)
 
-                                # Find L3 MTU parameters associated with current interface
-                                for obj5 in obj4.re_search_children(r"ip-mtu"):
-                                    InterfacesParse[InterfacesDict["L3MTU"][0]] = obj5.text.split("ip-mtu ")[1]
-                                    break
+                            sdpNH = ""
+                            sdpKA = ""
+                            sdpVC = obj4.text.split("sdp ")[1].split(":")[1].split()[0]
+                            sdpState = "Dis"
 
-                                # Find port/LAG associated with current interface
-                                for obj5 in obj4.re_search_children(r"^ *sap"):
-                                    if InterfacesParse[InterfacesDict["PortBinding"][0]] != "": InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|"
-                                    tempPortBinding = obj5.text.split("sap ")[1].split(" create")[0]
-                                    InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + tempPortBinding
-                                    if obj5.re_search(r":"):
-                                        if InterfacesParse[InterfacesDict["PortName"][0]] != "": InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + "|"
-                                        if InterfacesParse[InterfacesDict["Encap"][0]] != "": InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "|"
-                                        if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + tempPortBinding.split(":")[0]
-                                        InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempPortBinding.split(":")[1]
-                                        if obj5.re_search(r"\."):
-                                            InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "qinq"
+                            for obj5 in obj4.re_search_children(r"shutdown"):
+                                if obj5.re_search(r"no "):
+                                    sdpState = "En"
+                                else:
+                                    sdpState = "Dis"
+
+                            searchExpression = r"^ *sdp " + str(sdpID)
+                            for obj90 in obj2.re_search_children(searchExpression):
+                                sdpType = obj90.text.split(str(sdpID))[1].split()[0]
+                                for obj91 in obj90.re_search_children(r"^ *far-end"):
+                                    sdpNH = obj91.text.split("far-end ")[1].split()[0]
+                                for obj91 in obj90.re_search_children(r"^ *keep-alive"):
+                                    for obj92 in obj91.re_search_children(r"shutdown"):
+                                        if obj92.re_search(r"no "):
+                                            sdpKA = "En"
                                         else:
-                                            InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "dot1q"
-                                    else:
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
-                                        InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
-                                    
-                                    if obj5.re_search(r"lag"):
-                                        InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
-                                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["LAGID"][0]]
-                                    else:
-                                        InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-
-                                    # Find QoS input policy associated with current interface
-                                    for obj6 in obj5.re_search_children(r"^ *ingress"):
-                                        for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                            if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
-                                                InterfacesParse[InterfacesDict["QoSIn"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                            else:
-                                                InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                            sdpKA = "Dis"
+                                if sdpState == "En":
+                                    for obj91 in obj90.re_search_children(r"^ *shutdown"):
+                                            sdpState = "Dis"
 
-                                    # Find QoS output policy associated with current interface
-                                    for obj6 in obj5.re_search_children(r"^ *egress"):
-                                        for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                            if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
-                                                InterfacesParse[InterfacesDict["QoSOut"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                            else:
-                                                InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-
-
-                                # Find VPLS service associated with current interface
-                                for obj5 in obj4.re_search_children(r"^ *vpls"):
-                                    vplsServiceName = obj5.text.split("\"")[1]
-                                    if InterfacesParse[InterfacesDict["IfType"][0]] != "": InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "|"
-                                    InterfacesParse[InterfacesDict["IfType"][0]] = InterfacesParse[InterfacesDict["IfType"][0]] + "VPLS SAP"
-                                    # Go to service section
-                                    for obj50 in obj1.re_search_children(r"service"):
-                                        # Find relevant VPLS service
-                                        for obj51 in obj50.re_search_children(r"vpls.*\""+vplsServiceName+r"\""):
-                                            vplsServiceID = obj51.text.split("vpls ")[1].split(" name")[0] + ":" + obj51.text.split("customer ")[1].split(" create")[0]
-                                            
-                                            vplsServiceDescr = ""
-                                            for obj5 in obj51.re_search_children(r"^ *description"):
-                                                vplsServiceDescr = obj51.text.split("\"")[1].split()[0]
-                                                if InterfacesParse[InterfacesDict["ServiceDescr"][0]] != "": InterfacesParse[InterfacesDict["ServiceDescr"][0]] = InterfacesParse[InterfacesDict["ServiceDescr"][0]] + "|"
-                                                InterfacesParse[InterfacesDict["ServiceDescr"][0]] = InterfacesParse[InterfacesDict["ServiceDescr"][0]] + vplsServiceDescr
+                            sdpLine.append(sdpType)
+                            sdpLine.append(sdpState)
+                            sdpLine.append(sdpNH)
+                            sdpLine.append(sdpVC)
+                            sdpLine.append(sdpKA)
 
-                                            if InterfacesParse[InterfacesDict["ParentIfName"][0]] != "": InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["ParentIfName"][0]] + "|"
-                                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["ParentIfName"][0]] + "vpls:" + vplsServiceID + ":" + vplsServiceName
+                            sdpList.append(sdpLine)
 
-                                            if InterfacesParse[InterfacesDict["ServiceID"][0]] != "": InterfacesParse[InterfacesDict["ServiceID"][0]] = InterfacesParse[InterfacesDict["ServiceID"][0]] + "|"
-                                            InterfacesParse[InterfacesDict["ServiceID"][0]] = InterfacesParse[InterfacesDict["ServiceID"][0]] + vplsServiceID
-                                            
-                                            if InterfacesParse[InterfacesDict["ServiceName"][0]] != "": InterfacesParse[InterfacesDict["ServiceName"][0]] = InterfacesParse[InterfacesDict["ServiceName"][0]] + "|"
-                                            InterfacesParse[InterfacesDict["ServiceName"][0]] = InterfacesParse[InterfacesDict["ServiceName"][0]] + vplsServiceName
-
-                                            if InterfacesParse[InterfacesDict["ServiceType"][0]] != "": InterfacesParse[InterfacesDict["ServiceType"][0]] = InterfacesParse[InterfacesDict["ServiceType"][0]] + "|"
-                                            InterfacesParse[InterfacesDict["ServiceType"][0]] = InterfacesParse[InterfacesDict["ServiceType"][0]] + "VPLS"
-
-                                            # Find VPLS SAPs from config
-                                            for obj5 in obj51.re_search_children(r"^ *sap"):
-                                                if InterfacesParse[InterfacesDict["PortBinding"][0]] != "": InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + "|"
-                                                tempPortBinding = obj5.text.split("sap ")[1].split(" create")[0]
-                                                InterfacesParse[InterfacesDict["PortBinding"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]] + tempPortBinding
-                                                if obj5.re_search(r":"):
-                                                    if InterfacesParse[InterfacesDict["PortName"][0]] != "": InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + "|"
-                                                    if InterfacesParse[InterfacesDict["Encap"][0]] != "": InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "|"
-                                                    if InterfacesParse[InterfacesDict["VLAN"][0]] != "": InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + "|"
-                                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]] + tempPortBinding.split(":")[0]
-                                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["VLAN"][0]] + tempPortBinding.split(":")[1]
-                                                    if obj5.re_search(r"\."):
-                                                        InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "qinq"
-                                                    else:
-                                                        InterfacesParse[InterfacesDict["Encap"][0]] = InterfacesParse[InterfacesDict["Encap"][0]] + "dot1q"
-                                                else:
-                                                    InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
-                                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
-                                                
-                                                # if obj5.re_search(r"lag"):
-                                                #     InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
-                                                #     InterfacesParse[InterfacesDict["ParentIfName"][0]] = "lag " + InterfacesParse[InterfacesDict["LAGID"][0]]
-                                                # else:
-                                                #     InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
-
-                                                # Find QoS input policy associated with current interface
-                                                for obj6 in obj5.re_search_children(r"^ *ingress"):
-                                                    for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                                        if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
-                                                            InterfacesParse[InterfacesDict["QoSIn"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                                        else:
-                                                            InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-
-                                                # Find QoS output policy associated with current interface
-                                                for obj6 in obj5.re_search_children(r"^ *egress"):
-                                                    for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                                        if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
-                                                            InterfacesParse[InterfacesDict["QoSOut"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                                        else:
-                                                            InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-
-
-                                # Find all OSPF processes and areas where this interface is participating
-                                ospfList = []
-                                ospfLine = []
-                                ospfRID = ""
-                                # Find all OSPF processes associated with interface
-                                for obj10 in obj3.re_search_children(r"ospf "):
-                                    if len(obj10.text.split("ospf ")) > 1:
-                                        ospfRID = str(obj10.text.split("ospf ")[1].split(" ")[0])
-                                    ospfLine.append(ospfRID)
-                                    
-                                    # First we will look for the area where interface is primary
-                                    ospfIfType1 = ""
-                                    ospfIfType2 = "Bcast"
-                                    ospfIfMode = "Act"
-                                    ospfBFDState = "Dis"
-                                    ospfPriority = ""
-                                    ospfMetric = ""
-                                    ospfHello = ""
-                                    ospfDead = ""
-                                    ospfRetransmit = ""
-                                    ospfAuth = ""
-                                    ospfIfState = "Dis"
 
-                                    area = ""
-                                    # Look through all OSPF areas
-                                    for obj11 in obj10.re_search_children(r"area "):
-                                        area = obj11.text.split("area ")[1]
-                                        area = ipaddress.ip_address(area)
-
-                                        # Find current interface configured as primary within an area
-                                        searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                                        for obj12 in obj11.re_search_children(searchExpression):
-                                            if re.search(r"secondary",obj12.text):
-                                                continue
-                                            else:
-                                                # Find all OSPF parameters for this primary interface
-                                                for obj13 in obj12.re_search_children("interface-type "):
-                                                    ospfIfType1 = str(obj13.text.split("interface-type ")[1].split(" ")[0].lstrip().rstrip())
-                                                    ospfIfType2 = ""
-                                                    if ospfIfType1 == "point-to-point":
-                                                        ospfIfType2 = "PtP"
-                                                    else:
-                                                        if ospfIfType1 == "point-to-multipoint":
-                                                            ospfIfType2 = "PtMP"
-                                                        else:
-                                                            ospfIfType2 = ospfIfType1
-                                                    break
-                                                ospfLine.append(ospfIfType2)
-                                                for obj13 in obj12.re_search_children("passive"):
-                                                    if re.match(r"^ *passive *$",obj13.text):
-                                                        ospfIfMode = "Pass"
-                                                    if re.match(r"^ *no passive *$",obj13.text):
-                                                        ospfIfMode = "Act"
-                                                    break
-                                                ospfLine.append(ospfIfMode)
-                                                for obj13 in obj12.re_search_children("bfd-enable"):
-                                                    if re.match(r"^ *bfd-enable *$",obj13.text):
-                                                        ospfBFDState = "En"
-                                                    if re.match(r"^ *no bfd-enable *$",obj13.text):
-                                                        ospfBFDState = "Dis"
-                                                    break
-                                                ospfLine.append(ospfBFDState)
-                                                for obj13 in obj12.re_search_children("priority "):
-                                                    ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfPriority)
-                                                for obj13 in obj12.re_search_children("metric "):
-                                                    ospfMetric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfMetric)
-                                                for obj13 in obj12.re_search_children("hello-interval "):
-                                                    ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfHello)
-                                                for obj13 in obj12.re_search_children("dead-interval "):
-                                                    ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfDead)
-                                                for obj13 in obj12.re_search_children("retransmit-interval "):
-                                                    ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfRetransmit)
-                                                for obj13 in obj12.re_search_children("authentication-type "):
-                                                    ospfAuth = str(obj13.text.split("authentication-type ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfAuth)
-                                                for obj13 in obj12.re_search_children("no shutdown"):
-                                                    ospfIfState = "En"
-                                                    break
+                        for obj4 in obj3.re_search_children(r"sap"):
+                            # for obj5 in obj4.re_search_children(r".*"):
+                            #     print(obj5)
+                            # if len(obj4.re_search_children(r".*")) == 0: continue
+                            duplicate = []
+                            for obj5 in obj4.re_search_children(r"sap"):
+                                if obj4.text.split("sap ")[1].split(" create")[0] == obj5.text.split("sap ")[1].split(" create")[0]:
+                                    duplicate.append(str(obj4))
 
-                                                ospfAreaList = []
-                                                ospfAreaList.append([int(area),"*",""])
-                                                if ospfIfState == "Dis":
-                                                    ospfAreaList[0][2] = "(Dis)"
-                                                else:
-                                                    ospfAreaList[0][2] = ""
+                            if len(duplicate) > 1:
+                                logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                                nextFile = 1
+                                skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
+                                break
+                        
+                            IfNumber = IfNumber + 1
+                            if debug: logger.debug("obj4: %s", obj4)
+                            
+                            InterfacesParse = [""] * len(InterfacesDict)
+                            InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                            InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                            InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                            InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                            # InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","") + "_epipe" + obj3.text.split("epipe ")[1].split(" name")[0]
+                            InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","")
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "L2VPN SAP"
+                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                            InterfacesParse[InterfacesDict["ServiceID"][0]] = obj3.text.split("epipe ")[1].split(" name")[0] + ":" + obj3.text.split("customer ")[1].split(" create")[0]
+                            InterfacesParse[InterfacesDict["ServiceName"][0]] = obj3.text.split("name ")[1].split(" customer")[0].replace("\"","")
+                            InterfacesParse[InterfacesDict["ServiceType"][0]] = "ePipe"
+                            for obj10 in obj3.re_search_children(r"description"):
+                                InterfacesParse[InterfacesDict["ServiceDescr"][0]] = obj10.text.split("\"")[1].replace("\"","")
 
-                                                ospfLine.append(ospfAreaList)
+                            # Find admin state associated with current interface
+                            for obj5 in obj4.re_search_children(r"shutdown"):
+                                if obj5.re_search(r"no "):
+                                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                                else:
+                                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
-                                                ospfList.append(ospfLine)
 
-                                                break
+                            if len(sdpList) > 0:
+                                sdpOutputLine = ""
+                                for sdpLine in sdpList:
+                                    if sdpOutputLine != "":
+                                        sdpOutputLine = sdpOutputLine + ";"
+                                    
+                                    sdpOutputLine = sdpOutputLine + "id:"+str(sdpLine[0]) + "|type:"+str(sdpLine[1]) + "|state:"+str(sdpLine[2]) + "|next-hop:"+str(sdpLine[3]) + "|vc-id:"+str(sdpLine[4]) + "|keepalive:"+str(sdpLine[5])
 
-                                    # Now we will look for all other areas where interface is secondary
-
-                                    area = ""
-                                    # Look through all OSPF areas
-                                    for obj11 in obj10.re_search_children(r"area "):
-                                        area = obj11.text.split("area ")[1]
-                                        area = ipaddress.ip_address(area)
-
-                                        ospfLine = []
-                                        ospfBFDState = "Dis"
-                                        ospfPriority = ""
-                                        ospfMetric = ""
-                                        ospfHello = ""
-                                        ospfDead = ""
-                                        ospfRetransmit = ""
-                                        ospfAuth = ""
-                                        ospfIfState = "Dis"
+                                InterfacesParse[InterfacesDict["ServiceSDP"][0]] = sdpOutputLine
 
-                                        # Find current interface configured as secondary within an area
-                                        searchExpression = r"\""+ InterfacesParse[InterfacesDict["IfName"][0]] + r"\""
-                                        for obj12 in obj11.re_search_children(searchExpression):
-                                            if re.search(r"secondary",obj12.text):
-                                                # Find all OSPF parameters for this secondary interface
-                                                ospfLine.append(ospfRID)        # Set to same value as on primary configuration
-                                                ospfLine.append(ospfIfType2)    # Set to same value as on primary configuration
-                                                ospfLine.append(ospfIfMode)     # Set to same value as on primary configuration
-                                                for obj13 in obj12.re_search_children("bfd-enable"):
-                                                    if re.match(r"^ *bfd-enable *$",obj13.text):
-                                                        ospfBFDState = "En"
-                                                    if re.match(r"^ *no bfd-enable *$",obj13.text):
-                                                        ospfBFDState = "Dis"
-                                                    break
-                                                ospfLine.append(ospfBFDState)
-                                                for obj13 in obj12.re_search_children("priority "):
-                                                    ospfPriority = str(obj13.text.split("priority ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfPriority)
-                                                for obj13 in obj12.re_search_children("metric "):
-                                                    ospfMetric = str(obj13.text.split("metric ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfMetric)
-                                                for obj13 in obj12.re_search_children("hello-interval "):
-                                                    ospfHello = str(obj13.text.split("hello-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfHello)
-                                                for obj13 in obj12.re_search_children("dead-interval "):
-                                                    ospfDead = str(obj13.text.split("dead-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfDead)
-                                                for obj13 in obj12.re_search_children("retransmit-interval "):
-                                                    ospfRetransmit = str(obj13.text.split("retransmit-interval ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfRetransmit)
-                                                for obj13 in obj12.re_search_children("authentication-type "):
-                                                    ospfAuth = str(obj13.text.split("authentication-type ")[1].split(" ")[0].lstrip().rstrip())
-                                                    break
-                                                ospfLine.append(ospfAuth)
-                                                for obj13 in obj12.re_search_children("no shutdown"):
-                                                    ospfIfState = "En"
-                                                    break
 
-                                                ospfAreaList = []
-                                                ospfAreaList.append([int(area),"",""])
-                                                if ospfIfState == "Dis":
-                                                    ospfAreaList[0][2] = "(Dis)"
-                                                else:
-                                                    ospfAreaList[0][2] = ""
-                                                ospfLine.append(ospfAreaList)
-
-                                                lineNumber = 0
-                                                match = 0
-                                                for ospfLineCheck in ospfList:
-                                                    if ((ospfLineCheck[3] == ospfBFDState) and (ospfLineCheck[4] == ospfPriority) and (ospfLineCheck[5] == ospfMetric) and (ospfLineCheck[6] == ospfHello) 
-                                                        and (ospfLineCheck[7] == ospfDead) and (ospfLineCheck[8] == ospfRetransmit) and (ospfLineCheck[9] == ospfAuth)):
-                                                        
-                                                        ospfList[lineNumber][10].extend(ospfAreaList)
-                                                        match = 1
-                                                        break
-
-                                                    lineNumber = lineNumber + 1
-
-                                                if match == 0:
-                                                    ospfList.append(ospfLine)
-                                
-                                # Sort all areas inside the ospfList
-                                # print(ospfList)
-                                lineNumber = 0
-                                for ospfLineCheck in ospfList:
-                                    ospfList[lineNumber][10].sort(key=lambda x: x[0])
-                                    lineNumber = lineNumber + 1
-                                
-                                # ospfList.sort(key=lambda x: x[10])
+                            # Find L2 MTU parameters associated with current interface
+                            for obj10 in obj3.re_search_children(r"service-mtu"):
+                                InterfacesParse[InterfacesDict["L2MTU"][0]] = obj10.text.split("service-mtu ")[1]
+                                break
 
+                            # Find port/LAG associated with current interface
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = obj4.text.split("sap ")[1].split(" create")[0]
+                            if obj4.re_search(r":"):
+                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[0]
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[1]
+                                if obj4.re_search(r"\."):
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
+                                else:
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                            else:
+                                InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
+                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
+                            
+                            if obj4.re_search(r"lag"):
+                                InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
 
-                                if len(ospfList) > 0:
-                                    ospfOutputLine = ""
-                                    for ospfLine in ospfList:
-                                        # print(ospfLine)
-                                        if ospfOutputLine != "":
-                                            ospfOutputLine = ospfOutputLine + ";"
+                            # print(InterfacesParse)
+                            InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                            InterfacesParseAll.append(InterfacesParse)
 
-                                        # ospfOutputLine = ospfOutputLine + "pid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3]) + "|prio:"+str(ospfLine[4]) + "|metr:"+str(ospfLine[5]) + "|hello:"+str(ospfLine[6]) + "|dead:"+str(ospfLine[7]) + "|retr:"+str(ospfLine[8]) + "|auth:"+str(ospfLine[9])
-                                        
-                                        ospfOutputLine = ospfOutputLine + "rid:"+str(ospfLine[0]) + "|type:"+str(ospfLine[1]) + "|mode:"+str(ospfLine[2]) + "|bfd:"+str(ospfLine[3])
-                                        if ospfLine[4] != "": ospfOutputLine = ospfOutputLine + "|prio:" + str(ospfLine[4])
-                                        if ospfLine[5] != "": ospfOutputLine = ospfOutputLine + "|metr:" + str(ospfLine[5])
-                                        if ((ospfLine[6] != "") or (ospfLine[7] != "") or (ospfLine[8] != "")):
-                                            if ospfLine[6] == "": ospfLine[6] = "def"
-                                            if ospfLine[7] == "": ospfLine[7] = "def"
-                                            if ospfLine[8] == "": ospfLine[8] = "def"
-                                            ospfOutputLine = ospfOutputLine + "|ospf_tmr:" + str(ospfLine[6]) + " " + str(ospfLine[7]) + " " + str(ospfLine[8])
-                                        if ospfLine[9] != "": ospfOutputLine = ospfOutputLine + "|auth:" + str(ospfLine[9])
-
-                                        if len(ospfLine) > 10:
-                                            ospfOutputLine = ospfOutputLine + "|areas:"
-
-                                            ospfOutputLine2 = ""
-                                            for area in ospfLine[10]:
-                                                if ospfOutputLine2 == "":
-                                                    ospfOutputLine2 = str(area[0]) + str(area[1]) + str(area[2]) 
-                                                else:
-                                                    ospfOutputLine2 = ospfOutputLine2 + " " + str(area[0]) + str(area[1]) + str(area[2])
-                                            
-                                            ospfOutputLine = ospfOutputLine + ospfOutputLine2
-                                        
-                                    InterfacesParse[InterfacesDict["OSPFv2"][0]] = ospfOutputLine
+                    # Find VPLS SAPs
+                    for obj3 in obj2.re_search_children(r"vpls"):
 
+                        sdpList = []
+                        # Find all SDP associated with the service
+                        for obj4 in obj3.re_search_children(r"sdp"):
 
-                                # print(InterfacesParse)
-                                InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                                InterfacesParseAll.append(InterfacesParse)
+                            sdpLine = []
 
+                            sdpType = ""
+                            sdpID = obj4.text.split("sdp ")[1].split(":")[0]
+                            sdpLine.append(sdpID)
 
-                        # Find ePipe SAPs
-                        for obj3 in obj2.re_search_children(r"epipe"):
+                            sdpNH = ""
+                            sdpKA = ""
+                            sdpVC = obj4.text.split("sdp ")[1].split(":")[1].split()[0]
+                            sdpState = "Dis"
 
-                            sdpList = []
-                            # Find all SDP associated with the service
-                            for obj4 in obj3.re_search_children(r"sdp"):
+                            for obj5 in obj4.re_search_children(r"shutdown"):
+                                if obj5.re_search(r"no "):
+                                    sdpState = "En"
+                                else:
+                                    sdpState = "Dis"
+
+                            searchExpression = r"^ *sdp " + str(sdpID)
+                            for obj90 in obj2.re_search_children(searchExpression):
+                                sdpType = obj90.text.split(str(sdpID))[1].split()[0]
+                                for obj91 in obj90.re_search_children(r"^ *far-end"):
+                                    sdpNH = obj91.text.split("far-end ")[1].split()[0]
+                                for obj91 in obj90.re_search_children(r"^ *keep-alive"):
+                                    for obj92 in obj91.re_search_children(r"shutdown"):
+                                        if obj92.re_search(r"no "):
+                                            sdpKA = "En"
+                                        else:
+                                            sdpKA = "Dis"
+                                if sdpState == "En":
+                                    for obj91 in obj90.re_search_children(r"^ *shutdown"):
+                                            sdpState = "Dis"
 
-                                sdpLine = []
+                            sdpLine.append(sdpType)
+                            sdpLine.append(sdpState)
+                            sdpLine.append(sdpNH)
+                            sdpLine.append(sdpVC)
+                            sdpLine.append(sdpKA)
 
-                                sdpType = ""
-                                sdpID = obj4.text.split("sdp ")[1].split(":")[0]
-                                sdpLine.append(sdpID)
+                            sdpList.append(sdpLine)
 
-                                sdpNH = ""
-                                sdpKA = ""
-                                sdpVC = obj4.text.split("sdp ")[1].split(":")[1].split()[0]
-                                sdpState = "Dis"
+                        for obj4 in obj3.re_search_children(r"sap"):
+                            # if len(obj4.re_search_children(r".*")) == 0: continue
+                            duplicate = []
+                            for obj5 in obj4.re_search_children(r"sap"):
+                                if obj4.text.split("sap ")[1].split(" create")[0] == obj5.text.split("sap ")[1].split(" create")[0]:
+                                    duplicate.append(str(obj4))
 
-                                for obj5 in obj4.re_search_children(r"shutdown"):
-                                    if obj5.re_search(r"no "):
-                                        sdpState = "En"
-                                    else:
-                                        sdpState = "Dis"
-
-                                searchExpression = r"^ *sdp " + str(sdpID)
-                                for obj90 in obj2.re_search_children(searchExpression):
-                                    sdpType = obj90.text.split(str(sdpID))[1].split()[0]
-                                    for obj91 in obj90.re_search_children(r"^ *far-end"):
-                                        sdpNH = obj91.text.split("far-end ")[1].split()[0]
-                                    for obj91 in obj90.re_search_children(r"^ *keep-alive"):
-                                        for obj92 in obj91.re_search_children(r"shutdown"):
-                                            if obj92.re_search(r"no "):
-                                                sdpKA = "En"
-                                            else:
-                                                sdpKA = "Dis"
-                                    if sdpState == "En":
-                                        for obj91 in obj90.re_search_children(r"^ *shutdown"):
-                                                sdpState = "Dis"
-
-                                sdpLine.append(sdpType)
-                                sdpLine.append(sdpState)
-                                sdpLine.append(sdpNH)
-                                sdpLine.append(sdpVC)
-                                sdpLine.append(sdpKA)
-
-                                sdpList.append(sdpLine)
-
-
-                            for obj4 in obj3.re_search_children(r"sap"):
-                                # for obj5 in obj4.re_search_children(r".*"):
-                                #     print(obj5)
-                                # if len(obj4.re_search_children(r".*")) == 0: continue
-                                duplicate = []
-                                for obj5 in obj4.re_search_children(r"sap"):
-                                    if obj4.text.split("sap ")[1].split(" create")[0] == obj5.text.split("sap ")[1].split(" create")[0]:
-                                        duplicate.append(str(obj4))
-
-                                if len(duplicate) > 1:
-                                    print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
-                                    nextFile = 1
-                                    break
+                            if len(duplicate) > 1:
+                                logger.warning("File %s contains duplicate interface lines: %s, skipping this file", os.path.split(showFilePath)[1], duplicate)
+                                nextFile = 1
+                                skipReason = ["duplicateInterfaces", "Duplicate interface lines: "+str(duplicate)]
+                                break
+                        
+                            IfNumber = IfNumber + 1
+                            if debug: logger.debug("obj4: %s", obj4)
                             
-                                IfNumber = IfNumber + 1
-                                if debug: print("debug: obj4: "+str(obj4))
-                                
-                                InterfacesParse = [""] * len(InterfacesDict)
-                                InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                                InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                                InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                                InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                                # InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","") + "_epipe" + obj3.text.split("epipe ")[1].split(" name")[0]
-                                InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","")
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "L2VPN SAP"
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
-                                InterfacesParse[InterfacesDict["ServiceID"][0]] = obj3.text.split("epipe ")[1].split(" name")[0] + ":" + obj3.text.split("customer ")[1].split(" create")[0]
-                                InterfacesParse[InterfacesDict["ServiceName"][0]] = obj3.text.split("name ")[1].split(" customer")[0].replace("\"","")
-                                InterfacesParse[InterfacesDict["ServiceType"][0]] = "ePipe"
-                                for obj10 in obj3.re_search_children(r"description"):
-                                    InterfacesParse[InterfacesDict["ServiceDescr"][0]] = obj10.text.split("\"")[1].replace("\"","")
-
-                                # Find admin state associated with current interface
-                                for obj5 in obj4.re_search_children(r"shutdown"):
-                                    if obj5.re_search(r"no "):
-                                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                                    else:
-                                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
+                            InterfacesParse = [""] * len(InterfacesDict)
+                            InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
+                            InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
+                            InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
+                            InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
+                            # InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","") + "_vpls" + obj3.text.split("vpls ")[1].split(" name")[0]
+                            InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","")
+                            InterfacesParse[InterfacesDict["IfType"][0]] = "VPLS SAP"
+                            InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
+                            InterfacesParse[InterfacesDict["ServiceID"][0]] = obj3.text.split("vpls ")[1].split(" name")[0] + ":" + obj3.text.split("customer ")[1].split(" create")[0]
+                            InterfacesParse[InterfacesDict["ServiceName"][0]] = obj3.text.split("name ")[1].split(" customer")[0].replace("\"","")
+                            InterfacesParse[InterfacesDict["ServiceType"][0]] = "VPLS"
+                            for obj10 in obj3.re_search_children(r"description"):
+                                InterfacesParse[InterfacesDict["ServiceDescr"][0]] = obj10.text.split("description ")[1].replace("\"","")
 
+                            # Find admin state associated with current interface
+                            for obj5 in obj4.re_search_children(r"shutdown"):
+                                if obj5.re_search(r"no "):
+                                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
+                                else:
+                                    InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
 
-                                if len(sdpList) > 0:
-                                    sdpOutputLine = ""
-                                    for sdpLine in sdpList:
-                                        if sdpOutputLine != "":
-                                            sdpOutputLine = sdpOutputLine + ";"
-                                        
-                                        sdpOutputLine = sdpOutputLine + "id:"+str(sdpLine[0]) + "|type:"+str(sdpLine[1]) + "|state:"+str(sdpLine[2]) + "|next-hop:"+str(sdpLine[3]) + "|vc-id:"+str(sdpLine[4]) + "|keepalive:"+str(sdpLine[5])
+                            if len(sdpList) > 0:
+                                sdpOutputLine = ""
+                                for sdpLine in sdpList:
+                                    if sdpOutputLine != "":
+                                        sdpOutputLine = sdpOutputLine + ";"
+                                    
+                                    sdpOutputLine = sdpOutputLine + "id:"+str(sdpLine[0]) + "|type:"+str(sdpLine[1]) + "|state:"+str(sdpLine[2]) + "|next-hop:"+str(sdpLine[3]) + "|vc-id:"+str(sdpLine[4]) + "|keepalive:"+str(sdpLine[5])
 
-                                    InterfacesParse[InterfacesDict["ServiceSDP"][0]] = sdpOutputLine
+                                InterfacesParse[InterfacesDict["ServiceSDP"][0]] = sdpOutputLine
 
 
-                                # Find L2 MTU parameters associated with current interface
-                                for obj10 in obj3.re_search_children(r"service-mtu"):
-                                    InterfacesParse[InterfacesDict["L2MTU"][0]] = obj10.text.split("service-mtu ")[1]
-                                    break
+                            # Find L2 MTU parameters associated with current interface
+                            for obj10 in obj3.re_search_children(r"service-mtu"):
+                                InterfacesParse[InterfacesDict["L2MTU"][0]] = obj10.text.split("service-mtu ")[1]
+                                break
 
-                                # Find port/LAG associated with current interface
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = obj4.text.split("sap ")[1].split(" create")[0]
-                                if obj4.re_search(r":"):
-                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[0]
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[1]
-                                    if obj4.re_search(r"\."):
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                                    else:
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                            # Find port/LAG associated with current interface
+                            InterfacesParse[InterfacesDict["PortBinding"][0]] = obj4.text.split("sap ")[1].split(" create")[0]
+                            if obj4.re_search(r":"):
+                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[0]
+                                InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[1]
+                                if obj4.re_search(r"\."):
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
                                 else:
-                                    InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
-                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
-                                
-                                if obj4.re_search(r"lag"):
-                                    InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
-
-                                # print(InterfacesParse)
-                                InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                                InterfacesParseAll.append(InterfacesParse)
+                                    InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
+                            else:
+                                InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
+                                InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
+                            
+                            if obj4.re_search(r"lag"):
+                                InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
+                            
+                            InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
 
-                        # Find VPLS SAPs
-                        for obj3 in obj2.re_search_children(r"vpls"):
+                            # Find QoS input policy associated with current interface
+                            for obj6 in obj4.re_search_children(r"^ *ingress"):
+                                for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                    if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
+                                        InterfacesParse[InterfacesDict["QoSIn"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                    else:
+                                        InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
 
-                            sdpList = []
-                            # Find all SDP associated with the service
-                            for obj4 in obj3.re_search_children(r"sdp"):
+                            # Find QoS output policy associated with current interface
+                            for obj6 in obj4.re_search_children(r"^ *egress"):
+                                for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
+                                    if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
+                                        InterfacesParse[InterfacesDict["QoSOut"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+                                    else:
+                                        InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
 
-                                sdpLine = []
+                            # print(InterfacesParse)
+                            InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
+                            InterfacesParseAll.append(InterfacesParse)
 
-                                sdpType = ""
-                                sdpID = obj4.text.split("sdp ")[1].split(":")[0]
-                                sdpLine.append(sdpID)
 
-                                sdpNH = ""
-                                sdpKA = ""
-                                sdpVC = obj4.text.split("sdp ")[1].split(":")[1].split()[0]
-                                sdpState = "Dis"
 
-                                for obj5 in obj4.re_search_children(r"shutdown"):
-                                    if obj5.re_search(r"no "):
-                                        sdpState = "En"
-                                    else:
-                                        sdpState = "Dis"
-
-                                searchExpression = r"^ *sdp " + str(sdpID)
-                                for obj90 in obj2.re_search_children(searchExpression):
-                                    sdpType = obj90.text.split(str(sdpID))[1].split()[0]
-                                    for obj91 in obj90.re_search_children(r"^ *far-end"):
-                                        sdpNH = obj91.text.split("far-end ")[1].split()[0]
-                                    for obj91 in obj90.re_search_children(r"^ *keep-alive"):
-                                        for obj92 in obj91.re_search_children(r"shutdown"):
-                                            if obj92.re_search(r"no "):
-                                                sdpKA = "En"
-                                            else:
-                                                sdpKA = "Dis"
-                                    if sdpState == "En":
-                                        for obj91 in obj90.re_search_children(r"^ *shutdown"):
-                                                sdpState = "Dis"
-
-                                sdpLine.append(sdpType)
-                                sdpLine.append(sdpState)
-                                sdpLine.append(sdpNH)
-                                sdpLine.append(sdpVC)
-                                sdpLine.append(sdpKA)
-
-                                sdpList.append(sdpLine)
-
-                            for obj4 in obj3.re_search_children(r"sap"):
-                                # if len(obj4.re_search_children(r".*")) == 0: continue
-                                duplicate = []
-                                for obj5 in obj4.re_search_children(r"sap"):
-                                    if obj4.text.split("sap ")[1].split(" create")[0] == obj5.text.split("sap ")[1].split(" create")[0]:
-                                        duplicate.append(str(obj4))
-
-                                if len(duplicate) > 1:
-                                    print("File "+str(os.path.split(inputPath)[1])+" contains duplicate interface lines: "+str(duplicate)+", skipping this file")
-                                    nextFile = 1
-                                    break
-                            
-                                IfNumber = IfNumber + 1
-                                if debug: print("debug: obj4: "+str(obj4))
-                                
-                                InterfacesParse = [""] * len(InterfacesDict)
-                                InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
-                                InterfacesParse[InterfacesDict["Hostname"][0]] = Hostname
-                                InterfacesParse[InterfacesDict["CLISyntax"][0]] = CLISyntax
-                                InterfacesParse[InterfacesDict["IfNumber"][0]] = str(IfNumber).zfill(4)
-                                # InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","") + "_vpls" + obj3.text.split("vpls ")[1].split(" name")[0]
-                                InterfacesParse[InterfacesDict["IfName"][0]] = obj4.text.split("sap ")[1].split(" create")[0].replace("\"","")
-                                InterfacesParse[InterfacesDict["IfType"][0]] = "VPLS SAP"
-                                InterfacesParse[InterfacesDict["IfMode"][0]] = "Access"
-                                InterfacesParse[InterfacesDict["ServiceID"][0]] = obj3.text.split("vpls ")[1].split(" name")[0] + ":" + obj3.text.split("customer ")[1].split(" create")[0]
-                                InterfacesParse[InterfacesDict["ServiceName"][0]] = obj3.text.split("name ")[1].split(" customer")[0].replace("\"","")
-                                InterfacesParse[InterfacesDict["ServiceType"][0]] = "VPLS"
-                                for obj10 in obj3.re_search_children(r"description"):
-                                    InterfacesParse[InterfacesDict["ServiceDescr"][0]] = obj10.text.split("description ")[1].replace("\"","")
-
-                                # Find admin state associated with current interface
-                                for obj5 in obj4.re_search_children(r"shutdown"):
-                                    if obj5.re_search(r"no "):
-                                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "En"
-                                    else:
-                                        InterfacesParse[InterfacesDict["StateAdm"][0]] = "Dis"
+        if debug and nextFile == 0: pauseFunc("Input file parsed. Press any key proceed.\r\n")
 
-                                if len(sdpList) > 0:
-                                    sdpOutputLine = ""
-                                    for sdpLine in sdpList:
-                                        if sdpOutputLine != "":
-                                            sdpOutputLine = sdpOutputLine + ";"
-                                        
-                                        sdpOutputLine = sdpOutputLine + "id:"+str(sdpLine[0]) + "|type:"+str(sdpLine[1]) + "|state:"+str(sdpLine[2]) + "|next-hop:"+str(sdpLine[3]) + "|vc-id:"+str(sdpLine[4]) + "|keepalive:"+str(sdpLine[5])
+        NodesParse = [""] * len(NodesDict)
+        NodesParse[NodesDict["Hostname"][0]] = Hostname
+        NodesParse[NodesDict["CLISyntax"][0]] = CLISyntax
+        NodesParse[NodesDict["SysAddr"][0]] = SysAddr
+        NodesParse[NodesDict["SWDescr"][0]] = SWDescr
+        NodesParse[NodesDict["SourceFile"][0]] = str(os.path.split(showFilePath)[1])
 
-                                    InterfacesParse[InterfacesDict["ServiceSDP"][0]] = sdpOutputLine
+        return [showFilePath, nextFile, NodesParse, InterfacesParseAll, IfNumber, skipReason]
 
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-                                # Find L2 MTU parameters associated with current interface
-                                for obj10 in obj3.re_search_children(r"service-mtu"):
-                                    InterfacesParse[InterfacesDict["L2MTU"][0]] = obj10.text.split("service-mtu ")[1]
-                                    break
 
-                                # Find port/LAG associated with current interface
-                                InterfacesParse[InterfacesDict["PortBinding"][0]] = obj4.text.split("sap ")[1].split(" create")[0]
-                                if obj4.re_search(r":"):
-                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[0]
-                                    InterfacesParse[InterfacesDict["VLAN"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]].split(":")[1]
-                                    if obj4.re_search(r"\."):
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "qinq"
-                                    else:
-                                        InterfacesParse[InterfacesDict["Encap"][0]] = "dot1q"
-                                else:
-                                    InterfacesParse[InterfacesDict["Encap"][0]] = "Null"
-                                    InterfacesParse[InterfacesDict["PortName"][0]] = InterfacesParse[InterfacesDict["PortBinding"][0]]
-                                
-                                if obj4.re_search(r"lag"):
-                                    InterfacesParse[InterfacesDict["LAGID"][0]] = InterfacesParse[InterfacesDict["PortName"][0]].split("lag-")[1]
-                                
-                                InterfacesParse[InterfacesDict["ParentIfName"][0]] = InterfacesParse[InterfacesDict["PortName"][0]]
 
-                                # Find QoS input policy associated with current interface
-                                for obj6 in obj4.re_search_children(r"^ *ingress"):
-                                    for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                        if InterfacesParse[InterfacesDict["QoSIn"][0]] == "":
-                                            InterfacesParse[InterfacesDict["QoSIn"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                        else:
-                                            InterfacesParse[InterfacesDict["QoSIn"][0]] = InterfacesParse[InterfacesDict["QoSIn"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+#####################################################################################################################################################
+#########################################################       Parse worker function       #########################################################
+#####################################################################################################################################################
+def parseWorkerFunc(parseArgs):
+    # Wrapper used by parallel parsing jobs: isolates errors of every single file so one broken file does not stop the whole run
+    showFilePath,defaultCLISyntax,genClean,nativeEngine = parseArgs
+    try:
+        return parseFileFunc(showFilePath,defaultCLISyntax,genClean,nativeEngine)
+    except Exception as e:
+        logger.error("Could not parse file %s: %s: %s, skipping to the next file", showFilePath, type(e).__name__, e)
+        return [showFilePath, 1, [], [], 0, ["parseError", str(type(e).__name__)+": "+str(e)]]
 
-                                # Find QoS output policy associated with current interface
-                                for obj6 in obj4.re_search_children(r"^ *egress"):
-                                    for obj7 in obj6.re_search_children(r"(.*qos.*)|(.*remark.*)"):
-                                        if InterfacesParse[InterfacesDict["QoSOut"][0]] == "":
-                                            InterfacesParse[InterfacesDict["QoSOut"][0]] = obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
-                                        else:
-                                            InterfacesParse[InterfacesDict["QoSOut"][0]] = InterfacesParse[InterfacesDict["QoSOut"][0]] + "|" + obj7.text.lstrip().rstrip().split(" ")[1].replace("\"","")
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-                                # print(InterfacesParse)
-                                InterfacesParse = [element.rstrip().lstrip() for element in InterfacesParse]
-                                InterfacesParseAll.append(InterfacesParse)
 
 
+#####################################################################################################################################################
+#########################################################         DB write function         #########################################################
+#####################################################################################################################################################
+# Writes results of parseFileFunc for a single node into the DB
+def writeNodeFunc(outputDB,outputCursor,parseResult):
+    showFilePath, nextFile, NodesParse, InterfacesParseAll, IfNumber, skipReason = parseResult
+
+    # File was skipped before the node could be identified
+    if len(NodesParse) == 0: return
+
+    Hostname = NodesParse[NodesDict["Hostname"][0]]
+    CLISyntax = NodesParse[NodesDict["CLISyntax"][0]]
+    SysAddr = NodesParse[NodesDict["SysAddr"][0]]
+    SWDescr = NodesParse[NodesDict["SWDescr"][0]]
+
+    # Checking if the node already exists
+    DBQuery = SQLStatementFunc("SELECT", "Nodes", ["Hostname", "CLISyntax"], orderBy="LastUpdatedTime DESC")
+    DBParams = [str(Hostname), str(CLISyntax)]
+    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+    outputCursor.execute(DBQuery,DBParams)
+    DBResponse=outputCursor.fetchone()
+    if debugSQL: logger.debug("DBResponse: %s", DBResponse)
+
+    if DBResponse is None:
+        NodeID = str(uuid.uuid4())
+    else:
+        NodeID = DBResponse[NodesDict["NodeID"][0]]
 
-            if debug and nextFile == 0: input("Input file parsed. Press any key proceed.\r\n")
+    if DBResponse is None:
+        DBQuery = SQLStatementFunc("INSERT", "Nodes", setColumns=["NodeID", "Hostname", "CLISyntax", "SysAddr", "SWDescr", "SourceFile", "LastUpdatedTime", "LastUpdatedBy"])
+        DBParams = [str(NodeID), str(Hostname), str(CLISyntax), str(SysAddr), str(SWDescr), str(os.path.split(showFilePath)[1]), str(datetime.datetime.today()), str(getpass.getuser())]
+        if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+        if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
+    else:
+        if DBResponse[NodesDict["SysAddr"][0]] != SysAddr:
+            logger.info("Node system address changed to %s - updating.", SysAddr)
+            DBQuery = SQLStatementFunc("UPDATE", "Nodes", ["NodeID"], ["SysAddr", "LastUpdatedTime", "LastUpdatedBy"])
+            DBParams = [str(SysAddr), str(datetime.datetime.today()), str(getpass.getuser()), str(NodeID)]
+            if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+            if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
+        if DBResponse[NodesDict["SourceFile"][0]] != str(os.path.split(showFilePath)[1]):
+            logger.info("Node source file changed to %s - updating.", os.path.split(showFilePath)[1])
+            DBQuery = SQLStatementFunc("UPDATE", "Nodes", ["NodeID"], ["SourceFile", "LastUpdatedTime", "LastUpdatedBy"])
+            DBParams = [str(os.path.split(showFilePath)[1]), str(datetime.datetime.today()), str(getpass.getuser()), str(NodeID)]
+            if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+            if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
+        if DBResponse[NodesDict["SWDescr"][0]] != SWDescr:
+            logger.info("Node SW description changed to %s - updating.", SWDescr)
+            DBQuery = SQLStatementFunc("UPDATE", "Nodes", ["NodeID"], ["SWDescr", "LastUpdatedTime", "LastUpdatedBy"])
+            DBParams = [str(SWDescr), str(datetime.datetime.today()), str(getpass.getuser()), str(NodeID)]
+            if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+            if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
+    if debug: pauseFunc("Node updated in the database. Press any key proceed.\r\n")
+
+    IfNew = 0
+    IfUpdated = 0
+    IfKept = 0
+    IfDeleted = 0
+    IDMatched = set()
+    InterfacesInsertAll = []            # New interfaces to be inserted with a single executemany
+
+    for InterfacesParse in InterfacesParseAll:
+        InterfacesParse[InterfacesDict["NodeID"][0]] = NodeID
 
 #####################################################################################################################################################
 ###################################################       Add/Update all parsed info in the DB        ###############################################
 #####################################################################################################################################################
 
-            if nextFile == 0:
-   
-                # Getting all existing interfaces of this node from DB with relevant CLI Syntax
-                DBQuery="""SELECT * 
-                            FROM Interfaces"""+str(SyntaxDict[CLISyntax])+"""
-                            WHERE NodeID = '"""+str(NodeID)+"""' 
-                            ORDER BY LastUpdatedTime DESC
-                            """
-                if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
-                DBResponse=outputCursor.fetchall()
-                InterfacesDBAll=list(DBResponse)
-                #if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-
-                # Getting all existing peerings of this node from DB - TBD
-
-
-
-                # Getting all existing interfaces of this node from DB with other CLI Syntaxes
-                InterfacesDBOther = []
-                PeeringDBOther = []
-                InterfacesDBHist = []
-                PeeringDBHist = []
-                # Getting all data for all supported syntaxes from the DB
-                for value1 in SyntaxDict:
-                    # Getting all existing interfaces from the DB, except historical
-                    DBQuery="""SELECT * FROM Interfaces"""+str(SyntaxDict[value1])+""" WHERE Hostname = '"""+str(Hostname)+"""' ORDER BY LastUpdatedTime DESC\n"""
-                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                    outputCursor.execute(DBQuery)
-                    DBResponse=outputCursor.fetchall()
-                    if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-                    if value1 == "Hist":
-                        InterfacesDBHist = list(DBResponse)
-                    else:
-                        if value1 != CLISyntax:
-                            InterfacesDBOther.append(list(DBResponse))
+    if nextFile == 0:
+
+        # Getting all existing interfaces of this node from DB with relevant CLI Syntax
+        DBQuery = SQLStatementFunc("SELECT", "Interfaces"+str(SyntaxDict[CLISyntax]), ["NodeID"], orderBy="LastUpdatedTime DESC")
+        DBParams = [str(NodeID)]
+        if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+        outputCursor.execute(DBQuery,DBParams)
+        DBResponse=outputCursor.fetchall()
+        InterfacesDBAll=list(DBResponse)
+        #if debugSQL: print("debug: DBResponse: "+str(DBResponse))
+
+        # Indexing all stored interfaces by interface and service names, the most recently updated one is kept for duplicates
+        InterfacesDBDict = {}
+        for obj4 in InterfacesDBAll:
+            if (obj4[InterfacesDict["IfName"][0]], obj4[InterfacesDict["ServiceName"][0]]) not in InterfacesDBDict:
+                InterfacesDBDict[(obj4[InterfacesDict["IfName"][0]], obj4[InterfacesDict["ServiceName"][0]])] = obj4
+
+        # Getting all existing peerings of this node from DB - TBD
+
+
+
+        # Getting all existing interfaces of this node from DB with other CLI Syntaxes
+        InterfacesDBOther = []
+        PeeringDBOther = []
+        InterfacesDBHist = []
+        PeeringDBHist = []
+        # Getting all data for all supported syntaxes from the DB
+        for value1 in SyntaxDict:
+            # Getting all existing interfaces from the DB, except historical
+            DBQuery = SQLStatementFunc("SELECT", "Interfaces"+str(SyntaxDict[value1]), ["Hostname"], orderBy="LastUpdatedTime DESC")
+            DBParams = [str(Hostname)]
+            if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+            outputCursor.execute(DBQuery,DBParams)
+            DBResponse=outputCursor.fetchall()
+            if debugSQL: logger.debug("DBResponse: %s", DBResponse)
+            if value1 == "Hist":
+                InterfacesDBHist = list(DBResponse)
+            else:
+                if value1 != CLISyntax:
+                    InterfacesDBOther.append(list(DBResponse))
+
+            # Getting all existing peerings from the DB, except historical
+            DBQuery = SQLStatementFunc("SELECT", "Peering"+str(SyntaxDict[value1]), ["Hostname"], orderBy="LastUpdatedTime DESC")
+            DBParams = [str(Hostname)]
+            if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+            outputCursor.execute(DBQuery,DBParams)
+            DBResponse=outputCursor.fetchall()
+            if debugSQL: logger.debug("DBResponse: %s", DBResponse)
+            if value1 == "Hist":
+                PeeringDBHist = list(DBResponse)
+            else:
+                if value1 != CLISyntax:
+                    PeeringDBOther.append(list(DBResponse))
 
-                    # Getting all existing peerings from the DB, except historical
-                    DBQuery="""SELECT * FROM Peering"""+str(SyntaxDict[value1])+""" WHERE Hostname = '"""+str(Hostname)+"""' ORDER BY LastUpdatedTime DESC\n"""
-                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                    outputCursor.execute(DBQuery)
-                    DBResponse=outputCursor.fetchall()
-                    if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-                    if value1 == "Hist":
-                        PeeringDBHist = list(DBResponse)
-                    else:
-                        if value1 != CLISyntax:
-                            PeeringDBOther.append(list(DBResponse))
+            # Getting all existing routing from the DB - TBD
 
-                    # Getting all existing routing from the DB - TBD
 
+        # Define a lisy of updatable interface value IDs (not all need to be updated|overwritten)
+        UpdatableIDs = []
+        for value in InterfacesDict:
+            # if ((value != "IfID") and (value != "NodeID") and (value != "Hostname") and (value != "CLISyntax") and (value != "Comments") and (value != "LastUpdatedTime") and (value != "LastUpdatedBy")):
+            if ((value != "IfID") and (value != "LastUpdatedTime") and (value != "LastUpdatedBy")):
+                UpdatableIDs.append(value)
 
-                # Go through all interfaces parsed from file
-                for obj3 in InterfacesParseAll:
-                    
-                    match = 0
-                    if InterfacesDBAll is not None:
-
-                        # Go through all interfaces stored in a DB
-                        for obj4 in InterfacesDBAll:
-
-                            # Find if parsed interface name matches any stored in DB
-                            if ((obj4[InterfacesDict["IfName"][0]] == obj3[InterfacesDict["IfName"][0]]) and (obj4[InterfacesDict["ServiceName"][0]] == obj3[InterfacesDict["ServiceName"][0]])):
-                                match = 1
-                                IDMatched.append(str(obj4[InterfacesDict["IfID"][0]]))
-
-                                # Define a lisy of updatable interface value IDs (not all need to be updated|overwritten)
-                                UpdatableIDs = []
-                                for value in InterfacesDict:
-                                    # if ((value != "IfID") and (value != "NodeID") and (value != "Hostname") and (value != "CLISyntax") and (value != "Comments") and (value != "LastUpdatedTime") and (value != "LastUpdatedBy")):
-                                    if ((value != "IfID") and (value != "LastUpdatedTime") and (value != "LastUpdatedBy")):
-                                        UpdatableIDs.append(value)
-
-                                # Compare and update all values for this interface in DB (except IfID)
-                                DBQuery="""UPDATE Interfaces"""+str(SyntaxDict[CLISyntax])+"""
-                                                        SET"""
-                                equal = 1
-                                
-                                for value2 in UpdatableIDs:
-                                    if (obj4[InterfacesDict[value2][0]] != obj3[InterfacesDict[value2][0]]):
-                                        equal = 0
-                                        DBQuery = DBQuery + "                                            "
-                                        DBQuery = DBQuery + value2 + """ = '"""+str(obj3[InterfacesDict[value2][0]])+"""',\n"""
-                                        print("Interface "+str(obj4[InterfacesDict["IfName"][0]])+" value "+str(value2)+" changed to "+str(obj3[InterfacesDict[value2][0]]))
-                                
-                                DBQuery = DBQuery + "                                            LastUpdatedTime = '"""+str(datetime.datetime.today())+"""',
-                                            LastUpdatedBy = '"""+str(getpass.getuser())+"""'
-                                        WHERE
-                                            IfID = '"""+obj4[InterfacesDict["IfID"][0]]+"""'
-                                            """
-                                # Sending SQL query to update changed interface values 
-                                if equal == 0:
-                                    IfUpdated = IfUpdated + 1
-                                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                                    if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                                    outputDB.commit()
-
-                                    # Move old values to historical table
-                                    obj4 = list(obj4)
-                                    obj4[InterfacesDict["LastUpdatedTime"][0]] = datetime.datetime.today()
-                                    obj4[InterfacesDict["LastUpdatedBy"][0]] = getpass.getuser()
-
-                                    DBQuery="""INSERT INTO Interfaces"""+str(SyntaxDict["Hist"])+""" (\n"""
-
-                                    i = 1
-                                    for value3 in InterfacesDict:
-                                        DBQuery = DBQuery + "                                            "
-                                        if i < len(InterfacesDict):
-                                            DBQuery = DBQuery + value3 + ",\n"
-                                        else:
-                                            DBQuery = DBQuery + value3 + "\n"
-                                        i = i + 1
-                                    
-                                    DBQuery = DBQuery + """                                                ) 
-                                                            VALUES (\n"""
-
-                                    i = 1
-                                    for value3 in InterfacesDict:
-                                        DBQuery = DBQuery + "                                            "
-                                        if i < len(InterfacesDict):
-                                            DBQuery = DBQuery + "'"+str(obj4[InterfacesDict[value3][0]])+"',\n"
-                                        else:
-                                            DBQuery = DBQuery + "'"+str(obj4[InterfacesDict[value3][0]])+"'\n"
-                                        i = i + 1
-                                    
-                                    DBQuery = DBQuery + """                                                )\n"""
+        # Go through all interfaces parsed from file
+        for obj3 in InterfacesParseAll:
+            
+            match = 0
+            # Find if parsed interface name matches any stored in DB
+            obj4 = InterfacesDBDict.get((obj3[InterfacesDict["IfName"][0]], obj3[InterfacesDict["ServiceName"][0]]))
+            if obj4 is not None:
+                match = 1
+                IDMatched.add(str(obj4[InterfacesDict["IfID"][0]]))
+
+                # Compare and update all values for this interface in DB (except IfID)
+                UpdatedColumns = []
+                DBParams = []
+                equal = 1
+                
+                for value2 in UpdatableIDs:
+                    if (obj4[InterfacesDict[value2][0]] != obj3[InterfacesDict[value2][0]]):
+                        equal = 0
+                        UpdatedColumns.append(value2)
+                        DBParams.append(str(obj3[InterfacesDict[value2][0]]))
+                        logger.info("Interface %s value %s changed to %s", obj4[InterfacesDict["IfName"][0]], value2, obj3[InterfacesDict[value2][0]])
+                
+                # Sending SQL query to update changed interface values 
+                if equal == 0:
+                    IfUpdated = IfUpdated + 1
+                    DBQuery = SQLStatementFunc("UPDATE", "Interfaces"+str(SyntaxDict[CLISyntax]), ["IfID"], UpdatedColumns + ["LastUpdatedTime", "LastUpdatedBy"])
+                    DBParams = DBParams + [str(datetime.datetime.today()), str(getpass.getuser()), str(obj4[InterfacesDict["IfID"][0]])]
+                    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+                    if not DBUpdateDisable: outputCursor.execute(DBQuery,DBParams)
+
+                    # Move old values to historical table
+                    obj4 = list(obj4)
+                    obj4[InterfacesDict["LastUpdatedTime"][0]] = datetime.datetime.today()
+                    obj4[InterfacesDict["LastUpdatedBy"][0]] = getpass.getuser()
+
+                    DBQuery = SQLStatementFunc("INSERT", "Interfaces"+str(SyntaxDict["Hist"]))
+                    DBParams = [str(obj4[InterfacesDict[value3][0]]) for value3 in InterfacesDict]
+
+                    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+                    #outputCursor.execute(DBQuery,DBParams)
+                    #outputDB.commit()
 
-                                    if debugSQL: print("debug: "+str(DBQuery))
-                                    #outputCursor.execute(DBQuery)
-                                    #outputDB.commit()
+                else:
+                    IfKept = IfKept + 1
+                    if debug: logger.debug("Interface %s found in DB, no update needed", obj3[InterfacesDict["IfName"][0]])
 
+            
+            # Adding interface to DB if it was not found there previously
+            if match == 0:
+                if debug: logger.debug("Interface %s not found in DB - creating", obj3[InterfacesDict["IfName"][0]])
+                IfNew = IfNew + 1
+
+                # Check if the same L3 interface is already created for another syntax
+                # print(len(InterfacesDBOther))
+                if InterfacesDBOther is not None:
+                    for table in InterfacesDBOther:
+                        # print(table)
+                        for obj10 in table:
+                            # Check if interface has matching IPv4/v6 adresses
+                            if ( ( (obj3[InterfacesDict["IPV4Addr"][0]] != "") and (obj3[InterfacesDict["IPV4Addr"][0]] == obj10[InterfacesDict["IPV4Addr"][0]]) ) or ( (obj3[InterfacesDict["IPV6Addr"][0]] != "") and (obj3[InterfacesDict["IPV6Addr"][0]] == obj10[InterfacesDict["IPV6Addr"][0]]) ) ):
+                                if ( (obj3[InterfacesDict["ServiceName"][0]] != "") and (obj10[InterfacesDict["ServiceName"][0]] != "") ):
+                                    serviceListSrc = obj3[InterfacesDict["ServiceName"][0]].split("|")
+                                    serviceListDst = obj10[InterfacesDict["ServiceName"][0]].split("|")
+
+                                    # Check if interface has matching services
+                                    for service in serviceListSrc:
+                                        if service in serviceListDst:
+                                            obj3[InterfacesDict["IfID"][0]] = obj10[InterfacesDict["IfID"][0]]
+                                            if debug: logger.debug("Interface found for another syntax, creating new record in DB Interfaces%s with previously used id: %s", SyntaxDict[CLISyntax], obj3[InterfacesDict["IfID"][0]])
+                                            break
                                 else:
-                                    IfKept = IfKept + 1
-                                    if debug: print("debug: Interface "+str(obj3[InterfacesDict["IfName"][0]])+" found in DB, no update needed")
-
-                                break
-                    
-                    # Adding interface to DB if it was not found there previously
-                    if match == 0:
-                        if debug: print("debug: Interface "+str(obj3[InterfacesDict["IfName"][0]])+" not found in DB - creating")
-                        IfNew = IfNew + 1
-
-                        # Check if the same L3 interface is already created for another syntax
-                        # print(len(InterfacesDBOther))
-                        if InterfacesDBOther is not None:
-                            for table in InterfacesDBOther:
-                                # print(table)
-                                for obj10 in table:
-                                    # Check if interface has matching IPv4/v6 adresses
-                                    if ( ( (obj3[InterfacesDict["IPV4Addr"][0]] != "") and (obj3[InterfacesDict["IPV4Addr"][0]] == obj10[InterfacesDict["IPV4Addr"][0]]) ) or ( (obj3[InterfacesDict["IPV6Addr"][0]] != "") and (obj3[InterfacesDict["IPV6Addr"][0]] == obj10[InterfacesDict["IPV6Addr"][0]]) ) ):
-                                        if ( (obj3[InterfacesDict["ServiceName"][0]] != "") and (obj10[InterfacesDict["ServiceName"][0]] != "") ):
-                                            serviceListSrc = obj3[InterfacesDict["ServiceName"][0]].split("|")
-                                            serviceListDst = obj10[InterfacesDict["ServiceName"][0]].split("|")
-
-                                            # Check if interface has matching services
-                                            for service in serviceListSrc:
-                                                if service in serviceListDst:
-                                                    obj3[InterfacesDict["IfID"][0]] = obj10[InterfacesDict["IfID"][0]]
-                                                    if debug: print("debug: Interface found for another syntax, creating new record in DB Interfaces"+str(SyntaxDict[CLISyntax])+" with previously used id: "+str(obj3[InterfacesDict["IfID"][0]]))
-                                                    break
-                                        else:
-                                            if ( (obj3[InterfacesDict["ServiceName"][0]] == "") and (obj10[InterfacesDict["ServiceName"][0]] == "") ):
-                                                obj3[InterfacesDict["IfID"][0]] = obj10[InterfacesDict["IfID"][0]]
-                                                if debug: print("debug: Interface found for another syntax, creating new record in DB Interfaces"+str(SyntaxDict[CLISyntax])+" with previously used id: "+str(obj3[InterfacesDict["IfID"][0]]))
-                                                break
-                        
-                        # Check if the same interface was previously deleted
-                        # print(len(InterfacesDBHist))
-                        if obj3[InterfacesDict["IfID"][0]] == "":
-                            if InterfacesDBHist is not None:
-                                for obj11 in InterfacesDBHist:
-                                    # print(obj11)
-                                    if ((obj3[InterfacesDict["IfName"][0]] != "" ) and (obj3[InterfacesDict["IfName"][0]] == obj11[InterfacesDict["IfName"][0]])):
-                                        obj3[InterfacesDict["IfID"][0]] = obj11[InterfacesDict["IfID"][0]]
-                                        if debug: print("debug: Interface found from last historical record, creating new record in DB Interfaces"+str(SyntaxDict[CLISyntax])+" with previously used id: "+str(obj3[InterfacesDict["IfID"][0]]))
+                                    if ( (obj3[InterfacesDict["ServiceName"][0]] == "") and (obj10[InterfacesDict["ServiceName"][0]] == "") ):
+                                        obj3[InterfacesDict["IfID"][0]] = obj10[InterfacesDict["IfID"][0]]
+                                        if debug: logger.debug("Interface found for another syntax, creating new record in DB Interfaces%s with previously used id: %s", SyntaxDict[CLISyntax], obj3[InterfacesDict["IfID"][0]])
                                         break
-                        
-                        # Check if ID is already present in the DB to prevent a conflict
+                
+                # Check if the same interface was previously deleted
+                # print(len(InterfacesDBHist))
+                if obj3[InterfacesDict["IfID"][0]] == "":
+                    if InterfacesDBHist is not None:
+                        for obj11 in InterfacesDBHist:
+                            # print(obj11)
+                            if ((obj3[InterfacesDict["IfName"][0]] != "" ) and (obj3[InterfacesDict["IfName"][0]] == obj11[InterfacesDict["IfName"][0]])):
+                                obj3[InterfacesDict["IfID"][0]] = obj11[InterfacesDict["IfID"][0]]
+                                if debug: logger.debug("Interface found from last historical record, creating new record in DB Interfaces%s with previously used id: %s", SyntaxDict[CLISyntax], obj3[InterfacesDict["IfID"][0]])
+                                break
+                
+                # Since no other options worked we generate a new ID for the interface
+                if obj3[InterfacesDict["IfID"][0]] == "":
+                    obj3[InterfacesDict["IfID"][0]] = str(uuid.uuid4())
+                    if debug: logger.debug("Interface is not found in other tables, creating new record in DB Interfaces%s with a new random id: %s", SyntaxDict[CLISyntax], obj3[InterfacesDict["IfID"][0]])
+
+                obj3[InterfacesDict["LastUpdatedTime"][0]] = str(datetime.datetime.today())
+                obj3[InterfacesDict["LastUpdatedBy"][0]] = str(getpass.getuser())
+                InterfacesInsertAll.append([str(obj3[InterfacesDict[value3][0]]) for value3 in InterfacesDict])
+
+        # Inserting all new interfaces at once, uniqueness of IDs is enforced by the primary key of the table
+        if len(InterfacesInsertAll) > 0:
+            DBQuery = SQLStatementFunc("INSERT", "Interfaces"+str(SyntaxDict[CLISyntax]))
+            if debugSQL: logger.debug("DBQuery: %s x %s", DBQuery, len(InterfacesInsertAll))
+            if not DBUpdateDisable:
+                outputCursor.execute("SAVEPOINT InterfacesInsert")
+                try:
+                    outputCursor.executemany(DBQuery,InterfacesInsertAll)
+                except sqlite3.IntegrityError:
+                    # Some reused ID is already taken, inserting interfaces one by one. The new interface keeps the reused ID (it links the interface
+                    # to the same one of another syntax or history), and the interface already holding this ID gets a new random ID instead
+                    outputCursor.execute("ROLLBACK TO InterfacesInsert")
+                    DBQueryUpdate = SQLStatementFunc("UPDATE", "Interfaces"+str(SyntaxDict[CLISyntax]), ["IfID"], ["IfID", "LastUpdatedTime", "LastUpdatedBy"])
+                    for obj3 in InterfacesInsertAll:
                         conflict = 1
                         while conflict == 1:
-                            DBQuery="""SELECT * FROM Interfaces"""+str(SyntaxDict[CLISyntax])+""" WHERE IfID = '"""+str(obj3[InterfacesDict["IfID"][0]])+"""'\n"""
-                            if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                            outputCursor.execute(DBQuery)
-                            DBResponse=outputCursor.fetchall()
-                            if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-
-                            # No conflicts found
-                            if len(DBResponse) == 0:
+                            try:
+                                outputCursor.execute(DBQuery,obj3)
                                 conflict = 0
-                            else:
+                            except sqlite3.IntegrityError:
+                                oldID = obj3[InterfacesDict["IfID"][0]]
                                 newID = str(uuid.uuid4())
-                                # Check if ID is already present in the DB to prevent a potential conflict
-                                conflict2 = 1
-                                while conflict2 == 1:
-                                    DBQuery="""SELECT * FROM Interfaces"""+str(SyntaxDict[CLISyntax])+""" WHERE IfID = '"""+str(newID)+"""'\n"""
-                                    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                                    outputCursor.execute(DBQuery)
-                                    DBResponse2=outputCursor.fetchall()
-                                    if debugSQL: print("debug: DBResponse: "+str(DBResponse2))
-
-                                    # No conflicts found
-                                    if len(DBResponse2) == 0:
-                                        conflict2 = 0
-                                        break
-                                    else:
-                                        newID = str(uuid.uuid4())
-                                
-                                # print(DBResponse)
-                                if debug: print("debug: Generated ID conflicts with interface " + DBResponse[0][InterfacesDict["IfName"][0]] + ", creating a new random id for it: "+str(newID))
-
-                                DBQuery="""UPDATE Interfaces"""+str(SyntaxDict[CLISyntax])+"""
-                                                        SET"""
-                                DBQuery = DBQuery + "                                            "
-                                DBQuery = DBQuery + """ IfID = '"""+str(newID)+"""',\n"""
-                                DBQuery = DBQuery + "                                            LastUpdatedTime = '"""+str(datetime.datetime.today())+"""',
-                                    LastUpdatedBy = '"""+str(getpass.getuser())+"""'
-                                WHERE
-                                    IfID = '"""+str(obj3[InterfacesDict["IfID"][0]])+"""'
-                                    """
-                                if debugSQL: print("debug: "+str(DBQuery))
-                                if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                                outputDB.commit()
-
-                                # Since we had to change ID of the existing interface we also need to updated it in matched list to not delete this interface if it is existing
-                                if str(obj3[InterfacesDict["IfID"][0]]) in IDMatched:
-                                    IDMatched[IDMatched.index(str(obj3[InterfacesDict["IfID"][0]]))] = str(newID)
-
-                        # Since no other options worked we generate a new ID for the interface
-                        if obj3[InterfacesDict["IfID"][0]] == "":
-                            obj3[InterfacesDict["IfID"][0]] = str(uuid.uuid4())
-                            if debug: print("debug: Interface is not found in other tables, creating new record in DB Interfaces"+str(SyntaxDict[CLISyntax])+" with a new random id: "+str(obj3[InterfacesDict["IfID"][0]]))
-
-                            # Check if ID is already present in the DB to prevent a potential conflict
-                            conflict = 1
-                            while conflict == 1:
-                                DBQuery="""SELECT * FROM Interfaces"""+str(SyntaxDict[CLISyntax])+""" WHERE IfID = '"""+str(obj3[InterfacesDict["IfID"][0]])+"""'\n"""
-                                if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                                outputCursor.execute(DBQuery)
-                                DBResponse=outputCursor.fetchall()
-                                if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-
-                                # No conflicts found
-                                if len(DBResponse) == 0:
-                                    conflict = 0
-                                    break
-                                else:
-                                    obj3[InterfacesDict["IfID"][0]] = str(uuid.uuid4())
-                                    if debug: print("debug: Generated ID conflicts with another one in the database, creating a new random id: "+str(obj3[InterfacesDict["IfID"][0]]))
+                                DBParams = [newID, str(datetime.datetime.today()), str(getpass.getuser()), oldID]
+                                if debugSQL: logger.debug("DBQuery: %s %s", DBQueryUpdate, DBParams)
+                                try:
+                                    outputCursor.execute(DBQueryUpdate,DBParams)
+                                except sqlite3.IntegrityError:
+                                    # New random ID is taken as well, trying another one
+                                    continue
+                                logger.warning("ID %s reused for interface %s is taken by another interface in the database, changing its id to %s", oldID, obj3[InterfacesDict["IfName"][0]], newID)
+
+                                # Since ID of the existing interface is changed it is also updated in matched IDs, so the interface is not deleted
+                                if oldID in IDMatched:
+                                    IDMatched.discard(oldID)
+                                    IDMatched.add(newID)
+                        IDMatched.add(obj3[InterfacesDict["IfID"][0]])
+                outputCursor.execute("RELEASE InterfacesInsert")
+            IDMatched.update([obj3[InterfacesDict["IfID"][0]] for obj3 in InterfacesInsertAll])
+           
+        if debug: pauseFunc("Existing interfaces are updated in the database. Press any key proceed.\r\n")
 
 
-                        obj3[InterfacesDict["LastUpdatedTime"][0]] = str(datetime.datetime.today())
-                        obj3[InterfacesDict["LastUpdatedBy"][0]] = str(getpass.getuser())
-                        IDMatched.append(obj3[InterfacesDict["IfID"][0]])
+#####################################################################################################################################################
+###########################################       Remove all not found interfaces from the DB         ###############################################
+#####################################################################################################################################################
 
-                        DBQuery="""INSERT INTO Interfaces"""+str(SyntaxDict[CLISyntax])+""" (\n"""
-                        
-                        i = 1
-                        for value3 in InterfacesDict:
-                            DBQuery = DBQuery + "                                            "
-                            if i < len(InterfacesDict):
-                                DBQuery = DBQuery + value3 + ",\n"
-                            else:
-                                DBQuery = DBQuery + value3 + "\n"
-                            i = i + 1
-                        
-                        DBQuery = DBQuery + """                                            ) 
-                                            VALUES (\n"""
-
-                        i = 1
-                        for value3 in InterfacesDict:
-                            DBQuery = DBQuery + "                                            "
-                            if i < len(InterfacesDict):
-                                DBQuery = DBQuery + "'"+str(obj3[InterfacesDict[value3][0]])+"',\n"
-                            else:
-                                DBQuery = DBQuery + "'"+str(obj3[InterfacesDict[value3][0]])+"'\n"
-                            i = i + 1
+        # Getting all existing interfaces of this node from DB with relevant CLI Syntax
+        DBQuery = SQLStatementFunc("SELECT", "Interfaces"+str(SyntaxDict[CLISyntax]), ["NodeID"], orderBy="LastUpdatedTime DESC")
+        DBParams = [str(NodeID)]
+        if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+        outputCursor.execute(DBQuery,DBParams)
+        DBResponse=outputCursor.fetchall()
+        InterfacesDBAll=list(DBResponse)
 
-                        DBQuery = DBQuery + """                                                )\n"""
+        # Deleteng all the interfaces in DB that were not found in parsed values and moving then to historical DB
+        if InterfacesDBAll is not None:
+            InterfacesDeleteAll = []
+            InterfacesHistAll = []
+            # Interfaces stored in DB but not matched with any parsed one
+            IDDeleted = set(obj3[InterfacesDict["IfID"][0]] for obj3 in InterfacesDBAll) - IDMatched
+            for obj3 in InterfacesDBAll:
+                if obj3[InterfacesDict["IfID"][0]] in IDDeleted:
+                    if debug: logger.debug("Interface %s not found in parsed files, moving it to historical table", obj3[InterfacesDict["IfName"][0]])
+                    IfDeleted = IfDeleted + 1
+                    InterfacesDeleteAll.append([obj3[InterfacesDict["IfID"][0]]])
 
-                        if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                        if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                        outputDB.commit()
-                   
-                if debug: input("Existing interfaces are updated in the database. Press any key proceed.\r\n")
+                    obj3 = list(obj3)
+
+                    obj3[InterfacesDict["LastUpdatedTime"][0]] = str(datetime.datetime.today())
+                    obj3[InterfacesDict["LastUpdatedBy"][0]] = str(getpass.getuser())
+
+                    InterfacesHistAll.append([str(obj3[InterfacesDict[value3][0]]) for value3 in InterfacesDict])
 
+            # Deleting all not found interfaces and moving them to historical table at once
+            if len(InterfacesDeleteAll) > 0:
+                DBQuery = SQLStatementFunc("DELETE", "Interfaces"+str(SyntaxDict[CLISyntax]), ["IfID"])
+                if debugSQL: logger.debug("DBQuery: %s x %s", DBQuery, len(InterfacesDeleteAll))
+                if not DBUpdateDisable: outputCursor.executemany(DBQuery,InterfacesDeleteAll)
+
+                DBQuery = SQLStatementFunc("INSERT", "Interfaces"+str(SyntaxDict["Hist"]))
+                if debugSQL: logger.debug("DBQuery: %s x %s", DBQuery, len(InterfacesHistAll))
+                if not DBUpdateDisable: outputCursor.executemany(DBQuery,InterfacesHistAll)
+
+            logger.info("Total %s interfaces found from parsing. Total %s are already in database: %s new, %s updated, %s are up to date, %s deleted", IfNumber, len(InterfacesDBAll), IfNew, IfUpdated, IfKept, IfDeleted)
+            # if debug: print("debug: IfIDs matched "+str(IDMatched))
+
+        if debug: pauseFunc("Non-existing interfaces are deleted from the database. Press any key proceed.\r\n")
 
 #####################################################################################################################################################
-###########################################       Remove all not found interfaces from the DB         ###############################################
+#####################################################################################################################################################
 #####################################################################################################################################################
 
-                # Getting all existing interfaces of this node from DB with relevant CLI Syntax
-                DBQuery="""SELECT * 
-                            FROM Interfaces"""+str(SyntaxDict[CLISyntax])+"""
-                            WHERE NodeID = '"""+str(NodeID)+"""' 
-                            ORDER BY LastUpdatedTime DESC
-                            """
-                if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
-                DBResponse=outputCursor.fetchall()
-                InterfacesDBAll=list(DBResponse)
-
-                # Deleteng all the interfaces in DB that were not found in parsed values and moving then to historical DB
-                if InterfacesDBAll is not None:
-                    for obj3 in InterfacesDBAll:
-                        match = 0
-                        # if debug: print("debug: Checking interface <"+str(obj3[4])+"> / port <"+str(obj3[8])+">")
-                        for obj4 in IDMatched:
-                            if obj3[InterfacesDict["IfID"][0]] == obj4:
-                                match = 1
-                                break
-                        
-                        if  match == 0:
-                            if debug: print("debug: Interface "+str(obj3[InterfacesDict["IfName"][0]])+" not found in parsed files, moving it to historical table")
-                            IfDeleted = IfDeleted + 1
-                            DBQuery="""DELETE FROM Interfaces"""+str(SyntaxDict[CLISyntax])+"""
-                                        WHERE 
-                                            IfID = '"""+obj3[InterfacesDict["IfID"][0]]+"""'
-                                            """
-                            if debugSQL: print("debug: "+str(DBQuery))
-                            if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                            outputDB.commit()
-
-                            obj3 = list(obj3)
-
-                            obj3[InterfacesDict["LastUpdatedTime"][0]] = str(datetime.datetime.today())
-                            obj3[InterfacesDict["LastUpdatedBy"][0]] = str(getpass.getuser())
-
-                            DBQuery="""INSERT INTO Interfaces"""+str(SyntaxDict["Hist"])+""" (\n"""
-
-                            i = 1
-                            for value3 in InterfacesDict:
-                                DBQuery = DBQuery + "                                            "
-                                if i < len(InterfacesDict):
-                                    DBQuery = DBQuery + value3 + ",\n"
-                                else:
-                                    DBQuery = DBQuery + value3 + "\n"
-                                i = i + 1
-                            
-                            DBQuery = DBQuery + """                                                ) 
-                                                    VALUES (\n"""
-
-                            i = 1
-                            for value3 in InterfacesDict:
-                                DBQuery = DBQuery + "                                            "
-                                if i < len(InterfacesDict):
-                                    DBQuery = DBQuery + "'"+str(obj3[InterfacesDict[value3][0]])+"',\n"
-                                else:
-                                    DBQuery = DBQuery + "'"+str(obj3[InterfacesDict[value3][0]])+"'\n"
-                                i = i + 1
 
-                            DBQuery = DBQuery + """                                                )\n"""
 
-                            if debugSQL: print("debug: "+str(DBQuery))
-                            if not DBUpdateDisable: outputCursor.execute(DBQuery)
-                            outputDB.commit()
 
-                    print("Total "+str(IfNumber)+" interfaces found from parsing. Total "+str(len(InterfacesDBAll))+" are already in database: "+str(IfNew)+" new, "+str(IfUpdated)+" updated, "+str(IfKept)+" are up to date, "+str(IfDeleted)+" deleted")
-                    # if debug: print("debug: IfIDs matched "+str(IDMatched))
 
-                if debug: input("Non-existing interfaces are deleted from the database. Press any key proceed.\r\n")
 
-    outputDB.close()
+
+
+
 
 #####################################################################################################################################################
+#########################################################        Interfaces formulas        #########################################################
 #####################################################################################################################################################
-#####################################################################################################################################################
-
+# Columns which are compared between source and destination interfaces on InterfacesComparison sheet have an additional "Match" column
+comparisonExcludedList = ["NodeID", "IfID", "CLISyntax", "IfNumber", "ParentIfName", "IfName", "PortName", "SFPSN", "TxLevel", "RxLevel", "BridgeID",
+                          "ServiceID", "PortBinding", "ServiceDescr", "ServiceSDP", "CDP", "Comments", "LastUpdatedTime", "LastUpdatedBy"]
+comparisonIndexes = set(InterfacesDict[value][0] for value in InterfacesDict if value not in comparisonExcludedList)
+
+# Formulas are built once as templates with "{0}" in place of the excel row number, so every row only substitutes its number into them instead of
+# building cell references again for every cell.
+
+# Builds formula templates of the middle columns of InterfacesData sheet (contains formulas for comparison|matching between source and destination)
+@functools.lru_cache(maxsize=None)
+def interfacesFormulasTemplateFunc(midHdrLenght):
+    # Create formula, checking if interface is migrated to destination config
+    Cell1Src = xlsxwriter.utility.xl_col_to_name(InterfacesDict["IfName"][0]) + "{0}"  # Contains source IfID excel cell
+    Cell1Dst = xlsxwriter.utility.xl_col_to_name(InterfacesDict["IfName"][0]+midHdrLenght+len(InterfacesDict)) + "{0}"     # Contains destination IfID excel cell
+    IfMigratedFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),\"Yes\",\"No\")")
+    Cell2List = []   # Contains source and destination interfaces excel cells to be compared
+    for value in InterfacesDict:
+        # Exclude cells that are useless in comparison, IfID is compared here unlike in the per-value comparison formulas
+        if ((value not in comparisonExcludedList) or (value == "IfID")):
+            Cell2Src = xlsxwriter.utility.xl_col_to_name(InterfacesDict[value][0]) + "{0}"
+            Cell2Dst = xlsxwriter.utility.xl_col_to_name(InterfacesDict[value][0]+midHdrLenght+len(InterfacesDict)) + "{0}"
+            Cell2List.append([Cell2Src,Cell2Dst])
+
+    DiffSrcFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),CONCATENATE(")
+    DiffDstFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),CONCATENATE(")
+    j = 0
+    for cellPair in Cell2List:
+        if j < (len(Cell2List)-1):
+            DiffSrcFromula = DiffSrcFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[0]+",\"#\")),")
+            DiffDstFromula = DiffDstFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[1]+",\"#\")),")
+        else:
+            DiffSrcFromula = DiffSrcFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[0]+",\"#\"))")
+            DiffDstFromula = DiffDstFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[1]+",\"#\"))")
+        j = j + 1
 
+    DiffSrcFromula = DiffSrcFromula + str("),\"\")")
+    DiffDstFromula = DiffDstFromula + str("),\"\")")
 
+    return (IfMigratedFromula, DiffSrcFromula, DiffDstFromula)
 
+# Builds formula template of the "Match" column of InterfacesComparison sheet for source and destination values written in the given column
+@functools.lru_cache(maxsize=None)
+def comparisonFormulaTemplateFunc(valueNumber):
+    Cell3Src = xlsxwriter.utility.xl_col_to_name(valueNumber) + "{0}"  # Contains source IfID excel cell
+    Cell3Dst = xlsxwriter.utility.xl_col_to_name(valueNumber+1) + "{0}"     # Contains destination IfID excel cell
+    return str("=IF(AND("+Cell3Src+"<>\"\","+Cell3Dst+"<>\"\"),IF(EXACT("+Cell3Src+","+Cell3Dst+"),\"\",\"Not match\"),IF(OR("+Cell3Src+"<>\"\","+Cell3Dst+"<>\"\"),\"Missing\",\"\"))")
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
 
 
+#####################################################################################################################################################
+#########################################################         DB rows streaming         #########################################################
+#####################################################################################################################################################
+# Iterates over the rows returned by a DB query, fetching them in chunks of outputChunkSize rows, so large tables are never loaded in memory at once.
+# Each query needs its own cursor while its rows are iterated.
+def DBRowsFunc(DBCursor, DBQuery, DBParams=()):
+    if debugSQL: logger.debug("DBQuery: %s %s", DBQuery, DBParams)
+    DBCursor.execute(DBQuery, DBParams)
+    while True:
+        DBResponse = DBCursor.fetchmany(outputChunkSize)
+        if len(DBResponse) == 0:
+            break
+        for DBRow in DBResponse:
+            yield DBRow
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
 
 
 #####################################################################################################################################################
-###########################################################       Output function         ###########################################################
+#########################################################           Output filters          #########################################################
+#####################################################################################################################################################
+# Output filters selected with "--host", "--syntax", "--if-type", "--since" and "--until" arguments are kept in a dictionary with "Hostname",
+# "CLISyntax", "IfType", "Since" and "Until" keys, empty values are not applied. Filters are translated into WHERE conditions of the DB queries,
+# so only matching rows are read from the DB (using indexes on the filtered columns).
+
+# Builds conditions of output filters applicable to the table (Nodes, InterfacesN or PeeringN) as [conditions, parameters], column names are
+# prefixed with the table alias if specified. CLISyntax filter selects source data only, the target syntax data is kept as the destination.
+# Interfaces and peering tables of other syntaxes are not filtered by CLISyntax, they are skipped as a whole (see outputSyntaxFunc).
+def outputFilterFunc(table, outputFilter, targSyntax, tableAlias=""):
+    conditions = []
+    DBParams = []
+    columnPrefix = ""
+    if tableAlias != "":
+        columnPrefix = tableAlias + "."
+
+    if outputFilter["Hostname"] != "":
+        conditions.append(columnPrefix + "Hostname GLOB ?")
+        DBParams.append(outputFilter["Hostname"])
+    if outputFilter["CLISyntax"] != "":
+        if table == "Nodes":
+            if targSyntax != "":
+                conditions.append(columnPrefix + "CLISyntax IN (?, ?)")
+                DBParams.extend([outputFilter["CLISyntax"], targSyntax])
+            else:
+                conditions.append(columnPrefix + "CLISyntax = ?")
+                DBParams.append(outputFilter["CLISyntax"])
+        elif table in ["Interfaces"+str(SyntaxDict["Hist"]), "Peering"+str(SyntaxDict["Hist"])]:
+            conditions.append(columnPrefix + "CLISyntax = ?")
+            DBParams.append(outputFilter["CLISyntax"])
+    if (outputFilter["IfType"] != "") and re.match(r"^Interfaces", table):
+        # Interface type may be followed by the service type, e.g. "Port|L3"
+        conditions.append("(" + columnPrefix + "IfType = ? OR " + columnPrefix + "IfType GLOB ?)")
+        DBParams.extend([outputFilter["IfType"], outputFilter["IfType"] + "|*"])
+    if outputFilter["Since"] != "":
+        conditions.append(columnPrefix + "LastUpdatedTime >= ?")
+        DBParams.append(outputFilter["Since"])
+    if outputFilter["Until"] != "":
+        conditions.append(columnPrefix + "LastUpdatedTime < ?")
+        DBParams.append(outputFilter["Until"])
+
+    return [conditions, DBParams]
+
+# Checks if interfaces and peering tables of the CLI syntax are written to output. Every such table holds data of a single syntax, so CLISyntax filter
+# selects the tables of the filtered syntax (and of the target syntax as the destination) instead of adding a condition to their queries.
+def outputSyntaxFunc(CLISyntax, outputFilter, targSyntax):
+    return (outputFilter["CLISyntax"] == "") or (CLISyntax == outputFilter["CLISyntax"]) or (CLISyntax == targSyntax)
+
+# Builds SELECT query of all table rows matching output filters as [query, parameters]
+def outputSelectFunc(table, outputFilter, targSyntax, orderBy):
+    conditions, DBParams = outputFilterFunc(table, outputFilter, targSyntax)
+    DBQuery = "SELECT * FROM " + table
+    if len(conditions) > 0:
+        DBQuery = DBQuery + " WHERE " + " AND ".join(conditions)
+    DBQuery = DBQuery + " ORDER BY " + outputOrderByFunc(orderBy, conditions)
+    return [DBQuery, DBParams]
+
+# Builds ORDER BY clause for filtered rows. Sort columns are turned into expressions (with unary "+") when filters are applied, so SQLite cannot
+# walk the sort index over the whole table instead of searching the index of a filtered column, and sorts only the matching rows.
+def outputOrderByFunc(orderBy, conditions):
+    if len(conditions) == 0:
+        return orderBy
+    return ", ".join("+" + value.strip() for value in orderBy.split(","))
+#####################################################################################################################################################
+#####################################################################################################################################################
 #####################################################################################################################################################
-def outputFunc(inputDB,outputPath,fileFormat,targSyntax):
-    print("Generating output\r\n")
 
-    inputCursor = inputDB.cursor()
 
-    # Getting all existing nodes from the DB
-    # if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-    DBQuery="""SELECT * 
-                FROM Nodes
-                ORDER BY Hostname ASC
-                """
-    if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-    inputCursor.execute(DBQuery)
-    DBResponse=inputCursor.fetchall()
-    NodesDBAll=DBResponse
-    if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-
-    InterfacesDBSrcAll = []
-    InterfacesDBHistAll = []
-    InterfacesDBDstAll = []
-    PeeringDBSrcAll = []
-    PeeringDBHistAll = []
-    PeeringDBDstAll = []
-    # Getting all data for all supported syntaxes from the DB
-    for value1 in SyntaxDict:
 
-        # Getting all existing interfaces from the DB
-        DBQuery="""SELECT * FROM Interfaces"""+str(SyntaxDict[value1])+""" ORDER BY Hostname ASC, CLISyntax ASC, IfNumber ASC\n"""
-        if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-        inputCursor.execute(DBQuery)
-        DBResponse=inputCursor.fetchall()
-        if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-        if value1 == targSyntax:
-            InterfacesDBDstAll = list(DBResponse)
-        else:
-            if value1 == "Hist":
-                InterfacesDBHistAll.append(list(DBResponse))
-            else:
-                InterfacesDBSrcAll.append(list(DBResponse))
-
-        # Getting all existing peerings from the DB
-        DBQuery="""SELECT * FROM Peering"""+str(SyntaxDict[value1])+""" ORDER BY Hostname ASC, CLISyntax ASC, PeeringType ASC\n"""
-        if debugSQL: print("debug: DBQuery: "+str(DBQuery))
-        inputCursor.execute(DBQuery)
-        DBResponse=inputCursor.fetchall()
-        if debugSQL: print("debug: DBResponse: "+str(DBResponse))
-        if value1 == targSyntax:
-            PeeringDBDstAll = list(DBResponse)
+#####################################################################################################################################################
+#########################################################            Output lines           #########################################################
+#####################################################################################################################################################
+# Generates lines of Nodes, InterfacesData and InterfacesComparison tables, the first line of each table being its header. Rows are streamed from the
+# DB and destination interfaces are joined to source ones (by the same IfID) in SQL, so memory use does not grow with the number of interfaces.
+# Every line is returned as [table name, values, cell types], where cell type is one of "HeaderSrc", "HeaderMid", "HeaderDst", "HeaderMatch", "Src",
+# "Mid", "Dst", "Match". Values of "Mid" and "Match" cells are formula templates with "{0}" in place of the excel row number of the line.
+# Only rows matching output filters are generated (see outputFilterFunc).
+def outputLinesFunc(inputDB,targSyntax,outputFilter):
+    inputCursor = inputDB.cursor()
+    midHdrLenght = 3
+    InterfacesEmpty = [""] * len(InterfacesDict)
+    InterfacesFormulas = list(interfacesFormulasTemplateFunc(midHdrLenght))
+
+    # Interfaces of all syntaxes except the target one and history are source interfaces, tables of syntaxes not selected by filter are skipped
+    InterfacesSrcTables = ["Interfaces"+str(SyntaxDict[value]) for value in SyntaxDict
+                           if (value != targSyntax) and (value != "Hist") and outputSyntaxFunc(value, outputFilter, targSyntax)]
+    if targSyntax != "":
+        InterfacesDstTable = "Interfaces"+str(SyntaxDict[targSyntax])
+
+    # Generating output for Nodes
+    yield ["Nodes", list(NodesDict), ["HeaderSrc"] * len(NodesDict)]
+    cellTypes = ["Src"] * len(NodesDict)
+    DBQuery, DBParams = outputSelectFunc("Nodes", outputFilter, targSyntax, "Hostname ASC")
+    for outputLine in DBRowsFunc(inputCursor, DBQuery, DBParams):
+        yield ["Nodes", outputLine, cellTypes]
+
+    # Generating output header for Interfaces (source, middle and destination)
+    yield ["InterfacesData", list(InterfacesDict) + ["Migrated?", "Difference in source", "Difference in destination"] + list(InterfacesDict),
+           ["HeaderSrc"] * len(InterfacesDict) + ["HeaderMid"] * midHdrLenght + ["HeaderDst"] * len(InterfacesDict)]
+    cellTypes = ["Src"] * len(InterfacesDict) + ["Mid"] * midHdrLenght + ["Dst"] * len(InterfacesDict)
+
+    # Generating output values for source Interfaces together with destination interface matching particular source interface (if any)
+    # Destination filters are part of the join condition, so source interfaces are generated even if their destination is filtered out
+    for InterfacesSrcTable in InterfacesSrcTables:
+        if targSyntax != "":
+            srcConditions, srcParams = outputFilterFunc(InterfacesSrcTable, outputFilter, targSyntax, "Src")
+            dstConditions, dstParams = outputFilterFunc(InterfacesDstTable, outputFilter, targSyntax, "Dst")
+            DBQuery = ("SELECT Src.*, Dst.* FROM " + InterfacesSrcTable + " AS Src LEFT JOIN " + InterfacesDstTable + " AS Dst ON "
+                       + " AND ".join(["Dst.IfID = Src.IfID"] + dstConditions))
+            if len(srcConditions) > 0:
+                DBQuery = DBQuery + " WHERE " + " AND ".join(srcConditions)
+            DBQuery = DBQuery + " ORDER BY " + outputOrderByFunc("Src.Hostname ASC, Src.CLISyntax ASC, Src.IfNumber ASC", srcConditions)
+            DBParams = dstParams + srcParams
         else:
-            if value1 == "Hist":
-                PeeringDBHistAll.append(list(DBResponse))
-            else:
-                PeeringDBSrcAll.append(list(DBResponse))
+            DBQuery, DBParams = outputSelectFunc(InterfacesSrcTable, outputFilter, targSyntax, "Hostname ASC, CLISyntax ASC, IfNumber ASC")
+        for outputLine in DBRowsFunc(inputCursor, DBQuery, DBParams):
+            outputLineDst = list(outputLine[len(InterfacesDict):]) or InterfacesEmpty
+            yield ["InterfacesData", list(outputLine[:len(InterfacesDict)]) + InterfacesFormulas + outputLineDst, cellTypes]
+
+    # Generating output values for destination interface not matching any source interface
+    if targSyntax != "":
+        conditions, DBParams = outputFilterFunc(InterfacesDstTable, outputFilter, targSyntax, "Dst")
+        orderBy = outputOrderByFunc("Hostname ASC, CLISyntax ASC, IfNumber ASC", conditions)
+        for InterfacesSrcTable in InterfacesSrcTables:
+            srcConditions, srcParams = outputFilterFunc(InterfacesSrcTable, outputFilter, targSyntax, "Src")
+            conditions.append("NOT EXISTS (SELECT 1 FROM " + InterfacesSrcTable + " AS Src WHERE " + " AND ".join(["Src.IfID = Dst.IfID"] + srcConditions) + ")")
+            DBParams = DBParams + srcParams
+        DBQuery = "SELECT * FROM " + InterfacesDstTable + " AS Dst"
+        if len(conditions) > 0:
+            DBQuery = DBQuery + " WHERE " + " AND ".join(conditions)
+        DBQuery = DBQuery + " ORDER BY " + orderBy
+        for outputLine in DBRowsFunc(inputCursor, DBQuery, DBParams):
+            yield ["InterfacesData", InterfacesEmpty + InterfacesFormulas + list(outputLine), cellTypes]
+
+    # Generating output for InterfacesComparison (only source interfaces matching a destination interface by the same IfID)
+    if targSyntax != "":
+        outputLine = []
+        cellTypesHeader = []
+        cellTypes = []
+        ComparisonFormulas = {}     # Formula templates by the column of source value
+        for value in InterfacesDict:
+            outputLine = outputLine + [value, value]
+            cellTypesHeader = cellTypesHeader + ["HeaderSrc", "HeaderDst"]
+            cellTypes = cellTypes + ["Src", "Dst"]
+            if InterfacesDict[value][0] in comparisonIndexes:
+                ComparisonFormulas[InterfacesDict[value][0]] = comparisonFormulaTemplateFunc(len(outputLine)-2)
+                outputLine.append("Match")
+                cellTypesHeader.append("HeaderMatch")
+                cellTypes.append("Match")
+        yield ["InterfacesComparison", outputLine, cellTypesHeader]
+
+        for InterfacesSrcTable in InterfacesSrcTables:
+            srcConditions, srcParams = outputFilterFunc(InterfacesSrcTable, outputFilter, targSyntax, "Src")
+            dstConditions, dstParams = outputFilterFunc(InterfacesDstTable, outputFilter, targSyntax, "Dst")
+            DBQuery = ("SELECT Src.*, Dst.* FROM " + InterfacesSrcTable + " AS Src JOIN " + InterfacesDstTable + " AS Dst ON "
+                       + " AND ".join(["Dst.IfID = Src.IfID"] + dstConditions))
+            if len(srcConditions) > 0:
+                DBQuery = DBQuery + " WHERE " + " AND ".join(srcConditions)
+            DBQuery = DBQuery + " ORDER BY " + outputOrderByFunc("Src.Hostname ASC, Src.CLISyntax ASC, Src.IfNumber ASC", srcConditions)
+            for outputLineBoth in DBRowsFunc(inputCursor, DBQuery, dstParams + srcParams):
+                outputLine = []
+                for valueNumber in range(len(InterfacesDict)):
+                    outputLine.append(outputLineBoth[valueNumber])
+                    outputLine.append(outputLineBoth[len(InterfacesDict)+valueNumber])
+                    if valueNumber in ComparisonFormulas:
+                        outputLine.append(ComparisonFormulas[valueNumber])
+                yield ["InterfacesComparison", outputLine, cellTypes]
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-        # Getting all existing routing from the DB - TBD
-    
-    # Creating files
-    if fileFormat == "csv":
-        outputFile = open(("./"+outputPath),"w+",newline ='')
-    if fileFormat == "xlsx":
-        # with xlsxwriter.Workbook(outputPath) as outputFile:
-        outputFile = xlsxwriter.Workbook(outputPath)
-
-        headerSrc_format = outputFile.add_format()
-        headerMid_format = outputFile.add_format()
-        headerDst_format = outputFile.add_format()
-        headerMatch_format = outputFile.add_format()
-
-        lineSrc_format = outputFile.add_format()
-        lineMid_format = outputFile.add_format()
-        lineDst_format = outputFile.add_format()
-        lineMatch_format = outputFile.add_format()
-
-        headerSrc_format.set_font_name("Arial")
-        headerSrc_format.set_align("center")
-        headerSrc_format.set_align("vcenter")
-        headerSrc_format.set_font_size("10")
-        headerSrc_format.set_bold("bold")
-        headerSrc_format.set_font_color("white")
-        headerSrc_format.set_bg_color("black")
-        headerSrc_format.set_num_format(49)
-
-        headerMid_format.set_font_name("Arial")
-        headerMid_format.set_align("center")
-        headerMid_format.set_align("vcenter")
-        headerMid_format.set_font_size("10")
-        headerMid_format.set_bold("bold")
-        headerMid_format.set_font_color("white")
-        headerMid_format.set_bg_color("blue")
-        headerMid_format.set_num_format(49)
-
-        headerDst_format.set_font_name("Arial")
-        headerDst_format.set_align("center")
-        headerDst_format.set_align("vcenter")
-        headerDst_format.set_font_size("10")
-        headerDst_format.set_bold("bold")
-        headerDst_format.set_font_color("white")
-        headerDst_format.set_bg_color("green")
-        headerDst_format.set_num_format(49)
-
-        headerMatch_format.set_font_name("Arial")
-        headerMatch_format.set_align("center")
-        headerMatch_format.set_align("vcenter")
-        headerMatch_format.set_font_size("10")
-        headerMatch_format.set_bold("bold")
-        headerMatch_format.set_font_color("white")
-        headerMatch_format.set_bg_color("blue")
-        headerMatch_format.set_num_format(49)
-
-        lineSrc_format.set_font_name("Arial")
-        lineSrc_format.set_font_size("9")
-        lineSrc_format.set_align("vcenter")
-        lineSrc_format.set_num_format(49)
-        lineSrc_format.set_text_wrap()
-
-        lineMid_format.set_font_name("Arial")
-        lineMid_format.set_font_size("9")
-        lineMid_format.set_align("vcenter")
-        lineMid_format.set_font_color("blue")
-        lineMid_format.set_text_wrap()
-
-        lineDst_format.set_font_name("Arial")
-        lineDst_format.set_font_size("9")
-        lineDst_format.set_align("vcenter")
-        lineDst_format.set_font_color("green")
-        lineDst_format.set_num_format(49)
-        lineDst_format.set_text_wrap()
-
-        lineMatch_format.set_font_name("Arial")
-        lineMatch_format.set_font_size("9")
-        lineMatch_format.set_align("vcenter")
-        lineMatch_format.set_font_color("red")
-        lineMatch_format.set_bg_color("#C5D9F1")
-        # lineMatch_format.set_num_format(49)
-
-        if NodesDBAll is not None:
-            NodesWorksheet = outputFile.add_worksheet("Nodes")
-        if ((InterfacesDBSrcAll is not None) or (InterfacesDBDstAll is not None)):
-            Interfaces1Worksheet = outputFile.add_worksheet("InterfacesData1")
-            if targSyntax != "":
-                Interfaces2Worksheet = outputFile.add_worksheet("InterfacesData2")
-                InterfacesComparisonWorksheet = outputFile.add_worksheet("InterfacesComparison")
-        # if InterfacesDBHistAll is not None:
-        #     InterfacesHistWorksheet = outputFile.add_worksheet("InterfacesHist")
 
 
 #####################################################################################################################################################
-###########################################################         Nodes sheet           ###########################################################
+#########################################################        CSV output function        #########################################################
+#####################################################################################################################################################
+# Writes Nodes, InterfacesData and InterfacesComparison tables one after another to a CSV file as their lines are streamed from the DB.
+# Values are quoted by the csv module, so commas, semicolons and line breaks in them are kept as they are.
+def outputCSVFunc(inputDB,outputPath,targSyntax,outputFilter):
+    with open(outputPath,"w",newline ='') as outputFile:
+        outputWriter = csv.writer(outputFile)
+
+        tableName = ""
+        for outputTable, outputLine, cellTypes in outputLinesFunc(inputDB,targSyntax,outputFilter):
+            # Formulas refer to rows of their own table
+            if outputTable != tableName:
+                tableName = outputTable
+                lineNumber = 0
+            outputWriter.writerow([value.format(lineNumber+1) if cellType in ("Mid", "Match") else value for value, cellType in zip(outputLine, cellTypes)])
+            lineNumber = lineNumber + 1
+#####################################################################################################################################################
+#####################################################################################################################################################
 #####################################################################################################################################################
 
-    # Generating output header for Nodes
-    lineNumber = 0
-    valueNumber = 0
-    for value in NodesDict:
-        if fileFormat == "csv":
-            value = value.replace(",","")
-            # if valueNumber == (len(NodesDict) - 1):
-            #     outputFile.write(str(value)+"\r\n")
-            # else:
-            #     outputFile.write(str(value)+",")
-            if valueNumber == 0:
-                outputFile.write(str(value))
-            else:
-                outputFile.write(","+str(value))
-        if fileFormat == "xlsx":
-            NodesWorksheet.write_string(lineNumber, valueNumber, str(value), headerSrc_format)
-        # if debug: print("writing value "+str(value[1])+" in column "+str(valueNumber))
-        valueNumber = valueNumber + 1
-
-    if fileFormat == "csv": outputFile.write("\r\n")
-
-    # Generating output values for Nodes
-    lineNumber = 1
-    for outputLine in NodesDBAll:
-        valueNumber = 0
-        for value in outputLine:
-            if value is None: value = ""
-            if fileFormat == "csv":
-                value = value.replace(",","")
-                if valueNumber == 0:
-                    outputFile.write(str(value))
-                else:
-                    outputFile.write(","+str(value))
-            if fileFormat == "xlsx":
-                NodesWorksheet.write_string(lineNumber, valueNumber, str(value), lineSrc_format)
-            # if debug: print("writing value "+str(value)+" in column "+str(valueNumber)+" on row "+str(lineNumber))
-            valueNumber = valueNumber + 1
 
-        if fileFormat == "csv": outputFile.write("\r\n")
-        lineNumber = lineNumber + 1
 
+#####################################################################################################################################################
+#########################################################     JSON Lines output function    #########################################################
+#####################################################################################################################################################
+# Interface columns which may contain several values joined with "|", they are written as arrays of values
+JSONArrayColumnsList = ["VLAN", "IPV4Addr", "IPV4Subnet", "IPV6Addr", "IPV6Subnet"]
+
+# Writes a JSON Lines file with one object per node, interface and peering, keyed by column names of NodesDict, InterfacesDict and PeeringDict.
+# Every object also has "Record" key ("Node", "Interface" or "Peering"), interfaces and peerings have "Role" key as well ("Source", or "Destination"
+# for target syntax data). Rows are streamed from the DB and written as they come, history data is not written.
+def outputJSONFunc(inputDB,outputPath,targSyntax,outputFilter):
+    inputCursor = inputDB.cursor()
 
+    with open(outputPath,"w",encoding="utf-8") as outputFile:
+        # Generating output for Nodes
+        DBQuery, DBParams = outputSelectFunc("Nodes", outputFilter, targSyntax, "Hostname ASC")
+        for outputLine in DBRowsFunc(inputCursor, DBQuery, DBParams):
+            outputObject = {"Record": "Node"}
+            outputObject.update(zip(NodesDict, outputLine))
+            outputFile.write(json.dumps(outputObject) + "\n")
+
+        # Generating output for Interfaces and Peering of all syntaxes
+        for table, columnsDict, record, orderBy in [ ["Interfaces", InterfacesDict, "Interface", "Hostname ASC, CLISyntax ASC, IfNumber ASC"],
+                                                     ["Peering", PeeringDict, "Peering", "Hostname ASC, CLISyntax ASC, PeeringType ASC"] ]:
+            for value in SyntaxDict:
+                if (value == "Hist") or not outputSyntaxFunc(value, outputFilter, targSyntax):
+                    continue
+                role = "Source"
+                if value == targSyntax:
+                    role = "Destination"
+
+                DBQuery, DBParams = outputSelectFunc(table+str(SyntaxDict[value]), outputFilter, targSyntax, orderBy)
+                for outputLine in DBRowsFunc(inputCursor, DBQuery, DBParams):
+                    outputObject = {"Record": record, "Role": role}
+                    outputObject.update(zip(columnsDict, outputLine))
+                    if table == "Interfaces":
+                        for column in JSONArrayColumnsList:
+                            if outputObject[column]:
+                                outputObject[column] = outputObject[column].split("|")
+                            else:
+                                outputObject[column] = []
+                    outputFile.write(json.dumps(outputObject) + "\n")
+#####################################################################################################################################################
 #####################################################################################################################################################
-######################################################          InterfacesData sheet           ######################################################
 #####################################################################################################################################################
 
-    # Generating output source header for Interfaces (contains interfaces of source syntaxes)
-    lineNumber = 0
-    valueNumber = 0
-    for value in InterfacesDict:
-        if fileFormat == "csv":
-            value = value.replace(",","")
-            if valueNumber == 0:
-                outputFile.write(str(value))
-            else:
-                outputFile.write(","+str(value))
-        if fileFormat == "xlsx":
-            Interfaces1Worksheet.write_string(lineNumber, valueNumber, str(value), headerSrc_format)
-            if targSyntax != "":
-                Interfaces2Worksheet.write_string(lineNumber, valueNumber, str(value), headerSrc_format)
-        # if debug: print("writing value "+str(value[1])+" in column "+str(valueNumber))
-        valueNumber = valueNumber + 1
-
-    # Generating output middle header for Interfaces (contains formulas for comparison|matching between source and destination)
-    midHdrLenght = 3
-    if fileFormat == "csv":
-        outputFile.write(",Interface migrated")
-        outputFile.write(",Difference in source")
-        outputFile.write(",Difference in destination")
-    if fileFormat == "xlsx":
-        Interfaces1Worksheet.write_string(lineNumber, valueNumber, str("Migrated?"), headerMid_format)
-        Interfaces1Worksheet.write_string(lineNumber, valueNumber+1, str("Difference in source"), headerMid_format)
-        Interfaces1Worksheet.write_string(lineNumber, valueNumber+2, str("Difference in destination"), headerMid_format)
-        if targSyntax != "":
-            Interfaces2Worksheet.write_string(lineNumber, valueNumber, str("Migrated?"), headerMid_format)
-            Interfaces2Worksheet.write_string(lineNumber, valueNumber+1, str("Difference in source"), headerMid_format)
-            Interfaces2Worksheet.write_string(lineNumber, valueNumber+2, str("Difference in destination"), headerMid_format)
-    # if debug: print("writing value "+str(value[1])+" in column "+str(valueNumber))
-    valueNumber = valueNumber + midHdrLenght
 
-    # Generating output destination header for Interfaces (contains interfaces of destination syntax)
-    for value in InterfacesDict:
-        if fileFormat == "csv":
-            value = value.replace(",","")
-            # if valueNumber == (2 * len(InterfacesDict) + midHdrLenght - 1):
-            #     outputFile.write(str(value)+"\r\n")
-            # else:
-            #     outputFile.write(str(value)+",")
-            outputFile.write(","+str(value))
-        if fileFormat == "xlsx":
-            Interfaces1Worksheet.write_string(lineNumber, valueNumber, str(value), headerDst_format)
-            if targSyntax != "":
-                Interfaces2Worksheet.write_string(lineNumber, valueNumber, str(value), headerDst_format)
-        # if debug: print("writing value "+str(value[1])+" in column "+str(valueNumber))
-        valueNumber = valueNumber + 1
-
-    if fileFormat == "csv": outputFile.write("\r\n")
-
-    # Generating output values for source Interfaces (contains interfaces of source syntaxes)
-    lineNumber = 1
-    IDMatched = []
-    for InterfacesDBSrc in InterfacesDBSrcAll:
-        for outputLine in InterfacesDBSrc:
-            valueNumber = 0
-            for value in outputLine:
-                if value is None: value = ""
-                if fileFormat == "csv":
-                    value = value.replace(",","")
-                    if valueNumber == 0:
-                        outputFile.write(str(value))
-                    else:
-                        outputFile.write(","+str(value))
-                if fileFormat == "xlsx":
-                    value = value.replace(";","\r\n")
-                    Interfaces1Worksheet.write_string(lineNumber, valueNumber, str(value), lineSrc_format)
-                    if targSyntax != "":
-                        Interfaces2Worksheet.write_string(lineNumber, valueNumber, str(value), lineSrc_format)
-                # if debug: print("writing value "+str(value)+" in column "+str(valueNumber)+" on row "+str(lineNumber))
-                valueNumber = valueNumber + 1
-
-            # Generating output values for middle Interfaces (contains formulas for comparison|matching between source and destination)
-            # Create formula, checking if interface is migrated to destination config
-            Cell1Src = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict["IfName"][0])  # Contains source IfID excel cell
-            Cell1Dst = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict["IfName"][0]+midHdrLenght+len(InterfacesDict))     # Contains destination IfID excel cell
-            IfMigratedFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),\"Yes\",\"No\")")
-            Cell2List = []   # Contains source and destination interfaces excel cells to be compared
-            for value in InterfacesDict:
-                # Exclude cells that are useless in comparison
-                if ((value != "NodeID") and (value != "CLISyntax") and (value != "IfNumber") and (value != "ParentIfName") and (value != "IfName")
-                        and (value != "PortName") and (value != "PortBinding") and (value != "SFPSN") and (value != "TxLevel") and (value != "RxLevel") and(value != "BridgeID") 
-                        and (value != "ServiceID") and (value != "ServiceDescr") and (value != "ServiceSDP") and (value != "CDP") and (value != "Comments") and (value != "LastUpdatedTime")
-                        and (value != "LastUpdatedBy")):
-                    Cell2Src = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict[value][0])
-                    Cell2Dst = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict[value][0]+midHdrLenght+len(InterfacesDict))
-                    Cell2List.append([Cell2Src,Cell2Dst])
-            
-            DiffSrcFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),CONCATENATE(")
-            DiffDstFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),CONCATENATE(")
-            j = 0
-            for cellPair in Cell2List:
-                if j < (len(Cell2List)-1):
-                    DiffSrcFromula = DiffSrcFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[0]+",\"#\")),")
-                    DiffDstFromula = DiffDstFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[1]+",\"#\")),")
-                else:
-                    DiffSrcFromula = DiffSrcFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[0]+",\"#\"))")
-                    DiffDstFromula = DiffDstFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[1]+",\"#\"))")
-                j = j + 1
-
-            DiffSrcFromula = DiffSrcFromula + str("),\"\")")
-            DiffDstFromula = DiffDstFromula + str("),\"\")")
-
-            # if lineNumber == 3:
-            #     print(len(Cell2List))
-            #     print(DiffSrcFromula)
-            #     print(DiffDstFromula)
-
-            if fileFormat == "csv":
-                outputFile.write(","+str(IfMigratedFromula.replace(",",";")))
-                outputFile.write(","+str(DiffSrcFromula.replace(",",";")+","+DiffDstFromula.replace(",",";")))
-            if fileFormat == "xlsx":
-                Interfaces1Worksheet.write_formula(lineNumber, valueNumber, IfMigratedFromula, lineMid_format)
-                Interfaces1Worksheet.write_formula(lineNumber, valueNumber+1, DiffSrcFromula, lineMid_format)
-                Interfaces1Worksheet.write_formula(lineNumber, valueNumber+2, DiffDstFromula, lineMid_format)
-                if targSyntax != "":
-                    Interfaces2Worksheet.write_formula(lineNumber, valueNumber, IfMigratedFromula, lineMid_format)
-                    Interfaces2Worksheet.write_formula(lineNumber, valueNumber+1, DiffSrcFromula, lineMid_format)
-                    Interfaces2Worksheet.write_formula(lineNumber, valueNumber+2, DiffDstFromula, lineMid_format)
-            valueNumber = valueNumber + midHdrLenght
-
-            # Generating output values for destination interface matching particular source interface (matched by the same IfID)
-            match = 0
-            for outputLineDst in InterfacesDBDstAll:
-                # print("Matching "+outputLine[InterfacesDict["IfID"][0]]+" to "+outputLineDst[InterfacesDict["IfID"][0]])
-                if outputLineDst[InterfacesDict["IfID"][0]] == outputLine[InterfacesDict["IfID"][0]]:
-                    match = 1
-                    IDMatched.append(str(outputLineDst[InterfacesDict["IfID"][0]]))
-                    for value in outputLineDst:
-                        if value is None: value = ""
-                        if fileFormat == "csv":
-                            value = value.replace(",","")
-                            outputFile.write(","+str(value))
-                        if fileFormat == "xlsx":
-                            value = value.replace(";","\r\n")
-                            Interfaces1Worksheet.write_string(lineNumber, valueNumber, str(value), lineDst_format)
-                            if targSyntax != "":
-                                Interfaces2Worksheet.write_string(lineNumber, valueNumber, str(value), lineDst_format)
-                        # if debug: print("writing value "+str(value)+" in column "+str(valueNumber)+" on row "+str(lineNumber))
-                        valueNumber = valueNumber + 1
-            if match == 0:
-                for value in InterfacesDict:
-                    if fileFormat == "csv":
-                        outputFile.write(",")
-                    if fileFormat == "xlsx":
-                        Interfaces1Worksheet.write_string(lineNumber, valueNumber, str(""), lineDst_format)
-                        if targSyntax != "":
-                            Interfaces2Worksheet.write_string(lineNumber, valueNumber, str(""), lineDst_format)
-                    # if debug: print("writing value "+str(value)+" in column "+str(valueNumber)+" on row "+str(lineNumber))
-                    valueNumber = valueNumber + 1
-
-            if fileFormat == "csv": outputFile.write("\r\n")
-            lineNumber = lineNumber + 1
 
-            # if lineNumber == 2: break
+#####################################################################################################################################################
+#########################################################            XLSX formats           #########################################################
+#####################################################################################################################################################
+# Creates cell formats of the workbook by cell types of output lines (see outputLinesFunc)
+def xlsxFormatsFunc(outputFile):
+    headerSrc_format = outputFile.add_format()
+    headerMid_format = outputFile.add_format()
+    headerDst_format = outputFile.add_format()
+    headerMatch_format = outputFile.add_format()
+
+    lineSrc_format = outputFile.add_format()
+    lineMid_format = outputFile.add_format()
+    lineDst_format = outputFile.add_format()
+    lineMatch_format = outputFile.add_format()
+
+    headerSrc_format.set_font_name("Arial")
+    headerSrc_format.set_align("center")
+    headerSrc_format.set_align("vcenter")
+    headerSrc_format.set_font_size("10")
+    headerSrc_format.set_bold("bold")
+    headerSrc_format.set_font_color("white")
+    headerSrc_format.set_bg_color("black")
+    headerSrc_format.set_num_format(49)
+
+    headerMid_format.set_font_name("Arial")
+    headerMid_format.set_align("center")
+    headerMid_format.set_align("vcenter")
+    headerMid_format.set_font_size("10")
+    headerMid_format.set_bold("bold")
+    headerMid_format.set_font_color("white")
+    headerMid_format.set_bg_color("blue")
+    headerMid_format.set_num_format(49)
+
+    headerDst_format.set_font_name("Arial")
+    headerDst_format.set_align("center")
+    headerDst_format.set_align("vcenter")
+    headerDst_format.set_font_size("10")
+    headerDst_format.set_bold("bold")
+    headerDst_format.set_font_color("white")
+    headerDst_format.set_bg_color("green")
+    headerDst_format.set_num_format(49)
+
+    headerMatch_format.set_font_name("Arial")
+    headerMatch_format.set_align("center")
+    headerMatch_format.set_align("vcenter")
+    headerMatch_format.set_font_size("10")
+    headerMatch_format.set_bold("bold")
+    headerMatch_format.set_font_color("white")
+    headerMatch_format.set_bg_color("blue")
+    headerMatch_format.set_num_format(49)
+
+    lineSrc_format.set_font_name("Arial")
+    lineSrc_format.set_font_size("9")
+    lineSrc_format.set_align("vcenter")
+    lineSrc_format.set_num_format(49)
+    lineSrc_format.set_text_wrap()
+
+    lineMid_format.set_font_name("Arial")
+    lineMid_format.set_font_size("9")
+    lineMid_format.set_align("vcenter")
+    lineMid_format.set_font_color("blue")
+    lineMid_format.set_text_wrap()
+
+    lineDst_format.set_font_name("Arial")
+    lineDst_format.set_font_size("9")
+    lineDst_format.set_align("vcenter")
+    lineDst_format.set_font_color("green")
+    lineDst_format.set_num_format(49)
+    lineDst_format.set_text_wrap()
+
+    lineMatch_format.set_font_name("Arial")
+    lineMatch_format.set_font_size("9")
+    lineMatch_format.set_align("vcenter")
+    lineMatch_format.set_font_color("red")
+    lineMatch_format.set_bg_color("#C5D9F1")
+    # lineMatch_format.set_num_format(49)
+
+    return {"HeaderSrc": headerSrc_format, "HeaderMid": headerMid_format, "HeaderDst": headerDst_format, "HeaderMatch": headerMatch_format,
+            "Src": lineSrc_format, "Mid": lineMid_format, "Dst": lineDst_format, "Match": lineMatch_format}
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-        
-    # Generating output values for destination interface not matching any source interface
-    for outputLineDst in InterfacesDBDstAll:
-        if outputLineDst[InterfacesDict["IfID"][0]] not in IDMatched:
-            valueNumber = 0
-            for value in InterfacesDict:
-                if fileFormat == "csv":
-                    if valueNumber != 0:
-                        outputFile.write(",")
-                valueNumber = valueNumber + 1
-
-            # Generating output values for middle Interfaces (contains formulas for comparison|matching between source and destination)
-            # Create formula, checking if interface is migrated to destination config
-            Cell1Src = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict["IfName"][0])  # Contains source IfID excel cell
-            Cell1Dst = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict["IfName"][0]+midHdrLenght+len(InterfacesDict))     # Contains destination IfID excel cell
-            IfMigratedFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),\"Yes\",\"No\")")
-            Cell2List = []   # Contains source and destination interfaces excel cells to be compared
-            for value in InterfacesDict:
-                # Exclude cells that are useless in comparison
-                if ((value != "NodeID") and (value != "CLISyntax") and (value != "IfNumber") and (value != "ParentIfName") and (value != "IfName")
-                        and (value != "PortName") and (value != "PortBinding") and (value != "SFPSN") and (value != "TxLevel") and (value != "RxLevel") and(value != "BridgeID") 
-                        and (value != "ServiceID") and (value != "ServiceDescr") and (value != "ServiceSDP") and (value != "CDP") and (value != "Comments") and (value != "LastUpdatedTime")
-                        and (value != "LastUpdatedBy")):
-                    Cell2Src = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict[value][0])
-                    Cell2Dst = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, InterfacesDict[value][0]+midHdrLenght+len(InterfacesDict))
-                    Cell2List.append([Cell2Src,Cell2Dst])
-            
-            DiffSrcFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),CONCATENATE(")
-            DiffDstFromula = str("=IF(AND("+Cell1Src+"<>\"\","+Cell1Dst+"<>\"\"),CONCATENATE(")
-            j = 0
-            for cellPair in Cell2List:
-                if j < (len(Cell2List)-1):
-                    DiffSrcFromula = DiffSrcFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[0]+",\"#\")),")
-                    DiffDstFromula = DiffDstFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[1]+",\"#\")),")
-                else:
-                    DiffSrcFromula = DiffSrcFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[0]+",\"#\"))")
-                    DiffDstFromula = DiffDstFromula + str("IF(EXACT("+cellPair[0]+","+cellPair[1]+"),\"\",CONCATENATE("+cellPair[1]+",\"#\"))")
-                j = j + 1
-
-            DiffSrcFromula = DiffSrcFromula + str("),\"\")")
-            DiffDstFromula = DiffDstFromula + str("),\"\")")
-
-            if fileFormat == "csv":
-                outputFile.write(","+str(IfMigratedFromula.replace(",",";")))
-                outputFile.write(","+str(DiffSrcFromula.replace(",",";")+","+DiffDstFromula.replace(",",";")))
-            if fileFormat == "xlsx":
-                Interfaces1Worksheet.write_formula(lineNumber, valueNumber, IfMigratedFromula, lineMid_format)
-                Interfaces1Worksheet.write_formula(lineNumber, valueNumber+1, DiffSrcFromula, lineMid_format)
-                Interfaces1Worksheet.write_formula(lineNumber, valueNumber+2, DiffDstFromula, lineMid_format)
-                if targSyntax != "":
-                    Interfaces2Worksheet.write_formula(lineNumber, valueNumber, IfMigratedFromula, lineMid_format)
-                    Interfaces2Worksheet.write_formula(lineNumber, valueNumber+1, DiffSrcFromula, lineMid_format)
-                    Interfaces2Worksheet.write_formula(lineNumber, valueNumber+2, DiffDstFromula, lineMid_format)
-            valueNumber = valueNumber + midHdrLenght
-
-
-            # print("Matching "+outputLine[InterfacesDict["IfID"][0]]+" to "+outputLineDst[InterfacesDict["IfID"][0]])
-            for value in outputLineDst:
-                if value is None: value = ""
-                if fileFormat == "csv":
-                    value = value.replace(",","")
-                    outputFile.write(","+str(value))
-                if fileFormat == "xlsx":
-                    value = value.replace(";","\r\n")
-                    Interfaces1Worksheet.write_string(lineNumber, valueNumber, str(value), lineDst_format)
-                    if targSyntax != "":
-                        Interfaces2Worksheet.write_string(lineNumber, valueNumber, str(value), lineDst_format)
-                # if debug: print("writing value "+str(value)+" in column "+str(valueNumber)+" on row "+str(lineNumber))
-                valueNumber = valueNumber + 1
-                
-            if fileFormat == "csv": outputFile.write("\r\n")
-            lineNumber = lineNumber + 1
 
 
 #####################################################################################################################################################
-#################################################           InterfacesComparison sheet             ##################################################
+#########################################################        XLSX output function       #########################################################
 #####################################################################################################################################################
-
+# Writes Nodes, InterfacesData1, InterfacesData2 and InterfacesComparison sheets to XLSX file as lines are streamed from the DB (see outputLinesFunc).
+# With "--xlsx-streaming" argument the workbook is opened in constant_memory mode, so xlsxwriter flushes every row to disk once the next one is
+# started instead of keeping the whole workbook in memory until it is closed.
+# Tables longer than Excel row limit continue on new sheets with "_2", "_3" etc. suffix, each starting with the table header.
+def outputXLSXFunc(inputDB,outputPath,targSyntax,outputFilter,xlsxStreaming):
+    outputFile = xlsxwriter.Workbook(outputPath, {"constant_memory": xlsxStreaming})
+    outputFormats = xlsxFormatsFunc(outputFile)
+
+    # Sheets written for every table, InterfacesData is written twice if target syntax is specified
+    sheetNamesDict = {"Nodes": ["Nodes"], "InterfacesData": ["InterfacesData1"], "InterfacesComparison": ["InterfacesComparison"]}
     if targSyntax != "":
-        # Generating output source header for InterfacesComparison (contains interfaces of source syntaxes)
-        lineNumber = 0
-        valueNumber = 0
-        for value in InterfacesDict:
-            if fileFormat == "csv":
-
-                value = value.replace(",","")
-                if valueNumber == 0:
-                    outputFile.write(str(value)+","+str(value))
-                else:
-                    outputFile.write(","+str(value)+","+str(value))
-                
-                # Exclude cells that are useless in comparison
-                if ((value != "NodeID") and (value != "IfID") and (value != "CLISyntax") and (value != "IfNumber") and (value != "ParentIfName") and (value != "IfName") and (value != "PortName")
-                            and (value != "SFPSN") and (value != "TxLevel") and (value != "RxLevel") and(value != "BridgeID") and (value != "ServiceID") and (value != "PortBinding")
-                            and (value != "ServiceDescr") and (value != "ServiceSDP") and (value != "CDP") and (value != "Comments") and (value != "LastUpdatedTime")
-                            and (value != "LastUpdatedBy")):
-
-                    outputFile.write(",Match")
-
-            if fileFormat == "xlsx":
-                InterfacesComparisonWorksheet.write_string(lineNumber, valueNumber, str(value), headerSrc_format)
-                InterfacesComparisonWorksheet.write_string(lineNumber, valueNumber+1, str(value), headerDst_format)
-                # Exclude cells that are useless in comparison
-                if ((value != "NodeID") and (value != "IfID") and (value != "CLISyntax") and (value != "IfNumber") and (value != "ParentIfName") and (value != "IfName") and (value != "PortName")
-                            and (value != "SFPSN") and (value != "TxLevel") and (value != "RxLevel") and(value != "BridgeID") and (value != "ServiceID") and (value != "PortBinding")
-                            and (value != "ServiceDescr") and (value != "ServiceSDP") and (value != "CDP") and (value != "Comments") and (value != "LastUpdatedTime")
-                            and (value != "LastUpdatedBy")):
-
-                    InterfacesComparisonWorksheet.write_string(lineNumber, valueNumber+2, "Match", headerMatch_format)
-                    valueNumber = valueNumber + 1
-
-            # if debug: print("writing value "+str(value[1])+" in column "+str(valueNumber))
-            valueNumber = valueNumber + 2
-
-        if fileFormat == "csv": outputFile.write("\r\n")
-
-        # Generating output values for source InterfacesComparison (contains interfaces of source syntaxes)
-        lineNumber = 1
-        IDMatched = []
-        for InterfacesDBSrc in InterfacesDBSrcAll:
-            for outputLine in InterfacesDBSrc:
-                match = 0
-                valueNumberSource = 0
-                valueNumberPrint = 0
-                for valueSrc in outputLine:
-                    if valueSrc is None: valueSrc = ""
-
-                    # Generating output values for destination interface matching particular source interface (matched by the same IfID)
-                    for outputLineDst in InterfacesDBDstAll:
-                        valueNumberDestination = 0
-                        # print("Matching "+outputLine[InterfacesDict["IfID"][0]]+" to "+outputLineDst[InterfacesDict["IfID"][0]])
-                        if outputLineDst[InterfacesDict["IfID"][0]] == outputLine[InterfacesDict["IfID"][0]]:
-                            match = 1
-                            for valueDst in outputLineDst:
-                                if valueNumberDestination == valueNumberSource:
-
-                                    Cell3Src = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, valueNumberPrint)  # Contains source IfID excel cell
-                                    Cell3Dst = xlsxwriter.utility.xl_rowcol_to_cell(lineNumber, valueNumberPrint+1)     # Contains destination IfID excel cell
-                                    MatchFromula = str("=IF(AND("+Cell3Src+"<>\"\","+Cell3Dst+"<>\"\"),IF(EXACT("+Cell3Src+","+Cell3Dst+"),\"\",\"Not match\"),IF(OR("+Cell3Src+"<>\"\","+Cell3Dst+"<>\"\"),\"Missing\",\"\"))")
-
-                                    if valueDst is None: valueDst = ""
-                                    if fileFormat == "csv":
-                                        valueSrc = valueSrc.replace(",","")
-                                        valueDst = valueDst.replace(",","")
-                                        
-                                        if valueNumberSource == 0:
-                                            outputFile.write(str(valueSrc)+","+str(valueDst))
-                                        else:
-                                            outputFile.write(","+str(valueSrc)+","+str(valueDst))
-
-                                        for value in InterfacesDict:
-                                            if InterfacesDict[value][0] == valueNumberDestination:
-                                                # Exclude cells that are useless in comparison
-                                                if ((value != "NodeID") and (value != "IfID") and (value != "CLISyntax") and (value != "IfNumber") and (value != "ParentIfName") and (value != "IfName") and (value != "PortName")
-                                                            and (value != "SFPSN") and (value != "TxLevel") and (value != "RxLevel") and(value != "BridgeID") and (value != "ServiceID") and (value != "PortBinding")
-                                                            and (value != "ServiceDescr") and (value != "ServiceSDP") and (value != "CDP") and (value != "Comments") and (value != "LastUpdatedTime")
-                                                            and (value != "LastUpdatedBy")):
-                                                    
-                                                    outputFile.write(","+str(MatchFromula.replace(",",";")))
-                                                break
-
-                                    if fileFormat == "xlsx":
-                                        valueSrc = valueSrc.replace(";","\r\n")
-                                        valueDst = valueDst.replace(";","\r\n")
-                                        InterfacesComparisonWorksheet.write_string(lineNumber, valueNumberPrint, str(valueSrc), lineSrc_format)
-                                        InterfacesComparisonWorksheet.write_string(lineNumber, valueNumberPrint+1, str(valueDst), lineDst_format)
-
-                                        for value in InterfacesDict:
-                                            if InterfacesDict[value][0] == valueNumberDestination:
-                                                # Exclude cells that are useless in comparison
-                                                if ((value != "NodeID") and (value != "IfID") and (value != "CLISyntax") and (value != "IfNumber") and (value != "ParentIfName") and (value != "IfName") and (value != "PortName")
-                                                            and (value != "SFPSN") and (value != "TxLevel") and (value != "RxLevel") and(value != "BridgeID") and (value != "ServiceID") and (value != "PortBinding")
-                                                            and (value != "ServiceDescr") and (value != "ServiceSDP") and (value != "CDP") and (value != "Comments") and (value != "LastUpdatedTime")
-                                                            and (value != "LastUpdatedBy")):
-                                                    
-                                                    InterfacesComparisonWorksheet.write_formula(lineNumber, valueNumberPrint+2, MatchFromula, lineMatch_format)
-                                                    valueNumberPrint = valueNumberPrint + 1
-                                                break
+        sheetNamesDict["InterfacesData"].append("InterfacesData2")
+
+    tableName = ""
+    for outputTable, outputLine, cellTypes in outputLinesFunc(inputDB,targSyntax,outputFilter):
+        if outputTable != tableName:
+            tableName = outputTable
+            tableHeader = [outputLine, cellTypes]
+            sheetPart = 1
+            worksheets = [outputFile.add_worksheet(sheetName) for sheetName in sheetNamesDict[outputTable]]
+            lineNumber = 0
+        elif lineNumber == xlsxMaxRows:
+            # Sheet is full, table continues on a new sheet starting with the same header
+            sheetPart = sheetPart + 1
+            if debug: logger.debug("Table %s continues on sheet part %s", outputTable, sheetPart)
+            worksheets = [outputFile.add_worksheet(sheetName+"_"+str(sheetPart)) for sheetName in sheetNamesDict[outputTable]]
+            for worksheet in worksheets:
+                for valueNumber, value in enumerate(tableHeader[0]):
+                    worksheet.write_string(0, valueNumber, str(value), outputFormats[tableHeader[1][valueNumber]])
+            lineNumber = 1
+
+        for valueNumber, value in enumerate(outputLine):
+            cellType = cellTypes[valueNumber]
+            if value is None: value = ""
+            if cellType in ("Mid", "Match"):
+                value = value.format(lineNumber+1)
+                for worksheet in worksheets:
+                    worksheet.write_formula(lineNumber, valueNumber, value, outputFormats[cellType])
+            else:
+                value = str(value)
+                if outputTable != "Nodes":
+                    value = value.replace(";","\r\n")
+                for worksheet in worksheets:
+                    worksheet.write_string(lineNumber, valueNumber, value, outputFormats[cellType])
+        lineNumber = lineNumber + 1
 
-                                    # if debug: print("writing value "+str(value)+" in column "+str(valueNumber)+" on row "+str(lineNumber))
+    outputFile.close()
+#####################################################################################################################################################
+#####################################################################################################################################################
+#####################################################################################################################################################
 
-                                    valueNumberPrint = valueNumberPrint + 2
-                                    break
 
-                                valueNumberDestination = valueNumberDestination + 1
-                                
-                    valueNumberSource = valueNumberSource + 1
 
-                if match == 1:
-                    if fileFormat == "csv": outputFile.write("\r\n")
-                    lineNumber = lineNumber + 1
+#####################################################################################################################################################
+###########################################################       Output function         ###########################################################
+#####################################################################################################################################################
+def outputFunc(inputDB,outputPath,fileFormat,targSyntax,xlsxStreaming,outputFilter):
+    logger.info("Generating output")
 
+    # Tables and indexes are created for all output modes, so existing databases get the indexes used by output queries and filters
+    createDBStructureFunc(inputDB)
 
-    outputFile.close()
+    # All formats are written as rows are read from the DB, so tables are not loaded in memory
+    if fileFormat == "csv":
+        outputCSVFunc(inputDB,outputPath,targSyntax,outputFilter)
+    elif fileFormat == "jsonl":
+        outputJSONFunc(inputDB,outputPath,targSyntax,outputFilter)
+    else:
+        outputXLSXFunc(inputDB,outputPath,targSyntax,outputFilter,xlsxStreaming)
 #####################################################################################################################################################
 #####################################################################################################################################################
 #####################################################################################################################################################
@@ -5553,7 +6141,7 @@ def outputFunc(inputDB,outputPath,fileFormat,targSyntax):
 ###########################################################        Merge function         ###########################################################
 #####################################################################################################################################################
 def mergeFunc():
-    print("Merging\r\n")
+    logger.info("Merging")
 
 #####################################################################################################################################################
 #####################################################################################################################################################
@@ -5566,7 +6154,7 @@ def mergeFunc():
 #####################################################################################################################################################
 # def collectFunc(login,password,mgmtAddrList,outputPath,defaultCLISyntax,delay):
 def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
-    print("Trying to connect to " + str(hostAddr) + "...")
+    logger.info("Trying to connect to %s...", hostAddr)
     startTime = time.time()
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -5576,33 +6164,33 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
     TelnetConnectionState = 0     # Telnet connection not yet established
     # Establishing SSH connection
     for port in PortsDict["SSH"]: # Going though all defined SSH ports to establish connection
-        print("Trying SSH to port " + str(port))
+        logger.info("%s: trying SSH to port %s", hostAddr, port)
         try:
             client.connect(hostname=str(hostAddr), username=login, password=password1, port=str(port),look_for_keys=False, allow_agent=False, timeout=5)
             connectionCursor = client.invoke_shell()
             if connectionCursor != "":
                 # print("connectionCursor " + str(connectionCursor))
-                print("   Connection to port " + str(port) + " successfull")
+                logger.info("%s: connection to port %s successfull", hostAddr, port)
                 SSHConnectionState = 1     # SSH connection succeeded
                 protocol = "ssh"
                 time.sleep(1)              # Wait a bit while MotD loading
         except (paramiko.ssh_exception.AuthenticationException, paramiko.ssh_exception.BadAuthenticationType):
-            print("   SSH authentication failed")
+            logger.warning("%s: SSH authentication failed", hostAddr)
             SSHConnectionState = -1
             break
         except (socket.timeout, paramiko.ssh_exception.NoValidConnectionsError):
-            print("   SSH connection to port " + str(port) + " timed out")
+            logger.warning("%s: SSH connection to port %s timed out", hostAddr, port)
         except KeyboardInterrupt:
             break
         except:
-            print("   Connection error: ", sys.exc_info()[0])
+            logger.warning("%s: connection error: %s", hostAddr, sys.exc_info()[0])
 
         if SSHConnectionState != 0: break
 
     if SSHConnectionState != 1:
         # Establishing Telnet connection
         for port in PortsDict["Telnet"]: # Going though all defined Telnet ports to establish connection
-            print("Trying Telnet to port " + str(port))
+            logger.info("%s: trying Telnet to port %s", hostAddr, port)
             try:
                 connectionCursor = telnetlib.Telnet(host=str(hostAddr), port=str(port), timeout=5)
                 
@@ -5625,23 +6213,23 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
                             # print(output3)
                             if output3[0] == 0:
                                 connectionCursor.write(b"\n")
-                                print("   Connection to port " + str(port) + " successfull")
+                                logger.info("%s: connection to port %s successfull", hostAddr, port)
                                 TelnetConnectionState = 1     # Telnet connection succeeded
                                 protocol = "telnet"
                                 time.sleep(1)              # Wait a bit while MotD loading
                             else:
-                                print("   Telnet authentication failed")
+                                logger.warning("%s: Telnet authentication failed", hostAddr)
                                 TelnetConnectionState = -1
                     else:
-                        print("   No Telnet service found")
+                        logger.warning("%s: no Telnet service found", hostAddr)
                         connectionCursor.close()
                         connectionCursor = ""
             except (socket.timeout):
-                print("   Telnet connection to port " + str(port) + " timed out")
+                logger.warning("%s: Telnet connection to port %s timed out", hostAddr, port)
             except KeyboardInterrupt:
                 break
             except:
-                print("   Connection error: ", sys.exc_info()[0])
+                logger.warning("%s: connection error: %s", hostAddr, sys.exc_info()[0])
             
             if TelnetConnectionState != 0: break
 
@@ -5672,7 +6260,7 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
                     shellPrompt = line.lstrip().rstrip()
                     shellPrompt = re.split(r"((>|#|\$|\%))", shellPrompt)[0] + re.split(r"((>|#|\$|\%))", shellPrompt)[1]
                 if shellPrompt != "":
-                    print("Found shell prompt: "+shellPrompt)
+                    logger.info("%s: found shell prompt: %s", hostAddr, shellPrompt)
                     break
         
         # Trying to find CLI syntax of Cisco/Nokia node
@@ -5712,10 +6300,13 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
         #         debugTextFile.write("\n".join(str(item) for item in versionLines))
 
         if CLISyntax == "":
-            print("Could not determine CLI syntax, skipping to next node")
-            return
+            logger.warning("%s: could not determine CLI syntax, skipping to next node", hostAddr)
+            connectionCursor.close()
+            if protocol == "ssh":
+                client.close()
+            return "Could not determine CLI syntax"
         else:
-            print("Using following command syntax for this node: "+CLISyntax)
+            logger.info("%s: using following command syntax for this node: %s", hostAddr, CLISyntax)
 
         # Vendor-specific preparation phase
         enableLines = []
@@ -5746,15 +6337,18 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
                     versionLines.extend(output[1])
                     versionLines.append("\n#####\tExecuted with code " + str(output[0]) + " in " + str(round(output[2],2)) + " second(s)\t#####\n\n")
 
-                    print("Using new shell prompt: "+shellPrompt)
+                    logger.info("%s: using new shell prompt: %s", hostAddr, shellPrompt)
 
                     # if debug:
                     #     with open("./" + outputPath + "/debugText.txt", 'a') as debugTextFile:
                     #         debugTextFile.write("\n".join(str(item) for item in versionLines))
 
                 else:
-                    print("Could not activate enable mode, skipping to next node")
-                    return
+                    logger.warning("%s: could not activate enable mode, skipping to next node", hostAddr)
+                    connectionCursor.close()
+                    if protocol == "ssh":
+                        client.close()
+                    return "Could not activate enable mode"
 
 
         ################################################### Disable terminal paging ###################################################
@@ -5788,24 +6382,23 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
         # Syntax: Cisco IOS/IOS-XE/IOS-XR
         if ((CLISyntax == "IOS") or (CLISyntax == "IOS-XR")):
             for obj1 in cfg.find_objects("^hostname"):       # Find node's Hostname from config
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 Hostname = obj1.text.split(" ")[1]
-                if debug: print("debug: Found Hostname in configuration file and updated to: "+Hostname)
+                if debug: logger.debug("Found Hostname in configuration file and updated to: %s", Hostname)
                 break
         # Syntax: Huawei VRP
         if (CLISyntax == "VRP"):
             for obj1 in cfg.find_objects("^sysname"):       # Find node's Hostname from config
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 Hostname = obj1.text.split(" ")[1]
-                if debug: print("debug: Found Hostname in configuration file and updated to: "+Hostname)
+                if debug: logger.debug("Found Hostname in configuration file and updated to: %s", Hostname)
                 break
         # Syntax: ALU/Nokia SR-OS
         if (CLISyntax == "SR-OS"):
             for obj1 in cfg.find_objects(" *name"):       # Find node's Hostname from config
-                print(obj1)
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 Hostname = obj1.text.split(" \"")[1].split("\"")[0]
-                if debug: print("debug: Found Hostname in configuration file and updated to: "+Hostname)
+                if debug: logger.debug("Found Hostname in configuration file and updated to: %s", Hostname)
                 break
         # Setting default Hostname
         if Hostname == "":
@@ -5819,47 +6412,47 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
         # Syntax: Cisco IOS-XR
         if (CLISyntax == "IOS-XR"):
             for obj1 in cfg.find_objects("^interface Loopback0"):       # Find node's system/loopback0 address from config
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 for obj2 in obj1.re_search_children("ipv4 address "):    #Find all IPv4 addresses associated with current interface (IOS-XR syntax)
-                    if debug: print("debug: obj2: "+str(obj2))
+                    if debug: logger.debug("obj2: %s", obj2)
                     if re.search(r"/",obj2.text):
                         SysAddr = obj2.text.split("ipv4 address ")[1].split("/")[0]
                     else:
                         SysAddr = obj2.text.split("ipv4 address ")[1].split(" ")[0]
-                    if debug: print("debug: SysAddr: "+str(SysAddr))
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
                     break
                 break
         # Syntax: Cisco IOS/IOS-XE
         if (CLISyntax == "IOS"):
             for obj1 in cfg.find_objects("^interface Loopback0"):       # Find node's system/loopback0 address from config
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 for obj2 in obj1.re_search_children("ip address "):    #Find all IPv4 addresses associated with current interface (IOS/IOS-XE syntax)
-                    if debug: print("debug: obj2: "+str(obj2))
+                    if debug: logger.debug("obj2: %s", obj2)
                     if re.search("/",obj2.text):
                         SysAddr = obj2.text.split("ip address ")[1].split("/")[0]
                     else:
                         SysAddr = obj2.text.split("ip address ")[1].split(" ")[0]
-                    if debug: print("debug: SysAddr: "+str(SysAddr))
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
                     break
                 break
         # Syntax: Huawei VRP
         if (CLISyntax == "VRP"):
             for obj1 in cfg.find_objects("^interface LoopBack0"):       # Find node's system/loopback0 address from config
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 for obj2 in obj1.re_search_children("ip address "):    #Find all IPv4 addresses associated with current interface (VRP syntax)
-                    if debug: print("debug: obj2: "+str(obj2))
+                    if debug: logger.debug("obj2: %s", obj2)
                     SysAddr = obj2.text.split("address ")[1].split(" ")[0]
-                    if debug: print("debug: SysAddr: "+str(SysAddr))
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
                     break
                 break
         # Syntax: ALU/Nokia SR-OS
         if (CLISyntax == "SR-OS"):
             for obj1 in cfg.find_objects("^ *interface \"system\""):       # Find node's system/loopback0 address from config
-                if debug: print("debug: obj1: "+str(obj1))
+                if debug: logger.debug("obj1: %s", obj1)
                 for obj2 in obj1.re_search_children("address "):    #Find all IPv4 addresses associated with current interface (SR-OS syntax)
-                    if debug: print("debug: obj2: "+str(obj2))
+                    if debug: logger.debug("obj2: %s", obj2)
                     SysAddr = obj2.text.split("address ")[1].split("/")[0]
-                    if debug: print("debug: SysAddr: "+str(SysAddr))
+                    if debug: logger.debug("SysAddr: %s", SysAddr)
                     break
                 break
 
@@ -5869,7 +6462,7 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
         if (os.path.isfile(outputFilePath)):
             os.remove(outputFilePath)
 
-        print("Configuration parsed, creating output file.")
+        logger.info("%s: configuration parsed, creating output file.", hostAddr)
 
         with open(outputFilePath, 'a') as outputFile:
             outputFile.write("#####\tNode " + Hostname + "[" + str(SysAddr) + "]" + " via " + str(hostAddr) + " over " + protocol + " on " + datetime.datetime.today().strftime("%Y-%m-%d %H:%M:%S") +"\t#####\n")
@@ -6004,7 +6597,7 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
                                             peerAddressList.append([ ifName, addressSrc ])
             pass
 
-        print(peerAddressList)
+        if debug: logger.debug("peerAddressList: %s", peerAddressList)
 
         ################################################### Define variables for show commands to execute ###################################################
         # Syntax: Cisco IOS-XR
@@ -6155,7 +6748,7 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
                             tempCommandList[iteration].append([ command[0].replace("{port-id}",port), command[1] ])
                         continue
                     if re.search(r"\{.*\}",command[0]):
-                        print("Unknown variable: " + re.search(r"\{.*\}",command[0]).group[0])
+                        logger.warning("%s: unknown variable: %s", hostAddr, re.search(r"\{.*\}",command[0]).group(0))
                         continue
                 else:
                     tempCommandList[iteration].append([ command[0], command[1] ])
@@ -6181,7 +6774,7 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
             #     with open("./" + outputPath + "/debugText.txt", 'a') as debugTextFile:
             #         debugTextFile.write("\n".join(str(item) for item in commandExecLines))
 
-        print("Show commands executed, adding data to the output file.")
+        logger.info("%s: show commands executed, adding data to the output file.", hostAddr)
 
 
 
@@ -6196,6 +6789,26 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
             if protocol == "ssh":
                 client.close()
 
+        return "OK"
+    else:
+        if (SSHConnectionState == -1) or (TelnetConnectionState == -1):
+            return "Authentication failed"
+        return "Could not connect"
+
+
+#####################################################################################################################################################
+###########################################################   Collect worker function     ###########################################################
+#####################################################################################################################################################
+def collectWorkerFunc(collectArgs):
+    # Wrapper used by worker pool streams: isolates errors of every single host so one failed node does not stop the whole collection
+    login,password1,password2,hostAddr,outputPath,recursive = collectArgs
+    startTime = time.time()
+    try:
+        result = collectFunc(login,password1,password2,hostAddr,outputPath,recursive)
+    except Exception as e:
+        result = "Error: " + str(type(e).__name__) + ": " + str(e)
+    return [ str(hostAddr), result, time.time() - startTime ]
+
 
 #####################################################################################################################################################
 #####################################################################################################################################################
@@ -6209,535 +6822,675 @@ def collectFunc(login,password1,password2,hostAddr,outputPath,recursive):
 
 # if debug: print("debug: "+str(sys.argv))
 
-argList = []
-for argument in sys.argv:
-    # if len(argument.split(":")) > 1:
-    #     argument = argument.split(":")[0] + ":******"
-    argList.append(argument)
-
-print("Issued command: "+" ".join(str(k) for k in argList))
-
-if len(sys.argv) <= 1:
-    printHelpFunc()
-    sys.exit()
-if ((sys.argv[1] == "help") or (sys.argv[1] == "?") or (sys.argv[1] == "h") or (sys.argv[1] == "--help") or (sys.argv[1] == "-h")):
-    printHelpFunc()
-    sys.exit()
-else:
+if __name__ == "__main__":     # Worker processes of parallel jobs import this script too, so script body runs only in the main process
+    argList = []
+    for argument in sys.argv:
+        # if len(argument.split(":")) > 1:
+        #     argument = argument.split(":")[0] + ":******"
+        argList.append(argument)
+
+    # Logging and batch arguments are accepted by all actions, so they are removed before the positional arguments of an action are checked
+    verbosity = 0
+    logFilePath = ""
+    reportPath = ""
+    # Positions of the removed arguments, values of "--log-file" and "--report" are removed by position as well, so the same value used as
+    # another argument (e.g. a path) is kept
+    removedArguments = set()
+    for argumentNumber, argument in enumerate(argList):
+        if (argumentNumber == 0) or (argumentNumber in removedArguments):
+            continue
+        if argument == "--batch":
+            batchMode = True
+            removedArguments.add(argumentNumber)
+        if argument == "--report":
+            removedArguments.add(argumentNumber)
+            if argumentNumber + 1 < len(argList):
+                reportPath = argList[argumentNumber + 1]
+                removedArguments.add(argumentNumber + 1)
+        if argument == "--quiet":
+            verbosity = -1
+            removedArguments.add(argumentNumber)
+        if argument == "-v":
+            verbosity = 1
+            removedArguments.add(argumentNumber)
+        if argument == "-vv":
+            verbosity = 2
+            removedArguments.add(argumentNumber)
+        if argument == "--log-file":
+            removedArguments.add(argumentNumber)
+            if argumentNumber + 1 < len(argList):
+                logFilePath = argList[argumentNumber + 1]
+                removedArguments.add(argumentNumber + 1)
+    sys.argv = [argument for argumentNumber, argument in enumerate(argList) if argumentNumber not in removedArguments]
+    loggingSetupFunc(verbosity,logFilePath)
+
+    logger.info("Issued command: %s", " ".join(str(k) for k in argList))
+
+    if len(sys.argv) <= 1:
+        printHelpFunc()
+        sys.exit()
+    if ((sys.argv[1] == "help") or (sys.argv[1] == "?") or (sys.argv[1] == "h") or (sys.argv[1] == "--help") or (sys.argv[1] == "-h")):
+        printHelpFunc()
+        sys.exit()
+    elif ((sys.argv[1] == "-t") or (sys.argv[1] == "--test")):
+        sys.exit(selfTestFunc())
+    else:
 
 #####################################################################################################################################################
 ###########################################################       Parse option         ##############################################################
 #####################################################################################################################################################
-    if (sys.argv[1] == "-p") or (sys.argv[1] == "--parse"):
-        if (len(sys.argv) < 4):     # Initial arguments check
-            print("Missig arguents, print -h for help.\r\n")
-            sys.exit()
-        inputPath = sys.argv[2]
-        if debug: print("debug: "+"Input path: "+str(inputPath))
-        outputPath = sys.argv[3]
-        if debug: print("debug: "+"Output path: "+str(outputPath))
-
-        genClean = 0
-        defaultCLISyntax = ""
-
-        if len(sys.argv) >= 4:
-            for argument in sys.argv:
-                if sys.argv.index(argument) >= 4:
-                    if argument == "clean":
-                        genClean = 1
-                    for value in SyntaxDict:
-                        if argument == value:
-                            if value != "Hist":
-                                defaultCLISyntax = value
-        
-        if debug: print("debug: "+"clean input: "+str(genClean))
-        if debug: print("debug: "+"default CLI syntax set to: "+str(defaultCLISyntax))
+        if (sys.argv[1] == "-p") or (sys.argv[1] == "--parse"):
+            if (len(sys.argv) < 4):     # Initial arguments check
+                logger.error("Missig arguents, print -h for help.")
+                sys.exit(1)
+            inputPath = sys.argv[2]
+            if debug: logger.debug("Input path: %s", inputPath)
+            outputPath = sys.argv[3]
+            if debug: logger.debug("Output path: %s", outputPath)
+
+            genClean = 0
+            defaultCLISyntax = ""
+            jobs = 1
+            commitEvery = 1
+            force = False
+            nativeEngine = False
+
+            valueArguments = ["--jobs", "--commit-every"]   # Options followed by a value
+
+            if len(sys.argv) >= 4:
+                for argumentNumber, argument in enumerate(sys.argv):
+                    if argumentNumber >= 4:
+                        # Values of options are read with their options
+                        if sys.argv[argumentNumber - 1] in valueArguments:
+                            continue
+                        if argument == "clean":
+                            genClean = 1
+                        if argument == "--force":
+                            force = True
+                        if argument == "--native":
+                            nativeEngine = True
+                        if argument == "--jobs":
+                            jobs = positiveArgumentFunc(argumentNumber, "Number of jobs must be a positive number.")
+                        if argument == "--commit-every":
+                            commitEvery = positiveArgumentFunc(argumentNumber, "Number of nodes per commit must be a positive number.")
+                        for value in SyntaxDict:
+                            if argument == value:
+                                if value != "Hist":
+                                    defaultCLISyntax = value
+            
+            if debug: logger.debug("clean input: %s", genClean)
+            if debug: logger.debug("default CLI syntax set to: %s", defaultCLISyntax)
+            if debug: logger.debug("number of parallel jobs set to: %s", jobs)
+            if debug: logger.debug("number of nodes per commit set to: %s", commitEvery)
+            if debug: logger.debug("parse unchanged files: %s", force)
+            if debug: logger.debug("native config engine: %s", nativeEngine)
 
-        if debug: print("debug: "+"Input file: "+str(os.path.isfile(inputPath)))
-        if debug: print("debug: "+"Input dir: "+str(os.path.isdir(inputPath)))
+            if debug: logger.debug("Input file: %s", os.path.isfile(inputPath))
+            if debug: logger.debug("Input dir: %s", os.path.isdir(inputPath))
 
-        inputFiles = []
+            inputFiles = []
 
-        if os.path.isfile(inputPath):
-            if (inputPath.endswith(".cfg") or inputPath.endswith(".txt") or inputPath.endswith(".log")):
-                print("Parsing specified file...\r\n")
-                inputFiles.append(inputPath)                  # Parse single file
-            else:
-                print("Specified file is not recognized text file, please specify another file. Supported extensions are cfg/txt/log.\r\n")
-                sys.exit()
-        else:
-            if os.path.isdir(inputPath):
-                if inputPath[-1] != "\\" and inputPath[-1] != "/":
-                    inputPath = inputPath + "\\"
-                i = 0
-                for f in os.listdir(inputPath):
-                    if os.path.isfile(inputPath+f):
-                        if (f.endswith(".cfg") or f.endswith(".txt") or f.endswith(".log")):
-                            if debug: print("debug: "+"Input file "+f+" is valid")
-                            inputFiles.append(inputPath+f)      # Parse all files whithin a directory
-                            i = i + 1
-                        else:
-                            if debug: print("debug: "+"Input file "+f+" has invalid extension")
-                if i == 0:
-                    print("Specified directory has no recognized text files, please specify another directory. Supported file extensions are cfg/txt/log.\r\n")
-                    sys.exit()
+            if os.path.isfile(inputPath):
+                if (inputPath.endswith(".cfg") or inputPath.endswith(".txt") or inputPath.endswith(".log")):
+                    logger.info("Parsing specified file...")
+                    inputFiles.append(inputPath)                  # Parse single file
                 else:
-                    print("Found",i,"suitable file(s) in specified directory.")
-            else:
-                print("Specified path is not a recognized directory or file, please specify another path. Supported file extensions are cfg/txt/log.\r\n")
-                sys.exit()
-
-        if ((os.path.isfile(outputPath) == False) & (os.path.isdir(outputPath) == False)):
-            outputPath2 = os.path.split(outputPath)
-            if outputPath2[0]:
-                if os.path.isdir(outputPath2[0]) == False:
-                    os.makedirs(outputPath2[0])
-
-            outputDB = sqlite3.connect(outputPath)
-            if ((outputDB == False) or (os.path.isfile(outputPath) == False)):
-                print("Could not create SQLite database, check destination directory permissions.\r\n")
-                sys.exit()
+                    logger.error("Specified file is not recognized text file, please specify another file. Supported extensions are cfg/txt/log.")
+                    sys.exit(1)
             else:
-                outputCursor = outputDB.cursor()
-
-                DBQuery="""CREATE TABLE sysInfo (
-                            DBFormatVersion, 
-                            CreationDate, 
-                            LastUpdatedTime, 
-                            LastUpdatedBy
-                            )"""
-                if debugSQL: print("debug: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
-
-                DBQuery="""INSERT INTO sysInfo 
-                            VALUES (
-                            '"""+str(DBFormatVersion)+"""',
-                            '"""+str(datetime.datetime.today())+"""',
-                            '"""+str(datetime.datetime.today())+"""',
-                            '"""+str(getpass.getuser())+"""'
-                            )"""
-                if debugSQL: print("debug: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
-
-                outputDB.commit()
-
-                DBQuery="""SELECT name 
-                            FROM sqlite_master where type='table'
-                            """
-                if debugSQL: print("debug: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
+                if os.path.isdir(inputPath):
+                    if inputPath[-1] != "\\" and inputPath[-1] != "/":
+                        inputPath = inputPath + "\\"
+                    i = 0
+                    for f in os.listdir(inputPath):
+                        if os.path.isfile(inputPath+f):
+                            if (f.endswith(".cfg") or f.endswith(".txt") or f.endswith(".log")):
+                                if debug: logger.debug("Input file %s is valid", f)
+                                inputFiles.append(inputPath+f)      # Parse all files whithin a directory
+                                i = i + 1
+                            else:
+                                if debug: logger.debug("Input file %s has invalid extension", f)
+                    if i == 0:
+                        logger.error("Specified directory has no recognized text files, please specify another directory. Supported file extensions are cfg/txt/log.")
+                        sys.exit(1)
+                    else:
+                        logger.info("Found %s suitable file(s) in specified directory.", i)
+                else:
+                    logger.error("Specified path is not a recognized directory or file, please specify another path. Supported file extensions are cfg/txt/log.")
+                    sys.exit(1)
 
-                tables = [description[0] for description in outputCursor.fetchall()]
-                if debug: print("debug: "+str(tables))
+            if ((os.path.isfile(outputPath) == False) & (os.path.isdir(outputPath) == False)):
+                outputPath2 = os.path.split(outputPath)
+                if outputPath2[0]:
+                    if os.path.isdir(outputPath2[0]) == False:
+                        os.makedirs(outputPath2[0])
 
-                match = 0
-                for t in tables:
-                    if (t == "sysInfo"): match = 1
-                if match == 0:
-                    print("DB creation error, could not create sysInfo table correctly.\r\n")
-                    outputDB.close()
-                    os.remove(outputPath)
-                    sys.exit()
+                outputDB = sqlite3.connect(outputPath)
+                if ((outputDB == False) or (os.path.isfile(outputPath) == False)):
+                    logger.error("Could not create SQLite database, check destination directory permissions.")
+                    sys.exit(1)
+                else:
+                    outputCursor = outputDB.cursor()
 
-                DBQuery="""SELECT *
-                            FROM sysInfo"""
-                if debugSQL: print("debug: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
+                    DBQuery="""CREATE TABLE sysInfo (
+                                DBFormatVersion, 
+                                CreationDate, 
+                                LastUpdatedTime, 
+                                LastUpdatedBy
+                                )"""
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                    outputCursor.execute(DBQuery)
 
-                sysInfoColumns = [description[0] for description in outputCursor.description]
-                if debug: print("debug: "+str(sysInfoColumns))
+                    DBQuery="""INSERT INTO sysInfo 
+                                VALUES (
+                                '"""+str(DBFormatVersion)+"""',
+                                '"""+str(datetime.datetime.today())+"""',
+                                '"""+str(datetime.datetime.today())+"""',
+                                '"""+str(getpass.getuser())+"""'
+                                )"""
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                    outputCursor.execute(DBQuery)
 
-                if ((sysInfoColumns[0] != "DBFormatVersion") or (sysInfoColumns[1] != "CreationDate") or (sysInfoColumns[2] !="LastUpdatedTime") or (sysInfoColumns[3] !="LastUpdatedBy")):
-                    print("DB creation error, could not create sysInfo table correctly.\r\n")
-                    outputDB.close()
-                    os.remove(outputPath)
-                    sys.exit()
-            
-            print("Successfully created database at \""+outputPath+"\".")
+                    outputDB.commit()
 
-        else:
-            if (os.path.isdir(outputPath) == True):
-                print("Specified output path matches existing directory, can not proceed.\r\n")
-                sys.exit()
-            else:
-                outputDB = sqlite3.connect(outputPath)
-                if debug: print("debug: "+"DB file: "+str(outputDB))
-                outputCursor = outputDB.cursor()
+                    DBQuery="""SELECT name 
+                                FROM sqlite_master where type='table'
+                                """
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                    outputCursor.execute(DBQuery)
 
-                DBQuery="""SELECT name
-                            FROM sqlite_master 
-                            WHERE type='table'
-                            """
-                if debugSQL: print("debug: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
+                    tables = [description[0] for description in outputCursor.fetchall()]
+                    if debug: logger.debug("tables: %s", tables)
 
-                tables = [description[0] for description in outputCursor.fetchall()]
-                if debug: print("debug: "+str(tables))
+                    match = 0
+                    for t in tables:
+                        if (t == "sysInfo"): match = 1
+                    if match == 0:
+                        logger.error("DB creation error, could not create sysInfo table correctly.")
+                        outputDB.close()
+                        os.remove(outputPath)
+                        sys.exit(1)
 
-                match = 0
-                for t in tables:
-                    if (t == "sysInfo"): match = 1
-                if match == 0:
-                    print("DB opening error, could not find sysInfo table.\r\n")
-                    outputDB.close()
-                    sys.exit()
+                    DBQuery="""SELECT *
+                                FROM sysInfo"""
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                    outputCursor.execute(DBQuery)
 
-                DBQuery="""SELECT * 
-                            FROM sysInfo
-                            """
-                if debugSQL: print("debug: "+str(DBQuery))
-                outputCursor.execute(DBQuery)
+                    sysInfoColumns = [description[0] for description in outputCursor.description]
+                    if debug: logger.debug("sysInfoColumns: %s", sysInfoColumns)
 
-                sysInfoColumns = [description[0] for description in outputCursor.description]
-                if debug: print("debug: "+str(sysInfoColumns))
+                    if ((sysInfoColumns[0] != "DBFormatVersion") or (sysInfoColumns[1] != "CreationDate") or (sysInfoColumns[2] !="LastUpdatedTime") or (sysInfoColumns[3] !="LastUpdatedBy")):
+                        logger.error("DB creation error, could not create sysInfo table correctly.")
+                        outputDB.close()
+                        os.remove(outputPath)
+                        sys.exit(1)
+                
+                logger.info("Successfully created database at \"%s\".", outputPath)
 
-                if ((sysInfoColumns[0] != "DBFormatVersion") or (sysInfoColumns[1] != "CreationDate") or (sysInfoColumns[2] !="LastUpdatedTime") or (sysInfoColumns[3] !="LastUpdatedBy")):
-                    print("DB opening error, sysInfo table has missing columns.\r\n")
-                    outputDB.close()
-                    sys.exit()
+            else:
+                if (os.path.isdir(outputPath) == True):
+                    logger.error("Specified output path matches existing directory, can not proceed.")
+                    sys.exit(1)
                 else:
-                    DBQuery="""SELECT DBFormatVersion 
-                                FROM sysInfo
+                    outputDB = sqlite3.connect(outputPath)
+                    if debug: logger.debug("DB file: %s", outputDB)
+                    outputCursor = outputDB.cursor()
+
+                    DBQuery="""SELECT name
+                                FROM sqlite_master 
+                                WHERE type='table'
                                 """
-                    if debugSQL: print("debug: "+str(DBQuery))
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
                     outputCursor.execute(DBQuery)
 
-                    DBFormatVersionCheck = 0
-                    DBFormatVersionCheck = outputCursor.fetchone()[0]
-                    if debug: print("debug: File DBFormatVersion = "+str(DBFormatVersionCheck[0]))
-                    if debug: print("debug: Current DBFormatVersion = "+str(DBFormatVersion))
+                    tables = [description[0] for description in outputCursor.fetchall()]
+                    if debug: logger.debug("tables: %s", tables)
 
-                    if str(DBFormatVersionCheck[0]) != str(DBFormatVersion):
-                        print("DB opening error, DB format version mismatch. Please specify another output file.\r\n")
+                    match = 0
+                    for t in tables:
+                        if (t == "sysInfo"): match = 1
+                    if match == 0:
+                        logger.error("DB opening error, could not find sysInfo table.")
                         outputDB.close()
-                        sys.exit()
-
-                    outputDB.close()
-                    shutil.copy(outputPath,outputPath+"."+time.strftime("%Y%m%d_%H%M%S")+".bak")
-                    outputDB = sqlite3.connect(outputPath)
-                    outputCursor = outputDB.cursor()
+                        sys.exit(1)
 
                     DBQuery="""SELECT * 
                                 FROM sysInfo
                                 """
-                    if debugSQL: print("debug: "+str(DBQuery))
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
                     outputCursor.execute(DBQuery)
-                    if debug: print(outputCursor.fetchall())
-                    DBQuery= """UPDATE sysInfo
-                                SET LastUpdatedTime = '"""+str(datetime.datetime.today())+"""' 
-                                WHERE DBFormatVersion = '"""+str(DBFormatVersion)+"""'
-                                """
-                    if debugSQL: print("debug: "+str(DBQuery))
-                    outputCursor.execute(DBQuery)
-                    if debug: print(outputCursor.fetchall())
-                    outputDB.commit()
-                
-                print("Successfully opened database at \""+outputPath+"\".")
-        
-        parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean)
-    else:
+
+                    sysInfoColumns = [description[0] for description in outputCursor.description]
+                    if debug: logger.debug("sysInfoColumns: %s", sysInfoColumns)
+
+                    if ((sysInfoColumns[0] != "DBFormatVersion") or (sysInfoColumns[1] != "CreationDate") or (sysInfoColumns[2] !="LastUpdatedTime") or (sysInfoColumns[3] !="LastUpdatedBy")):
+                        logger.error("DB opening error, sysInfo table has missing columns.")
+                        outputDB.close()
+                        sys.exit(1)
+                    else:
+                        DBQuery="""SELECT DBFormatVersion 
+                                    FROM sysInfo
+                                    """
+                        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                        outputCursor.execute(DBQuery)
+
+                        DBFormatVersionCheck = 0
+                        DBFormatVersionCheck = outputCursor.fetchone()[0]
+                        if debug: logger.debug("File DBFormatVersion = %s", DBFormatVersionCheck[0])
+                        if debug: logger.debug("Current DBFormatVersion = %s", DBFormatVersion)
+
+                        if str(DBFormatVersionCheck[0]) != str(DBFormatVersion):
+                            logger.error("DB opening error, DB format version mismatch. Please specify another output file.")
+                            outputDB.close()
+                            sys.exit(1)
+
+                        outputDB.close()
+                        shutil.copy(outputPath,outputPath+"."+time.strftime("%Y%m%d_%H%M%S")+".bak")
+                        outputDB = sqlite3.connect(outputPath)
+                        outputCursor = outputDB.cursor()
+
+                        DBQuery="""SELECT * 
+                                    FROM sysInfo
+                                    """
+                        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                        outputCursor.execute(DBQuery)
+                        if debug: logger.debug("DBResponse: %s", outputCursor.fetchall())
+                        DBQuery= """UPDATE sysInfo
+                                    SET LastUpdatedTime = '"""+str(datetime.datetime.today())+"""' 
+                                    WHERE DBFormatVersion = '"""+str(DBFormatVersion)+"""'
+                                    """
+                        if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                        outputCursor.execute(DBQuery)
+                        if debug: logger.debug("DBResponse: %s", outputCursor.fetchall())
+                        outputDB.commit()
+                    
+                    logger.info("Successfully opened database at \"%s\".", outputPath)
+            
+            parseReport = parseFunc(inputFiles,outputDB,defaultCLISyntax,genClean,jobs,commitEvery,force,nativeEngine)
+            if batchMode:
+                parseReport["command"] = " ".join(str(k) for k in argList)
+                sys.exit(batchReportFunc(reportPath if reportPath != "" else outputPath+".report.json",parseReport))
+        else:
 #####################################################################################################################################################
 #########################################################         Output option         #############################################################
 #####################################################################################################################################################
-        if (sys.argv[1] == "-o") or (sys.argv[1] == "--output"):
-            if (len(sys.argv) < 4):     # Initial arguments check
-                print("Missig arguents, print -h for help.\r\n")
-                sys.exit()
-            inputPath = sys.argv[2]
-            if debug: print("debug: "+"Input path: "+str(inputPath))
-            outputPath = sys.argv[3]
-            if debug: print("debug: "+"Output path: "+str(outputPath))
-
-            targSyntax = ""
-
-            if len(sys.argv) == 5:
-                for argument in sys.argv:
-                    if sys.argv.index(argument) == 4:
+            if (sys.argv[1] == "-o") or (sys.argv[1] == "--output"):
+                if (len(sys.argv) < 4):     # Initial arguments check
+                    logger.error("Missig arguents, print -h for help.")
+                    sys.exit(1)
+                inputPath = sys.argv[2]
+                if debug: logger.debug("Input path: %s", inputPath)
+                outputPath = sys.argv[3]
+                if debug: logger.debug("Output path: %s", outputPath)
+
+                targSyntax = ""
+                xlsxStreaming = False
+                outputFilter = {"Hostname": "", "CLISyntax": "", "IfType": "", "Since": "", "Until": ""}
+                outputFilterArguments = {"--host": "Hostname", "--syntax": "CLISyntax", "--if-type": "IfType", "--since": "Since", "--until": "Until"}
+
+                for argumentNumber, argument in enumerate(sys.argv[4:], 4):
+                    if argument == "--xlsx-streaming":
+                        xlsxStreaming = True
+                    elif argument in outputFilterArguments:
+                        outputFilter[outputFilterArguments[argument]] = argumentValueFunc(argumentNumber)
+                    elif sys.argv[argumentNumber - 1] in outputFilterArguments:
+                        continue
+                    else:
                         for value in SyntaxDict:
                             if argument == value:
                                 if value != "Hist":
                                     targSyntax = value
 
-            if debug: print("debug: "+"Input file: "+str(os.path.isfile(inputPath)))
-            if debug: print("debug: "+"Input dir: "+str(os.path.isdir(inputPath)))
+                # Checking filter values
+                if (outputFilter["CLISyntax"] != "") and ((outputFilter["CLISyntax"] not in SyntaxDict) or (outputFilter["CLISyntax"] == "Hist")):
+                    logger.error("Unknown CLI syntax \"%s\" in \"--syntax\" argument, supported syntax keys are: %s.", outputFilter["CLISyntax"],
+                                 ", ".join(str(k) for k,v in SyntaxDict.items() if k != "Hist"))
+                    sys.exit(1)
+                for value in ["Since", "Until"]:
+                    if outputFilter[value] != "":
+                        # Times are compared as text in the same format as LastUpdatedTime is stored
+                        try:
+                            outputFilter[value] = str(datetime.datetime.fromisoformat(outputFilter[value]))
+                        except ValueError:
+                            logger.error("Could not recognize time \"%s\", please specify it as YYYY-MM-DD or \"YYYY-MM-DD HH:MM:SS\".", outputFilter[value])
+                            sys.exit(1)
+                if debug: logger.debug("output filter: %s", outputFilter)
+
+                if debug: logger.debug("Input file: %s", os.path.isfile(inputPath))
+                if debug: logger.debug("Input dir: %s", os.path.isdir(inputPath))
+
+                if os.path.isfile(inputPath):
+                    logger.info("Opening specified database...")
+                else:
+                    logger.error("Specified path is not a recognized database file, please specify another path.")
+                    sys.exit(1)
 
-            if os.path.isfile(inputPath):
-                print("Opening specified database...\r\n")
-            else:
-                print("Specified path is not a recognized database file, please specify another path.\r\n")
-                sys.exit()
+                inputDB = sqlite3.connect(inputPath)
+                if debug: logger.debug("DB file: %s", inputDB)
+                inputCursor = inputDB.cursor()
 
-            inputDB = sqlite3.connect(inputPath)
-            if debug: print("debug: "+"DB file: "+str(inputDB))
-            inputCursor = inputDB.cursor()
+                DBQuery="""SELECT name
+                            FROM sqlite_master 
+                            WHERE type='table'
+                            """
+                if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                inputCursor.execute(DBQuery)
 
-            DBQuery="""SELECT name
-                        FROM sqlite_master 
-                        WHERE type='table'
-                        """
-            if debugSQL: print("debug: "+str(DBQuery))
-            inputCursor.execute(DBQuery)
+                tables = [description[0] for description in inputCursor.fetchall()]
+                if debug: logger.debug("tables: %s", tables)
 
-            tables = [description[0] for description in inputCursor.fetchall()]
-            if debug: print("debug: "+str(tables))
+                match = 0
+                for t in tables:
+                    if (t == "sysInfo"): match = 1
+                if match == 0:
+                    logger.error("DB opening error, could not find sysInfo table.")
+                    inputDB.close()
+                    sys.exit(1)
 
-            match = 0
-            for t in tables:
-                if (t == "sysInfo"): match = 1
-            if match == 0:
-                print("DB opening error, could not find sysInfo table.\r\n")
-                inputDB.close()
-                sys.exit()
-
-            DBQuery="""SELECT * 
-                        FROM sysInfo
-                        """
-            if debugSQL: print("debug: "+str(DBQuery))
-            inputCursor.execute(DBQuery)
-
-            sysInfoColumns = [description[0] for description in inputCursor.description]
-            if debug: print("debug: "+str(sysInfoColumns))
-
-            if ((sysInfoColumns[0] != "DBFormatVersion") or (sysInfoColumns[1] != "CreationDate") or (sysInfoColumns[2] !="LastUpdatedTime") or (sysInfoColumns[3] !="LastUpdatedBy")):
-                print("DB opening error, sysInfo table has missing columns.\r\n")
-                inputDB.close()
-                sys.exit()
-            else:
-                DBQuery="""SELECT DBFormatVersion 
+                DBQuery="""SELECT * 
                             FROM sysInfo
                             """
-                if debugSQL: print("debug: "+str(DBQuery))
+                if debugSQL: logger.debug("DBQuery: %s", DBQuery)
                 inputCursor.execute(DBQuery)
 
-                DBFormatVersionCheck = ""
-                DBFormatVersionCheck = inputCursor.fetchone()[0]
-                if debug: print("debug: File DBFormatVersionCheck = "+str(DBFormatVersionCheck[0]))
-                if debug: print("debug: Current DBFormatVersion = "+str(DBFormatVersion))
-
-                if str(DBFormatVersionCheck[0]) != str(DBFormatVersion):
-                    print("DB opening error, DB format version mismatch. Please specify another output file.\r\n")
-                    inputDB.close()
-                    sys.exit()
-            
-            print("Successfully opened database at \""+inputPath+"\".")
+                sysInfoColumns = [description[0] for description in inputCursor.description]
+                if debug: logger.debug("sysInfoColumns: %s", sysInfoColumns)
 
-            if ((os.path.isfile(outputPath) == False) & (os.path.isdir(outputPath) == False)):
-                outputPath2 = os.path.split(outputPath)
-                if outputPath2[1] is None:
-                    print("Please specify path with non-empty filename\r\n")
+                if ((sysInfoColumns[0] != "DBFormatVersion") or (sysInfoColumns[1] != "CreationDate") or (sysInfoColumns[2] !="LastUpdatedTime") or (sysInfoColumns[3] !="LastUpdatedBy")):
+                    logger.error("DB opening error, sysInfo table has missing columns.")
                     inputDB.close()
-                    sys.exit()
+                    sys.exit(1)
                 else:
-                    if outputPath2[0]:
-                        if os.path.isdir(outputPath2[0]) == False:
-                            os.makedirs(outputPath2[0])
-                            print("Creating a new output file "+ outputPath2[1] +" at "+outputPath2[0])
+                    DBQuery="""SELECT DBFormatVersion 
+                                FROM sysInfo
+                                """
+                    if debugSQL: logger.debug("DBQuery: %s", DBQuery)
+                    inputCursor.execute(DBQuery)
+
+                    DBFormatVersionCheck = ""
+                    DBFormatVersionCheck = inputCursor.fetchone()[0]
+                    if debug: logger.debug("File DBFormatVersionCheck = %s", DBFormatVersionCheck[0])
+                    if debug: logger.debug("Current DBFormatVersion = %s", DBFormatVersion)
+
+                    if str(DBFormatVersionCheck[0]) != str(DBFormatVersion):
+                        logger.error("DB opening error, DB format version mismatch. Please specify another output file.")
+                        inputDB.close()
+                        sys.exit(1)
+                
+                logger.info("Successfully opened database at \"%s\".", inputPath)
+
+                if ((os.path.isfile(outputPath) == False) & (os.path.isdir(outputPath) == False)):
+                    outputPath2 = os.path.split(outputPath)
+                    if outputPath2[1] is None:
+                        logger.error("Please specify path with non-empty filename")
+                        inputDB.close()
+                        sys.exit(1)
                     else:
-                        print("Creating a new output file "+outputPath2[1]+"\".")
-            else:
-                if (os.path.isdir(outputPath) == True):
-                    print("Specified output file matches existing directory name. Please specify another output path.\r\n")
-                    inputDB.close()
-                    sys.exit()
+                        if outputPath2[0]:
+                            if os.path.isdir(outputPath2[0]) == False:
+                                os.makedirs(outputPath2[0])
+                                logger.info("Creating a new output file %s at %s", outputPath2[1], outputPath2[0])
+                        else:
+                            logger.info("Creating a new output file %s\".", outputPath2[1])
                 else:
-                    print("Specified output file matches existing file. Existing file will backed up to another file and overwritten.\r\n")
-                    shutil.copy(outputPath,outputPath+"."+time.strftime("%Y%m%d_%H%M%S")+".bak")
-                    os.remove(outputPath)
+                    if (os.path.isdir(outputPath) == True):
+                        logger.error("Specified output file matches existing directory name. Please specify another output path.")
+                        inputDB.close()
+                        sys.exit(1)
+                    else:
+                        logger.warning("Specified output file matches existing file. Existing file will backed up to another file and overwritten.")
+                        shutil.copy(outputPath,outputPath+"."+time.strftime("%Y%m%d_%H%M%S")+".bak")
+                        os.remove(outputPath)
 
 
-            if len(outputPath.split(".")) > 1:
-                # print(outputPath2[1].split(".")[1])
-                if re.match(r"^[Cc][Ss][Vv]$",outputPath.split(".")[-1]):
-                    print("Using CSV output file format.")
-                    fileFormat = "csv"
-                else:
-                    if re.match(r"^[Xx][Ll][Ss][Xx]$",outputPath.split(".")[-1]):
-                        print("Using XLSX output file format.")
-                        fileFormat = "xlsx"
+                if len(outputPath.split(".")) > 1:
+                    # print(outputPath2[1].split(".")[1])
+                    if re.match(r"^[Cc][Ss][Vv]$",outputPath.split(".")[-1]):
+                        logger.info("Using CSV output file format.")
+                        fileFormat = "csv"
                     else:
-                        print("Could not identify output file extension to set up file format. Please specify either \".csv\" or \".xlsx\" file extension.\r\n")
-                        inputDB.close()
-                        sys.exit()
+                        if re.match(r"^[Xx][Ll][Ss][Xx]$",outputPath.split(".")[-1]):
+                            logger.info("Using XLSX output file format.")
+                            fileFormat = "xlsx"
+                        else:
+                            if re.match(r"^([Jj][Ss][Oo][Nn][Ll]|[Nn][Dd][Jj][Ss][Oo][Nn])$",outputPath.split(".")[-1]):
+                                logger.info("Using JSON Lines output file format.")
+                                fileFormat = "jsonl"
+                            else:
+                                logger.error("Could not identify output file extension to set up file format. Please specify either \".csv\", \".xlsx\" or \".jsonl\" file extension.")
+                                inputDB.close()
+                                sys.exit(1)
 
-            outputFunc(inputDB,outputPath,fileFormat,targSyntax)
-        else:
+                outputFunc(inputDB,outputPath,fileFormat,targSyntax,xlsxStreaming,outputFilter)
+            else:
 #####################################################################################################################################################
 ###########################################################        Collect option         ###########################################################
 #####################################################################################################################################################
-            if (sys.argv[1] == "-c") or (sys.argv[1] == "--collect"):
-
-    # -c|--collect    {login} {IPv4 addresses list/file} {output directory name} [recursive] [number of streams]
-                # Initial arguments check
-                if (len(sys.argv) < 5):
-                    print("Missig arguents, print -h for help.\r\n")
-                    sys.exit()
-
-                # # Checking login password
-                # if len(sys.argv[2].split(":")) < 2:
-                #     print("Please specify login.\r\n")
-                #     sys.exit()
-
-                # login = sys.argv[2].split(":")[0]
-                login = sys.argv[2]
-                # password = sys.argv[2].split(":")[1]
-                if debug: print("debug: "+"Using login: "+str(login))
-                
-                # Checking output directory
-                outputPath = sys.argv[4]
-                if ( os.path.isfile(outputPath) == True ):
-                    print("Specified output directory path matches existing file, please specify another one.\r\n")
-                    sys.exit()
-
-                if ( os.path.isdir(outputPath) == False ):
-                    if debug: print("debug: "+"Creating directory: "+str(outputPath))
-                    os.makedirs(outputPath)
-
-                # outputPath = outputPath + "/" + datetime.datetime.today().strftime("%Y-%m-%d_%H-%M") + "/"
-                # if ( os.path.isdir(outputPath) == False ):
-                #     os.makedirs(outputPath)
-
-                # Checking management adresses and creating a list
-                mgmtAddrList = []
-                rawAddrList = []
-                fileBool = False
-                # print(sys.argv[3])
-                # Checking if list of IPv4 addresses specified in a file
-                if re.match(r"^[\d\,\.\-\/]+$",sys.argv[3]):
-                    # print("Address list specified: " + str(sys.argv[3]))
-
-                    if len(sys.argv[3].split(",")) > 1:
-                        rawAddrList = sys.argv[3].split(",")
-                    else:
-                        rawAddrList.append(sys.argv[3])
-                else:
-                    # Check if specified string matches existing directory
-                    if ( os.path.isdir(sys.argv[3]) == True ):
-                        print("Specifed IPv4 addresses filename is not a file, exiting")
-                        sys.exit()
-
-                    # Check if specified string not matches existing filename
-                    if ( os.path.isfile(sys.argv[3]) == False ):
-                        print("Could not find specifed IPv4 addresses filename, exiting")
-                        sys.exit()
-
-                    fileBool = True
-                    print("Filename specified: " + str(sys.argv[3]))
-
-                    # Open file
-                    addressFileContent = open(sys.argv[3],"r",newline ='\r')
-                    rawAddrList = addressFileContent.readlines()
-
-                # print(rawAddrList)
-
-                for value in rawAddrList:
-                    # print(value)
-                    escapes = ''.join([chr(char) for char in range(1, 32)])
-                    translator = str.maketrans('', '', escapes)
-                    value = value.translate(translator)
-                    value = value.lstrip().rstrip()
-                    # print(value)
-
-                    # Searching for individual IPv4 adresses in provided input
-                    if re.match(r"^([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}$", value):
-                        if fileBool:
-                            print("Found address in file: " + str(value))
-                        if int(ipaddress.ip_address(str(value))) not in mgmtAddrList:
-                            mgmtAddrList.append(int(ipaddress.ip_address(str(value))))  
-
+                if (sys.argv[1] == "-c") or (sys.argv[1] == "--collect"):
+
+        # -c|--collect    {login} {IPv4 addresses list/file} {output directory name} [recursive] [number of streams]
+                    # Initial arguments check
+                    if (len(sys.argv) < 5):
+                        logger.error("Missig arguents, print -h for help.")
+                        sys.exit(1)
+
+                    # # Checking login password
+                    # if len(sys.argv[2].split(":")) < 2:
+                    #     print("Please specify login.\r\n")
+                    #     sys.exit()
+
+                    # login = sys.argv[2].split(":")[0]
+                    login = sys.argv[2]
+                    # password = sys.argv[2].split(":")[1]
+                    if debug: logger.debug("Using login: %s", login)
+                    
+                    # Checking output directory
+                    outputPath = sys.argv[4]
+                    if ( os.path.isfile(outputPath) == True ):
+                        logger.error("Specified output directory path matches existing file, please specify another one.")
+                        sys.exit(1)
+
+                    if ( os.path.isdir(outputPath) == False ):
+                        if debug: logger.debug("Creating directory: %s", outputPath)
+                        os.makedirs(outputPath)
+
+                    # outputPath = outputPath + "/" + datetime.datetime.today().strftime("%Y-%m-%d_%H-%M") + "/"
+                    # if ( os.path.isdir(outputPath) == False ):
+                    #     os.makedirs(outputPath)
+
+                    # Checking management adresses and creating a list
+                    mgmtAddrList = []
+                    rawAddrList = []
+                    fileBool = False
+                    # print(sys.argv[3])
+                    # Checking if list of IPv4 addresses specified in a file
+                    if re.match(r"^[\d\,\.\-\/]+$",sys.argv[3]):
+                        # print("Address list specified: " + str(sys.argv[3]))
+
+                        if len(sys.argv[3].split(",")) > 1:
+                            rawAddrList = sys.argv[3].split(",")
+                        else:
+                            rawAddrList.append(sys.argv[3])
                     else:
-                    # Searching for IPv4 ranges in provided input
-                        if re.match(r"^([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}-([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}$", value):
+                        # Check if specified string matches existing directory
+                        if ( os.path.isdir(sys.argv[3]) == True ):
+                            logger.error("Specifed IPv4 addresses filename is not a file, exiting")
+                            sys.exit(1)
+
+                        # Check if specified string not matches existing filename
+                        if ( os.path.isfile(sys.argv[3]) == False ):
+                            logger.error("Could not find specifed IPv4 addresses filename, exiting")
+                            sys.exit(1)
+
+                        fileBool = True
+                        logger.info("Filename specified: %s", sys.argv[3])
+
+                        # Open file
+                        addressFileContent = open(sys.argv[3],"r",newline ='\r')
+                        rawAddrList = addressFileContent.readlines()
+
+                    # print(rawAddrList)
+
+                    for value in rawAddrList:
+                        # print(value)
+                        escapes = ''.join([chr(char) for char in range(1, 32)])
+                        translator = str.maketrans('', '', escapes)
+                        value = value.translate(translator)
+                        value = value.lstrip().rstrip()
+                        # print(value)
+
+                        # Searching for individual IPv4 adresses in provided input
+                        if re.match(r"^([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}$", value):
                             if fileBool:
-                                print("Found address range in file: " + str(value))
- 
-                            ipaddStart = ipaddress.ip_address(str(value.split("-")[0]))
-                            ipaddStop = ipaddress.ip_address(str(value.split("-")[1]))
-                            
-                            # print(int(ipaddStop)-int(ipaddStart)+1)
-                            if (int(ipaddStop)-int(ipaddStart)+1) > 1024:
-                                print("Ranges containing more than 1024 adresses are not allowed.")
-                                sys.exit()
-                            else:
-                                if (int(ipaddStop)-int(ipaddStart)+1) < 0:
-                                    print("Starting address in range can not be lower than ending address.")
-                                    sys.exit()
-                            for i in range(int(ipaddStart),int(ipaddStop)+1):
-                                if int(ipaddress.ip_address(i)) not in mgmtAddrList:
-                                    mgmtAddrList.append(int(ipaddress.ip_address(i)))
+                                logger.info("Found address in file: %s", value)
+                            if int(ipaddress.ip_address(str(value))) not in mgmtAddrList:
+                                mgmtAddrList.append(int(ipaddress.ip_address(str(value))))  
+
                         else:
-                    # Searching for IPv4 subnets in provided input
-                            if re.match(r"^([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}\/([1-9]|[1-2][0-9]|3[0-2])$", value):
+                        # Searching for IPv4 ranges in provided input
+                            if re.match(r"^([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}-([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}$", value):
                                 if fileBool:
-                                    print("Found address subnet in file: " + str(value))
-                                ipadd = ipaddress.ip_interface(str(value))
-                                if len(list(ipadd.network)) > 1024:
-                                    print("Subnets larger than /22 are not allowed.")
-                                    sys.exit()
-                                for host in list(ipadd.network):
-                                    if int(host) not in mgmtAddrList:
-                                        mgmtAddrList.append(int(host))
+                                    logger.info("Found address range in file: %s", value)
+     
+                                ipaddStart = ipaddress.ip_address(str(value.split("-")[0]))
+                                ipaddStop = ipaddress.ip_address(str(value.split("-")[1]))
+                                
+                                # print(int(ipaddStop)-int(ipaddStart)+1)
+                                if (int(ipaddStop)-int(ipaddStart)+1) > 1024:
+                                    logger.error("Ranges containing more than 1024 adresses are not allowed.")
+                                    sys.exit(1)
+                                else:
+                                    if (int(ipaddStop)-int(ipaddStart)+1) < 0:
+                                        logger.error("Starting address in range can not be lower than ending address.")
+                                        sys.exit(1)
+                                for i in range(int(ipaddStart),int(ipaddStop)+1):
+                                    if int(ipaddress.ip_address(i)) not in mgmtAddrList:
+                                        mgmtAddrList.append(int(ipaddress.ip_address(i)))
                             else:
-                    # Searching for IPv4 BGP peers in provided input
-                                if re.match(r"^(neighbor|peer) +([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}.*$", value):
+                        # Searching for IPv4 subnets in provided input
+                                if re.match(r"^([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}\/([1-9]|[1-2][0-9]|3[0-2])$", value):
                                     if fileBool:
-                                        print("Found address of BGP peer in file: " + str(value.split()[1]))
-                                    if int(ipaddress.ip_address(str(value.split()[1]))) not in mgmtAddrList:
-                                        mgmtAddrList.append(int(ipaddress.ip_address(str(value.split()[1]))))
-
-                if len(mgmtAddrList) == 0:
-                    print("No valid IPv4 management address specified. IPv4 addresses must be in range 1.0.0.0 ~ 223.255.255.255 and subnet masks in range /22 ~ /32.\r\n")
-                    sys.exit()
-
-                # mgmtAddrList.sort()
-
-                if len(mgmtAddrList) > 1024:
-                    print("Working on more than 1024 adresses is not allowed.")
-                    sys.exit()
-                else:
-                    if len(mgmtAddrList) > 10:
-                        if not re.match(r'^ *(Y|y)(E|e)(S|s) *$',input("You have specified "+str(len(mgmtAddrList))+" addresses. Type \"yes\" if you sure you want to proceed? ")):
-                            print("Aborting action.")
-                            sys.exit()
+                                        logger.info("Found address subnet in file: %s", value)
+                                    ipadd = ipaddress.ip_interface(str(value))
+                                    if len(list(ipadd.network)) > 1024:
+                                        logger.error("Subnets larger than /22 are not allowed.")
+                                        sys.exit(1)
+                                    for host in list(ipadd.network):
+                                        if int(host) not in mgmtAddrList:
+                                            mgmtAddrList.append(int(host))
+                                else:
+                        # Searching for IPv4 BGP peers in provided input
+                                    if re.match(r"^(neighbor|peer) +([1-9][0-9]?|1[0-9][0-9]|(2[0-1][0-9]|22[0-3]))(\.([1-9]?[0-9]|1[0-9][0-9]|(2[0-4][0-9]|25[0-5]))){3}.*$", value):
+                                        if fileBool:
+                                            logger.info("Found address of BGP peer in file: %s", value.split()[1])
+                                        if int(ipaddress.ip_address(str(value.split()[1]))) not in mgmtAddrList:
+                                            mgmtAddrList.append(int(ipaddress.ip_address(str(value.split()[1]))))
+
+                    if len(mgmtAddrList) == 0:
+                        logger.error("No valid IPv4 management address specified. IPv4 addresses must be in range 1.0.0.0 ~ 223.255.255.255 and subnet masks in range /22 ~ /32.")
+                        sys.exit(1)
+
+                    # mgmtAddrList.sort()
+
+                    if len(mgmtAddrList) > 1024:
+                        logger.error("Working on more than 1024 adresses is not allowed.")
+                        sys.exit(1)
+                    else:
+                        if ((len(mgmtAddrList) > 10) and (not batchMode)):
+                            if not re.match(r'^ *(Y|y)(E|e)(S|s) *$',input("You have specified "+str(len(mgmtAddrList))+" addresses. Type \"yes\" if you sure you want to proceed? ")):
+                                logger.info("Aborting action.")
+                                sys.exit()
 
-                if len(mgmtAddrList) > 1:
-                    print("Working on "+str(len(mgmtAddrList))+" addresses in range between "+str(ipaddress.ip_address(min(mgmtAddrList)))+" and "+str(ipaddress.ip_address(max(mgmtAddrList))) + ".")
+                    if len(mgmtAddrList) > 1:
+                        logger.info("Working on %s addresses in range between %s and %s.", len(mgmtAddrList), ipaddress.ip_address(min(mgmtAddrList)), ipaddress.ip_address(max(mgmtAddrList)))
 
-                else:
-                    print("Working on single specified address: " + str(ipaddress.ip_address(mgmtAddrList[0])))
+                    else:
+                        logger.info("Working on single specified address: %s", ipaddress.ip_address(mgmtAddrList[0]))
 
 # -c|--collect    {login} {IPv4 addresses list/file} {output directory name} [recursive] [number of streams]
 
 
-                # Checking optional arguments
-                recursive = False
-                parallel = False
+                    # Checking optional arguments
+                    recursive = False
+                    streams = 1
 
-                argNumber = 0
-                for argument in sys.argv:
-                    if argNumber == 5:
+                    for argument in sys.argv[5:]:
                         if argument == "recursive":
                             recursive = True
-                            if debug: print("debug: "+"Working recursively.")
+                            if debug: logger.debug("Working recursively.")
                         else:
                             if (( argument.isnumeric() ) and ( streams == 1 )):
+                                if (int(argument) < 2) or (int(argument) > 100):
+                                    logger.error("Number of streams must be in range from 2 to 100.")
+                                    sys.exit(1)
                                 streams = int(argument)
-                                if debug: print("debug: "+"number of streams set to " + str(streams) + ".")
-
-                password1 = password2 = ""
-                password1 = getpass.getpass("Please enter a password for authentication: ")
-                password2 = getpass.getpass("Please enter a secondary (enable) password: ")
-                
-                if password2 == "":
-                    password2 = password1
-
-                print("Collecting data...\r\n")
-                
-                for host in mgmtAddrList:
-                    hostAddr = ipaddress.ip_address(host)
-                    collectFunc(login,password1,password2,hostAddr,outputPath,recursive)
-                # print("Function under construction")
-            else:
-                print("Unknown argument \""+sys.argv[1]+"\"")
-                sys.exit()
+                                if debug: logger.debug("number of streams set to %s.", streams)
+                            else:
+                                # Options of other modes (e.g. "--jobs") or a second number of streams are not silently ignored
+                                logger.error("Unknown argument \"%s\", print -h for help.", argument)
+                                sys.exit(1)
+
+                    password1 = password2 = ""
+                    if batchMode:
+                        # Batch mode never asks for passwords, so they are taken from environment variables
+                        password1 = os.environ.get("CONFPARSER_PASSWORD", "")
+                        password2 = os.environ.get("CONFPARSER_ENABLE_PASSWORD", "")
+                        if password1 == "":
+                            logger.error("Password must be set in CONFPARSER_PASSWORD environment variable in batch mode.")
+                            sys.exit(1)
+                    else:
+                        password1 = getpass.getpass("Please enter a password for authentication: ")
+                        password2 = getpass.getpass("Please enter a secondary (enable) password: ")
+                    
+                    if password2 == "":
+                        password2 = password1
+
+                    logger.info("Collecting data...")
+
+                    collectArgsList = []
+                    for host in mgmtAddrList:
+                        hostAddr = ipaddress.ip_address(host)
+                        collectArgsList.append([login,password1,password2,hostAddr,outputPath,recursive])
+
+                    collectResults = []
+                    collectInterrupted = False
+                    if streams > 1:
+                        # Collection is dominated by network waits, so threads are used as streams
+                        streams = min(streams, len(collectArgsList))
+                        logger.info("Collecting in %s parallel streams.", streams)
+                        collectPool = multiprocessing.pool.ThreadPool(processes=streams)
+                        try:
+                            for result in collectPool.imap_unordered(collectWorkerFunc, collectArgsList):
+                                collectResults.append(result)
+                                logger.info("Finished %s/%s: %s - %s", len(collectResults), len(collectArgsList), result[0], result[1])
+                            collectPool.close()
+                        except KeyboardInterrupt:
+                            logger.warning("Collection interrupted, terminating streams.")
+                            collectInterrupted = True
+                            collectPool.terminate()
+                        collectPool.join()
+                    else:
+                        for collectArgs in collectArgsList:
+                            collectResults.append(collectWorkerFunc(collectArgs))
+
+                    # Printing per-host summary
+                    collectResults.sort(key=lambda result: int(ipaddress.ip_address(result[0])))
+                    collectSucceeded = 0
+                    logger.info("Collection summary:")
+                    for result in collectResults:
+                        if result[1] == "OK": collectSucceeded = collectSucceeded + 1
+                        logger.info("   %s%s second(s)   %s", result[0].ljust(16), str(round(result[2],2)).rjust(8), result[1])
+                    logger.info("Collected %s of %s node(s), %s failed.", collectSucceeded, len(collectArgsList), len(collectArgsList) - collectSucceeded)
+
+                    if batchMode:
+                        collectReport = {"action": "collect", "total": len(collectArgsList), "unchanged": 0, "succeeded": collectSucceeded, "failed": [], "interrupted": collectInterrupted}
+                        for result in collectResults:
+                            if result[1] != "OK":
+                                collectReport["failed"].append({"host": result[0], "reason": "collectError", "message": result[1]})
+                        collectReport["command"] = " ".join(str(k) for k in argList)
+                        sys.exit(batchReportFunc(reportPath if reportPath != "" else os.path.join(outputPath, "collect.report.json"),collectReport))
+                else:
+                    logger.error("Unknown argument \"%s\", print -h for help.", sys.argv[1])
+                    sys.exit(1)
 
 ####################################################################################################
\ No newline at end of file